@@ -1,4 +1,5 @@
 from ..util import verify_dynamic_loading_support as _verify_dynamic_loading_support
+from .action_executor import ActionExecutor
 from .actions import (
     EmailAction,
     MicrosoftTeamsNotificationAction,
@@ -12,6 +13,7 @@ from .actions import (
 from .checkpoint import ActionContext, Checkpoint, CheckpointResult
 
 for _module_name, _package_name in [
+    (".action_executor", "great_expectations.checkpoint"),
     (".actions", "great_expectations.checkpoint"),
     (".checkpoint", "great_expectations.checkpoint"),
 ]:
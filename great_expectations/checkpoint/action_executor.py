@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from great_expectations._docs_decorators import public_api
+from great_expectations.checkpoint.actions import (
+    ActionContext,
+    UpdateDataDocsAction,
+    ValidationAction,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.checkpoint.checkpoint import CheckpointResult
+
+logger = logging.getLogger(__name__)
+
+
+@public_api
+class ActionExecutor:
+    """Runs the Actions of a Checkpoint, running independent Actions concurrently.
+
+    Actions building Data Docs (UpdateDataDocsAction) are run first, one after another, since
+    notifications link to the pages they build; all remaining Actions only depend on those and
+    are run concurrently, so that one slow webhook or mail server does not hold up the others.
+    Their results are added to the ActionContext in the order of the Actions, regardless of the
+    order in which they complete.
+
+    A failing (or timed out) notification Action is logged and left out of the ActionContext; it
+    does not fail the Checkpoint run.  Failures of UpdateDataDocsAction are raised, as with
+    inline Actions.
+
+    With background=True, Actions are put on a queue, processed by a worker thread of the
+    executor, and Checkpoint.run returns as soon as Validation Results are stored.  Queued
+    Actions are drained (see wait()) before the interpreter exits.
+
+    Args:
+        max_workers: The maximum number of notification Actions run concurrently.
+        timeout: The maximum number of seconds to wait for notification Actions, counted from
+            the moment they are submitted; Actions still running afterwards are abandoned.
+        retries: The number of times a failing Action is retried.
+        retry_delay: The number of seconds to wait before the first retry; the delay is doubled
+            for every subsequent retry.
+        background: Whether to run Actions asynchronously (fire-and-forget).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+        retry_delay: float = 1.0,
+        background: bool = False,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1 (got {max_workers}).")  # noqa: TRY003 # FIXME CoP
+
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive (got {timeout}).")  # noqa: TRY003 # FIXME CoP
+
+        if retries < 0:
+            raise ValueError(f"retries must not be negative (got {retries}).")  # noqa: TRY003 # FIXME CoP
+
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._background = background
+
+        self._queue: queue.Queue[Tuple[List[ValidationAction], CheckpointResult]] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def background(self) -> bool:
+        return self._background
+
+    def submit(
+        self, actions: Sequence[ValidationAction], checkpoint_result: CheckpointResult
+    ) -> Optional[ActionContext]:
+        """Runs Actions for the result of a Checkpoint run.
+
+        Returns:
+            The ActionContext holding results of the Actions or None, if the Actions are run in
+            the background.
+        """
+        if not self._background:
+            return self.run(actions=actions, checkpoint_result=checkpoint_result)
+
+        self._ensure_worker()
+        self._queue.put((list(actions), checkpoint_result))
+        return None
+
+    def run(
+        self, actions: Sequence[ValidationAction], checkpoint_result: CheckpointResult
+    ) -> ActionContext:
+        """Runs Actions for the result of a Checkpoint run and waits for them to complete."""
+        action_context = ActionContext()
+
+        data_docs_actions = [
+            action for action in actions if isinstance(action, UpdateDataDocsAction)
+        ]
+        notification_actions = [
+            action for action in actions if not isinstance(action, UpdateDataDocsAction)
+        ]
+
+        for action in data_docs_actions:
+            action_result = self._run_with_retries(
+                action=action, checkpoint_result=checkpoint_result, action_context=action_context
+            )
+            action_context.update(action=action, action_result=action_result)
+
+        if not notification_actions:
+            return action_context
+
+        # Notification Actions only read results of Data Docs Actions.
+        data_docs_context = ActionContext()
+        for action, action_result in action_context.data:
+            data_docs_context.update(action=action, action_result=action_result)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(notification_actions)),
+            thread_name_prefix="gx-actions",
+        )
+        try:
+            futures = [
+                (
+                    action,
+                    executor.submit(
+                        self._run_with_retries,
+                        action=action,
+                        checkpoint_result=checkpoint_result,
+                        action_context=data_docs_context,
+                    ),
+                )
+                for action in notification_actions
+            ]
+            deadline: Optional[float] = (
+                None if self._timeout is None else time.monotonic() + self._timeout
+            )
+            for action, future in futures:
+                remaining: Optional[float] = (
+                    None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                )
+                try:
+                    action_result = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    logger.warning(
+                        f'Action "{action.name}" did not complete within {self._timeout} seconds; '
+                        "abandoning it."
+                    )
+                    continue
+                except Exception:
+                    logger.exception(f'Action "{action.name}" failed.')
+                    continue
+
+                action_context.update(action=action, action_result=action_result)
+        finally:
+            # Abandoned Actions keep their threads busy, but must not hold up the Checkpoint run.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return action_context
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for Actions queued in the background to complete.
+
+        Args:
+            timeout: The maximum number of seconds to wait (None means no limit).
+
+        Returns:
+            Whether or not all queued Actions have completed.
+        """
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining: Optional[float] = (
+                    None if deadline is None else deadline - time.monotonic()
+                )
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(timeout=remaining)
+
+        return True
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is not None:
+                return
+
+            self._worker = threading.Thread(
+                target=self._process_queue, name="gx-actions-queue", daemon=True
+            )
+            self._worker.start()
+            # Queued notifications are not dropped when the interpreter exits.
+            atexit.register(self.wait)
+
+    def _process_queue(self) -> None:
+        while True:
+            actions, checkpoint_result = self._queue.get()
+            try:
+                self.run(actions=actions, checkpoint_result=checkpoint_result)
+            except Exception:
+                logger.exception(
+                    f"Actions of Checkpoint {checkpoint_result.checkpoint_config.name} failed."
+                )
+            finally:
+                self._queue.task_done()
+
+    def _run_with_retries(
+        self,
+        action: ValidationAction,
+        checkpoint_result: CheckpointResult,
+        action_context: ActionContext,
+    ) -> dict:
+        attempt: int = 0
+        while True:
+            try:
+                return action.run(
+                    checkpoint_result=checkpoint_result, action_context=action_context
+                )
+            except Exception as e:
+                if attempt >= self._retries:
+                    raise
+
+                delay: float = self._retry_delay * 2**attempt
+                attempt += 1
+                logger.warning(
+                    f'Action "{action.name}" failed ({e}); retrying in {delay} seconds '
+                    f"(attempt {attempt} of {self._retries})."
+                )
+                time.sleep(delay)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -43,10 +46,16 @@ from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.serdes import _IdentifierBundle
 from great_expectations.core.validation_definition import ValidationDefinition
 from great_expectations.data_context.data_context.context_factory import project_manager
+from great_expectations.data_context.store.validation_results_store import (
+    deferring_writes,
+    get_deferred_writes,
+    writing_deferred,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.datasource.fluent.interfaces import isolated_execution_engines
 from great_expectations.exceptions import (
     CheckpointNotAddedError,
     CheckpointNotFreshError,
@@ -61,10 +70,16 @@ from great_expectations.exceptions.resource_freshness import ResourceFreshnessAg
 from great_expectations.render.renderer.renderer import Renderer
 
 if TYPE_CHECKING:
+    from great_expectations.checkpoint.action_executor import ActionExecutor
     from great_expectations.core.suite_parameters import SuiteParameterDict
     from great_expectations.data_context.store.validation_definition_store import (
         ValidationDefinitionStore,
     )
+    from great_expectations.data_context.store.validation_results_store import (
+        DeferredWrites,
+    )
+
+logger = logging.getLogger(__name__)
 
 
 @public_api
@@ -289,11 +304,14 @@ class Checkpoint(BaseModel):
         return validation_definitions
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913 # FIXME CoP
         self,
         batch_parameters: Dict[str, Any] | None = None,
         expectation_parameters: SuiteParameterDict | None = None,
         run_id: RunIdentifier | None = None,
+        profile_validation: bool = False,
+        max_workers: int = 1,
+        action_executor: Optional[ActionExecutor] = None,
     ) -> CheckpointResult:
         """
         Runs the Checkpoint's underlying Validation Definitions and Actions.
@@ -302,6 +320,15 @@ class Checkpoint(BaseModel):
             batch_parameters: Parameters to be used when loading the Batch.
             expectation_parameters: Parameters to be used when validating the Batch.
             run_id: An optional unique identifier for the run.
+            profile_validation: If True, the performance profile of every validation is added to
+                the meta of its result under the "validation_profile" key.
+            max_workers: The maximum number of Validation Definitions run concurrently (in threads).
+                With the default of 1, Validation Definitions are run one after another and the
+                first failure is raised; otherwise, failure of one Validation Definition is
+                recorded as an unsuccessful result and does not stop the others.
+            action_executor: An optional ActionExecutor running the Checkpoint's Actions (e.g.,
+                concurrently, with timeouts and retries, or in the background).  By default,
+                Actions are run inline, one after another.
 
         Returns:
             A CheckpointResult object containing the results of the run.
@@ -312,7 +339,11 @@ class Checkpoint(BaseModel):
             CheckpointNotAddedError: If the Checkpoint has not been added to the Store.
             CheckpointNotFreshError: If the Checkpoint has been modified since it was last added
                                      to the Store.
+            ValueError: If max_workers is less than 1.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1 (got {max_workers}).")  # noqa: TRY003 # FIXME CoP
+
         if not self.validation_definitions:
             raise CheckpointRunWithoutValidationDefinitionError()
 
@@ -325,15 +356,26 @@ class Checkpoint(BaseModel):
                 diagnostics.raise_for_error()
 
         run_id = run_id or RunIdentifier(run_time=dt.datetime.now(dt.timezone.utc))
-        run_results = self._run_validation_definitions(
-            batch_parameters=batch_parameters,
-            expectation_parameters=expectation_parameters,
-            result_format=self.result_format,
-            run_id=run_id,
-        )
+        # With store backends writing in bulk, results of all Validation Definitions are persisted
+        # together, once they have all run.
+        validation_results_store = project_manager.get_validation_results_store()
+        with writing_deferred(validation_results_store.defer_writes()):
+            run_results = self._run_validation_definitions(
+                batch_parameters=batch_parameters,
+                expectation_parameters=expectation_parameters,
+                result_format=self.result_format,
+                run_id=run_id,
+                profile_validation=profile_validation,
+                max_workers=max_workers,
+            )
 
         checkpoint_result = self._construct_result(run_id=run_id, run_results=run_results)
-        self._run_actions(checkpoint_result=checkpoint_result)
+        if action_executor:
+            action_executor.submit(
+                actions=self._sort_actions(), checkpoint_result=checkpoint_result
+            )
+        else:
+            self._run_actions(checkpoint_result=checkpoint_result)
 
         self._submit_analytics_event()
 
@@ -346,13 +388,25 @@ class Checkpoint(BaseModel):
         )
         submit_analytics_event(event=event)
 
-    def _run_validation_definitions(
+    def _run_validation_definitions(  # noqa: PLR0913 # FIXME CoP
         self,
         batch_parameters: Dict[str, Any] | None,
         expectation_parameters: SuiteParameterDict | None,
         result_format: ResultFormatUnion,
         run_id: RunIdentifier,
+        profile_validation: bool = False,
+        max_workers: int = 1,
     ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
+        if max_workers > 1 and len(self.validation_definitions) > 1:
+            return self._run_validation_definitions_concurrently(
+                batch_parameters=batch_parameters,
+                expectation_parameters=expectation_parameters,
+                result_format=result_format,
+                run_id=run_id,
+                profile_validation=profile_validation,
+                max_workers=max_workers,
+            )
+
         run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
         for validation_definition in self.validation_definitions:
             validation_result = validation_definition.run(
@@ -361,6 +415,7 @@ class Checkpoint(BaseModel):
                 expectation_parameters=expectation_parameters,
                 result_format=result_format,
                 run_id=run_id,
+                profile_validation=profile_validation,
             )
             key = self._build_result_key(
                 validation_definition=validation_definition,
@@ -371,6 +426,105 @@ class Checkpoint(BaseModel):
 
         return run_results
 
+    def _run_validation_definitions_concurrently(  # noqa: PLR0913 # FIXME CoP
+        self,
+        batch_parameters: Dict[str, Any] | None,
+        expectation_parameters: SuiteParameterDict | None,
+        result_format: ResultFormatUnion,
+        run_id: RunIdentifier,
+        profile_validation: bool,
+        max_workers: int,
+    ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
+        """
+        Runs Validation Definitions in a thread pool.
+
+        Every Validation Definition is given ExecutionEngine objects of its own (ExecutionEngine
+        objects hold loaded Batch data and are not shared between threads).  Results are keyed in
+        the order of Validation Definitions, regardless of the order in which they complete.
+        """
+        # results are written along with those of this run (see "Checkpoint.run()")
+        deferred_writes: Optional[DeferredWrites] = get_deferred_writes()
+
+        def _run(validation_definition: ValidationDefinition) -> ExpectationSuiteValidationResult:
+            with isolated_execution_engines(), deferring_writes(deferred_writes):
+                return validation_definition.run(
+                    checkpoint_id=self.id,
+                    batch_parameters=batch_parameters,
+                    expectation_parameters=expectation_parameters,
+                    result_format=result_format,
+                    run_id=run_id,
+                    profile_validation=profile_validation,
+                )
+
+        run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-checkpoint"
+        ) as executor:
+            futures = [
+                (validation_definition, executor.submit(_run, validation_definition))
+                for validation_definition in self.validation_definitions
+            ]
+            for validation_definition, future in futures:
+                batch_identifier: Optional[str]
+                try:
+                    validation_result = future.result()
+                    batch_identifier = validation_result.batch_id
+                except Exception as e:
+                    logger.exception(
+                        f"Validation Definition {validation_definition.name} of Checkpoint "
+                        f"{self.name} failed."
+                    )
+                    validation_result = self._build_failed_validation_result(
+                        validation_definition=validation_definition,
+                        run_id=run_id,
+                        exception=e,
+                    )
+                    # Without Batch, the result is told apart by name of its Validation Definition.
+                    batch_identifier = validation_definition.name
+
+                key = self._build_result_key(
+                    validation_definition=validation_definition,
+                    run_id=run_id,
+                    batch_identifier=batch_identifier,
+                )
+                run_results[key] = validation_result
+
+        return run_results
+
+    def _build_failed_validation_result(
+        self,
+        validation_definition: ValidationDefinition,
+        run_id: RunIdentifier,
+        exception: Exception,
+    ) -> ExpectationSuiteValidationResult:
+        validation_result = ExpectationSuiteValidationResult(
+            success=False,
+            results=[],
+            suite_name=validation_definition.suite.name,
+            statistics={
+                "evaluated_expectations": 0,
+                "successful_expectations": 0,
+                "unsuccessful_expectations": 0,
+                "success_percent": None,
+            },
+            meta={
+                "validation_id": validation_definition.id,
+                "checkpoint_id": self.id,
+                "exception_info": {
+                    "exception_message": str(exception),
+                    "exception_traceback": "".join(
+                        traceback.format_exception(
+                            type(exception), exception, exception.__traceback__
+                        )
+                    ),
+                    "raised_exception": True,
+                },
+            },
+        )
+        validation_result.meta["run_id"] = run_id
+        validation_result.meta["validation_time"] = run_id.run_time
+        return validation_result
+
     def _build_result_key(
         self,
         validation_definition: ValidationDefinition,
@@ -37,6 +37,16 @@ try:
 except (ImportError, AttributeError):
     sqlite = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment] # FIXME CoP
 
+try:
+    from sqlalchemy.dialects import postgresql
+except (ImportError, AttributeError):
+    postgresql = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment] # FIXME CoP
+
+try:
+    from sqlalchemy.dialects import mysql
+except (ImportError, AttributeError):
+    mysql = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment] # FIXME CoP
+
 try:
     from sqlalchemy.dialects import registry
 except (ImportError, AttributeError):
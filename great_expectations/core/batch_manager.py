@@ -164,6 +164,36 @@ class BatchManager:
     def save_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
         """
         Updates the data for the specified Batch in the cache
+
+        Metrics cached for the specified Batch are evicted if its previously loaded data is replaced
         """
+        previous_batch_data: Optional[BatchDataUnion] = self._batch_data_cache.get(batch_id)
+        if previous_batch_data is not None and not _is_same_batch_data(
+            previous_batch_data, batch_data
+        ):
+            self._execution_engine.evict_cached_metrics(batch_id=batch_id)
+
         self._batch_data_cache[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the specified Batch and its data from the cache and evicts all metrics cached for it
+        """
+        self._batch_data_cache.pop(batch_id, None)
+        self._batch_cache.pop(batch_id, None)
+
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+        if self._active_batch_id == batch_id:
+            self._active_batch_id = None
+
+        self._execution_engine.evict_cached_metrics(batch_id=batch_id)
+
+
+def _is_same_batch_data(batch_data: BatchDataUnion, other_batch_data: BatchDataUnion) -> bool:
+    # DataFrame-backed BatchData may be rebuilt around the same DataFrame when a Batch is reloaded.
+    return batch_data is other_batch_data or getattr(
+        batch_data, "dataframe", batch_data
+    ) is getattr(other_batch_data, "dataframe", other_batch_data)
@@ -9,15 +9,42 @@ from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 T = TypeVar("T")
 
+_CACHED_ID_ATTRIBUTE_NAME = "_cached_id"
+
 
 class IDDict(dict):
+    """Dictionary, whose contents identify it by means of its "to_id()" method.
+
+    The default id (i.e., computed using all keys, except "_id_ignore_keys") is requested in hot
+    loops (e.g., "MetricConfiguration.id").  It is memoized only while all values are immutable
+    (e.g., strings, numbers, and tuples of them), and invalidated whenever top-level contents are
+    modified; ids of dictionaries holding nested containers, which may be modified in place, are
+    computed on every call.  Copies do not carry the memoized id over.
+    """
+
     _id_ignore_keys: Set[str] = set()
 
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            # Using "vars()", since "DotDict" subclasses map attribute access to keys.
+            instance_attributes: dict = vars(self)
+            if _CACHED_ID_ATTRIBUTE_NAME in instance_attributes:
+                return instance_attributes[_CACHED_ID_ATTRIBUTE_NAME]
+
+            id_ = self._compute_id(id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys)
+            if all(_is_immutable(value) for value in self.values()):
+                instance_attributes[_CACHED_ID_ATTRIBUTE_NAME] = id_
+
+            return id_
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys):
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -28,6 +55,59 @@ class IDDict(dict):
         _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
         return hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
 
+    def _invalidate_id(self) -> None:
+        vars(self).pop(_CACHED_ID_ATTRIBUTE_NAME, None)
+
+    def __getstate__(self) -> dict:
+        # copies (and unpickled instances) recompute their id, rather than sharing a stale one
+        state: dict = dict(vars(self))
+        state.pop(_CACHED_ID_ATTRIBUTE_NAME, None)
+        return state
+
+    @override
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._invalidate_id()
+
+    @override
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._invalidate_id()
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc] # FIXME CoP
+        result = super().__ior__(other)
+        self._invalidate_id()
+        return result
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._invalidate_id()
+
+    @override
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._invalidate_id()
+        return result
+
+    @override
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._invalidate_id()
+        return result
+
+    @override
+    def popitem(self):
+        result = super().popitem()
+        self._invalidate_id()
+        return result
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate_id()
+
     @override
     def __hash__(self) -> int:  # type: ignore[override] # FIXME CoP
         """Overrides the default implementation"""
@@ -35,6 +115,13 @@ class IDDict(dict):
         return _result_hash
 
 
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_immutable(element) for element in value)
+
+    return value is None or isinstance(value, (str, bytes, int, float))
+
+
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict],
 ) -> Union[T, IDDict]:
@@ -247,7 +247,7 @@ class ValidationDefinition(BaseModel):
         return batch_definition
 
     @public_api
-    def run(
+    def run(  # noqa: PLR0913 # FIXME CoP
         self,
         *,
         checkpoint_id: Optional[str] = None,
@@ -255,6 +255,7 @@ class ValidationDefinition(BaseModel):
         expectation_parameters: Optional[SuiteParameterDict] = None,
         result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT,
         run_id: RunIdentifier | None = None,
+        profile_validation: bool = False,
     ) -> ExpectationSuiteValidationResult:
         """
         Runs a validation using the configured data and suite.
@@ -278,6 +279,9 @@ class ValidationDefinition(BaseModel):
               definition. Otherwise, it should be None.
             run_id: An identifier for this run. Typically, this should be set to None and it will
               be generated by this call.
+            profile_validation: If True, the performance profile of the validation (wall time,
+              queries issued, and rows scanned per metric and per expectation, as well as metric
+              cache hits) is added to the result's meta under the "validation_profile" key.
         """
         diagnostics = self.is_fresh()
         if not diagnostics.success:
@@ -291,8 +295,21 @@ class ValidationDefinition(BaseModel):
             batch_definition=self.batch_definition,
             batch_parameters=batch_parameters,
             result_format=result_format,
+            profile_validation=profile_validation,
         )
-        results = validator.validate_expectation_suite(self.suite, expectation_parameters)
+        try:
+            results = validator.validate_expectation_suite(self.suite, expectation_parameters)
+            (
+                expectation_suite_identifier,
+                validation_result_id,
+            ) = self._get_expectation_suite_and_validation_result_ids(
+                validator=validator, run_id=run_id
+            )
+        finally:
+            # Batch (and metrics computed on it) is not needed once its validation result is built,
+            # so that long-lived ExecutionEngines do not accumulate Batches of previous runs.
+            validator.unload_batch()
+
         results.meta["validation_id"] = self.id
         results.meta["checkpoint_id"] = checkpoint_id
 
@@ -309,13 +326,6 @@ class ValidationDefinition(BaseModel):
         else:
             results.meta["batch_parameters"] = None
 
-        (
-            expectation_suite_identifier,
-            validation_result_id,
-        ) = self._get_expectation_suite_and_validation_result_ids(
-            validator=validator, run_id=run_id
-        )
-
         ref = self._validation_results_store.store_validation_results(
             suite_validation_result=results,
             suite_validation_result_identifier=validation_result_id,
@@ -60,7 +60,11 @@ from great_expectations.core.factory import (
     ValidationDefinitionFactory,
 )
 from great_expectations.core.yaml_handler import YAMLHandler
-from great_expectations.data_context.store import Store, TupleStoreBackend
+from great_expectations.data_context.store import (
+    Store,
+    TupleStoreBackend,
+    ValidationResultsStore,
+)
 from great_expectations.data_context.templates import CONFIG_VARIABLES_TEMPLATE
 from great_expectations.data_context.types.base import (
     DataContextConfig,
@@ -110,9 +114,6 @@ if TYPE_CHECKING:
     from great_expectations.data_context.store.validation_definition_store import (
         ValidationDefinitionStore,
     )
-    from great_expectations.data_context.store.validation_results_store import (
-        ValidationResultsStore,
-    )
     from great_expectations.datasource.datasource_dict import DatasourceDict
     from great_expectations.datasource.fluent.interfaces import (
         BatchParameters,
@@ -2107,11 +2108,11 @@ class AbstractDataContext(ConfigPeer, ABC):
         selected_store = self.stores[validation_results_store_name]
 
         if run_id is None or batch_identifier is None:
-            # Get most recent run id
-            # NOTE : This method requires a (potentially very inefficient) list_keys call.
-            # It should probably move to live in an appropriate Store class,
-            # but when we do so, that Store will need to function as more than just a key-value Store.  # noqa: E501 # FIXME CoP
-            key_list = selected_store.list_keys()
+            # Get most recent run id (of the Expectation Suite)
+            if isinstance(selected_store, ValidationResultsStore):
+                key_list = selected_store.list_keys_for_suite(suite_name=expectation_suite_name)
+            else:
+                key_list = selected_store.list_keys()
             filtered_key_list = []
             for key in key_list:
                 if run_id is not None and key.run_id != run_id:
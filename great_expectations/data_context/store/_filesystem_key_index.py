@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class FilesystemKeyIndex:
+    """Persistent index of files in a directory tree (see "use_key_index" of
+    TupleFilesystemStoreBackend).
+
+    The index is a log file, in which every line records addition ("+") or removal ("-") of a file
+    (by its path, relative to the root directory).  Writers append to the log, and readers replay
+    only the lines appended since they last read it, so that listing files never walks the tree.
+    The log is compacted (rewritten to hold only current files) when it is rebuilt, and when it is
+    dominated by removals; rewritten logs start with a header line ("#") unique to the rewrite, by
+    which other readers notice them, and replay them from the start.
+
+    Writers (of any process) exclude each other by a lock file next to the log, so that entries are
+    neither interleaved (appends are not atomic on network file systems, such as NFS) nor lost to a
+    concurrent rewrite of the log.
+
+    Files added or removed behind the back of the index (e.g., by hand) are not noticed; rebuild()
+    walks the tree and rewrites the index.
+
+    Args:
+        index_filepath: path of the log file.
+        list_filepaths: callable, returning relative paths of all files in the directory tree.
+    """
+
+    # Minimum number of removals before the log is compacted.
+    COMPACTION_THRESHOLD = 1000
+    # Age (in seconds) of lock files, after which their writers are presumed dead.
+    STALE_LOCK_SECONDS = 30.0
+
+    def __init__(self, index_filepath: str, list_filepaths: Callable[[], List[str]]) -> None:
+        self._index_filepath = pathlib.Path(index_filepath)
+        self._list_filepaths = list_filepaths
+
+        # Insertion-ordered set of relative file paths.
+        self._filepaths: Dict[str, None] = {}
+        self._num_removals = 0
+        # First line of the log (see "_write()") and the offset up to which it has been replayed.
+        self._log_header: Optional[bytes] = None
+        self._offset = 0
+
+        self._lock = threading.Lock()
+        self._lock_filepath = self._index_filepath.with_name(f"{self._index_filepath.name}.lock")
+        self._lock_file_depth = 0
+
+    def list_filepaths(self, prefix: Tuple[str, ...] = ()) -> List[str]:
+        """Returns relative paths of indexed files in directory "prefix" (a tuple of components)."""
+        with self._lock:
+            self._refresh()
+            if not prefix:
+                return list(self._filepaths)
+
+            directory: str = os.path.join(*prefix) + os.sep  # noqa: PTH118 # FIXME CoP
+            return [filepath for filepath in self._filepaths if filepath.startswith(directory)]
+
+    def add(self, filepath: str) -> None:
+        filepath = os.path.normpath(filepath)
+        with self._lock:
+            self._refresh()
+            if filepath not in self._filepaths:
+                self._append(entries=[("+", filepath)])
+
+    def remove(self, filepath: str) -> None:
+        filepath = os.path.normpath(filepath)
+        with self._lock:
+            self._refresh()
+            if filepath in self._filepaths:
+                self._append(entries=[("-", filepath)])
+
+    def rebuild(self) -> None:
+        """Walks the directory tree, and rewrites the index to hold the files it finds."""
+        with self._lock, self._lock_file():
+            self._index()
+
+    def _index(self) -> None:
+        self._filepaths = {os.path.normpath(filepath): None for filepath in self._list_filepaths()}
+        self._write()
+
+    def _refresh(self) -> None:
+        """Replays entries, which (other) writers have appended to the log since its last read."""
+        if not self._read():
+            with self._lock_file():
+                # first use of the index (or the index has been deleted); index the existing files
+                if not self._read():
+                    self._index()
+                    return
+
+        if self._num_removals > max(self.COMPACTION_THRESHOLD, len(self._filepaths)):
+            with self._lock_file():
+                # entries appended before the lock was taken are kept by the compacted log
+                self._read()
+                self._write()
+
+    def _read(self) -> bool:
+        """Replays entries appended to the log since its last read; False, if there is no log."""
+        try:
+            infile = self._index_filepath.open("rb")
+        except FileNotFoundError:
+            return False
+
+        with infile:
+            # files of rewritten logs may be told apart by neither their inode nor their size
+            header: bytes = infile.readline()
+            if header != self._log_header:
+                # log has been rewritten
+                self._filepaths = {}
+                self._num_removals = 0
+                self._log_header = header
+                self._offset = 0
+
+            infile.seek(self._offset)
+            content: bytes = infile.read()
+
+        # ignore partially written last line (it is read once the writer completes it)
+        end: int = content.rfind(b"\n") + 1
+        self._replay(lines=content[:end].decode("utf-8").splitlines())
+        self._offset += end
+        return True
+
+    def _replay(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            try:
+                operation, filepath = json.loads(line)
+            except ValueError:
+                logger.warning(
+                    f'Skipping invalid line "{line}" of key index {self._index_filepath}.'
+                )
+                continue
+
+            if operation == "#":
+                continue
+
+            if operation == "+":
+                self._filepaths[filepath] = None
+            else:
+                self._filepaths.pop(filepath, None)
+                self._num_removals += 1
+
+    def _append(self, entries: List[Tuple[str, str]]) -> None:
+        content: bytes = "".join(f"{json.dumps(list(entry))}\n" for entry in entries).encode(
+            "utf-8"
+        )
+        with self._lock_file(), self._index_filepath.open("ab") as outfile:
+            outfile.write(content)
+
+        # replayed (in order with entries of other writers) when the index is next refreshed
+        self._refresh()
+
+    def _write(self) -> None:
+        """Rewrites the log to hold current files only (atomically, never exposing partial logs)."""
+        self._index_filepath.parent.mkdir(parents=True, exist_ok=True)
+        temporary_filepath = self._index_filepath.with_name(
+            f"{self._index_filepath.name}.{os.getpid()}.tmp"
+        )
+        header: bytes = f"{json.dumps(['#', uuid.uuid4().hex])}\n".encode()
+        content: bytes = header + "".join(
+            f"{json.dumps(['+', filepath])}\n" for filepath in self._filepaths
+        ).encode("utf-8")
+        temporary_filepath.write_bytes(content)
+        temporary_filepath.replace(self._index_filepath)
+
+        self._num_removals = 0
+        self._log_header = header
+        self._offset = len(content)
+
+    @contextlib.contextmanager
+    def _lock_file(self) -> Iterator[None]:
+        """Within this context, no other writer (of any process) writes to the log.
+
+        The lock file is created exclusively (which network file systems, such as NFS, support);
+        lock files older than STALE_LOCK_SECONDS, left behind by dead writers, are removed.
+        """
+        if self._lock_file_depth:
+            # the lock file is already held (e.g., while appending entries, the log is compacted)
+            self._lock_file_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_file_depth -= 1
+            return
+
+        self._index_filepath.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                self._lock_filepath.touch(exist_ok=False)
+                break
+            except FileExistsError:
+                pass
+
+            try:
+                lock_age: float = time.time() - self._lock_filepath.stat().st_mtime
+            except FileNotFoundError:
+                continue
+
+            if lock_age > self.STALE_LOCK_SECONDS:
+                logger.warning(f"Removing stale lock file {self._lock_filepath} of key index.")
+                self._lock_filepath.unlink(missing_ok=True)
+            else:
+                time.sleep(0.01)
+
+        self._lock_file_depth = 1
+        try:
+            yield
+        finally:
+            self._lock_file_depth = 0
+            self._lock_filepath.unlink(missing_ok=True)
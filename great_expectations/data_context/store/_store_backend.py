@@ -4,7 +4,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import pyparsing as pp
 
@@ -61,6 +61,11 @@ class StoreBackend(metaclass=ABCMeta):
     def store_name(self):
         return self._store_name
 
+    @property
+    def supports_bulk_writes(self) -> bool:
+        """Whether set_many() writes all values at once (rather than one by one, with _set())."""
+        return False
+
     def _construct_store_backend_id(self, suppress_warning: bool = False) -> Optional[uuid.UUID]:
         """
         Create a store_backend_id if one does not exist, and return it if it exists
@@ -124,6 +129,15 @@ class StoreBackend(metaclass=ABCMeta):
     def get_all(self):
         return self._get_all()
 
+    def get_many(self, keys: Sequence[tuple], **kwargs) -> list:
+        """Returns values of keys (in the same order); raises InvalidKeyError if any key is missing.
+
+        Store backends reading from remote object stores read values concurrently.
+        """
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
     def set(self, key, value, **kwargs):
         self._validate_key(key)
         self._validate_value(value)
@@ -134,6 +148,20 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")  # noqa: TRY003 # FIXME CoP
 
+    def set_many(self, items: Sequence[Tuple[tuple, Any]], **kwargs) -> None:
+        """Sets values of many (key, value) pairs at once.
+
+        Store backends writing to databases write all values in bulk (in one transaction).
+        """
+        for key, value in items:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            self._set_many(items, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError("ValueError while calling _set_many on store backend.")  # noqa: TRY003 # FIXME CoP
+
     def add(self, key, value, **kwargs):
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -219,10 +247,17 @@ class StoreBackend(metaclass=ABCMeta):
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
 
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> list:
+        return [self._get(key, **kwargs) for key in keys]
+
     @abstractmethod
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
 
+    def _set_many(self, items: Sequence[Tuple[tuple, Any]], **kwargs) -> None:
+        for key, value in items:
+            self._set(key, value, **kwargs)
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs) -> None:
         raise NotImplementedError
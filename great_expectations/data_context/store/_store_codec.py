@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import base64
+import bz2
+import gzip
+from typing import Callable, Dict, Tuple
+
+from great_expectations.exceptions import StoreConfigurationError, StoreError
+
+# Values encoded by a codec start with the marker, followed by the name of the codec (and a colon),
+# so that readers detect (and decode) them regardless of the codec configured for the store.
+STORE_CODEC_MARKER = "gx-store-codec:"
+
+_CODECS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "gzip": (
+        lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+        gzip.decompress,
+    ),
+    "bz2": (bz2.compress, bz2.decompress),
+}
+
+
+def validate_store_codec(codec: str) -> None:
+    if codec not in _CODECS:
+        raise StoreConfigurationError(  # noqa: TRY003 # FIXME CoP
+            f'Unknown store codec "{codec}"; supported codecs are: {", ".join(sorted(_CODECS))}.'
+        )
+
+
+def encode_value(value: str, codec: str) -> str:
+    """Compresses serialized value with codec.
+
+    Store backends read and write text, so compressed bytes are base64-encoded.
+    """
+    validate_store_codec(codec)
+    compress, _ = _CODECS[codec]
+    encoded: str = base64.b64encode(compress(value.encode("utf-8"))).decode("ascii")
+    return f"{STORE_CODEC_MARKER}{codec}:{encoded}"
+
+
+def is_encoded_value(value: object) -> bool:
+    return isinstance(value, str) and value.startswith(STORE_CODEC_MARKER)
+
+
+def decode_value(value: str) -> str:
+    """Decompresses value written by encode_value() (with whichever codec it was encoded)."""
+    codec, _, encoded = value[len(STORE_CODEC_MARKER) :].partition(":")
+    if codec not in _CODECS:
+        raise StoreError(  # noqa: TRY003 # FIXME CoP
+            f'Unable to decode value written with unknown store codec "{codec}".'
+        )
+    _, decompress = _CODECS[codec]
+    return decompress(base64.b64decode(encoded)).decode("utf-8")
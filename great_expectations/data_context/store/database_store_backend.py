@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import sqlalchemy
@@ -27,6 +27,20 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    """Uses a database table (with a column for every key element and a "value" column) as a store.
+
+    Additional keyword arguments are passed to sqlalchemy.create_engine(); among others, these
+    configure the connection pool of the store (e.g., "pool_size", "max_overflow", "pool_recycle",
+    "pool_pre_ping").
+
+    get_many() and set_many() read and write many keys in bulk: keys are selected in batches (of
+    BULK_BATCH_SIZE keys), and values are written in one transaction, with dialect-native upserts
+    (INSERT ... ON CONFLICT on PostgreSQL and SQLite, INSERT ... ON DUPLICATE KEY UPDATE on MySQL).
+    """
+
+    # Number of keys selected by one query of get_many().
+    BULK_BATCH_SIZE = 100
+
     def __init__(  # noqa: C901, PLR0912, PLR0913 # FIXME CoP
         self,
         table_name,
@@ -228,18 +242,19 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs,
         )
 
+    def _build_key_clause(self, key):
+        return sa.and_(
+            *(
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            )
+        )
+
     def _get(self, key):  # type: ignore[explicit-override] # FIXME
         sel = (
             sa.select(sa.column("value"))
             .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
-            )
+            .where(self._build_key_clause(key))
         )
         try:
             with self.engine.begin() as connection:
@@ -251,7 +266,41 @@ class DatabaseStoreBackend(StoreBackend):
 
     @override
     def _get_all(self) -> list[Any]:
-        raise NotImplementedError
+        sel = sa.select(sa.column("value")).select_from(self._table)
+        try:
+            with self.engine.begin() as connection:
+                return [row[0] for row in connection.execute(sel).fetchall()]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {e!s}")
+            raise gx_exceptions.StoreError("Unable to fetch values")  # noqa: TRY003 # FIXME CoP
+
+    @override
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> list:
+        columns = [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        values: Dict[Tuple[str, ...], Any] = {}
+        try:
+            with self.engine.begin() as connection:
+                for start in range(0, len(keys), self.BULK_BATCH_SIZE):
+                    batch = keys[start : start + self.BULK_BATCH_SIZE]
+                    sel = (
+                        sa.select(*columns, self._table.columns.value)
+                        .select_from(self._table)
+                        .where(sa.or_(*(self._build_key_clause(key) for key in batch)))
+                    )
+                    for row in connection.execute(sel).fetchall():
+                        values[tuple(str(element) for element in row[:-1])] = row[-1]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {e!s}")
+            raise gx_exceptions.StoreError("Unable to fetch values")  # noqa: TRY003 # FIXME CoP
+
+        result = []
+        for key in keys:
+            value_key = tuple(str(element) for element in key)
+            if value_key not in values:
+                raise gx_exceptions.StoreError(f"Unable to fetch value for key: {key!s}")  # noqa: TRY003 # FIXME CoP
+            result.append(values[value_key])
+
+        return result
 
     @override
     def _set(self, key, value, allow_update=True, **kwargs) -> None:
@@ -260,11 +309,7 @@ class DatabaseStoreBackend(StoreBackend):
 
         if allow_update:
             if self.has_key(key):
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
-                )
+                ins = self._table.update().where(self._build_key_clause(key)).values(**cols)
             else:
                 ins = self._table.insert().values(**cols)  # type: ignore[assignment] # FIXME CoP
         else:
@@ -281,6 +326,106 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {e!s} while trying to store key"
                 )
 
+    @property
+    @override
+    def supports_bulk_writes(self) -> bool:
+        return True
+
+    @override
+    def _set_many(self, items: Sequence[Tuple[tuple, Any]], allow_update=True, **kwargs) -> None:
+        if not allow_update:
+            # inserts of existing keys are only accepted if their values are unchanged (see _set)
+            for key, value in items:
+                self._set(key, value, allow_update=False, **kwargs)
+            return
+
+        rows: List[Dict[str, Any]] = [
+            {**dict(zip(self.key_columns, key)), "value": value} for key, value in items
+        ]
+        if not rows:
+            return
+
+        upsert = self._build_upsert()
+        try:
+            with self.engine.begin() as connection:
+                if upsert is not None:
+                    connection.execute(upsert, rows)
+                else:
+                    self._update_or_insert_rows(connection=connection, rows=rows)
+        except SQLAlchemyError as e:
+            raise gx_exceptions.StoreBackendError(  # noqa: TRY003 # FIXME CoP
+                f"Unable to store values: got sqlalchemy error {e!s}"
+            )
+
+    def _build_upsert(self) -> Optional[Any]:
+        """Returns dialect-native upsert statement (or None, if dialect of engine has none)."""
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name in ("postgresql", "sqlite"):
+            dialect = sqlalchemy.postgresql if dialect_name == "postgresql" else sqlalchemy.sqlite
+            statement = dialect.insert(self._table)
+            return statement.on_conflict_do_update(
+                index_elements=self.key_columns,
+                set_={"value": statement.excluded.value},
+            )
+
+        if dialect_name == "mysql":
+            statement = sqlalchemy.mysql.insert(self._table)
+            return statement.on_duplicate_key_update(value=statement.inserted.value)
+
+        return None
+
+    def _update_or_insert_rows(self, connection, rows: List[Dict[str, Any]]) -> None:
+        """Updates rows of existing keys and inserts the others (in transaction of "connection")."""
+        key_columns = [getattr(self._table.columns, key_col) for key_col in self.key_columns]
+        existing_keys = set()
+        for start in range(0, len(rows), self.BULK_BATCH_SIZE):
+            batch = rows[start : start + self.BULK_BATCH_SIZE]
+            sel = (
+                sa.select(*key_columns)
+                .select_from(self._table)
+                .where(
+                    sa.or_(
+                        *(
+                            self._build_key_clause([row[key_col] for key_col in self.key_columns])
+                            for row in batch
+                        )
+                    )
+                )
+            )
+            existing_keys.update(
+                tuple(str(element) for element in row) for row in connection.execute(sel).fetchall()
+            )
+
+        rows_to_update: List[Dict[str, Any]] = []
+        rows_to_insert: List[Dict[str, Any]] = []
+        for row in rows:
+            if tuple(str(row[key_col]) for key_col in self.key_columns) in existing_keys:
+                rows_to_update.append(
+                    {
+                        **{f"key_{key_col}": row[key_col] for key_col in self.key_columns},
+                        "value": row["value"],
+                    }
+                )
+            else:
+                rows_to_insert.append(row)
+
+        if rows_to_update:
+            update = (
+                self._table.update()
+                .where(
+                    sa.and_(
+                        *(
+                            getattr(self._table.columns, key_col) == sa.bindparam(f"key_{key_col}")
+                            for key_col in self.key_columns
+                        )
+                    )
+                )
+                .values(value=sa.bindparam("value"))
+            )
+            connection.execute(update, rows_to_update)
+        if rows_to_insert:
+            connection.execute(self._table.insert(), rows_to_insert)
+
     @override
     def _move(self) -> None:  # type: ignore[override] # FIXME CoP
         raise NotImplementedError
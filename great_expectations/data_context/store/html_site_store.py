@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -357,6 +358,32 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    # Key of the (JSON) manifest of rendered resources, kept by incremental builds of the site.
+    MANIFEST_KEY = ("data_docs_manifest.json",)
+
+    def get_manifest(self) -> Optional[dict]:
+        """Returns the manifest of rendered resources (None if the site has none)."""
+        store_backend = self.store_backends["static_assets"]
+        if isinstance(store_backend, GXCloudStoreBackend) or not store_backend.has_key(
+            self.MANIFEST_KEY
+        ):
+            return None
+
+        return json.loads(store_backend.get(self.MANIFEST_KEY))
+
+    def write_manifest(self, manifest: dict) -> None:
+        """Writes the manifest of rendered resources, using the "static_assets" backend store."""
+        store_backend = self.store_backends["static_assets"]
+        if isinstance(store_backend, GXCloudStoreBackend):
+            return
+
+        store_backend.set(
+            self.MANIFEST_KEY,
+            json.dumps(manifest),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import json
-from typing import ClassVar, Type
+from typing import ClassVar, List, Type
 
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.types.resource_identifiers import (
+    BatchMetricIdentifier,
     ValidationMetricIdentifier,
 )
 from great_expectations.util import (
@@ -22,6 +23,15 @@ class MetricStore(Store):
     """
 
     _key_class: ClassVar[Type] = ValidationMetricIdentifier
+    _default_table_name: ClassVar[str] = "ge_metrics"
+    _default_key_columns: ClassVar[List[str]] = [
+        "run_name",
+        "run_time",
+        "data_asset_name",
+        "expectation_suite_identifier",
+        "metric_name",
+        "metric_kwargs_id",
+    ]
 
     def __init__(self, store_backend=None, store_name=None) -> None:
         if store_backend is not None:
@@ -35,19 +45,9 @@ class MetricStore(Store):
             if issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
                 if "table_name" not in store_backend:
-                    store_backend["table_name"] = store_backend.get("table_name", "ge_metrics")
+                    store_backend["table_name"] = self._default_table_name
                 if "key_columns" not in store_backend:
-                    store_backend["key_columns"] = store_backend.get(
-                        "key_columns",
-                        [
-                            "run_name",
-                            "run_time",
-                            "data_asset_name",
-                            "expectation_suite_identifier",
-                            "metric_name",
-                            "metric_kwargs_id",
-                        ],
-                    )
+                    store_backend["key_columns"] = list(self._default_key_columns)
 
         super().__init__(store_backend=store_backend, store_name=store_name)
 
@@ -57,3 +57,19 @@ class MetricStore(Store):
     def deserialize(self, value):  # type: ignore[explicit-override] # FIXME
         if value:
             return json.loads(value)["value"]
+
+
+class BatchMetricStore(MetricStore):
+    """
+    A BatchMetricStore persists resolved metric values between runs, keyed by fingerprint of Batch
+    data they were computed on, so that metrics of unchanged Batch data do not need to be
+    recomputed.
+    """
+
+    _key_class: ClassVar[Type] = BatchMetricIdentifier
+    _default_table_name: ClassVar[str] = "ge_batch_metrics"
+    _default_key_columns: ClassVar[List[str]] = [
+        "batch_fingerprint",
+        "metric_name",
+        "metric_kwargs_id",
+    ]
@@ -9,6 +9,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
 )
@@ -232,15 +233,24 @@ class Store:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.get(key)
 
-        if self.cloud_mode:
-            self._validate_key(key)
-            value = self._store_backend.get(self.key_to_tuple(key))
-            # TODO [Robby] MER-285: Handle non-200 http errors
-            if value:
-                value = self.gx_cloud_response_json_to_object_dict(response_json=value)
-        else:
+        self._validate_key(key)
+        value = self._store_backend.get(self.key_to_tuple(key))
+        return self._deserialize_stored_value(value)
+
+    def get_many(self, keys: Sequence[DataContextKey]) -> list[Optional[Any]]:
+        """Like get(), for many keys at once; store backends may read values concurrently.
+
+        Returns values in the order of keys, and raises InvalidKeyError if any key is missing.
+        """
+        for key in keys:
             self._validate_key(key)
-            value = self._store_backend.get(self.key_to_tuple(key))
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [self._deserialize_stored_value(value) for value in values]
+
+    def _deserialize_stored_value(self, value: Any) -> Optional[Any]:
+        # TODO [Robby] MER-285: Handle non-200 http errors
+        if value and self.cloud_mode:
+            value = self.gx_cloud_response_json_to_object_dict(response_json=value)
 
         if value:
             return self.deserialize(value)
@@ -292,6 +302,14 @@ class Store:
         self._validate_key(key)
         return self._store_backend.set(self.key_to_tuple(key), self.serialize(value), **kwargs)
 
+    def set_many(self, items: Sequence[Tuple[DataContextKey, Any]], **kwargs) -> None:
+        """Like set(), for many (key, value) pairs at once; store backends may write in bulk."""
+        for key, _ in items:
+            self._validate_key(key)
+        self._store_backend.set_many(
+            [(self.key_to_tuple(key), self.serialize(value)) for key, value in items], **kwargs
+        )
+
     def add(self, key: DataContextKey, value: Any, **kwargs) -> None:
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
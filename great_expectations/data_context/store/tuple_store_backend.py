@@ -9,10 +9,12 @@ import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.data_context.store._filesystem_key_index import FilesystemKeyIndex
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
 from great_expectations.util import filter_properties_dict
@@ -29,6 +31,9 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     three components.
     """  # noqa: E501 # FIXME CoP
 
+    # Maximum number of objects read at the same time by get_many() of remote object store backends.
+    MAX_CONCURRENT_READS = 16
+
     def __init__(  # noqa: PLR0913 # FIXME CoP
         self,
         filepath_template=None,
@@ -213,6 +218,19 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     def config(self) -> dict:
         return self._config  # type: ignore[attr-defined] # FIXME CoP
 
+    def _get_many_concurrently(
+        self, keys: Sequence[tuple], get: Callable[[tuple], Any]
+    ) -> List[Any]:
+        """Calls "get" for every key on a pool of threads (reads of object stores are I/O bound)."""
+        if len(keys) <= 1:
+            return [get(key) for key in keys]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENT_READS, len(keys)),
+            thread_name_prefix="gx-store-reads",
+        ) as executor:
+            return list(executor.map(get, keys))
+
 
 class TupleFilesystemStoreBackend(TupleStoreBackend):
     """Uses a local filepath as a store.
@@ -220,8 +238,14 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    With use_key_index=True, files of the store are recorded in a key index (kept in base_directory), from
+    which keys are listed instead of walking the directory tree; use rebuild_key_index() if files were
+    added or removed other than through the store backend.
     """  # noqa: E501 # FIXME CoP
 
+    KEY_INDEX_FILENAME = ".ge_store_key_index"
+
     def __init__(  # noqa: PLR0913 # FIXME CoP
         self,
         base_directory,
@@ -236,6 +260,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        use_key_index: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -269,6 +294,14 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             str(os.path.dirname(self.full_base_directory)),  # noqa: PTH120 # FIXME CoP
             exist_ok=True,
         )
+        self._key_index: Optional[FilesystemKeyIndex] = None
+        if use_key_index:
+            self._key_index = FilesystemKeyIndex(
+                index_filepath=os.path.join(  # noqa: PTH118 # FIXME CoP
+                    self.full_base_directory, self.KEY_INDEX_FILENAME
+                ),
+                list_filepaths=self._walk_filepaths,
+            )
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -288,6 +321,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "use_key_index": use_key_index,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -326,6 +360,8 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+        if self._key_index:
+            self._key_index.add(self._convert_key_to_filepath(key))
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):  # type: ignore[explicit-override] # FIXME
@@ -341,13 +377,37 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(source_path):  # noqa: PTH110 # FIXME CoP
             os.makedirs(dest_dir, exist_ok=True)  # noqa: PTH103 # FIXME CoP
             shutil.move(source_path, dest_path)
+            if self._key_index:
+                self._key_index.remove(self._convert_key_to_filepath(source_key))
+                self._key_index.add(self._convert_key_to_filepath(dest_key))
             return dest_key
 
         return False
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        if self._key_index:
+            filepaths = self._key_index.list_filepaths(prefix=prefix)
+        else:
+            filepaths = self._walk_filepaths(prefix=prefix)
+
         key_list = []
+        for filepath in filepaths:
+            if self._is_missing_prefix_or_suffix(
+                filepath_prefix=self.filepath_prefix,
+                filepath_suffix=self.filepath_suffix,
+                key=filepath,
+            ):
+                continue
+            key = self._convert_filepath_to_key(filepath)
+            if key and not self.is_ignored_key(key):
+                key_list.append(key)
+
+        return key_list
+
+    def _walk_filepaths(self, prefix: Tuple = ()) -> List[str]:
+        """Returns paths (relative to base directory) of all files of the store under "prefix"."""
+        filepaths = []
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118 # FIXME CoP
         ):
@@ -360,21 +420,27 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     self.full_base_directory,
                 )
                 if relative_path == ".":
+                    if file_name.startswith(self.KEY_INDEX_FILENAME):
+                        continue
                     filepath = file_name
                 else:
                     filepath = os.path.join(relative_path, file_name)  # noqa: PTH118 # FIXME CoP
 
-                if self._is_missing_prefix_or_suffix(
-                    filepath_prefix=self.filepath_prefix,
-                    filepath_suffix=self.filepath_suffix,
-                    key=filepath,
-                ):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+                filepaths.append(filepath)
 
-        return key_list
+        return filepaths
+
+    def rebuild_key_index(self) -> None:
+        """Rebuilds key index (see use_key_index) from files found in base directory.
+
+        Use it if files were added to (or removed from) base directory other than through the
+        store backend, e.g., copied from another project.
+        """
+        if not self._key_index:
+            raise StoreBackendError(  # noqa: TRY003 # FIXME CoP
+                f"{self.__class__.__name__} does not use key index (see use_key_index)."
+            )
+        self._key_index.rebuild()
 
     def rrmdir(self, mroot, curpath) -> None:
         """
@@ -403,6 +469,8 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(filepath):  # noqa: PTH110 # FIXME CoP
             d_path = os.path.dirname(filepath)  # noqa: PTH120 # FIXME CoP
             os.remove(filepath)  # noqa: PTH107 # FIXME CoP
+            if self._key_index:
+                self._key_index.remove(self._convert_key_to_filepath(key))
             self.rrmdir(self.full_base_directory, d_path)
             return True
         return False
@@ -497,6 +565,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        self._client = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -540,22 +609,28 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):  # type: ignore[explicit-override] # FIXME
-        client = self._create_client()
+        client = self._get_client()
         s3_object_key = self._build_s3_object_key(key)
         return self._get_by_s3_object_key(client, s3_object_key)
 
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
+        NOTE: S3 has no bulk download; objects are downloaded concurrently (see _get_many).
         See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
         for the docs.
         """
-        client = self._create_client()
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
-        s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        return self._get_many(keys)
+
+    @override
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> list:
+        client = self._get_client()
+        return self._get_many_concurrently(
+            keys=keys,
+            get=lambda key: self._get_by_s3_object_key(client, self._build_s3_object_key(key)),
+        )
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -656,7 +731,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         else:
             # build s3 endpoint when no endpoint_url is configured
 
-            location = self._create_client().get_bucket_location(Bucket=self.bucket)[
+            location = self._get_client().get_bucket_location(Bucket=self.bucket)[
                 "LocationConstraint"
             ]
 
@@ -734,6 +809,12 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _create_client(self):
         return aws.boto3.client("s3", **self.boto3_options)
 
+    def _get_client(self):
+        """Returns client shared by all reads of store backend (boto3 clients are thread-safe)."""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
     def _create_resource(self):
         return aws.boto3.resource("s3", **self.boto3_options)
 
@@ -786,6 +867,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self._client = None
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -828,23 +910,30 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _get(self, key):  # type: ignore[explicit-override] # FIXME
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        bucket = self._get_client().bucket(self.bucket)
         return self._get_by_gcs_object_key(bucket, key)
 
     @override
     def _get_all(self) -> list[Any]:
-        from great_expectations.compatibility import google
-
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
-
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
 
-        return [self._get_by_gcs_object_key(bucket, key) for key in keys]
+        return self._get_many(keys)
+
+    @override
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> list:
+        bucket = self._get_client().bucket(self.bucket)
+        return self._get_many_concurrently(
+            keys=keys, get=lambda key: self._get_by_gcs_object_key(bucket, key)
+        )
+
+    def _get_client(self):
+        """Returns client shared by all reads of this store backend."""
+        if self._client is None:
+            from great_expectations.compatibility import google
+
+            self._client = google.storage.Client(project=self.project)
+        return self._client
 
     def _get_by_gcs_object_key(self, bucket, key):
         gcs_object_key = self._build_gcs_object_key(key)
@@ -1075,7 +1164,12 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
     @override
     def _get_all(self) -> list[Any]:
         keys = self.list_keys()
-        return [self._get(key) for key in keys]
+        return self._get_many(keys)
+
+    @override
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> list:
+        # container client is cached (see _container_client) and shared by all reads
+        return self._get_many_concurrently(keys=keys, get=self._get)
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):  # type: ignore[explicit-override] # FIXME
         from great_expectations.compatibility.azure import ContentSettings
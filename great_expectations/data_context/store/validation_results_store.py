@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Type
+import contextlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, List, Optional, Tuple, Type
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
 )
+from great_expectations.data_context.store._store_codec import (
+    decode_value,
+    encode_value,
+    is_encoded_value,
+    validate_store_codec,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
+from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -24,13 +34,110 @@ from great_expectations.util import (
 )
 
 if TYPE_CHECKING:
+    import datetime
+
     from great_expectations.data_context.types.refs import GXCloudResourceRef
 
 
+logger = logging.getLogger(__name__)
+
+# Deferred writes, into which current thread sets Validation Results (see "deferring_writes()").
+_deferred_writes = threading.local()
+
+
+class DeferredWrites:
+    """Validation Results of one ValidationResultsStore, whose writes are deferred.
+
+    See "ValidationResultsStore.defer_writes()".
+
+    Args:
+        store: ValidationResultsStore, into which Validation Results are written
+    """
+
+    def __init__(self, store: ValidationResultsStore) -> None:
+        self._store = store
+        self._values: Dict[ValidationResultIdentifier, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> ValidationResultsStore:
+        return self._store
+
+    def set(self, key: ValidationResultIdentifier, value: Any) -> None:
+        with self._lock:
+            self._values[key] = value
+
+    def get(self, key: ValidationResultIdentifier) -> Optional[Any]:
+        with self._lock:
+            return self._values.get(key)
+
+    def write(self) -> None:
+        """Writes deferred Validation Results (all together, through "set_many()")."""
+        with self._lock:
+            values, self._values = self._values, {}
+
+        if values:
+            self._store.store_backend.set_many(
+                [(self._store.key_to_tuple(key), value) for key, value in values.items()]
+            )
+
+
+def get_deferred_writes() -> Optional[DeferredWrites]:
+    """Returns deferred writes, into which current thread sets Validation Results (if any)."""
+    return getattr(_deferred_writes, "deferred_writes", None)
+
+
+@contextlib.contextmanager
+def writing_deferred(deferred_writes: Optional[DeferredWrites]) -> Iterator[None]:
+    """Within this context, Validation Results set in current thread are deferred into given
+    deferred writes, and written when it exits.
+
+    Validation Results deferred before an exception are still written; should writing them fail as
+    well, the failure is logged, rather than raised in place of the exception.
+    """
+    if deferred_writes is None:
+        yield
+        return
+
+    try:
+        with deferring_writes(deferred_writes):
+            yield
+    except BaseException:
+        try:
+            deferred_writes.write()
+        except Exception:
+            logger.exception("Unable to write deferred Validation Results.")
+        raise
+
+    deferred_writes.write()
+
+
+@contextlib.contextmanager
+def deferring_writes(deferred_writes: Optional[DeferredWrites]) -> Iterator[None]:
+    """Within this context, Validation Results set in current thread go to "deferred_writes".
+
+    Threads working on behalf of the thread, which deferred writes (e.g., running Validation
+    Definitions of a Checkpoint concurrently), enter this context with "get_deferred_writes()" of
+    that thread.
+    """
+    previous_deferred_writes: Optional[DeferredWrites] = get_deferred_writes()
+    _deferred_writes.deferred_writes = deferred_writes
+    try:
+        yield
+    finally:
+        _deferred_writes.deferred_writes = previous_deferred_writes
+
+
 class ValidationResultsStore(Store):
     """
     A ValidationResultsStore manages Validation Results to ensure they are accessible via a Data Context for review and rendering into Data Docs.
 
+    With "codec" (e.g., "gzip"), Validation Results are written compressed; stored values carry a marker of their codec,
+    so that Validation Results written with any codec (or none) are read back regardless of the configured codec.
+
+    Within writing_deferred() of defer_writes(), Validation Results set in current thread are not written one by one,
+    but all together (through set_many()) when the context exits.
+
     --ge-feature-maturity-info--
 
         id: validation_results_store_filesystem
@@ -98,9 +205,19 @@ class ValidationResultsStore(Store):
 
     _key_class: ClassVar[Type] = ValidationResultIdentifier
 
-    def __init__(self, store_backend=None, runtime_environment=None, store_name=None) -> None:
+    def __init__(
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        codec: Optional[str] = None,
+    ) -> None:
         self._expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema()
 
+        if codec is not None:
+            validate_store_codec(codec)
+        self._codec = codec
+
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -139,6 +256,7 @@ class ValidationResultsStore(Store):
             "store_backend": store_backend,
             "runtime_environment": runtime_environment,
             "store_name": store_name,
+            "codec": codec,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -160,6 +278,14 @@ class ValidationResultsStore(Store):
     def serialize(self, value):  # type: ignore[explicit-override] # FIXME
         if self.cloud_mode:
             return value.to_json_dict()
+        if self._codec:
+            # indentation only adds to the size (and serialization time) of compressed values
+            return encode_value(
+                self._expectationSuiteValidationResultSchema.dumps(
+                    value.to_json_dict(), sort_keys=True
+                ),
+                codec=self._codec,
+            )
         return self._expectationSuiteValidationResultSchema.dumps(
             value.to_json_dict(), indent=2, sort_keys=True
         )
@@ -167,8 +293,9 @@ class ValidationResultsStore(Store):
     def deserialize(self, value):  # type: ignore[explicit-override] # FIXME
         if isinstance(value, dict):
             return self._expectationSuiteValidationResultSchema.load(value)
-        else:
-            return self._expectationSuiteValidationResultSchema.loads(value)
+        if is_encoded_value(value):
+            value = decode_value(value)
+        return self._expectationSuiteValidationResultSchema.loads(value)
 
     @property
     @override
@@ -202,6 +329,81 @@ class ValidationResultsStore(Store):
             expectation_suite_id=expectation_suite_id,
         )
 
+    def _get_deferred_writes(self) -> Optional[DeferredWrites]:
+        deferred_writes: Optional[DeferredWrites] = get_deferred_writes()
+        if deferred_writes is None or deferred_writes.store is not self:
+            return None
+
+        return deferred_writes
+
+    @override
+    def get(self, key):
+        deferred_writes: Optional[DeferredWrites] = self._get_deferred_writes()
+        if deferred_writes is not None:
+            value = deferred_writes.get(key)
+            if value is not None:
+                return self.deserialize(value)
+
+        return super().get(key)
+
+    @override
+    def set(self, key, value, **kwargs):
+        deferred_writes: Optional[DeferredWrites] = self._get_deferred_writes()
+        if deferred_writes is not None and key != StoreBackend.STORE_BACKEND_ID_KEY:
+            self._validate_key(key)
+            deferred_writes.set(key, self.serialize(value))
+            return None
+
+        return super().set(key, value, **kwargs)
+
+    def defer_writes(self) -> Optional[DeferredWrites]:
+        """Returns deferred writes of Validation Results, to be set within "writing_deferred()".
+
+        Checkpoints use it to persist results of all of their Validation Definitions at once, in
+        one bulk upsert.  Only store backends writing values in bulk (e.g., DatabaseStoreBackend)
+        defer writes; for others, which would write deferred values one by one anyway (holding
+        results of the whole run in memory meanwhile), None is returned.  Writes to GX Cloud, which
+        returns a reference to every stored Validation Result, are not deferred either.
+
+        Only Validation Results set by threads within "writing_deferred()" (or
+        "deferring_writes()") of the returned deferred writes are deferred; they are read back
+        (with "get()") by these threads only, and seen by others (e.g., other Checkpoint runs) once
+        they are written.
+        """
+        if self.cloud_mode or not self.store_backend.supports_bulk_writes:
+            return None
+
+        return DeferredWrites(store=self)
+
+    def list_keys_for_suite(
+        self, suite_name: str, run_time: Optional[datetime.datetime] = None
+    ) -> List[ValidationResultIdentifier]:
+        """Lists keys of Validation Results of an Expectation Suite (optionally, of one run time).
+
+        Only keys under the Expectation Suite are listed from store backends, which lay keys out by
+        their components (e.g., TupleFilesystemStoreBackend without filepath_template; with
+        use_key_index, this does not walk any directories).
+        """
+        prefix: Tuple[str, ...] = ()
+        if not (
+            isinstance(self._store_backend, TupleStoreBackend)
+            and self._store_backend.filepath_template
+        ):
+            prefix = self.key_to_tuple(ExpectationSuiteIdentifier(name=suite_name))
+
+        keys = [
+            self.tuple_to_key(key)
+            for key in self._store_backend.list_keys(prefix=prefix)
+            if key != StoreBackend.STORE_BACKEND_ID_KEY
+        ]
+        return [
+            key
+            for key in keys
+            if isinstance(key, ValidationResultIdentifier)
+            and key.expectation_suite_identifier.name == suite_name
+            and (run_time is None or key.run_id.run_time == run_time)
+        ]
+
     @staticmethod
     def parse_result_url_from_gx_cloud_ref(ref: GXCloudResourceRef) -> str | None:
         return ref.response["data"]["result_url"]
@@ -222,6 +222,28 @@ class MetricIdentifier(DataContextKey):
         return cls(*tuple_)
 
 
+class BatchMetricIdentifier(MetricIdentifier):
+    """A BatchMetricIdentifier serves as a key to store and retrieve Metrics computed on Batch data
+    with given fingerprint."""
+
+    def __init__(self, batch_fingerprint, metric_name, metric_kwargs_id) -> None:
+        super().__init__(metric_name, metric_kwargs_id)
+        self._batch_fingerprint = batch_fingerprint
+
+    @property
+    def batch_fingerprint(self):
+        return self._batch_fingerprint
+
+    def to_tuple(self):  # type: ignore[explicit-override] # FIXME
+        return (self.batch_fingerprint, *super().to_tuple())
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if tuple_[-1] == "__":
+            return cls(*tuple_[:-1], None)
+        return cls(*tuple_)
+
+
 class ValidationMetricIdentifier(MetricIdentifier):
     def __init__(
         self,
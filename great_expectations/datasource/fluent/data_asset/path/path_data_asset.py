@@ -202,6 +202,15 @@ class PathDataAsset(DataAsset, Generic[DatasourceT, PartitionerT], ABC):
             ) from e
         raise TestConnectionError(self._test_connection_error_message)
 
+    def refresh_data_references(self) -> None:
+        """Forgets the data references listed for this DataAsset, so that they are listed anew.
+
+        Data references persisted to a data reference index directory (such as the one configured
+        with `s3_data_reference_index_directory`) are listed incrementally, which may miss data
+        references removed, or added out of order, since they were last listed.
+        """
+        self._data_connector.refresh_data_references()
+
     def _batch_spec_options_from_batch_request(self, batch_request: BatchRequest) -> dict:
         """Build a set of options for use in a batch spec from a batch request.
 
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final, List, Optional
+
+if TYPE_CHECKING:
+    from great_expectations.alias_types import PathStr
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DataReferenceSnapshot:
+    """Data references listed by a FilePathDataConnector.
+
+    Args:
+        data_references: listed data references.
+        listed_at: time (seconds since the epoch), at which listing started.
+        state: connector specific state of listing (e.g., last listed key), used to list
+            incrementally.
+    """
+
+    data_references: List[str]
+    listed_at: float
+    state: dict = field(default_factory=dict)
+
+
+class DataReferenceIndex:
+    """Persistent snapshot of data references listed by a FilePathDataConnector.
+
+    Snapshots outlive connectors (and processes), so that connectors list only data references
+    added since (see FilePathDataConnector._list_data_references_since), rather than all of them.
+    The index file is replaced atomically; unreadable index files, and those of other sources or
+    versions, are treated as missing.
+
+    Args:
+        index_filepath: path of the index file.
+        source: identity of listed data (e.g., bucket, prefix, and listing options).
+    """
+
+    VERSION: Final[int] = 1
+
+    def __init__(self, index_filepath: PathStr, source: str) -> None:
+        self._index_filepath = pathlib.Path(index_filepath)
+        self._source = source
+
+    @classmethod
+    def in_directory(cls, directory: PathStr, source: str) -> DataReferenceIndex:
+        """Returns index of source, kept in directory (in file named after hash of source)."""
+        filename: str = f"{hashlib.sha256(source.encode('utf-8')).hexdigest()}.json"
+        return cls(index_filepath=pathlib.Path(directory) / filename, source=source)
+
+    @property
+    def index_filepath(self) -> pathlib.Path:
+        return self._index_filepath
+
+    def load(self) -> Optional[DataReferenceSnapshot]:
+        try:
+            with self._index_filepath.open(encoding="utf-8") as f:
+                index: dict = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable data reference index {self._index_filepath}: {e}")
+            return None
+
+        if index.get("version") != self.VERSION or index.get("source") != self._source:
+            return None
+
+        return DataReferenceSnapshot(
+            data_references=index["data_references"],
+            listed_at=index["listed_at"],
+            state=index.get("state", {}),
+        )
+
+    def save(self, snapshot: DataReferenceSnapshot) -> None:
+        index: dict = {
+            "version": self.VERSION,
+            "source": self._source,
+            "listed_at": snapshot.listed_at,
+            "state": snapshot.state,
+            "data_references": snapshot.data_references,
+        }
+        temp_filepath: Optional[pathlib.Path] = None
+        try:
+            self._index_filepath.parent.mkdir(parents=True, exist_ok=True)
+            # temporary file is unique to this write (concurrent writers, be they processes or
+            # threads, never share it)
+            fd, temp_filename = tempfile.mkstemp(
+                dir=self._index_filepath.parent,
+                prefix=f"{self._index_filepath.name}.",
+                suffix=".tmp",
+            )
+            temp_filepath = pathlib.Path(temp_filename)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            temp_filepath.replace(self._index_filepath)
+        except OSError as e:
+            # connectors list data references anew, when their index can not be written
+            logger.warning(f"Unable to write data reference index {self._index_filepath}: {e}")
+            if temp_filepath:
+                temp_filepath.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        self._index_filepath.unlink(missing_ok=True)
@@ -5,6 +5,7 @@ import logging
 import re
 import sre_constants
 import sre_parse
+import time
 from abc import abstractmethod
 from collections import defaultdict
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Union
@@ -22,6 +23,10 @@ from great_expectations.datasource.fluent.data_connector.batch_filter import (
     BatchFilter,
     build_batch_filter,
 )
+from great_expectations.datasource.fluent.data_connector.data_reference_index import (
+    DataReferenceIndex,
+    DataReferenceSnapshot,
+)
 from great_expectations.datasource.fluent.data_connector.regex_parser import (
     RegExParser,
 )
@@ -48,17 +53,20 @@ class FilePathDataConnector(DataConnector):
     Args:
         datasource_name: The name of the Datasource associated with this DataConnector instance
         data_asset_name: The name of the DataAsset using this DataConnector instance
+        data_reference_index_directory: Directory, in which listed data references are persisted
+            (if not given, every DataConnector instance lists all data references anew)
     """
 
     FILE_PATH_BATCH_SPEC_KEY = "path"
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 # FIXME CoP
         self,
         datasource_name: str,
         data_asset_name: str,
         unnamed_regex_group_prefix: str = "batch_request_param_",
         file_path_template_map_fn: Optional[Callable] = None,
         whole_directory_path_override: PathStr | None = None,
+        data_reference_index_directory: PathStr | None = None,
     ) -> None:
         super().__init__(
             datasource_name=datasource_name,
@@ -77,6 +85,8 @@ class FilePathDataConnector(DataConnector):
             re.Pattern, Dict[str, List[LegacyBatchDefinition] | None]
         ] = defaultdict(dict)
 
+        self._data_reference_index_directory: PathStr | None = data_reference_index_directory
+
     # Interface Method
     @override
     def get_batch_definition_list(self, batch_request: BatchRequest) -> List[LegacyBatchDefinition]:
@@ -358,7 +368,7 @@ class FilePathDataConnector(DataConnector):
             return batch_definitions
 
         # Cache was empty so we need to calculate BatchDefinitions
-        for data_reference in self.get_data_references():
+        for data_reference in self._list_data_references():
             batch_definition = self._build_batch_definition(
                 data_reference=data_reference, batching_regex=batching_regex
             )
@@ -371,6 +381,58 @@ class FilePathDataConnector(DataConnector):
 
         return batch_definitions
 
+    def refresh_data_references(self) -> None:
+        """Forgets listed data references (including persisted ones), so that they are listed anew.
+
+        Incremental listing (see "_list_data_references_since()") may miss data references removed
+        (or, depending on the connector, added out of order) since they were last listed.
+        """
+        self._data_references_cache.clear()
+        data_reference_index: DataReferenceIndex | None = self._get_data_reference_index()
+        if data_reference_index:
+            data_reference_index.clear()
+
+    def _list_data_references(self) -> List[str]:
+        """Lists data references (incrementally, if data references listed before are persisted)."""
+        data_reference_index: DataReferenceIndex | None = self._get_data_reference_index()
+        if data_reference_index is None:
+            return self.get_data_references()
+
+        listed_at: float = time.time()
+        data_references, state = self._list_data_references_since(
+            snapshot=data_reference_index.load()
+        )
+        data_reference_index.save(
+            DataReferenceSnapshot(data_references=data_references, listed_at=listed_at, state=state)
+        )
+        return data_references
+
+    def _list_data_references_since(
+        self, snapshot: DataReferenceSnapshot | None
+    ) -> Tuple[List[str], dict]:
+        """Lists data references, given those listed before (if any); returns them, with state.
+
+        Connectors able to list data references incrementally override this method; by default,
+        all data references are listed.
+        """
+        return self.get_data_references(), {}
+
+    def _get_data_reference_index(self) -> DataReferenceIndex | None:
+        if not self._data_reference_index_directory:
+            return None
+
+        source: str | None = self._get_data_reference_index_source()
+        if source is None:
+            return None
+
+        return DataReferenceIndex.in_directory(
+            directory=self._data_reference_index_directory, source=source
+        )
+
+    def _get_data_reference_index_source(self) -> str | None:
+        """Identity of data references listed by this connector; None, if they are not persisted."""
+        return None
+
     def _get_batch_definitions(self, batching_regex: re.Pattern) -> List[LegacyBatchDefinition]:
         batch_definition_map = self._get_data_references_cache(batching_regex=batching_regex)
         batch_definitions = [
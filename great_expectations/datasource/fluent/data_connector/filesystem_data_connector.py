@@ -3,7 +3,8 @@ from __future__ import annotations
 import logging
 import os
 import pathlib
-from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional, Type, Union
+import time
+from typing import TYPE_CHECKING, Callable, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.typing_extensions import override
@@ -13,9 +14,17 @@ from great_expectations.datasource.fluent.data_connector import (
 
 if TYPE_CHECKING:
     from great_expectations.alias_types import PathStr
+    from great_expectations.datasource.fluent.data_connector.data_reference_index import (
+        DataReferenceSnapshot,
+    )
 
 logger = logging.getLogger(__name__)
 
+# Directories modified this recently (in seconds) before listing may be modified again within the
+# resolution of their modification times; such directories are listed anew next time.
+_RACY_DIRECTORY_MTIME_SECONDS = 1.0
+_RACY_DIRECTORY_MTIME = -1
+
 
 class FilesystemOptions(pydantic.BaseModel):
     glob_directive: str = "**/*"
@@ -31,6 +40,7 @@ class FilesystemDataConnector(FilePathDataConnector):
         glob_directive: glob for selecting files in directory (defaults to `**/*`) or nested directories (e.g. `*/*/*.csv`)
         data_context_root_directory: Optional GreatExpectations root directory (if installed on filesystem)
         whole_directory_path_override: Treat an entire directory as a single Asset
+        data_reference_index_directory: Directory, in which listed files are persisted, so that they are listed anew only after directories under base_directory change
     """  # noqa: E501 # FIXME CoP
 
     asset_level_option_keys: ClassVar[tuple[str, ...]] = ("glob_directive",)
@@ -45,6 +55,7 @@ class FilesystemDataConnector(FilePathDataConnector):
         data_context_root_directory: Optional[pathlib.Path] = None,
         file_path_template_map_fn: Optional[Callable] = None,
         whole_directory_path_override: PathStr | None = None,
+        data_reference_index_directory: PathStr | None = None,
     ) -> None:
         self._base_directory = base_directory
         self._glob_directive: str = glob_directive
@@ -55,6 +66,7 @@ class FilesystemDataConnector(FilePathDataConnector):
             data_asset_name=data_asset_name,
             file_path_template_map_fn=file_path_template_map_fn,
             whole_directory_path_override=whole_directory_path_override,
+            data_reference_index_directory=data_reference_index_directory,
         )
 
     @property
@@ -78,6 +90,7 @@ class FilesystemDataConnector(FilePathDataConnector):
         data_context_root_directory: Optional[pathlib.Path] = None,
         file_path_template_map_fn: Optional[Callable] = None,
         whole_directory_path_override: PathStr | None = None,
+        data_reference_index_directory: PathStr | None = None,
     ) -> FilesystemDataConnector:
         """Builds "FilesystemDataConnector", which links named DataAsset to filesystem.
 
@@ -89,6 +102,7 @@ class FilesystemDataConnector(FilePathDataConnector):
             data_context_root_directory: Optional GreatExpectations root directory (if installed on filesystem)
             file_path_template_map_fn: Format function mapping path to fully-qualified resource on filesystem (optional)
             get_unfiltered_batch_definition_list_fn: Function used to get the batch definition list before filtering
+            data_reference_index_directory: Directory, in which listed files are persisted (optional)
 
         Returns:
             Instantiated "FilesystemDataConnector" object
@@ -101,6 +115,7 @@ class FilesystemDataConnector(FilePathDataConnector):
             data_context_root_directory=data_context_root_directory,
             file_path_template_map_fn=file_path_template_map_fn,
             whole_directory_path_override=whole_directory_path_override,
+            data_reference_index_directory=data_reference_index_directory,
         )
 
     @classmethod
@@ -142,6 +157,56 @@ class FilesystemDataConnector(FilePathDataConnector):
         )
         return sorted(path_list)
 
+    @override
+    def _get_data_reference_index_source(self) -> str | None:
+        return f"file://{self.base_directory.resolve()}?glob={self._glob_directive}"
+
+    @override
+    def _list_data_references_since(
+        self, snapshot: DataReferenceSnapshot | None
+    ) -> Tuple[List[str], dict]:
+        # Adding, removing, or renaming files (or directories) changes modification times of their
+        # directories; unless any directory changed, files listed before are still current.
+        directory_mtimes: Optional[Dict[str, int]] = (
+            snapshot.state.get("directory_mtimes") if snapshot else None
+        )
+        if (
+            snapshot
+            and directory_mtimes
+            and self._stat_directory_mtimes(directories=directory_mtimes) == directory_mtimes
+        ):
+            return snapshot.data_references, snapshot.state
+
+        directory_mtimes = self._walk_directory_mtimes()
+        return self.get_data_references(), {"directory_mtimes": directory_mtimes}
+
+    def _walk_directory_mtimes(self) -> Dict[str, int]:
+        base_directory: pathlib.Path = self.base_directory
+        listed_at_ns: int = time.time_ns()
+        directory_mtimes: Dict[str, int] = {}
+        for directory, _, _ in os.walk(base_directory):
+            relative_directory: str = os.path.relpath(directory, base_directory)
+            mtime_ns: int = pathlib.Path(directory).stat().st_mtime_ns
+            if listed_at_ns - mtime_ns < _RACY_DIRECTORY_MTIME_SECONDS * 1e9:
+                mtime_ns = _RACY_DIRECTORY_MTIME
+
+            directory_mtimes[relative_directory] = mtime_ns
+
+        return directory_mtimes
+
+    def _stat_directory_mtimes(self, directories: Dict[str, int]) -> Dict[str, int]:
+        base_directory: pathlib.Path = self.base_directory
+        directory_mtimes: Dict[str, int] = {}
+        for relative_directory in directories:
+            try:
+                directory_mtimes[relative_directory] = (
+                    (base_directory / relative_directory).stat().st_mtime_ns
+                )
+            except OSError:
+                continue
+
+        return directory_mtimes
+
     # Interface Method
     @override
     def _get_full_file_path(self, path: str) -> str:
@@ -3,7 +3,18 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generator, List, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.typing_extensions import override
@@ -18,7 +29,11 @@ from great_expectations.datasource.fluent.data_connector.file_path_data_connecto
 if TYPE_CHECKING:
     from botocore.client import BaseClient
 
+    from great_expectations.alias_types import PathStr
     from great_expectations.core.batch import LegacyBatchDefinition
+    from great_expectations.datasource.fluent.data_connector.data_reference_index import (
+        DataReferenceSnapshot,
+    )
 
 
 logger = logging.getLogger(__name__)
@@ -29,6 +44,7 @@ class _S3Options(pydantic.BaseModel):
     s3_delimiter: str = "/"
     s3_max_keys: int = 1000
     s3_recursive_file_discovery: bool = False
+    s3_data_reference_index_directory: Optional[str] = None
 
 
 class S3DataConnector(FilePathDataConnector):
@@ -45,6 +61,7 @@ class S3DataConnector(FilePathDataConnector):
         max_keys (int): S3 max_keys (default is 1000)
         recursive_file_discovery (bool): Flag to indicate if files should be searched recursively from subfolders
         file_path_template_map_fn: Format function mapping path to fully-qualified resource on S3
+        data_reference_index_directory: Directory, in which listed keys are persisted, so that later listings only request keys after the last listed key (S3 "StartAfter")
     """  # noqa: E501 # FIXME CoP
 
     asset_level_option_keys: ClassVar[tuple[str, ...]] = (
@@ -52,6 +69,7 @@ class S3DataConnector(FilePathDataConnector):
         "s3_delimiter",
         "s3_max_keys",
         "s3_recursive_file_discovery",
+        "s3_data_reference_index_directory",
     )
     asset_options_type: ClassVar[Type[_S3Options]] = _S3Options
 
@@ -66,6 +84,7 @@ class S3DataConnector(FilePathDataConnector):
         max_keys: int = 1000,
         recursive_file_discovery: bool = False,
         file_path_template_map_fn: Optional[Callable] = None,
+        data_reference_index_directory: PathStr | None = None,
     ) -> None:
         self._s3_client: BaseClient = s3_client
 
@@ -83,6 +102,7 @@ class S3DataConnector(FilePathDataConnector):
             datasource_name=datasource_name,
             data_asset_name=data_asset_name,
             file_path_template_map_fn=file_path_template_map_fn,
+            data_reference_index_directory=data_reference_index_directory,
         )
 
     @classmethod
@@ -97,6 +117,7 @@ class S3DataConnector(FilePathDataConnector):
         max_keys: int = 1000,
         recursive_file_discovery: bool = False,
         file_path_template_map_fn: Optional[Callable] = None,
+        data_reference_index_directory: PathStr | None = None,
     ) -> S3DataConnector:
         """Builds "S3DataConnector", which links named DataAsset to AWS S3.
 
@@ -110,6 +131,7 @@ class S3DataConnector(FilePathDataConnector):
             max_keys: S3 max_keys (default is 1000)
             recursive_file_discovery: Flag to indicate if files should be searched recursively from subfolders
             file_path_template_map_fn: Format function mapping path to fully-qualified resource on S3
+            data_reference_index_directory: Directory, in which listed keys are persisted (optional)
 
         Returns:
             Instantiated "S3DataConnector" object
@@ -124,6 +146,7 @@ class S3DataConnector(FilePathDataConnector):
             max_keys=max_keys,
             recursive_file_discovery=recursive_file_discovery,
             file_path_template_map_fn=file_path_template_map_fn,
+            data_reference_index_directory=data_reference_index_directory,
         )
 
     @classmethod
@@ -175,12 +198,18 @@ class S3DataConnector(FilePathDataConnector):
     # Interface Method
     @override
     def get_data_references(self) -> List[str]:
+        return self._list_s3_keys()
+
+    def _list_s3_keys(self, start_after: Optional[str] = None) -> List[str]:
         query_options: dict = {
             "Bucket": self._bucket,
             "Prefix": self._sanitized_prefix,
             "Delimiter": self._delimiter,
             "MaxKeys": self._max_keys,
         }
+        if start_after is not None:
+            query_options["StartAfter"] = start_after
+
         path_list: List[str] = list(
             list_s3_keys(
                 s3=self._s3_client,
@@ -191,6 +220,31 @@ class S3DataConnector(FilePathDataConnector):
         )
         return path_list
 
+    @override
+    def _get_data_reference_index_source(self) -> str | None:
+        return (
+            f"s3://{self._bucket}/{self._sanitized_prefix}"
+            f"?delimiter={self._delimiter}&recursive={self._recursive_file_discovery}"
+        )
+
+    @override
+    def _list_data_references_since(
+        self, snapshot: DataReferenceSnapshot | None
+    ) -> Tuple[List[str], dict]:
+        # S3 lists keys in lexicographic order, so that keys listed after the last listed key
+        # include all keys added since (unless they sort before it).
+        start_after: Optional[str] = snapshot.state.get("start_after") if snapshot else None
+        data_references: List[str] = self._list_s3_keys(start_after=start_after)
+        if snapshot and start_after is not None:
+            data_references = sorted(set(snapshot.data_references).union(data_references))
+        else:
+            data_references = sorted(data_references)
+
+        if not data_references:
+            return data_references, {}
+
+        return data_references, {"start_after": data_references[-1]}
+
     # Interface Method
     @override
     def _get_full_file_path(self, path: str) -> str:
@@ -240,7 +294,10 @@ def list_s3_keys(  # noqa: C901 #  too complex
 
     s3_objects_info: dict = s3.list_objects_v2(**query_options)
 
-    if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
+    # Queries listing keys after a given key (incrementally) legitimately find no keys.
+    if "StartAfter" not in query_options and not any(
+        key in s3_objects_info for key in ["Contents", "CommonPrefixes"]
+    ):
         raise ValueError("S3 query may not have been configured correctly.")  # noqa: TRY003 # FIXME CoP
 
     if "Contents" in s3_objects_info:
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import dataclasses
 import functools
 import logging
+import threading
 import uuid
 import warnings
 from abc import ABC, abstractmethod
@@ -17,6 +19,7 @@ from typing import (
     Dict,
     Final,
     Generic,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -205,6 +208,28 @@ class TestConnectionError(ConnectionError):
         super().__init__(message)
 
 
+# Per-thread ExecutionEngine objects of Datasource objects (see "isolated_execution_engines()").
+_isolated_execution_engines = threading.local()
+
+
+@contextlib.contextmanager
+def isolated_execution_engines() -> Iterator[None]:
+    """Within this context, every Datasource provides current thread with its own ExecutionEngine.
+
+    ExecutionEngine objects keep state of loaded Batch objects (and metric caches), so Datasource
+    objects, shared by concurrently running validations, must not hand out the same ExecutionEngine
+    to all of them.  ExecutionEngine objects built within the context are discarded when it exits.
+    """
+    previous_execution_engines: Optional[dict] = getattr(
+        _isolated_execution_engines, "execution_engines", None
+    )
+    _isolated_execution_engines.execution_engines = {}
+    try:
+        yield
+    finally:
+        _isolated_execution_engines.execution_engines = previous_execution_engines
+
+
 class GxDatasourceWarning(UserWarning):
     """
     Warning related to usage or configuration of a Datasource that could lead to
@@ -656,6 +681,18 @@ class Datasource(
     type: str
     name: str
     id: Optional[uuid.UUID] = Field(default=None, description="Datasource id")
+    metric_cache_max_size_in_bytes: Optional[pydantic.NonNegativeInt] = Field(
+        default=None,
+        description="Upper bound on estimated memory footprint of metrics cached by the"
+        " ExecutionEngine; least recently used metrics are evicted beyond it (default is"
+        " unbounded).",
+    )
+    persistent_metric_store: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Configuration of BatchMetricStore, in which the ExecutionEngine persists"
+        " metric values between runs; metrics of Batch data with unchanged fingerprint are"
+        " obtained from it instead of being recomputed (default does not persist metrics).",
+    )
     assets: MutableSequence[_DataAssetT] = []
 
     # private attrs
@@ -762,15 +799,57 @@ class Datasource(
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
         )
-        if (
-            current_execution_engine_kwargs != self._cached_execution_engine_kwargs
-            or not self._execution_engine
-        ):
-            self._execution_engine = self._execution_engine_type()(
-                **current_execution_engine_kwargs
+        execution_engine = self._get_cached_execution_engine(
+            execution_engine_kwargs=current_execution_engine_kwargs
+        )
+        if execution_engine is None:
+            execution_engine = self._execution_engine_type()(**current_execution_engine_kwargs)
+            self._cache_execution_engine(
+                execution_engine_kwargs=current_execution_engine_kwargs,
+                execution_engine=execution_engine,
             )
-            self._cached_execution_engine_kwargs = current_execution_engine_kwargs
-        return self._execution_engine
+        return execution_engine
+
+    def _get_cached_execution_engine(
+        self, execution_engine_kwargs: Dict[str, Any]
+    ) -> Optional[_ExecutionEngineT]:
+        """Returns ExecutionEngine, previously built with "execution_engine_kwargs" (None, if none).
+
+        Within "isolated_execution_engines()" context, only ExecutionEngine objects built by current
+        thread (in that context) are considered.
+        """
+        isolated_execution_engines: Optional[dict] = getattr(
+            _isolated_execution_engines, "execution_engines", None
+        )
+        if isolated_execution_engines is not None:
+            # Datasource is kept alongside its ExecutionEngine, so that its "id()" is not reused.
+            _, cached_execution_engine_kwargs, execution_engine = isolated_execution_engines.get(
+                id(self), (None, None, None)
+            )
+        else:
+            cached_execution_engine_kwargs = self._cached_execution_engine_kwargs
+            execution_engine = self._execution_engine
+
+        if not execution_engine or execution_engine_kwargs != cached_execution_engine_kwargs:
+            return None
+
+        return execution_engine
+
+    def _cache_execution_engine(
+        self, execution_engine_kwargs: Dict[str, Any], execution_engine: _ExecutionEngineT
+    ) -> None:
+        isolated_execution_engines: Optional[dict] = getattr(
+            _isolated_execution_engines, "execution_engines", None
+        )
+        if isolated_execution_engines is not None:
+            isolated_execution_engines[id(self)] = (
+                self,
+                execution_engine_kwargs,
+                execution_engine,
+            )
+        else:
+            self._cached_execution_engine_kwargs = execution_engine_kwargs
+            self._execution_engine = execution_engine
 
     def get_batch(self, batch_request: BatchRequest) -> Batch:
         """A Batch that corresponds to the BatchRequest.
@@ -994,8 +1073,16 @@ class Datasource(
     # End Abstract Methods
 
 
+# Base Datasource fields, which configure the execution engine (and hence are passed to it)
+_EXECUTION_ENGINE_FIELD_NAMES: Final[Set[str]] = {
+    "metric_cache_max_size_in_bytes",
+    "persistent_metric_store",
+}
+
 # This is used to prevent passing things like `type`, `assets` etc. to the execution engine
-_BASE_DATASOURCE_FIELD_NAMES: Final[Set[str]] = {name for name in Datasource.__fields__}
+_BASE_DATASOURCE_FIELD_NAMES: Final[Set[str]] = {
+    name for name in Datasource.__fields__ if name not in _EXECUTION_ENGINE_FIELD_NAMES
+}
 
 
 @dataclasses.dataclass(frozen=True)
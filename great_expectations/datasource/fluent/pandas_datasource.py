@@ -502,6 +502,11 @@ class _PandasDatasource(Datasource, Generic[_DataAssetT]):
 
     # instance attributes
     assets: MutableSequence[_DataAssetT] = []
+    chunksize: Optional[pydantic.PositiveInt] = pydantic.Field(
+        default=None,
+        description="Number of rows of chunks, in which files are read whenever metrics are"
+        " computed (rather than loaded into memory whole); by default, files are loaded whole.",
+    )
 
     # Abstract Methods
     @property
@@ -627,6 +632,8 @@ class PandasDatasource(_PandasDatasource):
         name: The name of this datasource.
         assets: An optional dictionary whose keys are Pandas DataAsset names and whose values
             are Pandas DataAsset objects.
+        chunksize: An optional number of rows of chunks, in which files are read whenever metrics
+            are computed, rather than loaded into memory whole.
     """
 
     # class directive to automatically generate read_* methods for assets
@@ -140,6 +140,7 @@ _PandasDataAssetT = TypeVar("_PandasDataAssetT", bound=_PandasDataAsset)
 class _PandasDatasource(Datasource):
     asset_types: ClassVar[Sequence[Type[DataAsset]]]
     assets: MutableSequence[_PandasDataAssetT]  # type: ignore[valid-type] # FIXME CoP
+    chunksize: Optional[int]
     @property
     @override
     def execution_engine_type(self) -> Type[PandasExecutionEngine]: ...
@@ -78,6 +78,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_delimiter: str = "/",
         s3_recursive_file_discovery: bool = False,
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         sep: typing.Union[str, None] = ...,
         delimiter: typing.Union[str, None] = ...,
         header: Union[int, Sequence[int], None, Literal["infer"]] = "infer",
@@ -137,6 +138,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         sheet_name: typing.Union[str, int, None] = 0,
         header: Union[int, Sequence[int], None] = 0,
         names: typing.Union[typing.List[str], None] = ...,
@@ -169,6 +171,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         columns: Union[Sequence[Hashable], None] = ...,
         use_threads: bool = ...,
         storage_options: StorageOptions = ...,
@@ -193,6 +196,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         key: typing.Any = ...,
         mode: str = "r",
         errors: str = "strict",
@@ -212,6 +216,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         match: Union[str, typing.Pattern] = ".+",
         flavor: typing.Union[str, None] = ...,
         header: Union[int, Sequence[int], None] = ...,
@@ -235,6 +240,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         orient: typing.Union[str, None] = ...,
         dtype: typing.Union[dict, None] = ...,
         convert_axes: typing.Any = ...,
@@ -259,6 +265,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         columns: typing.Union[typing.List[str], None] = ...,
         kwargs: typing.Union[dict, None] = ...,
     ) -> ORCAsset: ...
@@ -270,6 +277,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         engine: str = "auto",
         columns: typing.Union[typing.List[str], None] = ...,
         storage_options: StorageOptions = ...,
@@ -284,6 +292,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         compression: CompressionOptions = "infer",
         storage_options: StorageOptions = ...,
     ) -> PickleAsset: ...
@@ -295,6 +304,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         format: typing.Union[str, None] = ...,
         index: Union[Hashable, None] = ...,
         encoding: typing.Union[str, None] = ...,
@@ -310,6 +320,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         usecols: typing.Union[int, str, typing.Sequence[int], None] = ...,
         convert_categoricals: bool = ...,
     ) -> SPSSAsset: ...
@@ -321,6 +332,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         convert_dates: bool = ...,
         convert_categoricals: bool = ...,
         index_col: typing.Union[str, None] = ...,
@@ -341,6 +353,7 @@ class PandasS3Datasource(_PandasFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         xpath: str = "./*",
         namespaces: typing.Union[typing.Dict[str, str], None] = ...,
         elems_only: bool = ...,
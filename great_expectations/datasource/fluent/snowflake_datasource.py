@@ -534,6 +534,7 @@ class SnowflakeDatasource(SQLDatasource):
         table_name: str = "",
         schema_name: Optional[str] = MISSING,  # type: ignore[assignment] # sentinel value
         batch_metadata: Optional[BatchMetadata] = None,
+        batch_fingerprint_query: Optional[str] = None,
     ) -> TableAsset:
         """Adds a table asset to this datasource.
 
@@ -544,6 +545,9 @@ class SnowflakeDatasource(SQLDatasource):
                 provided.
             batch_metadata: BatchMetadata we want to associate with this DataAsset and all batches
                 derived from it.
+            batch_fingerprint_query: Freshness query, whose result fingerprints the data of batches,
+                so that metrics persisted for unchanged data (see `persistent_metric_store`) are
+                reused.
 
         Returns:
             The table asset that is added to the datasource.
@@ -570,6 +574,7 @@ class SnowflakeDatasource(SQLDatasource):
             table_name=table_name,
             schema_name=schema_name,
             batch_metadata=batch_metadata,
+            batch_fingerprint_query=batch_fingerprint_query,
         )
 
     @pydantic.root_validator(pre=True)
@@ -733,6 +738,9 @@ class SnowflakeDatasource(SQLDatasource):
             connection_string=connection_string,
             engine=self.get_engine(),
             create_temp_table=self.create_temp_table,
+            max_concurrent_queries=self.max_concurrent_queries,
+            metric_cache_max_size_in_bytes=self.metric_cache_max_size_in_bytes,
+            persistent_metric_store=self.persistent_metric_store,
             data_context=self._data_context,
         )
         self._execution_engine = gx_exec_engine
@@ -135,21 +135,22 @@ class _SparkDatasource(Datasource):
             exclude=self._get_exec_engine_excludes(),
             config_provider=self._config_provider,
         )
-        if (
-            current_execution_engine_kwargs != self._cached_execution_engine_kwargs
-            or not self._execution_engine
-        ):
+        execution_engine = self._get_cached_execution_engine(
+            execution_engine_kwargs=current_execution_engine_kwargs
+        )
+        if execution_engine is None:
             if self._spark:
-                self._execution_engine = self._execution_engine_type()(
+                execution_engine = self._execution_engine_type()(
                     spark=self._spark, **current_execution_engine_kwargs
                 )
             else:
-                self._execution_engine = self._execution_engine_type()(
-                    **current_execution_engine_kwargs
-                )
+                execution_engine = self._execution_engine_type()(**current_execution_engine_kwargs)
 
-            self._cached_execution_engine_kwargs = current_execution_engine_kwargs
-        return self._execution_engine
+            self._cache_execution_engine(
+                execution_engine_kwargs=current_execution_engine_kwargs,
+                execution_engine=execution_engine,
+            )
+        return execution_engine
 
     @override
     def test_connection(self, test_assets: bool = True) -> None:
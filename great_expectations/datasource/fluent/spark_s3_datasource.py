@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Literal, Type, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Literal, Optional, Type, Union
 
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import aws, pydantic
@@ -112,13 +112,14 @@ class SparkS3Datasource(_SparkFilePathDatasource):
                 asset.test_connection()
 
     @override
-    def _build_data_connector(
+    def _build_data_connector(  # noqa: PLR0913 # FIXME CoP
         self,
         data_asset: SPARK_PATH_ASSET_UNION,
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
         s3_recursive_file_discovery: bool = False,
+        s3_data_reference_index_directory: Optional[str] = None,
         **kwargs,
     ) -> None:
         """Builds and attaches the `S3DataConnector` to the asset."""
@@ -137,6 +138,7 @@ class SparkS3Datasource(_SparkFilePathDatasource):
             max_keys=s3_max_keys,
             recursive_file_discovery=s3_recursive_file_discovery,
             file_path_template_map_fn=S3Url.OBJECT_URL_TEMPLATE.format,
+            data_reference_index_directory=s3_data_reference_index_directory,
         )
 
         # build a more specific `_test_connection_error_message`
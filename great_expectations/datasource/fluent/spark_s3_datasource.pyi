@@ -30,6 +30,7 @@ class SparkS3Datasource(_SparkFilePathDatasource):
         s3_prefix: str = "",
         s3_delimiter: str = "/",
         s3_max_keys: int = 1000,
+        s3_data_reference_index_directory: Optional[str] = None,
         s3_recursive_file_discovery: bool = False,
         header: bool = ...,
         infer_schema: bool = ...,
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import copy
 import logging
+import time
 import warnings
 from datetime import date, datetime
 from pprint import pformat as pf
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Final,
     Generic,
+    Hashable,
     List,
     Literal,
     Optional,
@@ -160,7 +163,9 @@ class SQLAlchemyCreateEngineError(SQLDatasourceError):
 
 
 class _Partitioner(PartitionerProtocol, Protocol):
-    def param_defaults(self, sql_asset: _SQLAsset) -> List[Dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchParameters] = None
+    ) -> List[Dict]:
         """Creates all valid batch requests options for sql_asset
 
         This can be implemented by querying the data defined in the sql_asset to generate
@@ -169,20 +174,98 @@ class _Partitioner(PartitionerProtocol, Protocol):
         set of distinct (year, month) pairs. We would then return a list of BatchRequest.options,
         ie dictionaries, of the form {"year": year, "month": month} that contain all these distinct
         pairs.
+
+        If options (BatchRequest.options) are given, only batch requests options matching them
+        are created (which need not query all the data defined in the sql_asset).
+        """
+        ...
+
+    def batch_parameters_to_partition_clause(
+        self, options: BatchParameters, data_partitioner: SqlAlchemyDataPartitioner
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        """Creates clause selecting rows of batches matching options (values of some param_names)
+
+        Returns None, if batches matching options can not be selected by a clause.
         """
         ...
 
 
+class _PartitionCache:
+    """Batch identifier data (partitions) of a _SQLAsset, discovered by its partitioners
+
+    Discovered partitions are reused for "ttl" seconds; if "ttl" is None, they are not cached.
+    """
+
+    def __init__(self) -> None:
+        self.ttl: Optional[float] = None
+        self._partitions: Dict[Hashable, Tuple[float, List[dict]]] = {}
+
+    def get(self, key: Hashable, discover_partitions: Callable[[], List[dict]]) -> List[dict]:
+        if self.ttl is None:
+            return discover_partitions()
+
+        now: float = time.monotonic()
+        discovered: Optional[Tuple[float, List[dict]]] = self._partitions.get(key)
+        if discovered is None or now - discovered[0] >= self.ttl:
+            discovered = (now, discover_partitions())
+            self._partitions[key] = discovered
+
+        # callers modify batch identifier data (e.g., when matching it with batch parameters)
+        return copy.deepcopy(discovered[1])
+
+    def clear(self) -> None:
+        self._partitions.clear()
+
+
+def _is_partition_clause_value(value: Any) -> bool:
+    # strings are matched against string representations of discovered values (see
+    # _SQLAsset._matches_request_options), which SQL comparisons do not reproduce
+    return value is not None and not isinstance(value, str)
+
+
 def _partitioner_and_sql_asset_to_batch_identifier_data(
-    partitioner: _Partitioner, asset: _SQLAsset
+    partitioner: _Partitioner, asset: _SQLAsset, options: Optional[BatchParameters] = None
 ) -> list[dict]:
     execution_engine = asset.datasource.get_execution_engine()
     sqlalchemy_data_partitioner = SqlAlchemyDataPartitioner(execution_engine.dialect_name)
-    return sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
-        execution_engine=execution_engine,
-        selectable=asset.as_selectable(),
-        partitioner_method_name=partitioner.method_name,
-        partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+
+    requested_options: dict = {
+        param_name: options[param_name]
+        for param_name in partitioner.param_names
+        if options and _is_partition_clause_value(options.get(param_name))
+    }
+    selectable: sqlalchemy.Selectable = asset.as_selectable()
+    partition_clause: Optional[sqlalchemy.ColumnElement] = (
+        partitioner.batch_parameters_to_partition_clause(
+            options=requested_options, data_partitioner=sqlalchemy_data_partitioner
+        )
+        if requested_options
+        else None
+    )
+    if partition_clause is None:
+        requested_options = {}
+    else:
+        # Only rows of requested batches are queried, rather than the whole asset.
+        selectable = (
+            sa.select(sa.text("*"))
+            .select_from(selectable)  # type: ignore[arg-type] # FIXME CoP
+            .where(partition_clause)
+            .subquery()
+        )
+
+    return asset._partition_cache.get(
+        key=(
+            partitioner.method_name,
+            repr(sorted(partitioner.partitioner_method_kwargs().items())),
+            repr(sorted(requested_options.items())),
+            str(selectable),
+        ),
+        discover_partitions=lambda: sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
+            execution_engine=execution_engine,
+            selectable=selectable,
+            partitioner_method_name=partitioner.method_name,
+            partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+        ),
     )
 
 
@@ -195,15 +278,34 @@ class _PartitionerDatetime(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchParameters] = None
+    ) -> list[dict]:
         batch_identifier_data = _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, options=options
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
             params.append(identifer_data[self.column_name])
         return params
 
+    def batch_parameters_to_partition_clause(
+        self, options: BatchParameters, data_partitioner: SqlAlchemyDataPartitioner
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        batch_identifiers: Dict[str, dict] = {self.column_name: dict(options)}
+        partition_clause = data_partitioner.partition_on_date_parts(
+            column_name=self.column_name,
+            batch_identifiers=batch_identifiers,
+            date_parts=list(options.keys()),
+        )
+        date_range_clause = data_partitioner.get_partition_clause_for_date_range(
+            column_name=self.column_name, batch_identifiers=batch_identifiers
+        )
+        if date_range_clause is None:
+            return partition_clause
+
+        return sa.and_(date_range_clause, partition_clause)
+
     def batch_parameters_to_batch_spec_kwarg_identifiers(
         self, options: BatchParameters
     ) -> Dict[str, Any]:
@@ -303,15 +405,26 @@ class _PartitionerOneColumnOneParam(FluentBaseModel):
     def columns(self) -> list[str]:
         return [self.column_name]
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchParameters] = None
+    ) -> list[dict]:
         batch_identifier_data = _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, options=options
         )
         params: list[dict] = []
         for identifer_data in batch_identifier_data:
             params.append({self.param_names[0]: identifer_data[self.column_name]})
         return params
 
+    def batch_parameters_to_partition_clause(
+        self, options: BatchParameters, data_partitioner: SqlAlchemyDataPartitioner
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        partitioner_method: Callable = data_partitioner.get_partitioner_method(self.method_name)
+        return partitioner_method(
+            batch_identifiers=self.batch_parameters_to_batch_spec_kwarg_identifiers(options),
+            **self.partitioner_method_kwargs(),
+        )
+
     @property
     def param_names(self) -> list[str]:
         raise NotImplementedError
@@ -393,11 +506,13 @@ class SqlPartitionerColumnValue(_PartitionerOneColumnOneParam):
         return {self.column_name: options[self.column_name]}
 
     @override
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchParameters] = None
+    ) -> list[dict]:
         # The superclass version of param_defaults is correct, but here we leverage that
         # the parameter name is the same as the column name to make this much faster.
         return _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, options=options
         )
 
 
@@ -427,9 +542,18 @@ class SqlPartitionerMultiColumnValue(FluentBaseModel):
             )
         return {col: options[col] for col in self.column_names}
 
-    def param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+    def param_defaults(
+        self, sql_asset: _SQLAsset, options: Optional[BatchParameters] = None
+    ) -> list[dict]:
         return _partitioner_and_sql_asset_to_batch_identifier_data(
-            partitioner=self, asset=sql_asset
+            partitioner=self, asset=sql_asset, options=options
+        )
+
+    def batch_parameters_to_partition_clause(
+        self, options: BatchParameters, data_partitioner: SqlAlchemyDataPartitioner
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        return data_partitioner.partition_on_multi_column_values(  # type: ignore[return-value] # FIXME CoP
+            column_names=list(options.keys()), batch_identifiers=dict(options)
         )
 
 
@@ -503,6 +627,12 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
     # Instance fields
     type: str = pydantic.Field("_sql_asset")
     name: str
+    batch_fingerprint_query: Optional[str] = pydantic.Field(
+        default=None,
+        description="Freshness query (e.g., 'SELECT COUNT(*), MAX(updated_at) FROM my_table'),"
+        " whose result fingerprints Batch data, so that metrics persisted for unchanged Batch"
+        " data (see `persistent_metric_store` of Datasource) are reused.",
+    )
     _partitioner_implementation_map: Dict[
         Type[ColumnPartitioner], Optional[Type[SqlPartitioner]]
     ] = pydantic.PrivateAttr(
@@ -518,6 +648,7 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
             PartitionerConvertedDatetime: None,  # only implemented for sqlite backend
         }
     )
+    _partition_cache: _PartitionCache = pydantic.PrivateAttr(default_factory=_PartitionCache)
 
     def get_partitioner_implementation(
         self, abstract_partitioner: ColumnPartitioner
@@ -545,6 +676,22 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
     def test_connection(self) -> None:
         pass
 
+    def set_partition_cache_ttl(self, ttl: Optional[float]) -> None:
+        """Caches partitions (batches) discovered by partitioners of this asset for ttl seconds.
+
+        Without caching, every batch request queries the data of this asset for its partitions.
+
+        Args:
+            ttl: Number of seconds, for which discovered partitions are reused; if None (the
+                default), partitions are not cached.
+        """
+        self._partition_cache.ttl = ttl
+        self._partition_cache.clear()
+
+    def refresh_partitions(self) -> None:
+        """Forgets cached partitions, so that the next batch requests discover them anew."""
+        self._partition_cache.clear()
+
     @staticmethod
     def _matches_request_options(candidate: Dict, requested_options: BatchParameters) -> bool:
         for k, v in requested_options.items():
@@ -571,7 +718,7 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
 
         batch_requests: List[BatchRequest] = []
         # We iterate through all possible batches as determined by the partitioner
-        for params in sql_partitioner.param_defaults(self):
+        for params in sql_partitioner.param_defaults(self, options=batch_request.options):
             # If the params from the partitioner don't match the batch parameters
             # we don't create this batch.
             if not _SQLAsset._matches_request_options(params, batch_request.options):
@@ -645,6 +792,8 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
 
         request = requests[request_index]
         batch_spec_kwargs = self._create_batch_spec_kwargs()
+        if self.batch_fingerprint_query:
+            batch_spec_kwargs["batch_fingerprint_query"] = self.batch_fingerprint_query
         if sql_partitioner:
             batch_spec_kwargs["partitioner_method"] = sql_partitioner.method_name
             batch_spec_kwargs["partitioner_kwargs"] = sql_partitioner.partitioner_method_kwargs()
@@ -1173,6 +1322,8 @@ class SQLDatasource(Datasource):
         connection_string: The SQLAlchemy connection string used to connect to the database.
             For example: "postgresql+psycopg2://postgres:@localhost/test_database"
         create_temp_table: Whether to leverage temporary tables during metric computation.
+        max_concurrent_queries: Maximum number of bundled metric queries (one per compute domain)
+            executed concurrently over pooled connections. Default (1) executes them serially.
         kwargs: Extra SQLAlchemy keyword arguments to pass to `create_engine()`. Note, only python
             primitive types will be serializable to config.
         assets: An optional dictionary whose keys are SQL DataAsset names and whose values
@@ -1187,6 +1338,7 @@ class SQLDatasource(Datasource):
     type: Literal["sql"] = "sql"
     connection_string: Union[ConfigStr, str]
     create_temp_table: bool = False
+    max_concurrent_queries: pydantic.PositiveInt = 1
     kwargs: Dict[str, Union[ConfigStr, Any]] = pydantic.Field(
         default={},
         description="Optional dictionary of `kwargs` will be passed to the SQLAlchemy Engine"
@@ -1249,17 +1401,22 @@ class SQLDatasource(Datasource):
             # but we want to include them here
             exclude_unset=False,
         )
-        if (
-            current_execution_engine_kwargs != self._cached_execution_engine_kwargs
-            or not self._execution_engine
-        ):
-            self._cached_execution_engine_kwargs = current_execution_engine_kwargs
-            engine_kwargs = current_execution_engine_kwargs.pop("kwargs", {})
-            self._execution_engine = self._execution_engine_type()(
-                **current_execution_engine_kwargs,
+        execution_engine = self._get_cached_execution_engine(
+            execution_engine_kwargs=current_execution_engine_kwargs
+        )
+        if execution_engine is None:
+            # cached kwargs are left intact, so that they compare equal to those of later calls
+            execution_engine_kwargs = dict(current_execution_engine_kwargs)
+            engine_kwargs = execution_engine_kwargs.pop("kwargs", {})
+            execution_engine = self._execution_engine_type()(
+                **execution_engine_kwargs,
                 **engine_kwargs,
             )
-        return self._execution_engine
+            self._cache_execution_engine(
+                execution_engine_kwargs=current_execution_engine_kwargs,
+                execution_engine=execution_engine,
+            )
+        return execution_engine
 
     @override
     def test_connection(self, test_assets: bool = True) -> None:
@@ -1288,6 +1445,7 @@ class SQLDatasource(Datasource):
         table_name: str = "",
         schema_name: Optional[str] = None,
         batch_metadata: Optional[BatchMetadata] = None,
+        batch_fingerprint_query: Optional[str] = None,
     ) -> TableAsset:
         """Adds a table asset to this datasource.
 
@@ -1296,6 +1454,9 @@ class SQLDatasource(Datasource):
             table_name: The table where the data resides.
             schema_name: The schema that holds the table.
             batch_metadata: BatchMetadata we want to associate with this DataAsset and all batches derived from it.
+            batch_fingerprint_query: Freshness query, whose result fingerprints the data of batches,
+                so that metrics persisted for unchanged data (see `persistent_metric_store`) are
+                reused.
 
         Returns:
             The table asset that is added to the datasource.
@@ -1309,6 +1470,7 @@ class SQLDatasource(Datasource):
             table_name=table_name,
             schema_name=schema_name,
             batch_metadata=batch_metadata or {},
+            batch_fingerprint_query=batch_fingerprint_query,
         )
         return self._add_asset(asset)
 
@@ -1318,6 +1480,7 @@ class SQLDatasource(Datasource):
         name: str,
         query: str,
         batch_metadata: Optional[BatchMetadata] = None,
+        batch_fingerprint_query: Optional[str] = None,
     ) -> QueryAsset:
         """Adds a query asset to this datasource.
 
@@ -1325,6 +1488,9 @@ class SQLDatasource(Datasource):
             name: The name of this table asset.
             query: The SELECT query to selects the data to validate. It must begin with the "SELECT".
             batch_metadata: BatchMetadata we want to associate with this DataAsset and all batches derived from it.
+            batch_fingerprint_query: Freshness query, whose result fingerprints the data of batches,
+                so that metrics persisted for unchanged data (see `persistent_metric_store`) are
+                reused.
 
         Returns:
             The query asset that is added to the datasource.
@@ -1335,5 +1501,6 @@ class SQLDatasource(Datasource):
             name=name,
             query=query,
             batch_metadata=batch_metadata or {},
+            batch_fingerprint_query=batch_fingerprint_query,
         )
         return self._add_asset(asset)
@@ -169,6 +169,7 @@ class SqliteDatasource(SQLDatasource):
         table_name: str = "",
         schema_name: Optional[str] = None,
         batch_metadata: Optional[BatchMetadata] = None,
+        batch_fingerprint_query: Optional[str] = None,
     ) -> SqliteTableAsset:
         """Adds a table asset to this SQLite datasource
 
@@ -177,6 +178,7 @@ class SqliteDatasource(SQLDatasource):
             table_name: The name of the database table
             schema_name: The schema to which this table belongs
             batch_metadata: An arbitrary dictionary for a caller to annotate the asset
+            batch_fingerprint_query: Freshness query, whose result fingerprints the data of batches
 
         Returns:
             The SqliteTableAsset added
@@ -188,6 +190,7 @@ class SqliteDatasource(SQLDatasource):
                 table_name=table_name,
                 schema_name=schema_name,
                 batch_metadata=batch_metadata,
+                batch_fingerprint_query=batch_fingerprint_query,
             ),
         )
 
@@ -200,6 +203,7 @@ class SqliteDatasource(SQLDatasource):
         name: str,
         query: str,
         batch_metadata: Optional[BatchMetadata] = None,
+        batch_fingerprint_query: Optional[str] = None,
     ) -> SqliteQueryAsset:
         """Adds a query asset to this SQLite datasource
 
@@ -207,6 +211,7 @@ class SqliteDatasource(SQLDatasource):
             name: The name of this query asset
             query: The SQL query
             batch_metadata: An arbitrary dictionary for a caller to annotate the asset
+            batch_fingerprint_query: Freshness query, whose result fingerprints the data of batches
 
         Returns:
             The SqliteQueryAsset added
@@ -214,7 +219,12 @@ class SqliteDatasource(SQLDatasource):
 
         return cast(
             SqliteQueryAsset,
-            super().add_query_asset(name=name, query=query, batch_metadata=batch_metadata),
+            super().add_query_asset(
+                name=name,
+                query=query,
+                batch_metadata=batch_metadata,
+                batch_fingerprint_query=batch_fingerprint_query,
+            ),
         )
 
     add_query_asset.__doc__ = SQLDatasource.add_query_asset.__doc__
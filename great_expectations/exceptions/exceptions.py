@@ -433,11 +433,13 @@ class InvalidMetricAccessorDomainKwargsKeyError(MetricError):
 
 
 class MetricResolutionError(MetricError):
-    def __init__(self, message, failed_metrics) -> None:
+    def __init__(self, message, failed_metrics, resolved_metrics=None) -> None:
         super().__init__(message)
         if not isinstance(failed_metrics, Iterable):
             failed_metrics = (failed_metrics,)
         self.failed_metrics = failed_metrics
+        # metrics resolved (by the same computation) before failure was raised
+        self.resolved_metrics = resolved_metrics or {}
 
 
 class GXCloudError(GreatExpectationsError):
@@ -0,0 +1,577 @@
+from __future__ import annotations
+
+import ast
+import contextlib
+import dataclasses
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.execution_engine import (
+        MetricComputationConfiguration,
+    )
+    from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
+
+logger = logging.getLogger(__name__)
+
+# Metric functions of these types compute values of every row (e.g., column map conditions).
+ROW_LEVEL_METRIC_FUNCTION_TYPES = {
+    MetricPartialFunctionTypes.MAP_FN,
+    MetricPartialFunctionTypes.MAP_SERIES,
+    MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+}
+
+# Conditions of these map metrics compare values of different rows (e.g., uniqueness), which are
+# not read in the same chunk; they (and metrics depending on them) are not computed over chunks.
+ROW_COMPARING_CONDITION_METRIC_NAMES = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+    "compound_columns.unique",
+}
+
+
+class DeferredChunkMetricValue:
+    """Value of row-level metric (e.g., condition of column map metric) of Batch data in chunks.
+
+    Row-level metrics are not computed over the whole Batch (which does not fit in memory); rather,
+    they are computed for every chunk, by metrics (e.g., unexpected count of column map metric),
+    which depend on them and are merged across chunks.
+    """
+
+    def __init__(self, metric_fn: Callable, metric_provider_kwargs: dict) -> None:
+        self._metric_fn = metric_fn
+        self._metric_provider_kwargs = metric_provider_kwargs
+
+    def compute(self, chunk_values: Dict[int, Any]) -> Any:
+        """Computes value of the metric for current chunk (memoized in its "chunk_values")."""
+        key: int = id(self)
+        if key not in chunk_values:
+            chunk_values[key] = self._metric_fn(
+                **get_chunk_metric_provider_kwargs(
+                    metric_provider_kwargs=self._metric_provider_kwargs, chunk_values=chunk_values
+                )
+            )
+
+        return chunk_values[key]
+
+
+def get_chunk_metric_provider_kwargs(
+    metric_provider_kwargs: dict, chunk_values: Dict[int, Any]
+) -> dict:
+    """Replaces deferred (row-level) metric dependencies with their values for current chunk."""
+    return {
+        **metric_provider_kwargs,
+        "metrics": {
+            metric_name: value.compute(chunk_values=chunk_values)
+            if isinstance(value, DeferredChunkMetricValue)
+            else value
+            for metric_name, value in metric_provider_kwargs["metrics"].items()
+        },
+    }
+
+
+def _defer_metric(metric_fn: Callable, **metric_provider_kwargs) -> DeferredChunkMetricValue:
+    return DeferredChunkMetricValue(
+        metric_fn=metric_fn, metric_provider_kwargs=metric_provider_kwargs
+    )
+
+
+def _raise_not_mergeable(metric_name: str, **metric_provider_kwargs) -> None:
+    raise gx_exceptions.MetricError(
+        message=f'Metric "{metric_name}" cannot be computed for Batch data, which is read in '
+        'chunks (see "chunksize" of PandasExecutionEngine), because its values for chunks cannot '
+        "be merged."
+    )
+
+
+def _raise_not_supported(metric_name: str, **metric_provider_kwargs) -> None:
+    raise gx_exceptions.MetricError(
+        message=f'Metric "{metric_name}" is not supported when reading Batch data in chunks '
+        '(see "chunksize" of PandasExecutionEngine), because it compares rows, which are read in '
+        "different chunks."
+    )
+
+
+@dataclass(frozen=True)
+class ChunkMerge:
+    """How metric is computed over Batch data, which is read in chunks.
+
+    For every chunk, "compute" (given metric function and its keyword arguments) computes partial
+    value (by default, the value of the metric for the chunk); "merge" merges two partial values,
+    and "finalize" (given merged partial value and keyword arguments of the metric function)
+    computes the value of the metric.  Metrics, for which "applies" is False (e.g., metrics, which
+    only transform their dependencies), are computed once, rather than chunk by chunk.  Metrics of
+    the schema of the data (e.g., "table.columns") are computed from the first chunk only.
+    """
+
+    merge: Callable[[Any, Any], Any]
+    compute: Optional[Callable[[Callable, dict], Any]] = None
+    finalize: Optional[Callable[[Any, dict], Any]] = None
+    applies: Optional[Callable[[dict], bool]] = None
+    first_chunk_only: bool = False
+
+    def compute_chunk(self, metric_fn: Callable, metric_provider_kwargs: dict) -> Any:
+        if self.compute is None:
+            return metric_fn(**metric_provider_kwargs)
+
+        return self.compute(metric_fn, metric_provider_kwargs)
+
+    def finalize_value(self, value: Any, metric_provider_kwargs: dict) -> Any:
+        if self.finalize is None:
+            return value
+
+        return self.finalize(value, metric_provider_kwargs)
+
+
+class ChunkedMetricComputation:
+    """Metrics of Batch data (read in chunks), resolved together in a single pass over its chunks.
+
+    Row-level metrics are deferred (see "DeferredChunkMetricValue"); metrics, which can be merged
+    across chunks (see CHUNK_MERGES and CHUNK_MERGES_BY_SUFFIX), are computed for every chunk (along
+    with row-level metrics they depend on) and merged.  Metrics, which depend on row-level metrics,
+    but cannot be merged, fail; other metrics are computed once (and fail, should they read Batch
+    data).  The pass is made when the value of the first metric is requested, so that metrics
+    computed by concurrent "MetricExecutor" share it.
+
+    Args:
+        batch_data: Batch data, which is read in chunks
+    """
+
+    def __init__(self, batch_data: ChunkedPandasBatchData) -> None:
+        self._batch_data = batch_data
+
+        self._metrics: Dict[Tuple[str, str, str], Tuple[Callable, dict, ChunkMerge]] = {}
+        self._values: Dict[Tuple[str, str, str], Any] = {}
+        self._errors: Dict[Tuple[str, str, str], Exception] = {}
+        self._computed = False
+
+        self._lock = threading.Lock()
+
+    def add(
+        self, metric_computation_configuration: MetricComputationConfiguration
+    ) -> MetricComputationConfiguration:
+        """Returns metric computation configuration, computing the metric over chunks."""
+        metric_fn: Callable = metric_computation_configuration.metric_fn
+        metric_provider_kwargs: dict = metric_computation_configuration.metric_provider_kwargs
+        metric_name: str = metric_computation_configuration.metric_configuration.metric_name
+        metric_id: Tuple[str, str, str] = metric_computation_configuration.metric_configuration.id
+
+        chunk_metric_fn: Callable
+        chunk_merge: Optional[ChunkMerge] = get_chunk_merge(
+            metric_name=metric_name, metric_provider_kwargs=metric_provider_kwargs
+        )
+        if metric_name.rpartition(".")[0] in ROW_COMPARING_CONDITION_METRIC_NAMES:
+            chunk_metric_fn = partial(_raise_not_supported, metric_name)
+        elif getattr(metric_fn, "metric_fn_type", None) in ROW_LEVEL_METRIC_FUNCTION_TYPES:
+            chunk_metric_fn = partial(_defer_metric, metric_fn)
+        elif chunk_merge is not None:
+            self._metrics[metric_id] = (metric_fn, metric_provider_kwargs, chunk_merge)
+            chunk_metric_fn = partial(self._get_value, metric_id)
+        elif any(
+            isinstance(value, DeferredChunkMetricValue)
+            for value in metric_provider_kwargs["metrics"].values()
+        ):
+            chunk_metric_fn = partial(_raise_not_mergeable, metric_name)
+        else:
+            return metric_computation_configuration
+
+        return dataclasses.replace(metric_computation_configuration, metric_fn=chunk_metric_fn)
+
+    def _get_value(self, metric_id: Tuple[str, str, str], **metric_provider_kwargs) -> Any:
+        with self._lock:
+            if not self._computed:
+                self._compute()
+                self._computed = True
+
+        if metric_id in self._errors:
+            raise self._errors[metric_id]
+
+        return self._values[metric_id]
+
+    def _compute(self) -> None:
+        partial_values: Dict[Tuple[str, str, str], Any] = {}
+        pending: Set[Tuple[str, str, str]] = set(self._metrics)
+
+        with contextlib.closing(self._batch_data.iter_chunks()) as chunks:
+            for _chunk in chunks:
+                self._compute_chunk(pending=pending, partial_values=partial_values)
+                if not pending:
+                    break
+
+        logger.debug(f"Computed {len(self._metrics)} metrics in a pass over chunks of Batch data.")
+
+        metric_id: Tuple[str, str, str]
+        for metric_id, (_, metric_provider_kwargs, chunk_merge) in self._metrics.items():
+            if metric_id in self._errors:
+                continue
+
+            if metric_id not in partial_values:
+                self._errors[metric_id] = gx_exceptions.MetricError(
+                    message="Batch data, which is read in chunks, has no chunks."
+                )
+                continue
+
+            try:
+                self._values[metric_id] = chunk_merge.finalize_value(
+                    value=partial_values[metric_id], metric_provider_kwargs=metric_provider_kwargs
+                )
+            except Exception as e:
+                self._errors[metric_id] = e
+
+    def _compute_chunk(
+        self,
+        pending: Set[Tuple[str, str, str]],
+        partial_values: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        """Computes pending metrics for current chunk, and merges them into their partial values."""
+        # values of row-level metrics of this chunk, shared by metrics depending on them
+        chunk_values: Dict[int, Any] = {}
+
+        metric_id: Tuple[str, str, str]
+        for metric_id in sorted(pending):
+            metric_fn, metric_provider_kwargs, chunk_merge = self._metrics[metric_id]
+            try:
+                value = chunk_merge.compute_chunk(
+                    metric_fn=metric_fn,
+                    metric_provider_kwargs=get_chunk_metric_provider_kwargs(
+                        metric_provider_kwargs=metric_provider_kwargs, chunk_values=chunk_values
+                    ),
+                )
+            except Exception as e:
+                self._errors[metric_id] = e
+                pending.discard(metric_id)
+                continue
+
+            if metric_id in partial_values:
+                value = chunk_merge.merge(partial_values[metric_id], value)
+            partial_values[metric_id] = value
+
+            if chunk_merge.first_chunk_only:
+                pending.discard(metric_id)
+
+
+def get_chunk_merge(metric_name: str, metric_provider_kwargs: dict) -> Optional[ChunkMerge]:
+    """Returns how metric is merged across chunks; None, if it is not (see "ChunkMerge.applies")."""
+    chunk_merge: Optional[ChunkMerge] = CHUNK_MERGES.get(metric_name)
+    if chunk_merge is None:
+        for suffix, suffix_chunk_merge in CHUNK_MERGES_BY_SUFFIX.items():
+            if metric_name.endswith(suffix):
+                chunk_merge = suffix_chunk_merge
+                break
+
+    if chunk_merge is None or (
+        chunk_merge.applies is not None and not chunk_merge.applies(metric_provider_kwargs)
+    ):
+        return None
+
+    return chunk_merge
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (pd.api.types.is_scalar(value) and pd.isna(value))
+
+
+def _merge_min(value: Any, other: Any) -> Any:
+    if _is_missing(value):
+        return other
+
+    if _is_missing(other):
+        return value
+
+    return min(value, other)
+
+
+def _merge_max(value: Any, other: Any) -> Any:
+    if _is_missing(value):
+        return other
+
+    if _is_missing(other):
+        return value
+
+    return max(value, other)
+
+
+def _get_nonnull_column_values(metric_provider_kwargs: dict) -> pd.Series:
+    df, _, accessor_domain_kwargs = metric_provider_kwargs["execution_engine"].get_compute_domain(
+        domain_kwargs=metric_provider_kwargs["metric_domain_kwargs"],
+        domain_type=MetricDomainTypes.COLUMN,
+    )
+    column_values: pd.Series = df[accessor_domain_kwargs["column"]]
+    return column_values[column_values.notnull()]
+
+
+def _compute_moments(metric_fn: Callable, metric_provider_kwargs: dict) -> Tuple[int, float, float]:
+    """Returns number, mean, and sum of squared deviations from mean of non-null column values."""
+    values: np.ndarray = _get_nonnull_column_values(
+        metric_provider_kwargs=metric_provider_kwargs
+    ).to_numpy(dtype=float)
+    if not values.size:
+        return 0, 0.0, 0.0
+
+    mean = float(values.mean())
+    return values.size, mean, float(((values - mean) ** 2).sum())
+
+
+def _merge_moments(
+    moments: Tuple[int, float, float], other: Tuple[int, float, float]
+) -> Tuple[int, float, float]:
+    """Merges moments of two parts of column (as in parallel variant of Welford's algorithm)."""
+    count, mean, squared_deviations = moments
+    other_count, other_mean, other_squared_deviations = other
+    total_count: int = count + other_count
+    if not total_count:
+        return moments
+
+    delta: float = other_mean - mean
+    return (
+        total_count,
+        mean + delta * other_count / total_count,
+        squared_deviations
+        + other_squared_deviations
+        + delta**2 * count * other_count / total_count,
+    )
+
+
+def _finalize_mean(moments: Tuple[int, float, float], metric_provider_kwargs: dict) -> float:
+    count, mean, _ = moments
+    return mean if count else np.nan
+
+
+def _finalize_standard_deviation(
+    moments: Tuple[int, float, float], metric_provider_kwargs: dict
+) -> float:
+    count, _, squared_deviations = moments
+    # sample standard deviation (as "pd.Series.std()")
+    return float(np.sqrt(squared_deviations / (count - 1))) if count > 1 else np.nan
+
+
+def _compute_quantile_sketch(metric_fn: Callable, metric_provider_kwargs: dict) -> Any:
+    from great_expectations.expectations.metrics.quantile_sketch import QuantileSketch
+
+    sketch = QuantileSketch()
+    sketch.update(
+        _get_nonnull_column_values(metric_provider_kwargs=metric_provider_kwargs).to_numpy()
+    )
+    return sketch
+
+
+def _merge_quantile_sketches(sketch: Any, other: Any) -> Any:
+    sketch.merge(other)
+    return sketch
+
+
+def _finalize_quantile_values(sketch: Any, metric_provider_kwargs: dict) -> Any:
+    metric_value_kwargs: dict = metric_provider_kwargs["metric_value_kwargs"]
+    values: list = sketch.quantiles(metric_value_kwargs["quantiles"])
+    if metric_value_kwargs.get("approximate"):
+        return {"values": values, "rank_error": sketch.rank_error}
+
+    return values
+
+
+def _finalize_median(sketch: Any, metric_provider_kwargs: dict) -> Any:
+    (value,) = sketch.quantiles([0.5])
+    if metric_provider_kwargs["metric_value_kwargs"].get("approximate"):
+        return {"value": value, "rank_error": sketch.rank_error}
+
+    return value
+
+
+def _compute_distinct_values(metric_fn: Callable, metric_provider_kwargs: dict) -> set:
+    return set(_get_nonnull_column_values(metric_provider_kwargs=metric_provider_kwargs).unique())
+
+
+def _compute_value_counts(metric_fn: Callable, metric_provider_kwargs: dict) -> pd.Series:
+    return metric_fn(
+        **{
+            **metric_provider_kwargs,
+            "metric_value_kwargs": {
+                **metric_provider_kwargs["metric_value_kwargs"],
+                "sort": "none",
+            },
+        }
+    )
+
+
+def _compute_column_value_counts(metric_fn: Callable, metric_provider_kwargs: dict) -> pd.Series:
+    return _get_nonnull_column_values(metric_provider_kwargs=metric_provider_kwargs).value_counts()
+
+
+def _merge_value_counts(value_counts: pd.Series, other: pd.Series) -> pd.Series:
+    merged: pd.Series = value_counts.add(other, fill_value=0).astype("int64")
+    merged.name = value_counts.name
+    merged.index.name = value_counts.index.name
+    return merged
+
+
+def _finalize_value_counts(value_counts: pd.Series, metric_provider_kwargs: dict) -> pd.Series:
+    from great_expectations.expectations.metrics.column_aggregate_metrics import (
+        column_value_counts,
+    )
+
+    return column_value_counts._sort_value_counts(
+        value_counts=value_counts,
+        sort=metric_provider_kwargs["metric_value_kwargs"].get("sort") or "value",
+    )
+
+
+def _finalize_most_common_value(value_counts: pd.Series, metric_provider_kwargs: dict) -> list:
+    if value_counts.empty:
+        return []
+
+    # all most common values, sorted (as "pd.Series.mode()")
+    return list(value_counts[value_counts == value_counts.max()].index.sort_values())
+
+
+def _get_result_limit(metric_provider_kwargs: dict) -> int:
+    from great_expectations.expectations.metrics.util import MAX_RESULT_RECORDS
+
+    result_format: dict = metric_provider_kwargs["metric_value_kwargs"]["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return MAX_RESULT_RECORDS
+
+    return min(result_format["partial_unexpected_count"], MAX_RESULT_RECORDS)
+
+
+def _finalize_unexpected_values(values: list, metric_provider_kwargs: dict) -> list:
+    return values[: _get_result_limit(metric_provider_kwargs=metric_provider_kwargs)]
+
+
+def _finalize_unexpected_index_list(values: list, metric_provider_kwargs: dict) -> list:
+    result_format: dict = metric_provider_kwargs["metric_value_kwargs"]["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return values
+
+    return values[: result_format["partial_unexpected_count"]]
+
+
+# Pandas "unexpected_index_query" metrics filter unexpected rows by their indices.
+_UNEXPECTED_INDEX_QUERY_PATTERN = re.compile(r"^df\.filter\(items=(.*), axis=0\)$", re.DOTALL)
+
+
+def _compute_unexpected_index_query(
+    metric_fn: Callable, metric_provider_kwargs: dict
+) -> list | None:
+    """Returns indices of unexpected rows of chunk (filtered by "unexpected_index_query")."""
+    query: Optional[str] = metric_fn(**metric_provider_kwargs)
+    if query is None:
+        return None
+
+    match: Optional[re.Match] = _UNEXPECTED_INDEX_QUERY_PATTERN.match(query)
+    if match is None:
+        raise gx_exceptions.MetricError(
+            message=f'Unexpected index query "{query}" cannot be merged across chunks.'
+        )
+
+    return ast.literal_eval(match.group(1))
+
+
+def _merge_unexpected_index_queries(values: list | None, other: list | None) -> list | None:
+    if values is None or other is None:
+        return None
+
+    return values + other
+
+
+def _finalize_unexpected_index_query(
+    values: list | None, metric_provider_kwargs: dict
+) -> str | None:
+    if values is None:
+        return None
+
+    return f"df.filter(items={values}, axis=0)"
+
+
+def _finalize_unexpected_rows(rows: pd.DataFrame, metric_provider_kwargs: dict) -> pd.DataFrame:
+    return rows.iloc[: _get_result_limit(metric_provider_kwargs=metric_provider_kwargs)]
+
+
+def _sum(value: Any, other: Any) -> Any:
+    return value + other
+
+
+def _keep_first(value: Any, other: Any) -> Any:
+    return value
+
+
+# Metrics, which are merged across chunks of Batch data (by name).
+CHUNK_MERGES: Dict[str, ChunkMerge] = {
+    "table.row_count": ChunkMerge(merge=_sum),
+    "table.columns": ChunkMerge(merge=_keep_first, first_chunk_only=True),
+    "table.column_types": ChunkMerge(merge=_keep_first, first_chunk_only=True),
+    "column.min": ChunkMerge(merge=_merge_min),
+    "column.max": ChunkMerge(merge=_merge_max),
+    "column.sum": ChunkMerge(merge=_sum),
+    "column.mean": ChunkMerge(
+        compute=_compute_moments, merge=_merge_moments, finalize=_finalize_mean
+    ),
+    "column.standard_deviation": ChunkMerge(
+        compute=_compute_moments, merge=_merge_moments, finalize=_finalize_standard_deviation
+    ),
+    "column.median": ChunkMerge(
+        compute=_compute_quantile_sketch, merge=_merge_quantile_sketches, finalize=_finalize_median
+    ),
+    "column.quantile_values": ChunkMerge(
+        compute=_compute_quantile_sketch,
+        merge=_merge_quantile_sketches,
+        finalize=_finalize_quantile_values,
+    ),
+    "column.histogram": ChunkMerge(merge=lambda counts, other: list(np.add(counts, other))),
+    "column.value_counts": ChunkMerge(
+        compute=_compute_value_counts,
+        merge=_merge_value_counts,
+        finalize=_finalize_value_counts,
+        # value counts sorted from (already merged) unsorted value counts are computed once
+        applies=lambda metric_provider_kwargs: "column.value_counts"
+        not in metric_provider_kwargs["metrics"],
+    ),
+    "column.most_common_value": ChunkMerge(
+        compute=_compute_column_value_counts,
+        merge=_merge_value_counts,
+        finalize=_finalize_most_common_value,
+    ),
+    "column.distinct_values": ChunkMerge(merge=set.union),
+    "column.distinct_values.count": ChunkMerge(
+        compute=_compute_distinct_values,
+        merge=set.union,
+        finalize=lambda values, metric_provider_kwargs: len(values),
+    ),
+    "column.distinct_values.count.under_threshold": ChunkMerge(
+        compute=_compute_distinct_values,
+        merge=set.union,
+        finalize=lambda values, metric_provider_kwargs: len(values)
+        < metric_provider_kwargs["metric_value_kwargs"]["threshold"],
+    ),
+    "column_values.between.count": ChunkMerge(merge=_sum),
+    "column_values.length.min": ChunkMerge(merge=_merge_min),
+    "column_values.length.max": ChunkMerge(merge=_merge_max),
+}
+
+# Summarization metrics of map metrics (e.g., "column_values.in_set.unexpected_count"), which are
+# merged across chunks of Batch data (by suffix of their name).
+CHUNK_MERGES_BY_SUFFIX: Dict[str, ChunkMerge] = {
+    ".unexpected_count": ChunkMerge(merge=_sum),
+    ".filtered_row_count": ChunkMerge(merge=_sum),
+    ".unexpected_values": ChunkMerge(merge=_sum, finalize=_finalize_unexpected_values),
+    ".unexpected_index_list": ChunkMerge(merge=_sum, finalize=_finalize_unexpected_index_list),
+    ".unexpected_index_query": ChunkMerge(
+        compute=_compute_unexpected_index_query,
+        merge=_merge_unexpected_index_queries,
+        finalize=_finalize_unexpected_index_query,
+    ),
+    ".unexpected_rows": ChunkMerge(
+        merge=lambda rows, other: pd.concat([rows, other]), finalize=_finalize_unexpected_rows
+    ),
+}
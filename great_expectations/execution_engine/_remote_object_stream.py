@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import io
+import logging
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Size of ranges fetched from remote objects (and of the buffer, in which they are held).
+REMOTE_READ_BUFFER_SIZE = 8 * 1024 * 1024
+# Size of the buffer of readers seeking to parts of remote objects (e.g., Parquet footers).
+SEEKING_READ_BUFFER_SIZE = 64 * 1024
+
+
+class RangedObjectStream(io.RawIOBase):
+    """Read-only, seekable file object over a remote object (e.g., in S3, GCS, or Azure Blob).
+
+    Bytes are fetched on demand, by "read_range(start, end)" (returning bytes of the object in the
+    range [start, end)), so that readers consuming the object sequentially (e.g., CSV and JSON
+    readers, decompressing the object as they go) or seeking to parts of it (e.g., Parquet readers,
+    reading the footer and then the row groups they need) never hold the whole object in memory.
+
+    Args:
+        size: size of the object, in bytes.
+        read_range: callable, fetching bytes of the object in given range.
+        name: name of the object (used in error messages of readers).
+        range_size: maximum size of ranges fetched by single reads.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        read_range: Callable[[int, int], bytes],
+        name: str | None = None,
+        range_size: int = REMOTE_READ_BUFFER_SIZE,
+    ) -> None:
+        super().__init__()
+        self._size = size
+        self._read_range = read_range
+        self._range_size = range_size
+        self._position = 0
+        self.name = name
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")  # noqa: TRY003 # FIXME CoP
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")  # noqa: TRY003 # FIXME CoP
+
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def,override] # FIXME CoP
+        end: int = min(self._position + len(buffer), self._position + self._range_size, self._size)
+        if end <= self._position:
+            return 0
+
+        data: bytes = self._read_range(self._position, end)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+def open_ranged_object_stream(
+    size: int,
+    read_range: Callable[[int, int], bytes],
+    name: str | None = None,
+    buffer_size: int = REMOTE_READ_BUFFER_SIZE,
+    sequential: bool = True,
+) -> io.BufferedReader:
+    """Returns buffered file object over a remote object, fetching ranges of up to "buffer_size".
+
+    Readers consuming the object sequentially (e.g., of CSV and JSON) read ahead "buffer_size"
+    bytes at a time.  Readers seeking to parts of the object (e.g., of Parquet and Feather) would
+    discard most of such a read-ahead on every seek, so unless "sequential", the buffer holds
+    (at most) SEEKING_READ_BUFFER_SIZE bytes, and larger reads fetch only the bytes they read.
+    """
+    logger.debug(f"Streaming remote object {name} ({size} bytes).")
+    return io.BufferedReader(
+        RangedObjectStream(size=size, read_range=read_range, name=name, range_size=buffer_size),
+        buffer_size=buffer_size if sequential else min(buffer_size, SEEKING_READ_BUFFER_SIZE),
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import contextlib
 import copy
+import dataclasses
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
@@ -8,10 +10,12 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ContextManager,
     Dict,
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -21,6 +25,16 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    MetricCacheStatistics,
+    PersistentMetricCache,
+)
+from great_expectations.execution_engine.metric_executor import (
+    MetricExecutor,
+    SerialMetricExecutor,
+    build_metric_executor,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -40,17 +54,22 @@ if TYPE_CHECKING:
     from great_expectations.compatibility.pyspark import functions as F
     from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
     from great_expectations.core.batch import (
+        AnyBatch,
         BatchData,
         BatchDataType,
         BatchDataUnion,
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.data_context.store.metric_store import BatchMetricStore
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
+    from great_expectations.validator.validation_profiler import ValidationProfiler
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
 
+_MISSING_METRIC = object()
+
 
 class NoOpDict:
     def __getitem__(self, item):
@@ -131,6 +150,12 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        metric_cache_max_size_in_bytes: upper bound on estimated memory footprint of metric cache; least recently used
+            metrics are evicted beyond it (default is None, meaning unbounded).  Metrics of a Batch are always evicted
+            once that Batch is unloaded.
+        persistent_metric_store: BatchMetricStore (or its configuration), in which metric values are persisted between
+            runs, keyed by fingerprint of Batch data (see "get_batch_fingerprint()"); metrics of Batch data, whose
+            fingerprint is unchanged, are then obtained from it instead of being recomputed (default is None).
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
@@ -138,13 +163,18 @@ class ExecutionEngine(ABC):
 
     recognized_batch_spec_defaults: Set[str] = set()
 
-    def __init__(
+    # ValidationProfiler is only set while validation is profiled.
+    _validation_profiler: Optional[ValidationProfiler] = None
+
+    def __init__(  # noqa: PLR0913 # FIXME CoP
         self,
         name: Optional[str] = None,
         caching: bool = True,
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_cache_max_size_in_bytes: Optional[int] = None,
+        persistent_metric_store: Optional[Union[BatchMetricStore, dict]] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -152,12 +182,17 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store  # noqa: E501 # FIXME CoP
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+            self._metric_cache: Union[MetricCache, NoOpDict] = MetricCache(
+                max_size_in_bytes=metric_cache_max_size_in_bytes
+            )
         else:
             self._metric_cache = NoOpDict()
 
+        self._persistent_metric_cache: Optional[PersistentMetricCache] = (
+            self._build_persistent_metric_cache(persistent_metric_store=persistent_metric_store)
+        )
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -190,11 +225,35 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache_max_size_in_bytes": metric_cache_max_size_in_bytes,
+            "persistent_metric_store": persistent_metric_store,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    @staticmethod
+    def _build_persistent_metric_cache(
+        persistent_metric_store: Optional[Union[BatchMetricStore, dict]],
+    ) -> Optional[PersistentMetricCache]:
+        if persistent_metric_store is None:
+            return None
+
+        if isinstance(persistent_metric_store, dict):
+            from great_expectations.data_context.util import instantiate_class_from_config
+
+            persistent_metric_store = instantiate_class_from_config(
+                config={
+                    "module_name": "great_expectations.data_context.store",
+                    "class_name": "BatchMetricStore",
+                    **persistent_metric_store,
+                },
+                runtime_environment={},
+                config_defaults={},
+            )
+
+        return PersistentMetricCache(store=persistent_metric_store)  # type: ignore[arg-type] # instantiated from config
+
     def configure_validator(  # noqa: B027 # empty-method-without-abstract-decorator
         self, validator
     ) -> None:
@@ -214,6 +273,27 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def metric_cache_statistics(self) -> Optional[MetricCacheStatistics]:
+        """Hit, miss, and eviction counters, and occupancy, of metric cache (None if disabled)."""
+        if not self._caching:
+            return None
+
+        return self._metric_cache.statistics  # type: ignore[union-attr] # caching implies MetricCache
+
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        return self._persistent_metric_cache
+
+    @property
+    def validation_profiler(self) -> Optional[ValidationProfiler]:
+        """ValidationProfiler recording performance of metric computations (None unless enabled)."""
+        return self._validation_profiler
+
+    @validation_profiler.setter
+    def validation_profiler(self, value: Optional[ValidationProfiler]) -> None:
+        self._validation_profiler = value
+
     def _load_batch_data_from_dict(self, batch_data_dict: Dict[str, BatchDataType]) -> None:
         """
         Loads all data in batch_data_dict using cache_batch_data
@@ -226,6 +306,106 @@ class ExecutionEngine(ABC):
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def unload_batch_data(self, batch_id: str) -> None:
+        """Releases data of Batch "batch_id" along with all metrics cached for it."""
+        self._batch_manager.unload_batch_data(batch_id=batch_id)
+
+    def get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Returns fingerprint of data of loaded Batch "batch_id" (None, if it cannot be taken).
+
+        Fingerprint is taken from markers of the Batch: "batch_fingerprint" (e.g., based on file
+        size and modification time, object ETag, or result of freshness query), or else
+        "pandas_data_fingerprint" (hash of DataFrame contents).
+        """
+        if batch_id is None:
+            return None
+
+        batch: Optional[AnyBatch] = self._batch_manager.batch_cache.get(batch_id)
+        batch_markers: Optional[BatchMarkers] = None if batch is None else batch.batch_markers
+        if not batch_markers:
+            return None
+
+        return batch_markers.get("batch_fingerprint") or batch_markers.get(
+            "pandas_data_fingerprint"
+        )
+
+    def get_persisted_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Returns values of metrics, which earlier runs have persisted for current Batch data.
+
+        Args:
+            metric_configurations: metrics to look up in persistent metric store
+
+        Returns:
+            Dictionary of persisted metric values keyed by metric ID (empty if persistent metric
+            store is not used).
+        """
+        persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if self._persistent_metric_cache is None:
+            return persisted_metrics
+
+        metric_configuration: MetricConfiguration
+        batch_fingerprint: Optional[str]
+        value: MetricValue
+        for metric_configuration in metric_configurations:
+            batch_fingerprint = self.get_batch_fingerprint(
+                batch_id=self._get_metric_batch_id(metric_configuration=metric_configuration)
+            )
+            if batch_fingerprint is None:
+                continue
+
+            value = self._persistent_metric_cache.get(
+                batch_fingerprint=batch_fingerprint,
+                metric_configuration=metric_configuration,
+                default=_MISSING_METRIC,
+            )
+            if value is not _MISSING_METRIC:
+                persisted_metrics[metric_configuration.id] = value
+
+        return persisted_metrics
+
+    def _persist_metrics(
+        self,
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+        metric_configurations: Iterable[MetricConfiguration],
+    ) -> None:
+        if self._persistent_metric_cache is None:
+            return
+
+        entries: List[Tuple[str, MetricConfiguration, MetricValue]] = []
+        metric_configuration: MetricConfiguration
+        batch_fingerprint: Optional[str]
+        for metric_configuration in metric_configurations:
+            if metric_configuration.id not in resolved_metrics:
+                continue
+
+            batch_fingerprint = self.get_batch_fingerprint(
+                batch_id=self._get_metric_batch_id(metric_configuration=metric_configuration)
+            )
+            if batch_fingerprint is None:
+                continue
+
+            entries.append(
+                (batch_fingerprint, metric_configuration, resolved_metrics[metric_configuration.id])
+            )
+
+        try:
+            # all metric values are persisted together (in one bulk write to database stores)
+            self._persistent_metric_cache.put_many(entries=entries)
+        except Exception as e:
+            # Failure to persist metric values must not fail metric resolution.
+            logger.warning(f"Unable to persist metrics: {e}")
+
+    def evict_cached_metrics(self, batch_id: Optional[str]) -> None:
+        """Evicts all metrics computed on Batch "batch_id" from metric cache."""
+        if not self._caching:
+            return
+
+        num_evicted: int = self._metric_cache.evict_batch(batch_id=batch_id)  # type: ignore[union-attr] # caching implies MetricCache
+        if num_evicted:
+            logger.debug(f'Evicted {num_evicted} cached metrics of Batch "{batch_id}".')
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -279,6 +459,7 @@ class ExecutionEngine(ABC):
         return self._process_direct_and_bundled_metric_computation_configurations(
             metric_fn_direct_configurations=metric_fn_direct_configurations,
             metric_fn_bundle_configurations=metric_fn_bundle_configurations,
+            runtime_configuration=runtime_configuration,
         )
 
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -496,14 +677,19 @@ class ExecutionEngine(ABC):
         ) in metric_to_resolve.metric_dependencies.items():
             if metric_configuration.id in metrics:
                 metric_dependencies_by_metric_name[metric_name] = metrics[metric_configuration.id]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
-                metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
-                    metric_configuration.id
-                ]
-            else:
-                raise gx_exceptions.MetricError(
-                    message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'  # noqa: E501 # FIXME CoP
+                continue
+
+            if self._caching:
+                cached_metric: MetricValue = self._metric_cache.get(  # type: ignore[union-attr] # caching implies MetricCache
+                    metric_configuration.id, _MISSING_METRIC
                 )
+                if cached_metric is not _MISSING_METRIC:
+                    metric_dependencies_by_metric_name[metric_name] = cached_metric
+                    continue
+
+            raise gx_exceptions.MetricError(
+                message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'  # noqa: E501 # FIXME CoP
+            )
 
         return metric_dependencies_by_metric_name
 
@@ -511,33 +697,40 @@ class ExecutionEngine(ABC):
         self,
         metric_fn_direct_configurations: List[MetricComputationConfiguration],
         metric_fn_bundle_configurations: List[MetricComputationConfiguration],
+        runtime_configuration: Optional[dict] = None,
     ) -> Dict[Tuple[str, str, str], MetricValue]:
         """
         This method processes directly-computable and bundled "MetricComputationConfiguration" objects.
 
+        Directly-computable metrics are computed by "MetricExecutor", selected using "runtime_configuration".
+
         Args:
             metric_fn_direct_configurations: directly-computable "MetricComputationConfiguration" objects
             metric_fn_bundle_configurations: bundled "MetricComputationConfiguration" objects (column aggregates)
+            runtime_configuration: runtime configuration information
 
         Returns:
             resolved_metrics (Dict): a dictionary with the values for the metrics that have just been resolved.
         """  # noqa: E501 # FIXME CoP
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-        metric_computation_configuration: MetricComputationConfiguration
-
-        for metric_computation_configuration in metric_fn_direct_configurations:
-            try:
-                resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
-                    metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                        **metric_computation_configuration.metric_provider_kwargs
-                    )
+        metric_executor: MetricExecutor = self._get_metric_executor(
+            runtime_configuration=runtime_configuration
+        )
+        validation_profiler: Optional[ValidationProfiler] = self._validation_profiler
+        if validation_profiler is not None:
+            metric_fn_direct_configurations = [
+                dataclasses.replace(
+                    metric_computation_configuration,
+                    metric_fn=validation_profiler.wrap(
+                        metric_fn=metric_computation_configuration.metric_fn,  # type: ignore[arg-type] # direct metric_fn is callable
+                        metric_configuration=metric_computation_configuration.metric_configuration,
+                    ),
                 )
-            except Exception as e:
-                raise gx_exceptions.MetricResolutionError(
-                    message=str(e),
-                    failed_metrics=(metric_computation_configuration.metric_configuration,),
-                ) from e
+                for metric_computation_configuration in metric_fn_direct_configurations
+            ]
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = metric_executor.execute(
+            metric_computation_configurations=metric_fn_direct_configurations
+        )
 
         try:
             # an engine-specific way of computing metrics together
@@ -545,6 +738,10 @@ class ExecutionEngine(ABC):
                 self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle_configurations)
             )
             resolved_metrics.update(resolved_metric_bundle)
+        except gx_exceptions.MetricResolutionError as e:
+            # engine-specific bundle resolution has already identified the failed metrics
+            e.resolved_metrics = {**resolved_metrics, **e.resolved_metrics}
+            raise
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -552,13 +749,83 @@ class ExecutionEngine(ABC):
                     metric_computation_configuration.metric_configuration
                     for metric_computation_configuration in metric_fn_bundle_configurations
                 ],
+                resolved_metrics=resolved_metrics,
             ) from e
 
+        metric_configurations: List[MetricConfiguration] = [
+            metric_computation_configuration.metric_configuration
+            for metric_computation_configuration in metric_fn_direct_configurations
+            + metric_fn_bundle_configurations
+        ]
+
         if self._caching:
-            self._metric_cache.update(resolved_metrics)
+            metric_configuration: MetricConfiguration
+            batch_ids: Dict[Tuple[str, str, str], Optional[str]] = {
+                metric_configuration.id: self._get_metric_batch_id(
+                    metric_configuration=metric_configuration
+                )
+                for metric_configuration in metric_configurations
+            }
+            self._metric_cache.update(  # type: ignore[call-arg] # caching implies MetricCache
+                metrics=resolved_metrics, batch_ids=batch_ids
+            )
+
+        self._persist_metrics(
+            resolved_metrics=resolved_metrics, metric_configurations=metric_configurations
+        )
 
         return resolved_metrics
 
+    def _measure_metrics(
+        self, metric_configurations: Sequence[MetricConfiguration]
+    ) -> ContextManager[None]:
+        """Measures computation of "metric_configurations" (e.g., bundled query), if profiling."""
+        if self._validation_profiler is None:
+            return contextlib.nullcontext()
+
+        return self._validation_profiler.measure(metric_configurations=metric_configurations)
+
+    def _record_queries(self, num_queries: int = 1) -> None:
+        """Reports queries (or jobs) issued to backend, if validation is profiled."""
+        if self._validation_profiler is not None:
+            self._validation_profiler.record_queries(num_queries=num_queries)
+
+    def _record_scan(self, num_rows: int, num_bytes: int = 0) -> None:
+        """Reports rows (and bytes) of Batch data scanned, if validation is profiled."""
+        if self._validation_profiler is not None:
+            self._validation_profiler.record_scan(num_rows=num_rows, num_bytes=num_bytes)
+
+    def _get_metric_batch_id(self, metric_configuration: MetricConfiguration) -> Optional[str]:
+        """Returns ID of Batch, on which metric is computed (Domain "batch_id" or active Batch)."""
+        return (
+            metric_configuration.metric_domain_kwargs.get("batch_id")
+            or self._batch_manager.active_batch_data_id
+        )
+
+    def _get_metric_executor(self, runtime_configuration: Optional[dict] = None) -> MetricExecutor:
+        """Returns "MetricExecutor" requested by "runtime_configuration"; should the ExecutionEngine
+        not support computing metrics concurrently, metrics are computed serially.
+        """
+        metric_executor: MetricExecutor = build_metric_executor(
+            runtime_configuration=runtime_configuration
+        )
+        if not (
+            isinstance(metric_executor, SerialMetricExecutor)
+            or self._supports_concurrent_metric_execution
+        ):
+            logger.debug(
+                f"{type(self).__name__} does not support concurrent metric computation; "
+                "computing metrics serially."
+            )
+            return SerialMetricExecutor()
+
+        return metric_executor
+
+    @property
+    def _supports_concurrent_metric_execution(self) -> bool:
+        """Whether or not metric functions may be called concurrently from multiple threads."""
+        return True
+
     def _partition_domain_kwargs(
         self,
         domain_kwargs: Dict[str, Any],
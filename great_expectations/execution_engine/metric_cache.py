@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations import __version__ as ge_version
+from great_expectations.core.id_dict import IDDict
+from great_expectations.data_context.types.resource_identifiers import (
+    BatchMetricIdentifier,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.data_context.store.metric_store import BatchMetricStore
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+_MetricKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class MetricCacheStatistics:
+    """Snapshot of "MetricCache" counters and occupancy."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_in_bytes: int
+
+
+def estimate_size_in_bytes(value: Any) -> int:
+    """Estimates memory footprint of metric value.
+
+    Pandas and NumPy objects report their own (deep) memory usage; containers are measured
+    recursively; everything else falls back to "sys.getsizeof()".  The estimate is meant for cache
+    accounting, not for exact measurement.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    size: int = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size_in_bytes(key) + estimate_size_in_bytes(element)
+            for key, element in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size_in_bytes(element) for element in value)
+
+    return size
+
+
+@dataclass
+class _MetricCacheEntry:
+    value: MetricValue
+    batch_id: Optional[str]
+    size_in_bytes: int
+
+
+class MetricCache:
+    """Least-recently-used cache of resolved metrics, bounded by estimated memory footprint.
+
+    Every entry is associated with the Batch its metric was computed on, so that all metrics of a
+    Batch can be evicted once the Batch is unloaded (or its data is replaced).  Hit, miss, and
+    eviction counters are maintained for diagnostics (see "statistics").
+
+    Args:
+        max_size_in_bytes: upper bound on total estimated size of cached metric values; "None" means
+            unbounded.  A single value larger than the bound is not cached at all.
+    """
+
+    def __init__(self, max_size_in_bytes: Optional[int] = None) -> None:
+        if max_size_in_bytes is not None and max_size_in_bytes < 0:
+            raise gx_exceptions.InvalidConfigError(  # noqa: TRY003 # FIXME CoP
+                f'"max_size_in_bytes" must be a non-negative integer (got {max_size_in_bytes}).'
+            )
+
+        self._max_size_in_bytes = max_size_in_bytes
+
+        self._entries: OrderedDict[_MetricKey, _MetricCacheEntry] = OrderedDict()
+        self._metric_ids_by_batch_id: Dict[Optional[str], Set[_MetricKey]] = {}
+        self._size_in_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._lock = threading.RLock()
+
+    @property
+    def max_size_in_bytes(self) -> Optional[int]:
+        return self._max_size_in_bytes
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size_in_bytes
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        with self._lock:
+            return MetricCacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_in_bytes=self._size_in_bytes,
+            )
+
+    def __contains__(self, metric_id: object) -> bool:
+        return metric_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, metric_id: _MetricKey) -> MetricValue:
+        with self._lock:
+            entry: _MetricCacheEntry = self._entries[metric_id]
+            self._entries.move_to_end(metric_id)
+            return entry.value
+
+    def get(self, metric_id: _MetricKey, default: Any = None) -> Any:
+        """Returns cached value of metric (marking it most recently used), counting hit or miss."""
+        with self._lock:
+            entry: Optional[_MetricCacheEntry] = self._entries.get(metric_id)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._entries.move_to_end(metric_id)
+            return entry.value
+
+    def put(
+        self,
+        metric_id: _MetricKey,
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+    ) -> None:
+        """Caches metric value computed on Batch "batch_id", evicting least recently used values."""
+        size_in_bytes: int = estimate_size_in_bytes(value)
+        with self._lock:
+            self._remove(metric_id=metric_id)
+
+            if self._max_size_in_bytes is not None and size_in_bytes > self._max_size_in_bytes:
+                logger.debug(
+                    f"Not caching metric {metric_id}: its estimated size ({size_in_bytes} bytes) "
+                    "exceeds cache capacity."
+                )
+                return
+
+            self._entries[metric_id] = _MetricCacheEntry(
+                value=value, batch_id=batch_id, size_in_bytes=size_in_bytes
+            )
+            self._metric_ids_by_batch_id.setdefault(batch_id, set()).add(metric_id)
+            self._size_in_bytes += size_in_bytes
+
+            self._evict_least_recently_used()
+
+    def update(
+        self,
+        metrics: Dict[_MetricKey, MetricValue],
+        batch_ids: Optional[Dict[_MetricKey, Optional[str]]] = None,
+    ) -> None:
+        """Caches many metric values; "batch_ids" optionally maps metric IDs to IDs of Batches."""
+        if batch_ids is None:
+            batch_ids = {}
+
+        metric_id: _MetricKey
+        value: MetricValue
+        for metric_id, value in metrics.items():
+            self.put(metric_id=metric_id, value=value, batch_id=batch_ids.get(metric_id))
+
+    def evict_batch(self, batch_id: Optional[str]) -> int:
+        """Evicts all metrics computed on Batch "batch_id".
+
+        Returns:
+            Number of evicted entries.
+        """
+        with self._lock:
+            metric_ids: Iterable[_MetricKey] = self._metric_ids_by_batch_id.pop(batch_id, set())
+            num_evicted: int = 0
+            metric_id: _MetricKey
+            for metric_id in metric_ids:
+                if self._remove(metric_id=metric_id):
+                    num_evicted += 1
+
+            self._evictions += num_evicted
+            return num_evicted
+
+    def clear(self) -> None:
+        """Removes all entries (counters are preserved)."""
+        with self._lock:
+            self._entries.clear()
+            self._metric_ids_by_batch_id.clear()
+            self._size_in_bytes = 0
+
+    def _evict_least_recently_used(self) -> None:
+        if self._max_size_in_bytes is None:
+            return
+
+        metric_id: _MetricKey
+        while self._size_in_bytes > self._max_size_in_bytes and self._entries:
+            metric_id = next(iter(self._entries))
+            self._remove(metric_id=metric_id)
+            self._evictions += 1
+
+    def _remove(self, metric_id: _MetricKey) -> bool:
+        entry: Optional[_MetricCacheEntry] = self._entries.pop(metric_id, None)
+        if entry is None:
+            return False
+
+        self._size_in_bytes -= entry.size_in_bytes
+        metric_ids: Optional[Set[_MetricKey]] = self._metric_ids_by_batch_id.get(entry.batch_id)
+        if metric_ids is not None:
+            metric_ids.discard(metric_id)
+            if not metric_ids:
+                del self._metric_ids_by_batch_id[entry.batch_id]
+
+        return True
+
+
+def build_batch_fingerprint(*components: Any) -> str:
+    """Combines components identifying state of Batch data (e.g., file size and modification time,
+    object ETag, result of freshness query) into single fingerprint string."""
+    return hashlib.md5(
+        json.dumps(list(components), sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def _to_persistable_metric_value(value: Any) -> Tuple[bool, Any]:
+    """Returns (True, JSON-native equivalent of "value"), if "value" survives JSON round trip
+    without changing its meaning; otherwise, returns (False, None).  Tuples, DataFrame objects,
+    dates, etc. are not persistable."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True, value
+
+    if isinstance(value, (np.bool_, np.integer, np.floating)):
+        return True, value.item()
+
+    if isinstance(value, list):
+        elements = [_to_persistable_metric_value(element) for element in value]
+        if all(is_persistable for is_persistable, _ in elements):
+            return True, [element for _, element in elements]
+
+        return False, None
+
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        items = {key: _to_persistable_metric_value(element) for key, element in value.items()}
+        if all(is_persistable for is_persistable, _ in items.values()):
+            return True, {key: element for key, (_, element) in items.items()}
+
+    return False, None
+
+
+class PersistentMetricCache:
+    """Cross-run cache of metric values, kept in "BatchMetricStore" by fingerprint of Batch data.
+
+    Only values that survive JSON round trip unchanged (numbers, strings, and lists/dictionaries
+    thereof) are persisted; "None" values are not persisted, since they cannot be told apart from
+    missing entries.  Metric keys exclude "batch_id" (Batch data is identified by its fingerprint)
+    and include Great Expectations version, so that upgrades invalidate persisted metrics.
+
+    Args:
+        store: "BatchMetricStore" holding persisted metric values.
+    """
+
+    def __init__(self, store: BatchMetricStore) -> None:
+        self._store = store
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def store(self) -> BatchMetricStore:
+        return self._store
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(
+        self,
+        batch_fingerprint: str,
+        metric_configuration: MetricConfiguration,
+        default: Any = None,
+    ) -> Any:
+        """Returns persisted value of metric computed on Batch data with given fingerprint.
+
+        Missing keys and store lookup failures are treated as cache misses.
+        """
+        key: BatchMetricIdentifier = self._build_key(
+            batch_fingerprint=batch_fingerprint,
+            metric_configuration=metric_configuration,
+        )
+        value: Any
+        try:
+            value = self._store.get(key=key)
+        except Exception as e:
+            logger.debug(f"Unable to get persisted value of metric for key {key}: {e}")
+            value = None
+
+        if value is None:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        return value
+
+    def put(
+        self,
+        batch_fingerprint: str,
+        metric_configuration: MetricConfiguration,
+        value: MetricValue,
+    ) -> bool:
+        """Persists metric value computed on Batch data with given fingerprint (if persistable).
+
+        Returns:
+            Whether or not metric value has been persisted.
+        """
+        return self.put_many(entries=[(batch_fingerprint, metric_configuration, value)]) == 1
+
+    def put_many(self, entries: Iterable[Tuple[str, MetricConfiguration, MetricValue]]) -> int:
+        """Persists values of many metrics (given as Batch fingerprint, metric, and value) at once.
+
+        Persistable values are written to the store together (through its set_many()).
+
+        Returns:
+            Number of persisted metric values.
+        """
+        items: List[Tuple[BatchMetricIdentifier, MetricValue]] = []
+        for batch_fingerprint, metric_configuration, value in entries:
+            is_persistable, persistable_value = _to_persistable_metric_value(value)
+            if not is_persistable or persistable_value is None:
+                continue
+
+            items.append(
+                (
+                    self._build_key(
+                        batch_fingerprint=batch_fingerprint,
+                        metric_configuration=metric_configuration,
+                    ),
+                    persistable_value,
+                )
+            )
+
+        if items:
+            self._store.set_many(items)
+
+        return len(items)
+
+    def _build_key(
+        self, batch_fingerprint: str, metric_configuration: MetricConfiguration
+    ) -> BatchMetricIdentifier:
+        metric_domain_kwargs = IDDict(
+            {
+                key: value
+                for key, value in metric_configuration.metric_domain_kwargs.items()
+                if key != "batch_id"
+            }
+        )
+        metric_kwargs_id: str = hashlib.md5(
+            json.dumps(
+                [
+                    ge_version,
+                    str(metric_domain_kwargs.to_id()),
+                    str(metric_configuration.metric_value_kwargs_id),
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+        return BatchMetricIdentifier(
+            batch_fingerprint=batch_fingerprint,
+            metric_name=metric_configuration.metric_name,
+            metric_kwargs_id=metric_kwargs_id,
+        )
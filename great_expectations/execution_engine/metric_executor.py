@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.execution_engine import (
+        MetricComputationConfiguration,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+METRIC_EXECUTOR_RUNTIME_CONFIGURATION_KEY = "metric_executor"
+METRIC_EXECUTOR_MAX_WORKERS_RUNTIME_CONFIGURATION_KEY = "metric_executor_max_workers"
+
+
+class MetricExecutor(ABC):
+    """MetricExecutor computes directly-computable (non-bundled) metrics of one resolution round.
+
+    All "MetricComputationConfiguration" objects passed to "execute()" have their metric
+    dependencies already resolved, and therefore do not depend on each other; implementations are
+    free to compute them in any order.
+    """
+
+    @abstractmethod
+    def execute(
+        self,
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes metrics of "metric_computation_configurations", using their "metric_fn".
+
+        Args:
+            metric_computation_configurations: "MetricComputationConfiguration" objects of
+                directly-computable metrics
+
+        Returns:
+            resolved_metrics (Dict): a dictionary with the values for the metrics that have just
+                been resolved.
+
+        Raises:
+            MetricResolutionError: identifying metrics, whose computation failed.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _compute_metric(
+        metric_computation_configuration: MetricComputationConfiguration,
+    ) -> MetricValue:
+        return metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+            **metric_computation_configuration.metric_provider_kwargs
+        )
+
+
+class SerialMetricExecutor(MetricExecutor):
+    """Computes metrics one at a time, stopping at the first failure (default behavior)."""
+
+    @override
+    def execute(
+        self,
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_computation_configurations:
+            try:
+                resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
+                    self._compute_metric(metric_computation_configuration)
+                )
+            except Exception as e:
+                raise gx_exceptions.MetricResolutionError(
+                    message=str(e),
+                    failed_metrics=(metric_computation_configuration.metric_configuration,),
+                ) from e
+
+        return resolved_metrics
+
+
+class ThreadPoolMetricExecutor(MetricExecutor):
+    """Computes metrics concurrently, using a pool of at most "max_workers" threads.
+
+    Every metric is attempted, and a single "MetricResolutionError" identifying all failed metrics
+    is raised at the end, so that one failing metric does not prevent its independent siblings from
+    being resolved in the same round.
+
+    Args:
+        max_workers: maximum number of threads (defaults to that of "ThreadPoolExecutor").
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise gx_exceptions.InvalidConfigError(  # noqa: TRY003 # FIXME CoP
+                f'"max_workers" must be a positive integer (got {max_workers}).'
+            )
+
+        self._max_workers = max_workers
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers
+
+    @override
+    def execute(
+        self,
+        metric_computation_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        if len(metric_computation_configurations) < 2:  # noqa: PLR2004 # FIXME CoP
+            return SerialMetricExecutor().execute(
+                metric_computation_configurations=metric_computation_configurations
+            )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        failed_metrics: List[MetricConfiguration] = []
+        exception_messages: List[str] = []
+        first_exception: Optional[Exception] = None
+
+        metric_computation_configuration: MetricComputationConfiguration
+        future: concurrent.futures.Future
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="gx-metric-executor",
+        ) as executor:
+            futures: List[Tuple[MetricComputationConfiguration, concurrent.futures.Future]] = [
+                (
+                    metric_computation_configuration,
+                    executor.submit(self._compute_metric, metric_computation_configuration),
+                )
+                for metric_computation_configuration in metric_computation_configurations
+            ]
+            for metric_computation_configuration, future in futures:
+                try:
+                    resolved_metrics[metric_computation_configuration.metric_configuration.id] = (
+                        future.result()
+                    )
+                except Exception as e:
+                    failed_metrics.append(metric_computation_configuration.metric_configuration)
+                    exception_messages.append(str(e))
+                    if first_exception is None:
+                        first_exception = e
+
+        if failed_metrics:
+            raise gx_exceptions.MetricResolutionError(
+                message="\n".join(exception_messages),
+                failed_metrics=failed_metrics,
+                resolved_metrics=resolved_metrics,
+            ) from first_exception
+
+        return resolved_metrics
+
+
+def build_metric_executor(runtime_configuration: Optional[dict] = None) -> MetricExecutor:
+    """Builds "MetricExecutor" as requested by "runtime_configuration".
+
+    The "metric_executor" key accepts either a "MetricExecutor" instance or one of the names
+    "serial" (default) and "thread"; for the latter, "metric_executor_max_workers" optionally bounds
+    the number of threads.
+
+    Args:
+        runtime_configuration: runtime configuration information
+
+    Returns:
+        "MetricExecutor" to be used for directly-computable metrics.
+    """
+    if not runtime_configuration:
+        return SerialMetricExecutor()
+
+    metric_executor: Union[str, MetricExecutor, None] = runtime_configuration.get(
+        METRIC_EXECUTOR_RUNTIME_CONFIGURATION_KEY
+    )
+    if metric_executor is None:
+        return SerialMetricExecutor()
+
+    if isinstance(metric_executor, MetricExecutor):
+        return metric_executor
+
+    if metric_executor == "serial":
+        return SerialMetricExecutor()
+
+    if metric_executor == "thread":
+        return ThreadPoolMetricExecutor(
+            max_workers=runtime_configuration.get(
+                METRIC_EXECUTOR_MAX_WORKERS_RUNTIME_CONFIGURATION_KEY
+            )
+        )
+
+    raise gx_exceptions.InvalidConfigError(  # noqa: TRY003 # FIXME CoP
+        f'Unrecognized "{METRIC_EXECUTOR_RUNTIME_CONFIGURATION_KEY}" value: {metric_executor!r} '
+        '(expected "serial", "thread", or a "MetricExecutor" instance).'
+    )
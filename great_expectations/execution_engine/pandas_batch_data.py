@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Callable, Iterator
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.batch import BatchData
 
 if TYPE_CHECKING:
@@ -16,3 +18,40 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """Batch data, which is read in chunks of rows (see "chunksize" of PandasExecutionEngine).
+
+    Every pass over the chunks (see "iter_chunks()") reads the data anew; while a chunk is
+    processed, "dataframe" is that chunk (in the thread iterating over the chunks), so that metric
+    functions compute metrics of the chunk.
+
+    Args:
+        execution_engine: "PandasExecutionEngine" reading the data
+        read_chunks: callable, reading the data and returning iterator over its chunks
+    """
+
+    def __init__(self, execution_engine, read_chunks: Callable[[], Iterator[pd.DataFrame]]) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type] # chunks are read on demand
+        self._read_chunks = read_chunks
+        self._current_chunk = threading.local()
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        try:
+            for chunk in self._read_chunks():
+                self._current_chunk.dataframe = chunk
+                yield chunk
+        finally:
+            self._current_chunk.dataframe = None
+
+    @property
+    def dataframe(self):
+        chunk = getattr(self._current_chunk, "dataframe", None)
+        if chunk is None:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
+                'Batch data is read in chunks (see "chunksize" of PandasExecutionEngine); only '
+                "metrics, which can be computed chunk by chunk and merged, are supported."
+            )
+
+        return chunk
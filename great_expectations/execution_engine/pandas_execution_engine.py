@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import contextlib
 import datetime
 import hashlib
+import inspect
 import logging
+import os
+import pathlib
 import pickle
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
 from functools import partial
-from io import BytesIO
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     Callable,
+    ContextManager,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,10 +29,11 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -39,15 +50,23 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001 # FIXME CoP
 )
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine._pandas_chunked_metrics import ChunkedMetricComputation
+from great_expectations.execution_engine._remote_object_stream import open_ranged_object_stream
 from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,  # noqa: TCH001 # FIXME CoP
     PartitionDomainKwargs,  # noqa: TCH001 # FIXME CoP
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.metric_cache import build_batch_fingerprint
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
@@ -59,6 +78,9 @@ from great_expectations.expectations.model_field_types import CONDITION_PARSER_P
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +88,39 @@ HASH_THRESHOLD = 1e9
 
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
+# Readers, into which columns to load are pushed down (as "columns" reader option).
+COLUMN_PUSHDOWN_READER_METHODS = {"read_parquet", "read_feather"}
+# Readers, into which predicates of partitioners and samplers are pushed down (as "filters" option).
+PREDICATE_PUSHDOWN_READER_METHODS = {"read_parquet"}
+# Readers, which read files in chunks of rows (see "chunksize" of PandasExecutionEngine).
+CHUNKED_READER_METHODS = {"read_csv", "read_table", "read_fwf", "read_json", "read_parquet"}
+# Readers, which consume files sequentially (rather than seeking to parts of them, e.g., Parquet).
+SEQUENTIAL_READER_METHODS = {"read_csv", "read_table", "read_fwf", "read_json"}
+# Readers, which read files in chunks of rows only if they are line-delimited (see "lines" option).
+LINE_DELIMITED_CHUNKED_READER_METHODS = {"read_json"}
+# Samplers, which are not applied chunk by chunk (random samples of chunks differ between passes).
+UNCHUNKED_SAMPLING_METHODS = {"sample_using_random"}
+
+# Columns of Batch data, loaded in this thread (see "columns_to_load()").
+_columns_to_load = threading.local()
+
+
+@contextlib.contextmanager
+def columns_to_load(columns: Optional[Iterable[str]]) -> Iterator[None]:
+    """Within this context, PandasExecutionEngine objects of current thread load only given columns.
+
+    Columns (along with columns and simple predicates of partitioners and samplers) are pushed down
+    into readers of files, which support it (see COLUMN_PUSHDOWN_READER_METHODS and
+    PREDICATE_PUSHDOWN_READER_METHODS); other readers load all columns, as do pushed down reads that
+    fail (e.g., because columns are missing from the file).  None loads all columns.
+    """
+    previous_columns: Optional[frozenset] = getattr(_columns_to_load, "columns", None)
+    _columns_to_load.columns = frozenset(columns) if columns is not None else None
+    try:
+        yield
+    finally:
+        _columns_to_load.columns = previous_columns
+
 
 class PandasExecutionEngine(ExecutionEngine):
     """PandasExecutionEngine instantiates the ExecutionEngine API to support computations using Pandas.
@@ -76,6 +131,12 @@ class PandasExecutionEngine(ExecutionEngine):
         *args: Positional arguments for configuring PandasExecutionEngine
         **kwargs: Keyword arguments for configuring PandasExecutionEngine
 
+    If "chunksize" keyword argument is set, files (read with one of CHUNKED_READER_METHODS; JSON files only if they are
+    line-delimited) are not loaded into memory, but read in chunks of "chunksize" rows whenever metrics are computed.
+    Row-level metrics are computed chunk by chunk, and aggregate metrics are merged across chunks (quantiles and
+    medians are estimated by quantile sketches); metrics, which cannot be merged, and conditions, which compare rows
+    (e.g., uniqueness), fail.
+
     For example:
     ```python
         execution_engine: ExecutionEngine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
@@ -114,6 +175,7 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        self._chunksize: Optional[int] = kwargs.pop("chunksize", None)
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -121,6 +183,10 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure: azure.BlobServiceClient | None = None
         self._gcs = None
 
+        # Boolean row masks of filtered Domains (see "get_domain_records()"), memoized per Batch.
+        self._domain_masks: Dict[Optional[str], _PandasDomainMasks] = {}
+        self._domain_masks_lock = threading.Lock()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -129,6 +195,7 @@ class PandasExecutionEngine(ExecutionEngine):
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "chunksize": self._chunksize,
             }
         )
 
@@ -199,6 +266,11 @@ class PandasExecutionEngine(ExecutionEngine):
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"  # noqa: E501 # FIXME CoP
             )
 
+        # DataFrame may have been changed in place (and loaded again as the same object), so
+        # memoized Domain masks are dropped on every load, not only when Batch data is replaced.
+        with self._domain_masks_lock:
+            self._domain_masks.pop(batch_id, None)
+
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     @override
@@ -249,7 +321,7 @@ class PandasExecutionEngine(ExecutionEngine):
                     if inferred_compression_param is not None:
                         reader_options["compression"] = inferred_compression_param
                 if s3_engine:
-                    s3_object: dict = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
+                    s3_object: dict = s3_engine.head_object(Bucket=s3_url.bucket, Key=s3_url.key)
             except (
                 aws.exceptions.ParamValidationError,
                 aws.exceptions.ClientError,
@@ -259,9 +331,27 @@ class PandasExecutionEngine(ExecutionEngine):
                 )
             logger.debug(f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}")
             reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())  # type: ignore[possibly-undefined] # FIXME
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            s3_object_etag: Optional[str] = s3_object.get("ETag")  # type: ignore[possibly-undefined] # FIXME
+            reader_method = reader_method or self._guess_reader_method_name(s3_url.key)
+            df = self._read_file(
+                batch_spec=batch_spec,
+                reader_method=reader_method,
+                reader_fn=reader_fn,
+                open_source=partial(
+                    open_ranged_object_stream,
+                    size=s3_object["ContentLength"],  # type: ignore[possibly-undefined] # FIXME
+                    read_range=partial(
+                        self._read_s3_object_range, s3_engine, s3_url, s3_object_etag
+                    ),
+                    name=path,
+                    sequential=reader_method in SEQUENTIAL_READER_METHODS,
+                ),
+                reader_options=reader_options,
+            )
+            if s3_object_etag:
+                batch_markers["batch_fingerprint"] = build_batch_fingerprint(
+                    dict(batch_spec), s3_object_etag
+                )
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -280,14 +370,27 @@ class PandasExecutionEngine(ExecutionEngine):
             blob_client = azure_engine.get_blob_client(
                 container=azure_url.container, blob=azure_url.blob
             )
-            azure_object = blob_client.download_blob()
+            azure_blob_size: int = blob_client.get_blob_properties().size
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
-            buf = BytesIO(azure_object.readall())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            reader_method = reader_method or self._guess_reader_method_name(azure_url.blob)
+            df = self._read_file(
+                batch_spec=batch_spec,
+                reader_method=reader_method,
+                reader_fn=reader_fn,
+                open_source=partial(
+                    open_ranged_object_stream,
+                    size=azure_blob_size,
+                    read_range=lambda start, end: blob_client.download_blob(
+                        offset=start, length=end - start
+                    ).readall(),
+                    name=path,
+                    sequential=reader_method in SEQUENTIAL_READER_METHODS,
+                ),
+                reader_options=reader_options,
+            )
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -305,6 +408,8 @@ class PandasExecutionEngine(ExecutionEngine):
             try:
                 gcs_bucket = gcs_engine.get_bucket(gcs_url.bucket)
                 gcs_blob = gcs_bucket.blob(gcs_url.blob)
+                # fetches metadata (i.e., size) of the blob
+                gcs_blob.reload()
                 logger.debug(f"Fetching GCS blob. Bucket: {gcs_url.bucket} Blob: {gcs_url.blob}")
             except google.GoogleAPIError as error:
                 raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
@@ -312,9 +417,23 @@ class PandasExecutionEngine(ExecutionEngine):
 Bucket: {error}"""  # noqa: E501 # FIXME CoP
                 )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
-            buf = BytesIO(gcs_blob.download_as_bytes())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            reader_method = reader_method or self._guess_reader_method_name(gcs_url.blob)
+            df = self._read_file(
+                batch_spec=batch_spec,
+                reader_method=reader_method,
+                reader_fn=reader_fn,
+                open_source=partial(
+                    open_ranged_object_stream,
+                    size=gcs_blob.size,
+                    # end of ranges of GCS downloads is inclusive
+                    read_range=lambda start, end: gcs_blob.download_as_bytes(
+                        start=start, end=end - 1
+                    ),
+                    name=batch_spec.path,
+                    sequential=reader_method in SEQUENTIAL_READER_METHODS,
+                ),
+                reader_options=reader_options,
+            )
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
@@ -322,25 +441,46 @@ Bucket: {error}"""  # noqa: E501 # FIXME CoP
             reader_options = batch_spec.reader_options
             path = batch_spec.path
             reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            df = self._read_file(
+                batch_spec=batch_spec,
+                reader_method=reader_method or self._guess_reader_method_name(path),
+                reader_fn=reader_fn,
+                open_source=partial(contextlib.nullcontext, path),
+                reader_options=reader_options or {},
+            )
+            if pathlib.Path(path).is_file():
+                path_stat: os.stat_result = pathlib.Path(path).stat()
+                batch_markers["batch_fingerprint"] = build_batch_fingerprint(
+                    dict(batch_spec), path_stat.st_size, path_stat.st_mtime_ns
+                )
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             reader_fn = self._get_reader_fn(reader_method)
-            reader_fn_result: pd.DataFrame | list[pd.DataFrame] = execute_pandas_reader_fn(
-                reader_fn, reader_options
-            )
-            if isinstance(reader_fn_result, list):
-                if len(reader_fn_result) > 1:
-                    raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
-                        "Pandas reader method must return a single DataFrame, "
-                        f'but "{reader_method}" returned {len(reader_fn_result)} DataFrames.'
-                    )
-                else:
-                    df = reader_fn_result[0]
+            # path of file, which is read in chunks, is first argument of its reader
+            path_option: Optional[str] = next(iter(inspect.signature(reader_fn).parameters), None)
+            path: Any = reader_options.get(path_option) if path_option else None
+            if (
+                self._chunksize is not None
+                and isinstance(path, (str, os.PathLike))
+                and self._is_read_in_chunks(
+                    reader_method=reader_method, reader_options=reader_options
+                )
+            ):
+                df = self._read_file(
+                    batch_spec=batch_spec,
+                    reader_method=reader_method,
+                    reader_fn=reader_fn,
+                    open_source=partial(contextlib.nullcontext, path),
+                    reader_options={
+                        name: value for name, value in reader_options.items() if name != path_option
+                    },
+                )
             else:
-                df = reader_fn_result
+                df = self._execute_reader_fn(
+                    reader_method=reader_method, reader_fn=reader_fn, reader_options=reader_options
+                )
 
         elif isinstance(batch_spec, FabricBatchSpec):
             reader_fn = batch_spec.get_reader_function()
@@ -352,6 +492,10 @@ Bucket: {error}"""  # noqa: E501 # FIXME CoP
 not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
             )
 
+        if isinstance(df, ChunkedPandasBatchData):
+            # partitioners and samplers are applied to every chunk, as it is read
+            return df, batch_markers
+
         df = self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type] # FIXME CoP
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
@@ -360,6 +504,243 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
 
         return typed_batch_data, batch_markers
 
+    @staticmethod
+    def _execute_reader_fn(
+        reader_method: str, reader_fn: DataFrameFactoryFn, reader_options: dict
+    ) -> pd.DataFrame:
+        reader_fn_result: pd.DataFrame | list[pd.DataFrame] = execute_pandas_reader_fn(
+            reader_fn, reader_options
+        )
+        if isinstance(reader_fn_result, list):
+            if len(reader_fn_result) > 1:
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
+                    "Pandas reader method must return a single DataFrame, "
+                    f'but "{reader_method}" returned {len(reader_fn_result)} DataFrames.'
+                )
+            return reader_fn_result[0]
+
+        return reader_fn_result
+
+    def _read_file(
+        self,
+        batch_spec: BatchSpec,
+        reader_method: str,
+        reader_fn: DataFrameFactoryFn,
+        open_source: Callable[[], ContextManager[str | IO[bytes]]],
+        reader_options: dict,
+    ) -> pd.DataFrame | ChunkedPandasBatchData:
+        """Reads file (opened by "open_source()") into memory, unless it is read in chunks."""
+        if self._chunksize is None or not self._is_read_in_chunks(
+            reader_method=reader_method, reader_options=reader_options
+        ):
+            with open_source() as source:
+                return self._read_with_pushdown(
+                    batch_spec=batch_spec,
+                    reader_method=reader_method,
+                    reader_fn=reader_fn,
+                    source=source,
+                    reader_options=reader_options,
+                )
+
+        sampling_method: Optional[str] = batch_spec.get("sampling_method")
+        if sampling_method in UNCHUNKED_SAMPLING_METHODS:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
+                f'Sampling method "{sampling_method}" is not supported for files read in chunks.'
+            )
+
+        # metrics computed over chunks (e.g., quantiles) are cached apart from those of whole files
+        batch_spec["chunksize"] = self._chunksize
+        return ChunkedPandasBatchData(
+            execution_engine=self,
+            read_chunks=partial(
+                self._read_chunks,
+                batch_spec=batch_spec,
+                reader_method=reader_method,
+                reader_fn=reader_fn,
+                open_source=open_source,
+                reader_options=reader_options,
+            ),
+        )
+
+    @staticmethod
+    def _is_read_in_chunks(reader_method: str, reader_options: dict) -> bool:
+        if reader_method not in CHUNKED_READER_METHODS:
+            return False
+
+        if reader_method in LINE_DELIMITED_CHUNKED_READER_METHODS:
+            return bool(reader_options.get("lines"))
+
+        return True
+
+    def _read_chunks(
+        self,
+        batch_spec: BatchSpec,
+        reader_method: str,
+        reader_fn: DataFrameFactoryFn,
+        open_source: Callable[[], ContextManager[str | IO[bytes]]],
+        reader_options: dict,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads file in chunks of "chunksize" rows, and partitions and samples every chunk."""
+        limit: Optional[int] = None
+        if batch_spec.get("sampling_method") == "sample_using_limit":
+            limit = batch_spec["sampling_kwargs"]["n"]
+
+        num_rows_read = 0
+        num_rows = 0
+        with (
+            open_source() as source,
+            self._open_chunk_reader(
+                reader_method=reader_method,
+                reader_fn=reader_fn,
+                source=source,
+                reader_options=reader_options,
+            ) as chunks,
+        ):
+            for chunk in chunks:
+                if isinstance(chunk.index, pd.RangeIndex):
+                    # chunk rows are indexed by position in file (as are rows of files read whole)
+                    chunk.index = pd.RangeIndex(num_rows_read, num_rows_read + len(chunk))
+                num_rows_read += len(chunk)
+
+                chunk = self._apply_partitioning_and_sampling_methods(batch_spec, chunk)  # noqa: PLW2901 # FIXME CoP
+                if limit is not None:
+                    chunk = chunk.iloc[: limit - num_rows]  # noqa: PLW2901 # FIXME CoP
+
+                num_rows += len(chunk)
+                yield chunk
+
+                if limit is not None and num_rows >= limit:
+                    return
+
+    @contextlib.contextmanager
+    def _open_chunk_reader(
+        self,
+        reader_method: str,
+        reader_fn: DataFrameFactoryFn,
+        source: str | IO[bytes],
+        reader_options: dict,
+    ) -> Iterator[Iterable[pd.DataFrame]]:
+        if reader_method == "read_parquet":
+            # pandas does not read Parquet files in chunks; pyarrow reads them in batches of rows
+            parquet_file = pyarrow.parquet.ParquetFile(source)
+            yield (
+                record_batch.to_pandas()
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=self._chunksize, columns=reader_options.get("columns")
+                )
+            )
+            return
+
+        with reader_fn(source, **reader_options, chunksize=self._chunksize) as chunks:
+            yield chunks
+
+    def _read_with_pushdown(
+        self,
+        batch_spec: BatchSpec,
+        reader_method: str,
+        reader_fn: DataFrameFactoryFn,
+        source: str | IO[bytes],
+        reader_options: dict,
+    ) -> pd.DataFrame:
+        """Reads Batch data, pushing columns to load (see "columns_to_load()") and predicates down.
+
+        Pushed down reader options are recorded in "reader_options" of the BatchSpec (and so are
+        part of the Batch fingerprint); should the pushed down read fail, all columns are read, as
+        if nothing had been pushed down.
+        """
+        pushdown_options: dict = self._get_pushdown_reader_options(
+            batch_spec=batch_spec, reader_method=reader_method, reader_options=reader_options
+        )
+        if not pushdown_options:
+            return reader_fn(source, **reader_options)
+
+        try:
+            df: pd.DataFrame = reader_fn(source, **reader_options, **pushdown_options)
+        except Exception as e:
+            logger.debug(
+                f'Reading with pushed down options {pushdown_options} failed ("{e!r}"); '
+                "reading all columns."
+            )
+            if not isinstance(source, str):
+                source.seek(0)
+            return reader_fn(source, **reader_options)
+
+        batch_spec["reader_options"] = {**reader_options, **pushdown_options}
+        return df
+
+    @staticmethod
+    def _read_s3_object_range(
+        s3_engine: Any, s3_url: S3Url, etag: Optional[str], start: int, end: int
+    ) -> bytes:
+        """Reads bytes [start, end) of S3 object (failing, should it change during the read)."""
+        get_object_kwargs: dict = {
+            "Bucket": s3_url.bucket,
+            "Key": s3_url.key,
+            "Range": f"bytes={start}-{end - 1}",
+        }
+        if etag:
+            get_object_kwargs["IfMatch"] = etag
+        try:
+            return s3_engine.get_object(**get_object_kwargs)["Body"].read()
+        except aws.exceptions.ClientError as error:
+            if error.response.get("Error", {}).get("Code") == "PreconditionFailed":
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
+                    "PandasExecutionEngine could not read data from S3 Bucket, because the object "
+                    f"{s3_url.key} changed during the read: {error}"
+                ) from error
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003 # FIXME CoP
+                f"""PandasExecutionEngine encountered the following error while trying to read data from S3 Bucket: {error}"""  # noqa: E501 # FIXME CoP
+            ) from error
+
+    @staticmethod
+    def _get_pushdown_reader_options(
+        batch_spec: BatchSpec, reader_method: str, reader_options: dict
+    ) -> dict:
+        columns: Optional[frozenset] = getattr(_columns_to_load, "columns", None)
+        if columns is None or reader_method not in COLUMN_PUSHDOWN_READER_METHODS:
+            return {}
+
+        pushdown_options: dict = {}
+        if "columns" not in reader_options:
+            # partitioners and samplers are applied to loaded data, so their columns are loaded
+            pushdown_columns = set(columns)
+            for kwargs in (
+                batch_spec.get("partitioner_kwargs") or {},
+                batch_spec.get("sampling_kwargs") or {},
+            ):
+                if kwargs.get("column_name"):
+                    pushdown_columns.add(kwargs["column_name"])
+            pushdown_options["columns"] = sorted(pushdown_columns)
+
+        if reader_method in PREDICATE_PUSHDOWN_READER_METHODS and "filters" not in reader_options:
+            filters: list = PandasExecutionEngine._get_pushdown_filters(batch_spec=batch_spec)
+            if filters:
+                pushdown_options["filters"] = filters
+
+        return pushdown_options
+
+    @staticmethod
+    def _get_pushdown_filters(batch_spec: BatchSpec) -> list:
+        """Returns predicates of simple partitioners and samplers, as read_parquet() filters."""
+        filters: list = []
+        if batch_spec.get("partitioner_method") == "partition_on_column_value":
+            partitioner_kwargs: dict = batch_spec["partitioner_kwargs"]
+            column_name: str = partitioner_kwargs["column_name"]
+            filters.append(
+                (column_name, "==", partitioner_kwargs["batch_identifiers"][column_name])
+            )
+
+        if batch_spec.get("sampling_method") == "sample_using_a_list":
+            sampling_kwargs: dict = batch_spec["sampling_kwargs"]
+            filters.append(
+                (sampling_kwargs["column_name"], "in", list(sampling_kwargs["value_list"]))
+            )
+
+        return filters
+
+    def _guess_reader_method_name(self, path: str) -> str:
+        return self.guess_reader_method_from_path(path)["reader_method"]
+
     def _apply_partitioning_and_sampling_methods(
         self,
         batch_spec: BatchSpec | PandasBatchSpecProtocol,
@@ -478,13 +859,135 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    @override
+    def _build_direct_and_bundled_metric_computation_configurations(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[
+        List[MetricComputationConfiguration],
+        List[MetricComputationConfiguration],
+    ]:
+        (
+            metric_fn_direct_configurations,
+            metric_fn_bundle_configurations,
+        ) = super()._build_direct_and_bundled_metric_computation_configurations(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        metric_fn_direct_configurations = self._compute_chunked_batch_metrics_over_chunks(
+            metric_fn_direct_configurations=metric_fn_direct_configurations
+        )
+        self._share_compute_domains(
+            metric_fn_direct_configurations=[
+                metric_computation_configuration
+                for metric_computation_configuration in metric_fn_direct_configurations
+                if not self._is_chunked_batch_metric(
+                    metric_configuration=metric_computation_configuration.metric_configuration
+                )
+            ]
+        )
+        return metric_fn_direct_configurations, metric_fn_bundle_configurations
+
+    def _compute_chunked_batch_metrics_over_chunks(
+        self, metric_fn_direct_configurations: List[MetricComputationConfiguration]
+    ) -> List[MetricComputationConfiguration]:
+        """Replaces metric functions of metrics of Batch data, which is read in chunks, so that
+        metrics resolved together are computed in a single pass over the chunks of their Batch (see
+        "ChunkedMetricComputation").
+        """
+        chunked_metric_computations: Dict[Optional[str], ChunkedMetricComputation] = {}
+
+        metric_computation_configurations: List[MetricComputationConfiguration] = []
+        metric_computation_configuration: MetricComputationConfiguration
+        batch_id: Optional[str]
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            if not self._is_chunked_batch_metric(
+                metric_configuration=metric_computation_configuration.metric_configuration
+            ):
+                metric_computation_configurations.append(metric_computation_configuration)
+                continue
+
+            batch_id = self._get_metric_batch_id(
+                metric_configuration=metric_computation_configuration.metric_configuration
+            )
+            if batch_id not in chunked_metric_computations:
+                chunked_metric_computations[batch_id] = ChunkedMetricComputation(
+                    batch_data=cast(
+                        ChunkedPandasBatchData, self.batch_manager.batch_data_cache[batch_id]
+                    )
+                )
+
+            metric_computation_configurations.append(
+                chunked_metric_computations[batch_id].add(
+                    metric_computation_configuration=metric_computation_configuration
+                )
+            )
+
+        return metric_computation_configurations
+
+    def _is_chunked_batch_metric(self, metric_configuration: MetricConfiguration) -> bool:
+        batch_id: Optional[str] = self._get_metric_batch_id(
+            metric_configuration=metric_configuration
+        )
+        return isinstance(
+            self.batch_manager.batch_data_cache.get(batch_id),  # type: ignore[arg-type] # batch_id may be None
+            ChunkedPandasBatchData,
+        )
+
+    def _share_compute_domains(
+        self, metric_fn_direct_configurations: List[MetricComputationConfiguration]
+    ) -> None:
+        """Groups column map condition metrics, resolved together, by their compute Domain (Batch,
+        "row_condition", and "condition_parser") and assigns one "PandasSharedComputeDomain" to
+        every group of two or more metrics, so that all conditions of the group are evaluated over
+        the same filtered DataFrame and the same column values.
+        """
+        metric_computation_configurations_by_compute_domain_id: Dict[
+            str, List[MetricComputationConfiguration]
+        ] = defaultdict(list)
+
+        metric_computation_configuration: MetricComputationConfiguration
+        compute_domain_id: str
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            if not getattr(
+                metric_computation_configuration.metric_fn, "shares_compute_domain", False
+            ):
+                continue
+
+            metric_domain_kwargs: dict = (
+                metric_computation_configuration.metric_configuration.metric_domain_kwargs
+            )
+            compute_domain_id = IDDict(
+                {key: value for key, value in metric_domain_kwargs.items() if key != "column"}
+            ).to_id()
+            metric_computation_configurations_by_compute_domain_id[compute_domain_id].append(
+                metric_computation_configuration
+            )
+
+        metric_computation_configurations: List[MetricComputationConfiguration]
+        shared_compute_domain: PandasSharedComputeDomain
+        for (
+            metric_computation_configurations
+        ) in metric_computation_configurations_by_compute_domain_id.values():
+            if len(metric_computation_configurations) < 2:  # noqa: PLR2004 # FIXME CoP
+                continue
+
+            shared_compute_domain = PandasSharedComputeDomain(execution_engine=self)
+            for metric_computation_configuration in metric_computation_configurations:
+                metric_computation_configuration.metric_provider_kwargs["shared_compute_domain"] = (
+                    shared_compute_domain
+                )
+
     @override
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501 # FIXME CoP
         return {}  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).  # noqa: E501 # FIXME CoP
 
     @override
-    def get_domain_records(  # noqa: C901, PLR0912 # FIXME CoP
+    def get_domain_records(  # noqa: C901, PLR0912, PLR0915 # FIXME CoP
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
@@ -506,6 +1009,7 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
+                batch_id = self.batch_manager.active_batch_data_id
                 data = cast(PandasBatchData, self.batch_manager.active_batch_data).dataframe
             else:
                 raise gx_exceptions.ValidationError(  # noqa: TRY003 # FIXME CoP
@@ -521,22 +1025,27 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        if self.validation_profiler is not None:
+            self._record_scan(
+                num_rows=len(data.index),
+                num_bytes=int(data.memory_usage(index=True, deep=False).sum()),
+            )
+
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
-        if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-
-            if condition_parser == CONDITION_PARSER_PANDAS:
-                data = data.query(row_condition, parser=condition_parser)
-            else:
-                raise ValueError(  # noqa: TRY003 # FIXME CoP
-                    "condition_parser for Pandas is required when setting a row_condition."
-                )
+        condition_parser = domain_kwargs.get("condition_parser", None)
+        if row_condition and condition_parser != CONDITION_PARSER_PANDAS:
+            raise ValueError(  # noqa: TRY003 # FIXME CoP
+                "condition_parser for Pandas is required when setting a row_condition."
+            )
 
+        # Filtering by "ignore_row_if" directive (rows, missing values in all/any of "subset"
+        # columns, are dropped).
+        subset: Optional[List[str]] = None
+        how: Optional[str] = None
         if "column" in domain_kwargs:
-            return data
-
-        if (
+            pass
+        elif (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
@@ -545,49 +1054,111 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
             column_A_name = domain_kwargs["column_A"]
             # noinspection PyPep8Naming
             column_B_name = domain_kwargs["column_B"]
+            subset = [column_A_name, column_B_name]
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
+                how = "all"
             elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
-                )
+                how = "any"
             else:  # noqa: PLR5501 # FIXME CoP
                 if ignore_row_if != "neither":
                     raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003 # FIXME CoP
-
-            return data
-
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
+        elif "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
+            subset = list(domain_kwargs["column_list"])
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
+                how = "all"
             elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
-                )
+                how = "any"
             else:  # noqa: PLR5501 # FIXME CoP
                 if ignore_row_if != "never":
                     raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003 # FIXME CoP
 
+        if not row_condition and how is None:
+            return data
+
+        mask: Optional[np.ndarray] = self._get_domain_mask(
+            batch_id=batch_id,
+            data=data,
+            row_condition=row_condition,
+            condition_parser=condition_parser,
+            subset=subset,
+            how=how,
+        )
+        if mask is None:
+            # "row_condition" is not a row mask, so "DataFrame.query()" handles it as usual.
+            data = data.query(row_condition, parser=condition_parser)
+            if how is not None:
+                data = data.dropna(axis=0, how=how, subset=subset)
+
             return data
 
-        return data
+        return data.loc[mask]
+
+    def _get_domain_mask(  # noqa: C901, PLR0913 # FIXME CoP
+        self,
+        batch_id: Optional[str],
+        data: pd.DataFrame,
+        row_condition: Optional[str],
+        condition_parser: Optional[str],
+        subset: Optional[List[str]],
+        how: Optional[str],
+    ) -> Optional[np.ndarray]:
+        """Returns boolean mask of rows of Batch data, which satisfy "row_condition" and are not
+        dropped according to "ignore_row_if" directive ("subset" and "how", as in
+        "DataFrame.dropna()"); None, if "row_condition" does not evaluate to boolean row mask.
+
+        Masks are memoized per Batch (unless caching is disabled), so that Domains sharing row
+        condition and "ignore_row_if" directive evaluate predicate only once; they are evicted along
+        with metrics of their Batch.
+        """
+        key: Tuple[Optional[str], Optional[str], Optional[Tuple[str, ...]], Optional[str]] = (
+            row_condition,
+            condition_parser,
+            None if subset is None else tuple(subset),
+            how,
+        )
+
+        domain_masks: Optional[_PandasDomainMasks] = None
+        if self._caching:
+            with self._domain_masks_lock:
+                domain_masks = self._domain_masks.get(batch_id)
+                if domain_masks is None or not domain_masks.is_valid_for(data=data):
+                    domain_masks = _PandasDomainMasks(data=data)
+                    self._domain_masks[batch_id] = domain_masks
+
+                if key in domain_masks.masks:
+                    return domain_masks.masks[key]
+
+        mask: np.ndarray = np.ones(len(data), dtype=bool)
+        if row_condition:
+            condition = data.eval(row_condition, parser=condition_parser)
+            if not (
+                isinstance(condition, pd.Series) and pd.api.types.is_bool_dtype(condition.dtype)
+            ):
+                return None
+
+            mask &= condition.to_numpy(dtype=bool)
+
+        if how == "all":
+            mask &= data[subset].notna().any(axis=1).to_numpy()
+        elif how == "any":
+            mask &= data[subset].notna().all(axis=1).to_numpy()
+
+        if domain_masks is not None:
+            with self._domain_masks_lock:
+                domain_masks.masks[key] = mask
+
+        return mask
+
+    @override
+    def evict_cached_metrics(self, batch_id: Optional[str]) -> None:
+        """Evicts metrics computed on Batch "batch_id" from metric cache, and its Domain masks."""
+        super().evict_cached_metrics(batch_id=batch_id)
+        with self._domain_masks_lock:
+            self._domain_masks.pop(batch_id, None)
 
     @override
     def get_compute_domain(
@@ -632,6 +1203,104 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501 # FIXME CoP
         return data, partition_domain_kwargs.compute, partition_domain_kwargs.accessor
 
 
+class PandasSharedComputeDomain:
+    """Compute Domain shared by column map condition metrics, which are resolved together.
+
+    Domain records (Batch data, filtered by "row_condition") are obtained once for the whole group
+    of metrics, and values of every column (with or without null values) are extracted once, so that
+    several conditions evaluated over the same column(s) neither rescan nor copy the full DataFrame.
+    Access is thread-safe, so that metrics sharing compute Domain can be computed by concurrent
+    "MetricExecutor".
+
+    Args:
+        execution_engine: "PandasExecutionEngine" holding Batch data
+    """
+
+    def __init__(self, execution_engine: PandasExecutionEngine) -> None:
+        self._execution_engine = execution_engine
+
+        self._domain_records: Optional[pd.DataFrame] = None
+        self._column_values: Dict[Tuple[str, bool], pd.Series] = {}
+
+        self._lock = threading.Lock()
+
+    def get_compute_domain(
+        self,
+        domain_kwargs: dict,
+        domain_type: Union[str, MetricDomainTypes],
+    ) -> Tuple[pd.DataFrame, dict, dict]:
+        """Same as "PandasExecutionEngine.get_compute_domain()", but reads Domain records once."""
+        with self._lock:
+            if self._domain_records is None:
+                self._domain_records = self._execution_engine.get_domain_records(
+                    domain_kwargs=domain_kwargs
+                )
+
+        partition_domain_kwargs: PartitionDomainKwargs = (
+            self._execution_engine._partition_domain_kwargs(
+                domain_kwargs=domain_kwargs, domain_type=domain_type
+            )
+        )
+        return (
+            self._domain_records,
+            partition_domain_kwargs.compute,
+            partition_domain_kwargs.accessor,
+        )
+
+    def get_column_values(self, column_name: str, filter_column_isnull: bool) -> pd.Series:
+        """Returns values of column in domain records (obtained by "get_compute_domain()"),
+        excluding null values if "filter_column_isnull" is True.
+        """
+        key: Tuple[str, bool] = (column_name, filter_column_isnull)
+        with self._lock:
+            column_values: Optional[pd.Series] = self._column_values.get(key)
+            if column_values is None:
+                column_values = get_column_values(
+                    data=cast(pd.DataFrame, self._domain_records),
+                    column_name=column_name,
+                    filter_column_isnull=filter_column_isnull,
+                )
+                self._column_values[key] = column_values
+
+        return column_values
+
+
+def get_column_values(
+    data: pd.DataFrame, column_name: str, filter_column_isnull: bool
+) -> pd.Series:
+    """Returns values of column, excluding null values if "filter_column_isnull" is True.
+
+    Filtering the column (rather than the whole DataFrame) avoids copying all other columns of wide
+    DataFrame objects.
+    """
+    column_values: pd.Series = data[column_name]
+    if filter_column_isnull:
+        column_values = column_values[column_values.notnull()]
+
+    return column_values
+
+
+@dataclass
+class _PandasDomainMasks:
+    """Memoized Domain masks of Batch data (valid as long as Batch holds the same DataFrame, with
+    the same shape and columns; values changed in place are accounted for by
+    "PandasExecutionEngine.load_batch_data()").
+    """
+
+    data: pd.DataFrame
+    masks: Dict[tuple, np.ndarray] = field(default_factory=dict)
+    shape: Tuple[int, int] = field(init=False)
+    columns: pd.Index = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.shape = self.data.shape
+        self.columns = self.data.columns
+
+    def is_valid_for(self, data: pd.DataFrame) -> bool:
+        # rows or columns added (or columns renamed) in place change shape, or replace columns Index
+        return self.data is data and self.shape == data.shape and self.columns is data.columns
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
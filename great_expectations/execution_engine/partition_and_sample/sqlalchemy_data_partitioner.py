@@ -16,7 +16,8 @@ not by itself.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union
+import datetime
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.sqlalchemy import (
@@ -53,6 +54,9 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
         PartitionerMethod.PARTITION_ON_DATE_PARTS: "get_data_for_batch_identifiers_for_partition_on_date_parts",  # noqa: E501 # FIXME CoP
     }
 
+    # Dialects, which compare date and timestamp columns with date literals (for range clauses).
+    DATE_RANGE_PARTITION_DIALECTS: list = [GXSqlDialect.POSTGRESQL]
+
     PARTITIONER_METHOD_TO_GET_UNIQUE_BATCH_IDENTIFIERS_METHOD_MAPPING: dict = {
         PartitionerMethod.PARTITION_ON_WHOLE_TABLE: "get_partition_query_for_data_for_batch_identifiers_for_partition_on_whole_table",  # noqa: E501 # FIXME CoP
         PartitionerMethod.PARTITION_ON_COLUMN_VALUE: "get_partition_query_for_data_for_batch_identifiers_for_partition_on_column_value",  # noqa: E501 # FIXME CoP
@@ -177,6 +181,56 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
 
         return query
 
+    def get_partition_clause_for_date_range(
+        self,
+        column_name: str,
+        batch_identifiers: dict,
+    ) -> Optional[sqlalchemy.BooleanClauseList]:
+        """Partition on range of column_name values covering year (month, day) of batch_identifiers.
+
+        Unlike the clauses of "partition_on_date_parts()", which extract date parts from every
+        value, range clauses let databases prune table partitions and use indexes on column_name.
+
+        Args:
+            column_name: column in table to use in determining partition.
+            batch_identifiers: should contain key values of {date_part: date_part_value} for "year"
+                and, optionally, "month" and "day" (in this order).
+
+        Returns:
+            Boolean clause, or None if the dialect or the date parts do not support range clauses.
+        """
+        if self._dialect not in self.DATE_RANGE_PARTITION_DIALECTS:
+            return None
+
+        date_parts_dict: dict = batch_identifiers[column_name]
+        date_parts: List[str] = [DatePart.YEAR.value, DatePart.MONTH.value, DatePart.DAY.value][
+            : len(date_parts_dict)
+        ]
+        if set(date_parts_dict.keys()) != set(date_parts):
+            return None
+
+        start: datetime.date
+        end: datetime.date
+        try:
+            start = datetime.date(
+                date_parts_dict[DatePart.YEAR.value],
+                date_parts_dict.get(DatePart.MONTH.value, 1),
+                date_parts_dict.get(DatePart.DAY.value, 1),
+            )
+            if DatePart.DAY.value in date_parts_dict:
+                end = start + datetime.timedelta(days=1)
+            elif DatePart.MONTH.value in date_parts_dict:
+                end = (start + datetime.timedelta(days=31)).replace(day=1)
+            else:
+                end = start.replace(year=start.year + 1)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+        return sa.and_(
+            sa.column(column_name) >= sa.literal(start, sa.Date),
+            sa.column(column_name) < sa.literal(end, sa.Date),
+        )
+
     @staticmethod
     def partition_on_whole_table(batch_identifiers: dict) -> bool:
         """'Partition' by returning the whole table"""
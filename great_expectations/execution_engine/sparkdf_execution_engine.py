@@ -889,11 +889,13 @@ illegal.  Please check your config."""  # noqa: E501 # FIXME CoP
                 aggregates[domain_id] = {
                     "column_aggregates": [],
                     "metric_ids": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
+            aggregates[domain_id]["metric_configurations"].append(metric_to_resolve)
 
         for aggregate in aggregates.values():
             domain_kwargs: dict = aggregate["domain_kwargs"]
@@ -901,7 +903,9 @@ illegal.  Please check your config."""  # noqa: E501 # FIXME CoP
 
             assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+            with self._measure_metrics(metric_configurations=aggregate["metric_configurations"]):
+                res = df.agg(*aggregate["column_aggregates"]).collect()
+                self._record_queries()
 
             logger.debug(
                 f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"  # noqa: E501 # FIXME CoP
@@ -140,6 +140,8 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        # temporary table is only created for (and in place of) query or selectable
+        self._uses_temp_table: bool = create_temp_table and not table_name
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError("Exactly one of table_name, query, or selectable must be specified")  # noqa: TRY003 # FIXME CoP
@@ -198,6 +200,11 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def uses_temp_table(self) -> bool:
+        """Whether data is read from temp table (visible only to the connection that created it)."""
+        return self._uses_temp_table
+
     def _create_temporary_table(  # noqa: C901, PLR0912 # FIXME CoP
         self,
         dialect: GXSqlDialect,
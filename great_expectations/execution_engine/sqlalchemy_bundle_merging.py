@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+
+logger = logging.getLogger(__name__)
+
+# Aggregate functions ignoring NULL arguments (nullifying arguments filters their input rows).
+_AGGREGATE_FUNCTION_NAMES = frozenset(
+    {
+        "avg",
+        "bool_and",
+        "bool_or",
+        "count",
+        "every",
+        "max",
+        "min",
+        "stddev",
+        "stddev_pop",
+        "stddev_samp",
+        "sum",
+        "var_pop",
+        "var_samp",
+        "variance",
+    }
+)
+
+# Scalar functions, which may combine aggregates (e.g., "COALESCE(SUM(...), 0)").
+_SCALAR_FUNCTION_NAMES = frozenset(
+    {
+        "abs",
+        "cast",
+        "ceil",
+        "ceiling",
+        "coalesce",
+        "floor",
+        "greatest",
+        "least",
+        "nullif",
+        "power",
+        "round",
+        "sqrt",
+    }
+)
+
+
+def filter_aggregates_by_condition(  # noqa: C901 # FIXME CoP
+    expression: Any,
+    condition: sa.ColumnElement,
+    use_filter_clause: bool = False,
+) -> Optional[sa.ColumnElement]:
+    """Rewrites bundled metric expression, so aggregates only consider rows matching "condition".
+
+    With "use_filter_clause", every aggregate is given "FILTER (WHERE <condition>)" clause;
+    otherwise (for dialects not supporting it), every argument of every aggregate is replaced with
+    "CASE WHEN <condition> THEN <argument> END".  Either way, the rewritten expression, computed
+    over all rows, equals the original expression computed over rows satisfying "condition", which
+    allows metrics of compute Domains differing only by row condition to share a scan.
+
+    Args:
+        expression: bundled metric expression (e.g., "MAX(a)" or
+            "COALESCE(SUM(CASE WHEN a > 1 THEN 1 ELSE 0 END), 0)")
+        condition: row condition, to which aggregates are to be restricted
+        use_filter_clause: whether or not to restrict aggregates with "FILTER (WHERE ...)" (rather
+            than with "CASE WHEN ...")
+
+    Returns:
+        Rewritten expression or None, if "expression" cannot be safely rewritten (e.g., it contains
+        window functions, textual SQL, or functions not known to be aggregate or scalar ones).
+    """
+    if not isinstance(expression, sa.sql.elements.ColumnElement):
+        return None
+
+    is_rewritable: bool = True
+    num_aggregates: int = 0
+
+    def _replace(element: Any) -> Optional[Any]:  # noqa: PLR0911 # FIXME CoP
+        nonlocal is_rewritable, num_aggregates
+
+        if isinstance(
+            element,
+            (
+                sa.sql.elements.TextClause,
+                sa.sql.elements.Over,
+                sa.sql.elements.WithinGroup,
+                sa.sql.elements.FunctionFilter,
+            ),
+        ) or (isinstance(element, sa.sql.elements.ColumnClause) and element.is_literal):
+            is_rewritable = False
+            return element
+
+        if not isinstance(element, sa.sql.functions.FunctionElement):
+            return None
+
+        function_name: str = str(getattr(element, "name", "")).lower()
+        if function_name in _AGGREGATE_FUNCTION_NAMES:
+            num_aggregates += 1
+            if use_filter_clause:
+                return element.filter(condition)
+
+            rewritten_function: Optional[sa.ColumnElement] = _nullify_aggregate_arguments(
+                function=element, condition=condition
+            )
+            if rewritten_function is None:
+                is_rewritable = False
+                return element
+
+            return rewritten_function
+
+        if function_name not in _SCALAR_FUNCTION_NAMES:
+            is_rewritable = False
+            return element
+
+        return None
+
+    rewritten_expression = sa.sql.visitors.replacement_traverse(expression, {}, _replace)
+    if not (is_rewritable and num_aggregates):
+        logger.debug(f"Unable to restrict aggregates of {expression!s} to row condition.")
+        return None
+
+    return rewritten_expression
+
+
+def _nullify_aggregate_arguments(
+    function: sa.sql.functions.FunctionElement, condition: sa.ColumnElement
+) -> Optional[sa.ColumnElement]:
+    arguments = []
+    argument: Any
+    for argument in function.clauses.clauses:
+        if isinstance(argument, sa.sql.elements.ColumnClause) and argument.is_literal:
+            if argument.name != "*":
+                return None
+
+            # "COUNT(*)" of filtered rows equals "COUNT(CASE WHEN <condition> THEN 1 END)"
+            arguments.append(sa.case((condition, sa.literal(1))))
+        elif (
+            isinstance(argument, sa.sql.elements.UnaryExpression)
+            and argument.operator is sa.sql.operators.distinct_op
+        ):
+            arguments.append(sa.distinct(sa.case((condition, argument.element))))
+        else:
+            arguments.append(sa.case((condition, argument)))
+
+    return getattr(sa.func, function.name)(*arguments, type_=function.type)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import concurrent.futures
 import copy
 import datetime
 import hashlib
@@ -10,6 +11,7 @@ import random
 import re
 import string
 import traceback
+from collections import defaultdict
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -48,12 +50,16 @@ from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,
     PartitionDomainKwargs,
 )
+from great_expectations.execution_engine.metric_cache import build_batch_fingerprint
 from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_partitioner import (
     SqlAlchemyDataPartitioner,
 )
 from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_sampler import (
     SqlAlchemyDataSampler,
 )
+from great_expectations.execution_engine.sqlalchemy_bundle_merging import (
+    filter_aggregates_by_condition,
+)
 from great_expectations.expectations.model_field_types import (
     CONDITION_PARSER_GREAT_EXPECTATIONS,
     CONDITION_PARSER_GREAT_EXPECTATIONS_DEPRECATED,
@@ -146,6 +152,8 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251 # FIXME CoP
 
+    from great_expectations.data_context.store.metric_store import BatchMetricStore
+
 
 _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.SQLITE,
@@ -220,6 +228,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        max_concurrent_queries (int): Maximum number of bundled metric queries (one per compute Domain) that may be \
+            executed concurrently, each over its own pooled connection.  Default (1) executes them one after another. \
+            Ignored for dialects that require a single persisted connection and when temporary tables are created, \
+            since temporary tables are only visible to the connection that created them.
+        merge_row_condition_bundles (bool): If True, bundled metrics of compute Domains, which differ only by \
+            "row_condition", are computed by single query (scan) over their common unconditioned Domain, with every \
+            aggregate restricted to rows satisfying its own row condition (using "FILTER (WHERE ...)" clause, where \
+            supported by the dialect, and "CASE WHEN ..." arguments otherwise).  Default (False) issues one query \
+            per compute Domain.
+        metric_cache_max_size_in_bytes (int): Upper bound on estimated memory footprint of cached metrics; least \
+            recently used metrics are evicted beyond it.  Default (None) leaves metric cache unbounded.
+        persistent_metric_store (BatchMetricStore or dict): Store (or its configuration), in which metric values are \
+            persisted between runs.  Batch data is fingerprinted using "batch_fingerprint_query" of BatchSpec (e.g., \
+            "SELECT COUNT(*), MAX(updated_at) FROM my_table"); metrics of Batch data with unchanged fingerprint are \
+            obtained from this store instead of being recomputed.  Default (None) does not persist metrics.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -239,16 +262,35 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        max_concurrent_queries: int = 1,
+        merge_row_condition_bundles: bool = False,
+        metric_cache_max_size_in_bytes: Optional[int] = None,
+        persistent_metric_store: Optional[Union[BatchMetricStore, dict]] = None,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501 # FIXME CoP
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache_max_size_in_bytes=metric_cache_max_size_in_bytes,
+            persistent_metric_store=persistent_metric_store,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+
+        if max_concurrent_queries < 1:
+            raise InvalidConfigError(  # noqa: TRY003 # FIXME CoP
+                '"max_concurrent_queries" must be a positive integer '
+                f"(got {max_concurrent_queries})."
+            )
+
+        self._max_concurrent_queries = max_concurrent_queries
+        self._merge_row_condition_bundles = merge_row_condition_bundles
+
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251 # FIXME CoP
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501 # FIXME CoP
@@ -374,6 +416,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "merge_row_condition_bundles": merge_row_condition_bundles,
+            "metric_cache_max_size_in_bytes": metric_cache_max_size_in_bytes,
+            "persistent_metric_store": persistent_metric_store,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -426,6 +471,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
             )
 
+    @property
+    def max_concurrent_queries(self) -> int:
+        return self._max_concurrent_queries
+
+    @property
+    def merge_row_condition_bundles(self) -> bool:
+        return self._merge_row_condition_bundles
+
     @property
     def credentials(self) -> Optional[dict]:
         return self._credentials
@@ -895,7 +948,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         return PartitionDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
     @override
-    def resolve_metric_bundle(  # noqa: C901 #  too complex
+    def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
     ) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -912,10 +965,6 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             Returns:
                 A dictionary of "MetricConfiguration" IDs and their corresponding now-queried (fully resolved) values.
         """  # noqa: E501 # FIXME CoP
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
-
-        res: List[sqlalchemy.Row]
-
         # We need a different query for each Domain (where clause).
         queries: Dict[Tuple[str, str, str], dict] = {}
 
@@ -937,22 +986,23 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             if domain_id not in queries:
                 queries[domain_id] = {
                     "select": [],
+                    "metric_fns": [],
                     "metric_ids": [],
+                    "metric_configurations": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
 
-            if self.engine.dialect.name == "clickhouse":
-                queries[domain_id]["select"].append(
-                    metric_fn.label(
-                        metric_to_resolve.metric_name.join(
-                            random.choices(string.ascii_lowercase, k=4)
-                        )
-                    )
+            queries[domain_id]["select"].append(
+                self._label_bundled_metric_fn(
+                    metric_fn=metric_fn, metric_name=metric_to_resolve.metric_name
                 )
-            else:
-                queries[domain_id]["select"].append(metric_fn.label(metric_to_resolve.metric_name))
-
+            )
+            queries[domain_id]["metric_fns"].append(metric_fn)
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
+            queries[domain_id]["metric_configurations"].append(metric_to_resolve)
+
+        if self._merge_row_condition_bundles:
+            queries = self._merge_row_condition_bundle_queries(queries=queries)
 
         for query in queries.values():
             domain_kwargs: dict = query["domain_kwargs"]
@@ -960,38 +1010,37 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             assert len(query["select"]) == len(query["metric_ids"])
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function] # FIXME CoP
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (  # type: ignore[truthy-function] # FIXME CoP
-                    sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)  # type: ignore[truthy-function] # FIXME CoP
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable.subquery())
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(selectable)  # type: ignore[arg-type] # FIXME CoP
+            query["sa_query_object"] = self._build_bundle_query_object(
+                select=query["select"], selectable=selectable
+            )
 
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()  # type: ignore[assignment] # FIXME CoP
+        res_by_domain_id: Dict[Tuple[str, str, str], List[sqlalchemy.Row]]
+        if self._can_execute_bundle_queries_concurrently(num_queries=len(queries)):
+            res_by_domain_id = self._execute_bundle_queries_concurrently(queries=queries)
+        else:
+            res_by_domain_id = {
+                domain_id: self._execute_bundle_query(query=query)
+                for domain_id, query in queries.items()
+            }
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
-                )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += (
-                    f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400 # FIXME CoP
-                raise ExecutionEngineError(message=exception_message)
+        return self._convert_bundle_query_results(
+            queries=queries, res_by_domain_id=res_by_domain_id
+        )
+
+    @staticmethod
+    def _convert_bundle_query_results(
+        queries: Dict[Tuple[str, str, str], dict],
+        res_by_domain_id: Dict[Tuple[str, str, str], List[sqlalchemy.Row]],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Converts fetched rows of bundled metrics queries (of those compute Domains, which have
+        them) into values of their metrics, keyed by "MetricConfiguration" IDs.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        domain_id: Tuple[str, str, str]
+        res: List[sqlalchemy.Row]
+        for domain_id, res in res_by_domain_id.items():
+            query: dict = queries[domain_id]
 
             assert len(res) == 1, "all bundle-computed metrics must be single-value statistics"
             assert len(query["metric_ids"]) == len(res[0]), "unexpected number of metrics returned"
@@ -1005,6 +1054,287 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _label_bundled_metric_fn(self, metric_fn: Any, metric_name: str) -> Any:
+        if self.engine.dialect.name == "clickhouse":
+            return metric_fn.label(metric_name.join(random.choices(string.ascii_lowercase, k=4)))
+
+        return metric_fn.label(metric_name)
+
+    def _merge_row_condition_bundle_queries(  # noqa: C901 # FIXME CoP
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], dict]:
+        """Merges bundled metrics queries of compute Domains, which differ only by "row_condition"
+        (parsed by the great_expectations condition parser), into single query over their common
+        unconditioned compute Domain, in which aggregates of every metric are restricted to rows
+        satisfying row condition of its original Domain.
+
+        Metrics, whose expressions cannot be safely rewritten (see
+        "filter_aggregates_by_condition()"), keep their original per-Domain queries.
+
+        Args:
+            queries: dictionary of queries (as built by "resolve_metric_bundle()"), keyed by compute
+                Domain ID.
+
+        Returns:
+            Dictionary of queries, in which merged queries are keyed by ID of their unconditioned
+            compute Domain.
+        """
+        queries_by_base_domain_id: Dict[
+            Tuple[str, str, str], List[Tuple[Tuple[str, str, str], dict]]
+        ] = defaultdict(list)
+        base_domain_kwargs_by_base_domain_id: Dict[Tuple[str, str, str], IDDict] = {}
+
+        domain_id: Tuple[str, str, str]
+        query: dict
+        domain_kwargs: dict
+        base_domain_kwargs: IDDict
+        base_domain_id: Tuple[str, str, str]
+        for domain_id, query in queries.items():
+            domain_kwargs = query["domain_kwargs"]
+            if domain_kwargs.get("row_condition") is not None and domain_kwargs.get(
+                "condition_parser"
+            ) not in (
+                CONDITION_PARSER_GREAT_EXPECTATIONS,
+                CONDITION_PARSER_GREAT_EXPECTATIONS_DEPRECATED,
+            ):
+                continue
+
+            base_domain_kwargs = IDDict(
+                {
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key not in ("row_condition", "condition_parser")
+                }
+            )
+            base_domain_id = base_domain_kwargs.to_id()
+            queries_by_base_domain_id[base_domain_id].append((domain_id, query))
+            base_domain_kwargs_by_base_domain_id[base_domain_id] = base_domain_kwargs
+
+        use_filter_clause: bool = self._supports_aggregate_filter_clause()
+
+        merged_queries: Dict[Tuple[str, str, str], dict] = dict(queries)
+
+        grouped_queries: List[Tuple[Tuple[str, str, str], dict]]
+        merged_query: dict
+        row_condition: Optional[str]
+        condition: Any
+        metric_fn: Any
+        rewritten_metric_fn: Any
+        metric_name: str
+        idx: int
+        for base_domain_id, grouped_queries in queries_by_base_domain_id.items():
+            if len(grouped_queries) < 2:  # noqa: PLR2004 # FIXME CoP
+                continue
+
+            merged_query = {
+                "select": [],
+                "metric_fns": [],
+                "metric_ids": [],
+                "metric_configurations": [],
+                "domain_kwargs": base_domain_kwargs_by_base_domain_id[base_domain_id],
+            }
+            for domain_id, query in grouped_queries:
+                row_condition = query["domain_kwargs"].get("row_condition")
+                condition = (
+                    None if row_condition is None else parse_condition_to_sqlalchemy(row_condition)
+                )
+                unmerged_idxs: List[int] = []
+                for idx, metric_fn in enumerate(query["metric_fns"]):
+                    rewritten_metric_fn = (
+                        metric_fn
+                        if condition is None
+                        else filter_aggregates_by_condition(
+                            expression=metric_fn,
+                            condition=condition,
+                            use_filter_clause=use_filter_clause,
+                        )
+                    )
+                    if rewritten_metric_fn is None:
+                        unmerged_idxs.append(idx)
+                        continue
+
+                    # metrics of different Domains may share names; labels must be unique
+                    metric_name = query["metric_configurations"][idx].metric_name
+                    merged_query["select"].append(
+                        self._label_bundled_metric_fn(
+                            metric_fn=rewritten_metric_fn,
+                            metric_name=f"{metric_name}_{len(merged_query['select'])}",
+                        )
+                    )
+                    merged_query["metric_fns"].append(rewritten_metric_fn)
+                    merged_query["metric_ids"].append(query["metric_ids"][idx])
+                    merged_query["metric_configurations"].append(
+                        query["metric_configurations"][idx]
+                    )
+
+                if unmerged_idxs:
+                    merged_queries[domain_id] = {
+                        key: [query[key][idx] for idx in unmerged_idxs]
+                        for key in ("select", "metric_fns", "metric_ids", "metric_configurations")
+                    }
+                    merged_queries[domain_id]["domain_kwargs"] = query["domain_kwargs"]
+                else:
+                    del merged_queries[domain_id]
+
+            if merged_query["metric_ids"]:
+                merged_queries[base_domain_id] = merged_query
+                logger.debug(
+                    f"Merged bundled metrics of {len(grouped_queries)} compute Domains into single "
+                    f"query on domain_id {base_domain_id}."
+                )
+
+        return merged_queries
+
+    def _supports_aggregate_filter_clause(self) -> bool:
+        """Whether or not dialect supports "FILTER (WHERE ...)" clause of aggregate functions."""
+        if self.dialect_name == GXSqlDialect.POSTGRESQL:
+            return True
+
+        if self.dialect_name == GXSqlDialect.SQLITE:
+            # noinspection PyUnresolvedReferences
+            return version.parse(self.engine.dialect.dbapi.sqlite_version) >= version.parse(
+                "3.30.0"
+            )
+
+        return False
+
+    @staticmethod
+    def _build_bundle_query_object(
+        select: List[Any], selectable: sqlalchemy.Selectable
+    ) -> sqlalchemy.Select:
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function] # FIXME CoP
+            return sa.select(*select).select_from(selectable.columns().subquery())
+
+        if (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (  # type: ignore[truthy-function] # FIXME CoP
+            sqlalchemy.TextualSelect and isinstance(selectable, sqlalchemy.TextualSelect)  # type: ignore[truthy-function] # FIXME CoP
+        ):
+            return sa.select(*select).select_from(selectable.subquery())
+
+        return sa.select(*select).select_from(selectable)  # type: ignore[arg-type] # FIXME CoP
+
+    def _execute_bundle_query(self, query: dict) -> List[sqlalchemy.Row]:
+        """Executes bundled metrics query of compute Domain (built by "resolve_metric_bundle()").
+
+        Args:
+            query: dictionary, containing SQLAlchemy query object ("sa_query_object") and compute
+                "domain_kwargs".
+
+        Returns:
+            Fetched rows of query result.
+        """
+        res: List[sqlalchemy.Row]
+        try:
+            logger.debug(f"Attempting query {query['sa_query_object']!s}")
+            with self._measure_metrics(metric_configurations=query["metric_configurations"]):
+                res = self.execute_query(query["sa_query_object"]).fetchall()  # type: ignore[assignment] # FIXME CoP
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(query["domain_kwargs"]).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400 # FIXME CoP
+            raise ExecutionEngineError(message=exception_message)
+
+        return res
+
+    @property
+    @override
+    def _supports_concurrent_metric_execution(self) -> bool:
+        """Single persisted connection cannot be shared by concurrently computed metrics, and
+        temporary tables are not visible to connections of other threads.
+        """
+        return (
+            self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS and not self._uses_temp_tables()
+        )
+
+    def _uses_temp_tables(self) -> bool:
+        """Whether data of loaded Batches is read from temporary tables.
+
+        "create_temp_table" of BatchSpec overrides that of this ExecutionEngine, which is used only
+        while no Batch is loaded.
+        """
+        batch_data_cache = self._batch_manager.batch_data_cache
+        if not batch_data_cache:
+            return self._create_temp_table
+
+        return any(
+            batch_data.uses_temp_table
+            for batch_data in batch_data_cache.values()
+            if isinstance(batch_data, SqlAlchemyBatchData)
+        )
+
+    def _can_execute_bundle_queries_concurrently(self, num_queries: int) -> bool:
+        """Concurrent execution requires independent pooled connections, which is not the case for
+        dialects that use single persisted connection, or when temporary tables (visible only to
+        their own connection) are used.
+        """
+        return (
+            self._max_concurrent_queries > 1
+            and num_queries > 1
+            and self._supports_concurrent_metric_execution
+        )
+
+    def _execute_bundle_queries_concurrently(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], List[sqlalchemy.Row]]:
+        """Executes bundled metrics queries for different compute Domains concurrently, using at
+        most "max_concurrent_queries" connections at a time.
+
+        Args:
+            queries: dictionary of queries (as built by "resolve_metric_bundle()"), keyed by compute
+                Domain ID.
+
+        Returns:
+            Fetched rows of query result for every compute Domain ID.
+
+        Raises:
+            MetricResolutionError: identifying only metrics of those compute Domains, whose queries
+                failed (and carrying resolved metrics of all other compute Domains).
+        """
+        res_by_domain_id: Dict[Tuple[str, str, str], List[sqlalchemy.Row]] = {}
+
+        failed_metrics: List[MetricConfiguration] = []
+        exception_messages: List[str] = []
+
+        domain_id: Tuple[str, str, str]
+        query: dict
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._max_concurrent_queries, len(queries)),
+            thread_name_prefix="gx-sqlalchemy-bundle",
+        ) as executor:
+            futures: Dict[Tuple[str, str, str], concurrent.futures.Future] = {
+                domain_id: executor.submit(self._execute_bundle_query, query=query)
+                for domain_id, query in queries.items()
+            }
+            for domain_id, future in futures.items():
+                try:
+                    res_by_domain_id[domain_id] = future.result()
+                except Exception as e:
+                    failed_metrics.extend(queries[domain_id]["metric_configurations"])
+                    exception_messages.append(str(e))
+
+        if failed_metrics:
+            raise gx_exceptions.MetricResolutionError(
+                message="\n".join(exception_messages),
+                failed_metrics=failed_metrics,
+                resolved_metrics=self._convert_bundle_query_results(
+                    queries=queries, res_by_domain_id=res_by_domain_id
+                ),
+            )
+
+        return res_by_domain_id
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1218,8 +1548,24 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 source_schema_name=source_schema_name,
             )
 
+        batch_fingerprint_query: Optional[str] = batch_spec.get("batch_fingerprint_query")
+        if batch_fingerprint_query:
+            batch_markers["batch_fingerprint"] = self._compute_batch_fingerprint(
+                batch_spec=batch_spec, batch_fingerprint_query=batch_fingerprint_query
+            )
+
         return batch_data, batch_markers
 
+    def _compute_batch_fingerprint(
+        self, batch_spec: BatchSpec, batch_fingerprint_query: str
+    ) -> str:
+        """Fingerprints Batch data using result of user-supplied "freshness" query (e.g., row count
+        and latest update timestamp of source table), combined with BatchSpec (which identifies data
+        selected from source table).
+        """
+        rows: List[sqlalchemy.Row] = self.execute_query(sa.text(batch_fingerprint_query)).fetchall()
+        return build_batch_fingerprint(dict(batch_spec), [list(row) for row in rows])
+
     def get_inspector(self) -> sqlalchemy.engine.reflection.Inspector:
         if self._inspector is None:
             if version.parse(sa.__version__) < version.parse("1.4"):
@@ -1271,6 +1617,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         with self.get_connection() as connection:
             result = connection.execute(query)  # type: ignore[arg-type] # FIXME:Selectable overly broad
 
+        self._record_queries()
         return result
 
     @new_method_or_class(version="0.16.14")
@@ -1298,4 +1645,5 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 with connection.begin():
                     result = connection.execute(query)  # type: ignore[call-overload] # FIXME:Selectable overly broad
 
+        self._record_queries()
         return result
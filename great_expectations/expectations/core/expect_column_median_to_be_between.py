@@ -44,6 +44,10 @@ STRICT_MIN_DESCRIPTION = (
 STRICT_MAX_DESCRIPTION = (
     "If True, the column median must be strictly smaller than max_value, default=False"
 )
+APPROXIMATE_DESCRIPTION = (
+    "If True, the column median is approximated in a single pass over the column (using "
+    "approximate quantile functions of the backend, where available), default=False"
+)
 SUPPORTED_DATA_SOURCES = [
     "Pandas",
     "Spark",
@@ -79,6 +83,8 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             {STRICT_MIN_DESCRIPTION}
         strict_max (boolean): \
             {STRICT_MAX_DESCRIPTION}
+        approximate (boolean): \
+            {APPROXIMATE_DESCRIPTION}
 
     Other Parameters:
         result_format (str or None): \
@@ -182,6 +188,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
     )
     strict_min: bool = pydantic.Field(default=False, description=STRICT_MAX_DESCRIPTION)
     strict_max: bool = pydantic.Field(default=False, description=STRICT_MIN_DESCRIPTION)
+    approximate: bool = pydantic.Field(default=False, description=APPROXIMATE_DESCRIPTION)
 
     library_metadata: ClassVar[Dict[str, Union[str, list, bool]]] = {
         "maturity": "production",
@@ -200,6 +207,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "strict_min",
         "max_value",
         "strict_max",
+        "approximate",
     )
 
     args_keys = (
@@ -362,9 +370,21 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
+        median: Any = metrics.get("column.median")
+        if not isinstance(median, dict):
+            return self._validate_metric_value_between(
+                metric_name="column.median",
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                execution_engine=execution_engine,
+            )
+
+        # approximate median is reported along with bound of its rank error
+        validation_result: Dict[str, Any] = self._validate_metric_value_between(
             metric_name="column.median",
-            metrics=metrics,
+            metrics={**metrics, "column.median": median["value"]},
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+        validation_result["result"]["details"] = {"rank_error": median["rank_error"]}
+        return validation_result
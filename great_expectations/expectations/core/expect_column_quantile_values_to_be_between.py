@@ -69,6 +69,10 @@ ALLOW_RELATIVE_ERROR_DESCRIPTION = (
     "Whether to allow relative error in quantile "
     "communications on backends that support or require it."
 )
+APPROXIMATE_DESCRIPTION = (
+    "If True, quantiles are approximated in a single pass over the column (using approximate "
+    "quantile functions of the backend, where available), default=False"
+)
 SUPPORTED_DATA_SOURCES = [
     "Pandas",
     "Spark",
@@ -102,6 +106,8 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             {QUANTILE_RANGES_DESCRIPTION} The length of the 'quantiles' list and the 'value_ranges' list must be equal.
         allow_relative_error (boolean or string): \
             {ALLOW_RELATIVE_ERROR_DESCRIPTION}
+        approximate (boolean): \
+            {APPROXIMATE_DESCRIPTION}
 
     Other Parameters:
         result_format (str or None): \
@@ -250,6 +256,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
         default=False,
         description=ALLOW_RELATIVE_ERROR_DESCRIPTION,
     )
+    approximate: bool = pydantic.Field(default=False, description=APPROXIMATE_DESCRIPTION)
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata: ClassVar[Dict[str, Union[str, list, bool]]] = {
@@ -267,6 +274,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
     success_keys = (
         "quantile_ranges",
         "allow_relative_error",
+        "approximate",
     )
 
     args_keys = (
@@ -730,6 +738,11 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
         execution_engine: Optional[ExecutionEngine] = None,
     ):
         quantile_vals = metrics.get("column.quantile_values")
+        details: Dict[str, Any] = {}
+        if isinstance(quantile_vals, dict):
+            # approximate quantiles are reported along with bound of their rank error
+            details["rank_error"] = quantile_vals["rank_error"]
+            quantile_vals = quantile_vals["values"]
         quantile_ranges = self.configuration.kwargs.get("quantile_ranges")
         quantiles = quantile_ranges["quantiles"]
         quantile_value_ranges = quantile_ranges["value_ranges"]
@@ -761,6 +774,6 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": {"success_details": success_details, **details},
             },
         }
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
 
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
-from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -41,65 +40,56 @@ class ColumnDistinctValues(ColumnAggregateMetricProvider):
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
         cls,
-        execution_engine: SqlAlchemyExecutionEngine,
-        metric_domain_kwargs: Dict[str, str],
+        metrics: Dict[str, Any],
         **kwargs,
     ) -> Set[Any]:
         """
-        Past implementations of column.distinct_values depended on column.value_counts.
-        This was causing performance issues due to the complex query used in column.value_counts and subsequent
-        in-memory operations.
+        Distinct values are the values of the (unsorted) column.value_counts metric, which is shared with other metrics
+        of the same column domain (e.g., column.most_common_value), so that the column is scanned once.
         """  # noqa: E501 # FIXME CoP
-        selectable: sqlalchemy.Selectable
-        accessor_domain_kwargs: Dict[str, str]
-        (
-            selectable,
-            _,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
-        column_name: str = accessor_domain_kwargs["column"]
-        column: sqlalchemy.ColumnClause = sa.column(column_name)
-
-        distinct_values: List[sqlalchemy.Row]
-        if hasattr(column, "is_not"):
-            distinct_values = execution_engine.execute_query(  # type: ignore[assignment] # FIXME CoP
-                sa.select(column).where(column.is_not(None)).distinct().select_from(selectable)  # type: ignore[arg-type] # FIXME CoP
-            ).fetchall()
-        else:
-            distinct_values = execution_engine.execute_query(  # type: ignore[assignment] # FIXME CoP
-                sa.select(column).where(column.isnot(None)).distinct().select_from(selectable)  # type: ignore[arg-type] # FIXME CoP
-            ).fetchall()
-        # Vectorized operation is not faster here due to overhead of converting to and from numpy array  # noqa: E501 # FIXME CoP
-        return {row[0] for row in distinct_values}
+        return set(metrics["column.value_counts"].index)
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
         cls,
-        execution_engine: SparkDFExecutionEngine,
-        metric_domain_kwargs: Dict[str, str],
+        metrics: Dict[str, Any],
         **kwargs,
     ) -> Set[Any]:
         """
-        Past implementations of column.distinct_values depended on column.value_counts.
-        This was causing performance issues due to the complex query used in column.value_counts and subsequent
-        in-memory operations.
+        Distinct values are the values of the (unsorted) column.value_counts metric, which is shared with other metrics
+        of the same column domain (e.g., column.most_common_value), so that the column is scanned once.
         """  # noqa: E501 # FIXME CoP
-        df: pyspark.DataFrame
-        accessor_domain_kwargs: Dict[str, str]
-        (
-            df,
-            _,
-            accessor_domain_kwargs,
-        ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
-        column_name: str = accessor_domain_kwargs["column"]
-        distinct_values: List[pyspark.Row] = (
-            df.select(F.col(column_name))
-            .distinct()
-            .where(F.col(column_name).isNotNull())
-            .rdd.flatMap(lambda x: x)
-            .collect()
+        return set(metrics["column.value_counts"].index)
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
         )
-        return set(distinct_values)
+
+        if isinstance(execution_engine, (SparkDFExecutionEngine, SqlAlchemyExecutionEngine)):
+            dependencies["column.value_counts"] = MetricConfiguration(
+                metric_name="column.value_counts",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={
+                    "sort": "none",
+                    "collate": None,
+                },
+            )
+
+        return dependencies
 
 
 class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
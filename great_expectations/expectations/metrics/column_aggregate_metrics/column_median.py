@@ -17,7 +17,11 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics import (
+    column_quantile_values,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.quantile_sketch import QuantileSketch
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -29,15 +33,26 @@ if TYPE_CHECKING:
 
 
 class ColumnMedian(ColumnAggregateMetricProvider):
-    """MetricProvider Class for Aggregate Mean MetricProvider"""
+    """MetricProvider Class for Aggregate Median MetricProvider
+
+    If metric value kwarg "approximate" is set, the median is approximated (without sorting the
+    column), and the metric value is a dictionary: {"value": <median>, "rank_error": <bound of the
+    rank error (None, if unknown)>}.
+    """
 
     metric_name = "column.median"
+    value_keys = ("approximate",)
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         """Pandas Median Implementation"""
         column_null_elements_cond: pd.Series = column.isnull()
         column_nonnull_elements: pd.Series = column[~column_null_elements_cond]
+        if kwargs.get("approximate"):
+            sketch = QuantileSketch()
+            sketch.update(column_nonnull_elements.to_numpy())
+            return {"value": sketch.quantiles([0.5])[0], "rank_error": sketch.rank_error}
+
         return column_nonnull_elements.median()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -57,6 +72,15 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         column_name = accessor_domain_kwargs["column"]
         column = sa.column(column_name)  # type: ignore[var-annotated] # FIXME CoP
         """SqlAlchemy Median Implementation"""
+        if metric_value_kwargs.get("approximate"):
+            values, rank_error = column_quantile_values.get_approximate_column_quantiles(
+                column=column,
+                quantiles=[0.5],
+                selectable=selectable,
+                execution_engine=execution_engine,
+            )
+            return {"value": values[0], "rank_error": rank_error}
+
         nonnull_count = metrics.get("column_values.nonnull.count")
         if not nonnull_count:
             return None
@@ -107,6 +131,14 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             accessor_domain_kwargs,
         ) = execution_engine.get_compute_domain(metric_domain_kwargs, MetricDomainTypes.COLUMN)
         column = accessor_domain_kwargs["column"]
+        if metric_value_kwargs.get("approximate"):
+            relative_error = column_quantile_values.SPARK_APPROXIMATE_QUANTILES_RELATIVE_ERROR
+            return {
+                # approxQuantile() returns no values for empty columns
+                "value": next(iter(df.approxQuantile(column, [0.5], relative_error)), None),
+                "rank_error": relative_error,
+            }
+
         # We will get the two middle values by choosing an epsilon to add
         # to the 50th percentile such that we always get exactly the middle two values
         # (i.e. 0 < epsilon < 1 / (2 * values))
@@ -143,7 +175,10 @@ class ColumnMedian(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+        # the approximate median does not depend on the position of the center values
+        if isinstance(
+            execution_engine, SqlAlchemyExecutionEngine
+        ) and not metric.metric_value_kwargs.get("approximate"):
             dependencies["column_values.nonnull.count"] = MetricConfiguration(
                 metric_name="column_values.nonnull.count",
                 metric_domain_kwargs=metric.metric_domain_kwargs,
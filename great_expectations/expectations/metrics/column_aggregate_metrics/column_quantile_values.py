@@ -5,7 +5,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 
@@ -26,18 +26,58 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.quantile_sketch import QuantileSketch
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
 
 logger = logging.getLogger(__name__)
 
+# Number of column values fetched at a time, when streaming them into a quantile sketch.
+APPROXIMATE_QUANTILES_CHUNK_SIZE = 10000
+
+# Relative error of approximate quantiles computed by Spark (as fraction of number of values).
+SPARK_APPROXIMATE_QUANTILES_RELATIVE_ERROR = 1.0e-3
+
+# Number of intervals, into which BigQuery APPROX_QUANTILES() divides column values; requested
+# quantiles are rounded to the nearest of its boundaries.
+BIGQUERY_APPROXIMATE_QUANTILES_NUM_INTERVALS = 1000
+
+# Rank errors of server-side quantile functions, which compute approximate quantiles of SQL dialects
+# (as fraction of number of values): 0 for exact functions of dialects without approximate ones, and
+# as documented by vendors for approximate functions (None, where no bound is documented).
+_SERVER_SIDE_APPROXIMATE_QUANTILES_RANK_ERROR: dict[str, Optional[float]] = {
+    GXSqlDialect.AWSATHENA: 1.0e-2,
+    GXSqlDialect.BIGQUERY: None,
+    GXSqlDialect.CLICKHOUSE: None,
+    GXSqlDialect.DATABRICKS: 1.0e-4,
+    GXSqlDialect.MSSQL: 0.0,
+    GXSqlDialect.MYSQL: 0.0,
+    GXSqlDialect.POSTGRESQL: 0.0,
+    GXSqlDialect.REDSHIFT: 5.0e-3,
+    GXSqlDialect.SNOWFLAKE: None,
+    GXSqlDialect.TRINO: 1.0e-2,
+}
+
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
+    """MetricProvider Class for Quantile Values of a column.
+
+    If metric value kwarg "approximate" is set, quantiles are approximated (in a single pass over
+    the column, where the engine has no approximate percentile function of its own), and the metric
+    value is a dictionary: {"values": [...], "rank_error": <bound of the rank error, as fraction of
+    number of values (None, if unknown)>}.
+    """
+
     metric_name = "column.quantile_values"
-    value_keys = ("quantiles", "allow_relative_error")
+    value_keys = ("quantiles", "allow_relative_error", "approximate")
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
         """Quantile Function"""
+        if kwargs.get("approximate"):
+            sketch = QuantileSketch()
+            sketch.update(column.dropna().to_numpy())
+            return {"values": sketch.quantiles(quantiles), "rank_error": sketch.rank_error}
+
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
         if not allow_relative_error:
@@ -73,7 +113,15 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         table_row_count = metrics.get("table.row_count")
-        if dialect_name == GXSqlDialect.MSSQL:
+        if metric_value_kwargs.get("approximate"):
+            values, rank_error = get_approximate_column_quantiles(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                execution_engine=execution_engine,
+            )
+            return {"values": values, "rank_error": rank_error}
+        elif dialect_name == GXSqlDialect.MSSQL:
             return _get_column_quantiles_mssql(
                 column=column,
                 quantiles=quantiles,
@@ -167,6 +215,14 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         column = accessor_domain_kwargs["column"]
 
+        if metric_value_kwargs.get("approximate"):
+            return {
+                "values": df.approxQuantile(  # type: ignore[attr-defined] # FIXME CoP
+                    column, list(quantiles), SPARK_APPROXIMATE_QUANTILES_RELATIVE_ERROR
+                ),
+                "rank_error": SPARK_APPROXIMATE_QUANTILES_RELATIVE_ERROR,
+            }
+
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         if not allow_relative_error:
             allow_relative_error = 0.0
@@ -183,6 +239,180 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         return df.approxQuantile(column, list(quantiles), allow_relative_error)  # type: ignore[attr-defined] # FIXME CoP
 
 
+def get_approximate_column_quantiles(
+    column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
+) -> tuple[list, Optional[float]]:
+    """Returns approximate quantiles of (non-null values of) column, and bound of their rank error.
+
+    Quantiles are computed server-side, by approximate percentile function of the SQL dialect or,
+    where it has none, by its exact percentile function.  Only as last resort (for dialects without
+    either), column values are streamed (in chunks) to the client, into a QuantileSketch, in single
+    pass over the column.  The rank error is given as fraction of number of values (None, if the
+    dialect does not document a bound).
+    """
+    quantiles = list(quantiles)
+    dialect_name: str = execution_engine.dialect_name.lower()
+    if dialect_name not in _SERVER_SIDE_APPROXIMATE_QUANTILES_RANK_ERROR:
+        logger.info(
+            f'SQL dialect "{dialect_name}" has no quantile function; values of column "{column}"'
+            " are streamed to the client to approximate their quantiles."
+        )
+        sketch: QuantileSketch = _build_column_quantile_sketch(
+            column=column, selectable=selectable, execution_engine=execution_engine
+        )
+        return sketch.quantiles(quantiles), sketch.rank_error
+
+    rank_error: Optional[float] = _SERVER_SIDE_APPROXIMATE_QUANTILES_RANK_ERROR[dialect_name]
+    values: list = _get_server_side_approximate_column_quantiles(
+        dialect_name=dialect_name,
+        column=column,
+        quantiles=quantiles,
+        # approximate quantiles are those of non-null values (as are those of QuantileSketch)
+        selectable=sa.select(column)
+        .where(column != None)  # noqa: E711 # comparison to None is SQL "IS NOT NULL"
+        .select_from(selectable)
+        .subquery(),
+        execution_engine=execution_engine,
+    )
+    return values, rank_error
+
+
+def _get_server_side_approximate_column_quantiles(  # noqa: PLR0911 # one query per dialect
+    dialect_name: str,
+    column,
+    quantiles: list,
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> list:
+    if dialect_name == GXSqlDialect.TRINO:
+        return _get_column_quantiles_trino(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    if dialect_name == GXSqlDialect.AWSATHENA:
+        return _get_column_quantiles_athena(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    if dialect_name == GXSqlDialect.BIGQUERY:
+        return _get_approximate_column_quantiles_bigquery(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    if dialect_name == GXSqlDialect.CLICKHOUSE:
+        return _get_approximate_column_quantiles_clickhouse(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    if dialect_name == GXSqlDialect.MSSQL:
+        return _get_column_quantiles_mssql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    if dialect_name == GXSqlDialect.MYSQL:
+        return _get_column_quantiles_mysql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+        )
+
+    if dialect_name in (GXSqlDialect.POSTGRESQL, GXSqlDialect.REDSHIFT):
+        return _get_percentile_disc_column_quantiles(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            execution_engine=execution_engine,
+            # Redshift supports the approximate version of percentile_disc only.
+            approximate=dialect_name == GXSqlDialect.REDSHIFT,
+        )
+
+    # Snowflake and Databricks (see the note on rounding of Snowflake quantiles above).
+    quantiles_query: sqlalchemy.Select = sa.select(
+        *[sa.func.approx_percentile(column, round(quantile, 10)) for quantile in quantiles]
+    ).select_from(selectable)
+    return list(execution_engine.execute_query(quantiles_query).fetchone())  # type: ignore[arg-type] # one row is returned
+
+
+def _get_percentile_disc_column_quantiles(
+    column,
+    quantiles: list,
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    approximate: bool,
+) -> list:
+    selects: list[sqlalchemy.WithinGroup] = [
+        sa.func.percentile_disc(quantile).within_group(column.asc()) for quantile in quantiles
+    ]
+    if approximate:
+        sql_approx: str = get_approximate_percentile_disc_sql(
+            selects=selects, sql_engine_dialect=execution_engine.dialect
+        )
+        quantiles_query: sqlalchemy.Select = sa.select(sa.text(sql_approx)).select_from(selectable)
+    else:
+        quantiles_query = sa.select(*selects).select_from(selectable)
+
+    return list(execution_engine.execute_query(quantiles_query).fetchone())  # type: ignore[arg-type] # one row is returned
+
+
+def _get_approximate_column_quantiles_clickhouse(
+    column, quantiles: list, selectable, execution_engine: SqlAlchemyExecutionEngine
+) -> list:
+    # quantiles() approximates quantiles of (reservoir) sample of column values
+    sql_approx: str = f"quantiles({', '.join(str(quantile) for quantile in quantiles)})({column})"
+    quantiles_query: sqlalchemy.Select = sa.select(sa.text(sql_approx)).select_from(selectable)
+    return list(execution_engine.execute_query(quantiles_query).fetchone()[0])  # type: ignore[index] # one row is returned
+
+
+def _get_approximate_column_quantiles_bigquery(
+    column, quantiles: list, selectable, execution_engine: SqlAlchemyExecutionEngine
+) -> list:
+    # APPROX_QUANTILES() returns boundaries of (approximately) equally sized intervals of values
+    num_intervals: int = BIGQUERY_APPROXIMATE_QUANTILES_NUM_INTERVALS
+    quantiles_query: sqlalchemy.Select = sa.select(
+        sa.func.approx_quantiles(column, sa.literal_column(str(num_intervals)))
+    ).select_from(selectable)
+    boundaries: list = execution_engine.execute_query(quantiles_query).fetchone()[0]  # type: ignore[index] # one row is returned
+    if not boundaries:
+        return [None] * len(quantiles)
+
+    return [boundaries[round(quantile * num_intervals)] for quantile in quantiles]
+
+
+def _build_column_quantile_sketch(
+    column, selectable, execution_engine: SqlAlchemyExecutionEngine
+) -> QuantileSketch:
+    query: sqlalchemy.Select = (
+        sa.select(column)
+        .where(column != None)  # noqa: E711 # FIXME CoP
+        .select_from(selectable)
+        .execution_options(stream_results=True)
+    )
+
+    sketch = QuantileSketch()
+    with execution_engine.get_connection() as connection:
+        result = connection.execute(query)
+        while rows := result.fetchmany(APPROXIMATE_QUANTILES_CHUNK_SIZE):
+            sketch.update([row[0] for row in rows])
+
+    return sketch
+
+
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
 ) -> list:
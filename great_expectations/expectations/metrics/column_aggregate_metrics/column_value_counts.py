@@ -6,8 +6,10 @@ import pandas as pd
 
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
@@ -16,12 +18,24 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import pyspark, sqlalchemy
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
 
 
 class ColumnValueCounts(ColumnAggregateMetricProvider):
+    """MetricProvider Class for Value Counts of a column.
+
+    Value counts are computed (in a single scan of the column) unsorted; value counts sorted by
+    "value" or by "count" depend on the unsorted ones, and are sorted in memory.  Hence, metrics of
+    the same column domain share one value counts result, regardless of how they sort it.  (Value
+    counts are computed directly, if the unsorted ones are not resolved as a dependency.)
+    """
+
     metric_name = "column.value_counts"
     value_keys = ("sort", "collate")
 
@@ -33,6 +47,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         execution_engine: PandasExecutionEngine,
         metric_domain_kwargs: Dict[str, str],
         metric_value_kwargs: Dict[str, Optional[str]],
+        metrics: Dict[str, Any],
         **kwargs,
     ) -> pd.Series:
         sort: str = metric_value_kwargs.get("sort") or cls.default_kwarg_values["sort"]
@@ -45,6 +60,9 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")  # noqa: TRY003 # FIXME CoP
 
+        if "column.value_counts" in metrics:
+            return _sort_value_counts(value_counts=metrics["column.value_counts"], sort=sort)
+
         df: pd.DataFrame
         accessor_domain_kwargs: Dict[str, str]
         df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
@@ -53,21 +71,9 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         column: str = accessor_domain_kwargs["column"]
 
         counts: pd.Series = df[column].value_counts()
-        if sort == "value":
-            try:
-                counts.sort_index(inplace=True)
-            except TypeError:
-                # Having values of multiple types in a object dtype column (e.g., strings and floats)  # noqa: E501 # FIXME CoP
-                # raises a TypeError when the sorting method performs comparisons.
-                # Related to the noqa E721 below: numpy / pandas implements equality, see https://github.com/astral-sh/ruff/issues/9570
-                if df[column].dtype == object:
-                    counts.index = counts.index.astype(str)
-                    counts.sort_index(inplace=True)
-        elif sort == "counts":
-            counts.sort_values(inplace=True)
         counts.name = "count"
         counts.index.name = "value"
-        return counts
+        return _sort_value_counts(value_counts=counts, sort=sort)
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
@@ -75,6 +81,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         execution_engine: SqlAlchemyExecutionEngine,
         metric_domain_kwargs: Dict[str, str],
         metric_value_kwargs: Dict[str, Optional[str]],
+        metrics: Dict[str, Any],
         **kwargs,
     ) -> pd.Series:
         sort: str = metric_value_kwargs.get("sort") or cls.default_kwarg_values["sort"]
@@ -87,6 +94,9 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         if collate is not None:
             raise ValueError("collate parameter is not supported in PandasDataset")  # noqa: TRY003 # FIXME CoP
 
+        if "column.value_counts" in metrics:
+            return _sort_value_counts(value_counts=metrics["column.value_counts"], sort=sort)
+
         selectable: sqlalchemy.Selectable
         accessor_domain_kwargs: Dict[str, str]
         selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
@@ -113,17 +123,6 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
                 .where(sa.column(column).isnot(None))
                 .group_by(sa.column(column))
             )
-        if sort == "value":
-            # NOTE: depending on the way the underlying database collates columns,
-            # ordering can vary. postgresql collate "C" matches default sort
-            # for python and most other systems, but is not universally supported,
-            # so we use the default sort for the system, unless specifically overridden
-            if collate is not None:
-                query = query.order_by(sa.column(column).collate(collate))
-            else:
-                query = query.order_by(sa.column(column))
-        elif sort == "count":
-            query = query.order_by(sa.column("count").desc())
         results: List[sqlalchemy.Row] = execution_engine.execute_query(  # type: ignore[assignment] # FIXME CoP
             query.select_from(selectable)  # type: ignore[arg-type] # FIXME CoP
         ).fetchall()
@@ -133,7 +132,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             index=pd.Index(data=[row[0] for row in results], name="value"),
             name="count",
         )
-        return series
+        return _sort_value_counts(value_counts=series, sort=sort)
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -141,6 +140,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         execution_engine: SparkDFExecutionEngine,
         metric_domain_kwargs: Dict[str, str],
         metric_value_kwargs: Dict[str, Optional[str]],
+        metrics: Dict[str, Any],
         **kwargs,
     ) -> pd.Series:
         sort: str = metric_value_kwargs.get("sort") or cls.default_kwarg_values["sort"]
@@ -153,6 +153,9 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         if collate is not None:
             raise ValueError("collate parameter is not supported in SparkDFDataset")  # noqa: TRY003 # FIXME CoP
 
+        if "column.value_counts" in metrics:
+            return _sort_value_counts(value_counts=metrics["column.value_counts"], sort=sort)
+
         df: pyspark.DataFrame
         accessor_domain_kwargs: Dict[str, str]
         df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
@@ -164,11 +167,6 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             df.select(column).where(F.col(column).isNotNull()).groupBy(column).count()
         )
 
-        if sort == "value":
-            value_counts_df = value_counts_df.orderBy(column)
-        elif sort == "count":
-            value_counts_df = value_counts_df.orderBy(F.desc("count"))
-
         value_counts: List[pyspark.Row] = value_counts_df.collect()
 
         # Numpy does not always infer the correct DataTypes for Spark df, so we cannot use vectorized approach.  # noqa: E501 # FIXME CoP
@@ -185,4 +183,54 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             index=pd.Index(data=values, name="value"),
             name="count",
         )
-        return series
+        return _sort_value_counts(value_counts=series, sort=sort)
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        sort: str = metric.metric_value_kwargs.get("sort") or cls.default_kwarg_values["sort"]
+        if sort != "none":
+            dependencies["column.value_counts"] = MetricConfiguration(
+                metric_name="column.value_counts",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={
+                    "sort": "none",
+                    "collate": None,
+                },
+            )
+
+        return dependencies
+
+
+def _sort_value_counts(value_counts: pd.Series, sort: str) -> pd.Series:
+    """Sorts (a copy of) value counts by "value" (ascending) or by "count" (descending)."""
+    if sort == "none":
+        return value_counts
+
+    if sort == "count":
+        return value_counts.sort_values(ascending=False, kind="stable")
+
+    try:
+        return value_counts.sort_index()
+    except TypeError:
+        # Having values of multiple types in a object dtype column (e.g., strings and floats)
+        # raises a TypeError when the sorting method performs comparisons.
+        if value_counts.index.dtype == object:
+            value_counts = value_counts.copy()
+            value_counts.index = pd.Index(value_counts.index.astype(str), name="value")
+            return value_counts.sort_index()
+
+        return value_counts
@@ -25,6 +25,10 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasSharedComputeDomain,
+    get_column_values,
+)
 from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
 )
@@ -88,31 +92,50 @@ def column_condition_partial(  # noqa: C901, PLR0915 # FIXME CoP
                 metric_value_kwargs: dict,
                 metrics: Dict[str, Any],
                 runtime_configuration: dict,
+                shared_compute_domain: Optional[PandasSharedComputeDomain] = None,
             ):
                 metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
                     metric_domain_kwargs=metric_domain_kwargs,
                     batch_columns_list=metrics["table.columns"],
                 )
 
-                (
-                    df,
-                    compute_domain_kwargs,
-                    accessor_domain_kwargs,
-                ) = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
-                )
+                if shared_compute_domain is None:
+                    (
+                        df,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    ) = execution_engine.get_compute_domain(
+                        domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                    )
+                else:
+                    (
+                        df,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    ) = shared_compute_domain.get_compute_domain(
+                        domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                    )
 
                 column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
 
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
                 )
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                if shared_compute_domain is None:
+                    column_values = get_column_values(
+                        data=df,
+                        column_name=column_name,
+                        filter_column_isnull=filter_column_isnull,
+                    )
+                else:
+                    column_values = shared_compute_domain.get_column_values(
+                        column_name=column_name,
+                        filter_column_isnull=filter_column_isnull,
+                    )
 
                 meets_expectation_series = metric_fn(
                     cls,
-                    df[column_name],
+                    column_values,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -122,6 +145,8 @@ def column_condition_partial(  # noqa: C901, PLR0915 # FIXME CoP
                     accessor_domain_kwargs,
                 )
 
+            # lets "PandasExecutionEngine" evaluate conditions sharing compute Domain over same data
+            inner_func.shares_compute_domain = True  # type: ignore[attr-defined] # FIXME CoP
             return inner_func
 
         return wrapper
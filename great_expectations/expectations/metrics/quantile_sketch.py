@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch (KLL-style compactor hierarchy) of a stream of sortable values.
+
+    Values are added in batches (e.g., chunks of rows fetched from a database), in a single pass
+    over the stream; sketches of parts of the stream may be merged.  Every level of the sketch holds
+    at most "k" values; values at level "h" stand for 2**h values of the stream.  When a level
+    overflows, it is sorted, and every other value (starting at a random offset) is promoted to the
+    next level.  Every such compaction of level "h" shifts ranks of stream values by at most 2**h,
+    so the sum over compactions bounds the rank error of quantiles (reported by "rank_error").
+
+    Args:
+        k: capacity of every level of the sketch; larger values trade memory for accuracy.
+        seed: seed of the random number generator choosing compaction offsets.
+    """
+
+    DEFAULT_K = 1000
+
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = None) -> None:
+        if k < 2:  # noqa: PLR2004 # FIXME CoP
+            raise ValueError(f"k must be at least 2 (got {k}).")  # noqa: TRY003 # FIXME CoP
+
+        self._k = k
+        self._rng = np.random.default_rng(seed)
+        self._levels: List[np.ndarray] = []
+        self._count = 0
+        # Upper bound of the absolute rank error, introduced by compactions.
+        self._max_rank_error = 0
+
+    @property
+    def count(self) -> int:
+        """Number of values of the stream, added to the sketch."""
+        return self._count
+
+    @property
+    def rank_error(self) -> float:
+        """Upper bound of the rank error of quantiles, as a fraction of the number of values."""
+        if not self._count:
+            return 0.0
+
+        return self._max_rank_error / self._count
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Adds batch of (non-null) values of the stream to the sketch."""
+        values = np.asarray(values)
+        if not values.size:
+            return
+
+        self._add_to_level(level=0, values=values.ravel())
+        self._count += values.size
+        self._compact()
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Adds values summarized by other sketch (e.g., of another part of stream) to this one."""
+        for level, values in enumerate(other._levels):
+            if values.size:
+                self._add_to_level(level=level, values=values)
+
+        self._count += other._count
+        self._max_rank_error += other._max_rank_error
+        self._compact()
+
+    def quantiles(self, quantiles: Iterable[float]) -> list:
+        """Returns (approximate) values of stream at given quantiles (None, if sketch is empty)."""
+        quantiles = list(quantiles)
+        if not self._count:
+            return [None] * len(quantiles)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(level_values.size, 2**level)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+
+        indices = np.searchsorted(
+            cumulative_weights,
+            [quantile * cumulative_weights[-1] for quantile in quantiles],
+            side="left",
+        )
+        return [_to_python_value(values[min(index, values.size - 1)]) for index in indices]
+
+    def _add_to_level(self, level: int, values: np.ndarray) -> None:
+        while len(self._levels) <= level:
+            self._levels.append(values[:0])
+
+        self._levels[level] = np.concatenate([self._levels[level], values])
+
+    def _compact(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if values.size > self._k:
+                values = np.sort(values, kind="stable")
+                # an odd value out stays at its level
+                remainder = values.size % 2
+                self._levels[level] = values[values.size - remainder :]
+                offset = int(self._rng.integers(2))
+                self._add_to_level(
+                    level=level + 1, values=values[offset : values.size - remainder : 2]
+                )
+                self._max_rank_error += 2**level
+
+            level += 1
+
+
+def _to_python_value(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from great_expectations.core.data_context_key import DataContextKey
+    from great_expectations.data_context.store.html_site_store import HtmlSiteStore
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def build_content_fingerprint(content: Any) -> str:
+    """Returns hash of JSON-serializable "content" (e.g., serialized Expectation Suite)."""
+    return hashlib.md5(json.dumps(content, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class DataDocsManifest:
+    """Record of resources already rendered into Data Docs site, kept in the site's own store.
+
+    For every rendered resource, the manifest keeps fingerprint of the source it was rendered from
+    (content hash for mutable resources, such as Expectation Suites; Validation Results are
+    immutable once stored, so their keys suffice).  It also caches the information, which the index
+    page needs about every Validation Result, so that building the index page does not require
+    reading every stored Validation Result.  Incremental builds consult the manifest to render only
+    new or changed resources.
+
+    The manifest is discarded whenever "build_signature" (which covers Great Expectations version
+    and configuration of the site) changes, since pages rendered by different renderers or views
+    must be rebuilt.
+
+    Args:
+        target_store: HtmlSiteStore of Data Docs site, in which the manifest is kept.
+        build_signature: identifier of everything (but source resources) affecting rendered pages.
+    """
+
+    def __init__(self, target_store: HtmlSiteStore, build_signature: str) -> None:
+        self._target_store = target_store
+        self._build_signature = build_signature
+
+        self._rendered: Dict[str, Dict[str, Optional[str]]] = {}
+        self._index_entries: Dict[str, dict] = {}
+        self._is_dirty = False
+
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_manifest_key(resource_key: DataContextKey) -> str:
+        return json.dumps(list(resource_key.to_tuple()))
+
+    def load(self) -> None:
+        """Reads manifest from site store, treating missing, unreadable, or stale one as empty."""
+        manifest: Optional[dict] = None
+        try:
+            manifest = self._target_store.get_manifest()
+        except Exception as e:
+            logger.warning(f"Unable to read Data Docs manifest ({e}); rebuilding all pages.")
+
+        with self._lock:
+            self._rendered = {}
+            self._index_entries = {}
+            self._is_dirty = False
+            if (
+                not manifest
+                or manifest.get("version") != MANIFEST_VERSION
+                or manifest.get("build_signature") != self._build_signature
+            ):
+                return
+
+            self._rendered = manifest.get("rendered", {})
+            self._index_entries = manifest.get("index_entries", {})
+
+    def save(self) -> None:
+        """Writes manifest to site store (if it has changed since it was loaded)."""
+        with self._lock:
+            if not self._is_dirty:
+                return
+
+            manifest: dict = {
+                "version": MANIFEST_VERSION,
+                "build_signature": self._build_signature,
+                "rendered": self._rendered,
+                "index_entries": self._index_entries,
+            }
+            self._is_dirty = False
+
+        self._target_store.write_manifest(manifest)
+
+    def is_rendered(
+        self,
+        section_name: str,
+        resource_key: DataContextKey,
+        fingerprint: Optional[str] = None,
+    ) -> bool:
+        """Returns whether resource was rendered (from source with fingerprint) into section."""
+        manifest_key: str = self._to_manifest_key(resource_key)
+        with self._lock:
+            rendered: Dict[str, Optional[str]] = self._rendered.get(section_name, {})
+            return manifest_key in rendered and rendered[manifest_key] == fingerprint
+
+    def mark_rendered(
+        self,
+        section_name: str,
+        resource_key: DataContextKey,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        manifest_key: str = self._to_manifest_key(resource_key)
+        with self._lock:
+            self._rendered.setdefault(section_name, {})[manifest_key] = fingerprint
+            self._is_dirty = True
+
+    def get_index_entry(self, resource_key: DataContextKey) -> Optional[dict]:
+        with self._lock:
+            return self._index_entries.get(self._to_manifest_key(resource_key))
+
+    def set_index_entry(self, resource_key: DataContextKey, index_entry: dict) -> None:
+        with self._lock:
+            self._index_entries[self._to_manifest_key(resource_key)] = index_entry
+            self._is_dirty = True
+
+    def discard(self, resource_key: DataContextKey) -> None:
+        """Forgets resource (e.g., once its page has been removed from site)."""
+        manifest_key: str = self._to_manifest_key(resource_key)
+        with self._lock:
+            for rendered in self._rendered.values():
+                if manifest_key in rendered:
+                    del rendered[manifest_key]
+                    self._is_dirty = True
+            if manifest_key in self._index_entries:
+                del self._index_entries[manifest_key]
+                self._is_dirty = True
@@ -0,0 +1,72 @@
+"""Renders Data Docs pages in worker processes (see DefaultSiteSectionBuilder.rendering_workers).
+
+Every worker process instantiates its own renderer and view (from the configuration of the site
+section) once, in initialize_rendering_worker(), and then turns resources into page HTML in
+render_page().  Workers have no Data Context; the only thing page renderers read from the Data
+Context (metadata of the Expectation Suite of a Validation Result) is resolved by the parent
+process and sent along with the resource.  Pages are written to the site store by the parent.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Union
+
+from great_expectations.core import ExpectationSuite
+from great_expectations.data_context.util import instantiate_class_from_config
+
+_renderer: Any = None
+_view: Any = None
+_view_render_kwargs: Dict[str, Any] = {}
+
+
+class _SuiteMetaSuites:
+    def __init__(self, suite_meta: Optional[dict]) -> None:
+        self._suite_meta = suite_meta
+
+    def get(self, name: str) -> SimpleNamespace:
+        if self._suite_meta is None:
+            raise KeyError(name)
+
+        return SimpleNamespace(meta=self._suite_meta)
+
+
+class _SuiteMetaDataContext:
+    """Stand-in for Data Context of renderers, exposing metadata of rendered Expectation Suite."""
+
+    def __init__(self) -> None:
+        self.suites = _SuiteMetaSuites(suite_meta=None)
+
+
+def initialize_rendering_worker(
+    renderer_config: dict,
+    view_config: dict,
+    view_runtime_environment: dict,
+    view_render_kwargs: dict,
+) -> None:
+    global _renderer, _view, _view_render_kwargs  # noqa: PLW0603 # FIXME CoP
+
+    _renderer = instantiate_class_from_config(
+        config=renderer_config,
+        runtime_environment={"data_context": _SuiteMetaDataContext()},
+        config_defaults={},
+    )
+    _view = instantiate_class_from_config(
+        config=view_config,
+        runtime_environment=view_runtime_environment,
+        config_defaults={},
+    )
+    _view_render_kwargs = view_render_kwargs
+
+
+def render_page(resource: Union[dict, Any], suite_meta: Optional[dict] = None) -> str:
+    """Renders resource (Validation Result or serialized Expectation Suite) into page HTML."""
+    if isinstance(resource, dict):
+        resource = ExpectationSuite(**resource)
+
+    data_context: Optional[_SuiteMetaDataContext] = getattr(_renderer, "_data_context", None)
+    if isinstance(data_context, _SuiteMetaDataContext):
+        data_context.suites = _SuiteMetaSuites(suite_meta=suite_meta)
+
+    rendered_content = _renderer.render(resource)
+    return _view.render(rendered_content, **_view_render_kwargs)
@@ -6,8 +6,10 @@ import pathlib
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.util import nested_update
@@ -23,7 +25,16 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.render.renderer.data_docs_manifest import (
+    DataDocsManifest,
+    build_content_fingerprint,
+)
+from great_expectations.render.renderer.parallel_rendering import (
+    initialize_rendering_worker,
+    render_page,
+)
 from great_expectations.render.util import resource_key_passes_run_name_filter
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251 # FIXME CoP
 
 if TYPE_CHECKING:
     from great_expectations.core.expectation_validation_result import (
@@ -118,6 +129,24 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    With ``incremental: true``, the site keeps a manifest of already rendered resources
+    (in ``data_docs_manifest.json`` next to ``index.html``), and every build only renders
+    new or changed Expectation Suites and Validation Results; the index page is built from
+    information cached in the manifest, rather than from every stored Validation Result::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental: true
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    With ``rendering_workers: <n>`` (n > 1), pages of every section are rendered by a pool of
+    n worker processes, and written to the site store as they complete.  Worker processes are
+    started with the default multiprocessing start method of the platform; where it is "spawn"
+    (Windows, macOS), the script building Data Docs must guard its entry point with
+    ``if __name__ == "__main__":``.
     """
 
     def __init__(  # noqa: C901, PLR0912, PLR0913 # FIXME CoP
@@ -132,6 +161,8 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental=False,
+        rendering_workers=None,
         **kwargs,
     ) -> None:
         self.site_name = site_name
@@ -218,6 +249,22 @@ class SiteBuilder:
             if site_section_builders["profiling"].get("run_name_filter") is None:
                 site_section_builders["profiling"]["run_name_filter"] = {"includes": "profiling"}
 
+        # GX Cloud renders JSON Site Data Docs, which are always built for given resources.
+        self.manifest: Optional[DataDocsManifest] = None
+        if incremental and not cloud_mode:
+            self.manifest = DataDocsManifest(
+                target_store=self.target_store,
+                build_signature=build_content_fingerprint(
+                    [
+                        ge_version,
+                        self.data_context_id,
+                        show_how_to_buttons,
+                        site_section_builders,
+                        site_index_builder,
+                    ]
+                ),
+            )
+
         self.site_section_builders = {}
         for site_section_name, site_section_config in site_section_builders.items():
             if not site_section_config or site_section_config in FALSEY_YAML_STRINGS:
@@ -236,6 +283,8 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "manifest": self.manifest,
+                    "rendering_workers": rendering_workers,
                 },
                 config_defaults={
                     "name": site_section_name,
@@ -271,6 +320,7 @@ class SiteBuilder:
                 },
                 "site_section_builders_config": site_section_builders,
                 "cloud_mode": self.cloud_mode,
+                "manifest": self.manifest,
             },
             config_defaults={
                 "name": "site_index_builder",
@@ -304,6 +354,8 @@ class SiteBuilder:
 
         :return:
         """
+        if self.manifest:
+            self.manifest.load()
 
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
@@ -317,6 +369,10 @@ class SiteBuilder:
         self.target_store.copy_static_assets()
 
         _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+
+        if self.manifest:
+            self.manifest.save()
+
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -340,6 +396,9 @@ class SiteBuilder:
 
 
 class DefaultSiteSectionBuilder:
+    # Number of resources read from source store at once.
+    READ_BATCH_SIZE = 100
+
     def __init__(  # noqa: PLR0913 # FIXME CoP
         self,
         name,
@@ -357,11 +416,15 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        manifest: Optional[DataDocsManifest] = None,
+        rendering_workers: Optional[int] = None,
         **kwargs,
     ) -> None:
         self.name = name
         self.data_context = data_context
         self.source_store = data_context.stores[source_store_name]
+        self.manifest = manifest
+        self.rendering_workers = rendering_workers or 1
         self.target_store = target_store
         self.run_name_filter = run_name_filter
         self.validation_results_limit = validation_results_limit
@@ -387,6 +450,8 @@ class DefaultSiteSectionBuilder:
                 package_name=None,
                 class_name=renderer["class_name"],
             )
+        # rendering workers instantiate their own renderers and views
+        self._renderer_config = {**renderer, "module_name": module_name}
 
         module_name = "great_expectations.render.view"
         if view is None:
@@ -395,12 +460,14 @@ class DefaultSiteSectionBuilder:
                 "class_name": "DefaultJinjaPageView",
             }
         module_name = view.get("module_name") or module_name
+        self._view_config = {**view, "module_name": module_name}
+        self._view_runtime_environment = {
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+        }
         self.view_class = instantiate_class_from_config(
             config=view,
-            runtime_environment={
-                "custom_styles_directory": custom_styles_directory,
-                "custom_views_directory": custom_views_directory,
-            },
+            runtime_environment=self._view_runtime_environment,
             config_defaults={"module_name": module_name},
         )
         if not self.view_class:
@@ -410,13 +477,50 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912 # FIXME CoP
+    def build(self, resource_identifiers=None) -> None:
+        resources = self._get_resources_to_render(resource_identifiers=resource_identifiers)
+
+        # GX Cloud stores rendered content (rather than pages) in its own backend, one at a time.
+        if self.rendering_workers > 1 and not self.cloud_mode:
+            self._render_resources_in_parallel(resources=resources)
+            return
+
+        for resource_key, resource, fingerprint in resources:
+            try:
+                rendered_content = self.renderer_class.render(resource)
+
+                if self.cloud_mode:
+                    self.target_store.set(
+                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                        rendered_content,
+                        source_type=resource_key.resource_type,
+                        source_id=resource_key.id,
+                    )
+                else:
+                    viewable_content = self.view_class.render(
+                        rendered_content,
+                        data_context_id=self.data_context_id,
+                        show_how_to_buttons=self.show_how_to_buttons,
+                    )
+                    self._write_page(
+                        resource_key=resource_key,
+                        viewable_content=viewable_content,
+                        fingerprint=fingerprint,
+                    )
+            except Exception as e:
+                _log_rendering_error(e)
+
+    def _get_resources_to_render(  # noqa: C901, PLR0912 # FIXME CoP
+        self, resource_identifiers=None
+    ) -> Iterator[Tuple[Any, Any, Optional[str]]]:
+        """Yields (key, resource, fingerprint) of every resource whose page needs to be rendered."""
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -429,14 +533,32 @@ class DefaultSiteSectionBuilder:
             if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
                 if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+
+            # Validation Results are immutable once stored; explicitly requested ones are rebuilt.
+            if (
+                self.manifest
+                and isinstance(resource_key, ValidationResultIdentifier)
+                and not resource_identifiers
+                and self.manifest.is_rendered(section_name=self.name, resource_key=resource_key)
+            ):
+                continue
+
+            resource_keys.append(resource_key)
+
+        for resource_key, resource in self._read_resources(resource_keys=resource_keys):
+            fingerprint: Optional[str] = None
+            if isinstance(resource_key, ExpectationSuiteIdentifier):
+                fingerprint = build_content_fingerprint(resource)
+                resource = ExpectationSuite(**resource)  # noqa: PLW2901 # FIXME CoP
+
+            if (
+                self.manifest
+                and fingerprint
+                and self.manifest.is_rendered(
+                    section_name=self.name, resource_key=resource_key, fingerprint=fingerprint
                 )
+            ):
+                logger.debug(f"        Skipping unchanged resource {resource_key!s}")
                 continue
 
             if isinstance(resource_key, ExpectationSuiteIdentifier):
@@ -456,41 +578,129 @@ class DefaultSiteSectionBuilder:
                         f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501 # FIXME CoP
                     )
 
+            yield resource_key, resource, fingerprint
+
+    def _read_resources(self, resource_keys: List[Any]) -> Iterator[Tuple[Any, Any]]:
+        """Yields (key, resource) of resources read from the store in batches (Store.get_many)."""
+        for start in range(0, len(resource_keys), self.READ_BATCH_SIZE):
+            batch = resource_keys[start : start + self.READ_BATCH_SIZE]
             try:
-                rendered_content = self.renderer_class.render(resource)
+                resources = self.source_store.get_many(batch)
+            except exceptions.InvalidKeyError:
+                # some resources were removed after keys were listed; read the batch key by key
+                pass
+            else:
+                yield from zip(batch, resources)
+                continue
 
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
+            for resource_key in batch:
+                try:
+                    resource = self.source_store.get(resource_key)
+                except exceptions.InvalidKeyError:
+                    logger.warning(
+                        f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
                     )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
+                    continue
+
+                yield resource_key, resource
+
+    def _render_resources_in_parallel(
+        self, resources: Iterator[Tuple[Any, Any, Optional[str]]]
+    ) -> None:
+        """Renders pages in worker processes; pages are written to target store by this process.
+
+        Resources are read (and pages written) here, while workers render; the number of pages in
+        flight is bounded, so that memory use does not grow with the number of resources.
+        """
+        max_pending: int = self.rendering_workers * 4
+        suite_metas: Dict[str, Optional[dict]] = {}
+        pending: Dict[Future, Tuple[Any, Optional[str]]] = {}
+
+        def _write_completed(futures: Set[Future]) -> None:
+            for future in futures:
+                resource_key, fingerprint = pending.pop(future)
+                try:
+                    self._write_page(
+                        resource_key=resource_key,
+                        viewable_content=future.result(),
+                        fingerprint=fingerprint,
                     )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
+                except Exception as e:
+                    _log_rendering_error(e)
+
+        with ProcessPoolExecutor(
+            max_workers=self.rendering_workers,
+            initializer=initialize_rendering_worker,
+            initargs=(
+                self._renderer_config,
+                self._view_config,
+                self._view_runtime_environment,
+                {
+                    "data_context_id": self.data_context_id,
+                    "show_how_to_buttons": self.show_how_to_buttons,
+                },
+            ),
+        ) as executor:
+            for resource_key, resource, fingerprint in resources:
+                # Expectation Suites are sent serialized (workers have no Data Context to bind to).
+                payload: Any = resource
+                suite_meta: Optional[dict] = None
+                if isinstance(resource, ExpectationSuite):
+                    payload = resource.to_json_dict()
+                elif isinstance(resource_key, ValidationResultIdentifier):
+                    suite_meta = self._get_suite_meta(
+                        expectation_suite_name=resource_key.expectation_suite_identifier.name,
+                        suite_metas=suite_metas,
                     )
-            except Exception as e:
-                exception_message = """\
+
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _write_completed(futures=done)
+
+                future = executor.submit(render_page, payload, suite_meta)
+                pending[future] = (resource_key, fingerprint)
+
+            _write_completed(futures=wait(pending).done)
+
+    def _get_suite_meta(
+        self, expectation_suite_name: str, suite_metas: Dict[str, Optional[dict]]
+    ) -> Optional[dict]:
+        if expectation_suite_name not in suite_metas:
+            try:
+                suite_metas[expectation_suite_name] = convert_to_json_serializable(
+                    self.data_context.suites.get(expectation_suite_name).meta
+                )
+            except Exception:
+                suite_metas[expectation_suite_name] = None
+
+        return suite_metas[expectation_suite_name]
+
+    def _write_page(self, resource_key, viewable_content: str, fingerprint: Optional[str]) -> None:
+        # Verify type
+        self.target_store.set(
+            SiteSectionIdentifier(
+                site_section_name=self.name,
+                resource_identifier=resource_key,
+            ),
+            viewable_content,
+        )
+        if self.manifest:
+            self.manifest.mark_rendered(
+                section_name=self.name,
+                resource_key=resource_key,
+                fingerprint=fingerprint,
+            )
+
+
+def _log_rendering_error(e: Exception) -> None:
+    exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """  # noqa: E501 # FIXME CoP
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400 # FIXME CoP
+    exception_traceback = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+    exception_message += f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+    logger.error(exception_message)
 
 
 class DefaultSiteIndexBuilder:
@@ -509,6 +719,7 @@ class DefaultSiteIndexBuilder:
         view=None,
         data_context_id=None,
         source_stores=None,
+        manifest: Optional[DataDocsManifest] = None,
         **kwargs,
     ) -> None:
         # NOTE: This method is almost identical to DefaultSiteSectionBuilder
@@ -521,6 +732,7 @@ class DefaultSiteIndexBuilder:
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
         self.site_section_builders_config = site_section_builders_config or {}
+        self.manifest = manifest
 
         if renderer is None:
             renderer = {
@@ -783,6 +995,8 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[ExpectationSuiteIdentifier].remove_key(
                             expectation_suite_site_key
                         )
+                        if self.manifest:
+                            self.manifest.discard(expectation_suite_site_key)
                     else:
                         cleaned_keys.append(expectation_suite_site_key)
                 expectation_suite_site_keys = cleaned_keys
@@ -829,6 +1043,8 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         self.target_store.store_backends[ValidationResultIdentifier].remove_key(
                             validation_result_site_key
                         )
+                        if self.manifest:
+                            self.manifest.discard(validation_result_site_key)
                     else:
                         cleaned_keys.append(validation_result_site_key)
                 validation_and_profiling_result_site_keys = cleaned_keys
@@ -852,18 +1068,19 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
+            index_entries = self._get_validation_index_entries(
+                validation_result_keys=profiling_result_site_keys,
+                validation_results_store_name=self.source_stores.get("profiling"),
+            )
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
+                    index_entry = index_entries.get(
+                        profiling_result_key
+                    ) or self._get_validation_index_entry(
+                        validation_result_key=profiling_result_key,
                         validation_results_store_name=self.source_stores.get("profiling"),
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
@@ -872,9 +1089,9 @@ diagnose and repair the underlying issue.  Detailed information follows:
                         run_id=profiling_result_key.run_id,
                         run_time=profiling_result_key.run_id.run_time,
                         run_name=profiling_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=index_entry["asset_name"],
+                        batch_kwargs=index_entry["batch_kwargs"],
+                        batch_spec=index_entry["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Profiling result not found: {profiling_result_key.to_tuple()!s:s} - skipping"  # noqa: E501 # FIXME CoP
@@ -906,36 +1123,122 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 validation_result_site_keys = validation_result_site_keys[
                     : self.validation_results_limit
                 ]
+            index_entries = self._get_validation_index_entries(
+                validation_result_keys=validation_result_site_keys,
+                validation_results_store_name=self.source_stores.get("validations"),
+            )
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
+                    index_entry = index_entries.get(
+                        validation_result_key
+                    ) or self._get_validation_index_entry(
+                        validation_result_key=validation_result_key,
                         validation_results_store_name=self.source_stores.get("validations"),
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
                         expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
                         section_name="validations",
                         batch_identifier=validation_result_key.batch_identifier,
                         run_id=validation_result_key.run_id,
-                        validation_success=validation_success,
+                        validation_success=index_entry["validation_success"],
                         run_time=validation_result_key.run_id.run_time,
                         run_name=validation_result_key.run_id.run_name,
-                        asset_name=_resolve_asset_name(validation),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
+                        asset_name=index_entry["asset_name"],
+                        batch_kwargs=index_entry["batch_kwargs"],
+                        batch_spec=index_entry["batch_spec"],
                     )
                 except Exception:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501 # FIXME CoP
                     logger.warning(error_msg)
 
+    def _get_validation_index_entry(
+        self,
+        validation_result_key: ValidationResultIdentifier,
+        validation_results_store_name: Optional[str],
+    ) -> dict:
+        """
+        Returns the information the index page needs about a Validation Result.
+
+        With a manifest, the information is read from the stored Validation Result only once.
+        """
+        if self.manifest:
+            index_entry = self.manifest.get_index_entry(validation_result_key)
+            if index_entry is not None:
+                return index_entry
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+            run_id=validation_result_key.run_id,
+            validation_results_store_name=validation_results_store_name,
+        )
+        return self._build_validation_index_entry(
+            validation_result_key=validation_result_key, validation=validation
+        )
+
+    def _get_validation_index_entries(
+        self,
+        validation_result_keys: List[ValidationResultIdentifier],
+        validation_results_store_name: Optional[str],
+    ) -> Dict[ValidationResultIdentifier, dict]:
+        """
+        Returns the information the index page needs about many Validation Results.
+
+        Validation Results not cached in the manifest are read from their store together (see
+        Store.get_many); if that fails, only cached entries are returned, and the remaining ones
+        are left to _get_validation_index_entry().
+        """
+        index_entries: Dict[ValidationResultIdentifier, dict] = {}
+        keys_to_read: List[ValidationResultIdentifier] = []
+        for validation_result_key in validation_result_keys:
+            index_entry = (
+                self.manifest.get_index_entry(validation_result_key) if self.manifest else None
+            )
+            if index_entry is None:
+                keys_to_read.append(validation_result_key)
+            else:
+                index_entries[validation_result_key] = index_entry
+
+        if not keys_to_read:
+            return index_entries
+
+        try:
+            validations = self.data_context.stores[
+                validation_results_store_name or self.data_context.validation_results_store_name
+            ].get_many(keys_to_read)
+        except Exception as e:
+            logger.debug(f"Unable to read Validation Results together ({e}); reading one by one.")
+            return index_entries
+
+        for validation_result_key, validation in zip(keys_to_read, validations):
+            try:
+                index_entries[validation_result_key] = self._build_validation_index_entry(
+                    validation_result_key=validation_result_key, validation=validation
+                )
+            except Exception:
+                # left to _get_validation_index_entry(), which reports invalid Validation Results
+                continue
+
+        return index_entries
+
+    def _build_validation_index_entry(
+        self, validation_result_key: ValidationResultIdentifier, validation
+    ) -> dict:
+        index_entry = {
+            "validation_success": validation.success,
+            "asset_name": _resolve_asset_name(validation),
+            "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+            "batch_spec": validation.meta.get("batch_spec", {}),
+        }
+        if self.manifest:
+            self.manifest.set_index_entry(
+                validation_result_key, convert_to_json_serializable(index_entry)
+            )
+
+        return index_entry
+
 
 def _resolve_asset_name(validation_results: ExpectationValidationResult) -> str | None:
     """
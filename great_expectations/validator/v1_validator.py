@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from copy import copy
 from functools import cached_property
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional
 
 from great_expectations import __version__ as ge_version
 from great_expectations.core.expectation_validation_result import (
@@ -14,7 +14,14 @@ from great_expectations.core.result_format import (
     ResultFormat,
 )
 from great_expectations.data_context.data_context.context_factory import project_manager
+from great_expectations.exceptions import ExpectationNotFoundError
+from great_expectations.execution_engine.pandas_execution_engine import columns_to_load
+from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251 # FIXME CoP
+from great_expectations.validator.validation_profiler import (
+    PROFILE_VALIDATION_RUNTIME_CONFIGURATION_KEY,
+    VALIDATION_PROFILE_META_KEY,
+)
 from great_expectations.validator.validator import Validator as OldValidator
 from great_expectations.validator.validator import calc_validation_statistics
 
@@ -34,6 +41,12 @@ class Validator:
     """Validator.
 
     Responsible for running expectations on a batch definition.
+
+    If "profile_validation" is True, performance profile of validating an expectation suite is
+    added to "meta" of its result (under "validation_profile" key).
+
+    Only columns of the batch, which expectations refer to, are loaded from files whose readers
+    support it (see "columns_to_load()" of PandasExecutionEngine).
     """
 
     def __init__(
@@ -41,12 +54,16 @@ class Validator:
         batch_definition: BatchDefinition,
         result_format: ResultFormatUnion = DEFAULT_RESULT_FORMAT,
         batch_parameters: Optional[BatchParameters] = None,
+        profile_validation: bool = False,
     ) -> None:
         self._batch_definition = batch_definition
         self._batch_parameters = batch_parameters
         self.result_format = result_format
+        self.profile_validation = profile_validation
 
         self._get_validator = project_manager.get_validator
+        # Columns of the batch loaded so far (None, if all of them are loaded, or nothing is).
+        self._loaded_columns: Optional[set[str]] = None
 
     def validate_expectation(
         self,
@@ -74,7 +91,7 @@ class Validator:
         )
         statistics = calc_validation_statistics(results)
 
-        return ExpectationSuiteValidationResult(
+        result = ExpectationSuiteValidationResult(
             results=results,
             success=statistics.success,
             suite_name=expectation_suite.name,
@@ -98,11 +115,26 @@ class Validator:
             },
             batch_id=self.active_batch_id,
         )
+        if self.profile_validation:
+            result.meta[VALIDATION_PROFILE_META_KEY] = self._wrapped_validator.validation_profile
+
+        return result
 
     @property
     def active_batch_id(self) -> Optional[str]:
         return self._wrapped_validator.active_batch_id
 
+    def unload_batch(self) -> None:
+        """Unloads the batch (if it is loaded), releasing its data and metrics computed on it."""
+        wrapped_validator: Optional[OldValidator] = self.__dict__.pop("_wrapped_validator", None)
+        self._loaded_columns = None
+        if wrapped_validator is None:
+            return
+
+        batch_id: Optional[str] = wrapped_validator.active_batch_id
+        if batch_id is not None:
+            wrapped_validator.execution_engine.unload_batch_data(batch_id=batch_id)
+
     @property
     def _include_rendered_content(self) -> bool:
         return project_manager.is_using_cloud()
@@ -120,6 +152,7 @@ class Validator:
         expectation_parameters: Optional[SuiteParameterDict] = None,
     ) -> list[ExpectationValidationResult]:
         """Run a list of expectation configurations against the batch definition"""
+        self._load_batch(expectation_configs=expectation_configs)
         processed_expectation_configs = self._wrapped_validator.process_expectations_for_validation(
             expectation_configs, expectation_parameters
         )
@@ -130,6 +163,9 @@ class Validator:
         else:
             runtime_configuration = {"result_format": copy(self.result_format)}
 
+        if self.profile_validation:
+            runtime_configuration[PROFILE_VALIDATION_RUNTIME_CONFIGURATION_KEY] = True
+
         results = self._wrapped_validator.graph_validate(
             configurations=processed_expectation_configs,
             runtime_configuration=runtime_configuration,
@@ -140,3 +176,106 @@ class Validator:
                 result.render()
 
         return results
+
+    def _load_batch(self, expectation_configs: list[ExpectationConfiguration]) -> None:
+        """Loads the batch (unless it is loaded already), with the columns expectations refer to."""
+        columns: Optional[set[str]] = _get_columns_to_load(
+            expectation_configs=expectation_configs, result_format=self.result_format
+        )
+        if "_wrapped_validator" in self.__dict__:
+            if self._loaded_columns is None or (
+                columns is not None and columns <= self._loaded_columns
+            ):
+                return
+
+            # batch was loaded with fewer columns than these expectations refer to
+            del self.__dict__["_wrapped_validator"]
+
+        with columns_to_load(columns):
+            _ = self._wrapped_validator
+
+        self._loaded_columns = columns
+
+
+# Table expectations, which do not refer to any column.
+_TABLE_EXPECTATIONS_WITHOUT_COLUMNS = {
+    "expect_table_row_count_to_be_between",
+    "expect_table_row_count_to_equal",
+}
+
+# Expectations of the columns of the table (e.g., their order), which refer to all its columns.
+_TABLE_COLUMNS_EXPECTATIONS = {
+    "expect_column_to_exist",
+    "expect_table_column_count_to_be_between",
+    "expect_table_column_count_to_equal",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+}
+
+
+def _get_columns_to_load(
+    expectation_configs: list[ExpectationConfiguration],
+    result_format: ResultFormatUnion,
+) -> Optional[set[str]]:
+    """Returns columns of the batch, which validating expectations refers to.
+
+    Columns are known for core expectations only (and not when they have row conditions); if an
+    expectation may refer to any column of the batch (e.g., expectations of the columns of the
+    table), or unexpected rows (with all their columns) are returned, None is returned.
+    """
+    columns: set[str] = set()
+    result_formats: list[Any] = [result_format]
+    for expectation_config in expectation_configs:
+        expectation_columns: Optional[list[str]] = _get_expectation_columns(expectation_config)
+        if expectation_columns is None:
+            return None
+
+        columns.update(expectation_columns)
+        result_formats.append(expectation_config.kwargs.get("result_format"))
+
+    for expectation_result_format in result_formats:
+        if isinstance(expectation_result_format, dict):
+            if expectation_result_format.get("include_unexpected_rows"):
+                return None
+
+            index_columns: Iterable[str] = (
+                expectation_result_format.get("unexpected_index_column_names") or []
+            )
+            columns.update(index_columns)
+
+    # without columns, there is nothing to push down
+    return columns or None
+
+
+def _get_expectation_columns(
+    expectation_config: ExpectationConfiguration,
+) -> Optional[list[str]]:
+    try:
+        expectation_impl = get_expectation_impl(expectation_config.type)
+    except ExpectationNotFoundError:
+        return None
+
+    if not expectation_impl.__module__.startswith("great_expectations.expectations.core."):
+        return None
+
+    if expectation_config.type in _TABLE_EXPECTATIONS_WITHOUT_COLUMNS:
+        return []
+
+    kwargs: dict = expectation_config.kwargs
+    if (
+        expectation_config.type in _TABLE_COLUMNS_EXPECTATIONS
+        or kwargs.get("row_condition")
+        or kwargs.get("column_index") is not None
+    ):
+        return None
+
+    expectation_columns: list = [
+        kwargs[key] for key in ("column", "column_A", "column_B") if key in kwargs
+    ] + list(kwargs.get("column_list") or [])
+    if not expectation_columns or not all(
+        isinstance(column, str) for column in expectation_columns
+    ):
+        # e.g., table expectations, or columns given as suite parameters
+        return None
+
+    return expectation_columns
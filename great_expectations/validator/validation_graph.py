@@ -17,6 +17,7 @@ from tqdm.auto import tqdm
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypeSuffixes
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -47,6 +48,10 @@ logging.captureWarnings(True)
 
 MAX_METRIC_COMPUTATION_RETRIES: int = 3
 
+_PARTIAL_METRIC_NAME_SUFFIXES: Tuple[str, ...] = tuple(
+    f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
+)
+
 
 class MetricEdge:
     def __init__(
@@ -89,6 +94,11 @@ class ValidationGraph:
 
         self._edge_ids = {edge.id for edge in self._edges}
 
+        # Topological index of metric dependencies (rebuilt from "edges" when resolving).
+        self._metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        self._metric_dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+        self._metric_dependent_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+
     @override
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
@@ -239,9 +249,38 @@ class ValidationGraph:
 
         progress_bar: Optional[tqdm] = None
 
+        # Graph is traversed once to obtain initial ready and needed metrics; afterwards, ready
+        # metrics are updated incrementally (using dependency index), as metrics get resolved,
+        # instead of rescanning all graph edges.
+        ready_metrics_by_id: Dict[_MetricKey, MetricConfiguration]
+        needed_metrics_by_id: Dict[_MetricKey, MetricConfiguration]
+        ready_metrics, needed_metrics = self._parse(metrics=metrics)
+        ready_metrics_by_id = {metric.id: metric for metric in ready_metrics}
+        needed_metrics_by_id = {metric.id: metric for metric in needed_metrics}
+        num_unmet_dependencies: Dict[_MetricKey, int] = {
+            metric_id: len(
+                [
+                    dependency_id
+                    for dependency_id in self._metric_dependency_ids.get(metric_id, set())
+                    if dependency_id not in metrics
+                ]
+            )
+            for metric_id in needed_metrics_by_id
+        }
+
+        resolved_metric_ids: List[_MetricKey] = []
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            self._update_ready_metrics(
+                resolved_metric_ids=resolved_metric_ids,
+                ready_metrics_by_id=ready_metrics_by_id,
+                needed_metrics_by_id=needed_metrics_by_id,
+                num_unmet_dependencies=num_unmet_dependencies,
+            )
+            resolved_metric_ids = []
+            ready_metrics = set(ready_metrics_by_id.values())
+            needed_metrics = set(needed_metrics_by_id.values())
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -272,17 +311,26 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501 # FIXME CoP
-                metrics.update(
+                newly_resolved_metrics: Dict[_MetricKey, MetricValue] = (
                     self._execution_engine.resolve_metrics(
                         metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
                         metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
                         runtime_configuration=runtime_configuration,
                     )
                 )
+                resolved_metric_ids = [
+                    metric_id for metric_id in newly_resolved_metrics if metric_id not in metrics
+                ]
+                metrics.update(newly_resolved_metrics)
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
                 if catch_exceptions:
+                    # metrics resolved alongside failed ones are kept; only failed ones are retried
+                    resolved_metric_ids = [
+                        metric_id for metric_id in err.resolved_metrics if metric_id not in metrics
+                    ]
+                    metrics.update(err.resolved_metrics)
                     exception_traceback = traceback.format_exc()
                     exception_message = str(err)
                     exception_info = ExceptionInfo(
@@ -327,23 +375,143 @@ class ValidationGraph:
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""  # noqa: E501 # FIXME CoP
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
+        self._build_metric_dependency_index()
+        pruned_metric_ids: Set[_MetricKey] = self._prefetch_persisted_metrics(metrics=metrics)
+
+        ready_metrics: Set[MetricConfiguration] = set()
+        needed_metrics: Set[MetricConfiguration] = set()
+
+        metric_id: _MetricKey
+        metric_configuration: MetricConfiguration
+        for metric_id, metric_configuration in self._metric_configurations.items():
+            if metric_id in metrics or metric_id in pruned_metric_ids:
+                continue
+
+            if all(
+                dependency_id in metrics for dependency_id in self._metric_dependency_ids[metric_id]
+            ):
+                ready_metrics.add(metric_configuration)
+            else:
+                needed_metrics.add(metric_configuration)
+
+        return ready_metrics, needed_metrics
+
+    def _prefetch_persisted_metrics(
+        self, metrics: Dict[_MetricKey, MetricValue]
+    ) -> Set[_MetricKey]:
+        """Adds metrics persisted by earlier runs (for unchanged Batch data) to resolved "metrics"
+        and returns ids of partial metrics (e.g., ".condition", ".aggregate_fn"), which no longer
+        need to be computed, because all of their dependents have been obtained this way.  Only
+        partial metrics are skipped, since other metrics may be requested directly (e.g., by
+        Expectation objects), rather than being mere intermediate results.
+        """
+        # Engines not derived from "ExecutionEngine" may not support persisted metrics.
+        get_persisted_metrics: Optional[Callable[..., Dict[_MetricKey, MetricValue]]] = getattr(
+            self._execution_engine, "get_persisted_metrics", None
+        )
+        if get_persisted_metrics is None:
+            return set()
+
+        persisted_metrics: Dict[_MetricKey, MetricValue] = get_persisted_metrics(
+            metric_configurations=[
+                metric_configuration
+                for metric_id, metric_configuration in self._metric_configurations.items()
+                if metric_id not in metrics
+            ]
+        )
+        if not persisted_metrics:
+            return set()
+
+        metrics.update(persisted_metrics)
+
+        pruned_metric_ids: Set[_MetricKey] = set()
+        candidate_metric_ids: List[_MetricKey] = [
+            dependency_id
+            for metric_id in persisted_metrics
+            for dependency_id in self._metric_dependency_ids.get(metric_id, set())
+        ]
+        metric_id: _MetricKey
+        metric_configuration: Optional[MetricConfiguration]
+        while candidate_metric_ids:
+            metric_id = candidate_metric_ids.pop()
+            if metric_id in metrics or metric_id in pruned_metric_ids:
+                continue
+
+            metric_configuration = self._metric_configurations.get(metric_id)
+            if metric_configuration is None or not metric_configuration.metric_name.endswith(
+                _PARTIAL_METRIC_NAME_SUFFIXES
+            ):
+                continue
+
+            if all(
+                dependent_id in metrics or dependent_id in pruned_metric_ids
+                for dependent_id in self._metric_dependent_ids.get(metric_id, set())
+            ):
+                pruned_metric_ids.add(metric_id)
+                candidate_metric_ids.extend(self._metric_dependency_ids.get(metric_id, set()))
+
+        logger.debug(
+            f"Obtained {len(persisted_metrics)} persisted metrics; "
+            f"skipping {len(pruned_metric_ids)} partial metrics."
+        )
 
+        return pruned_metric_ids
+
+    def _build_metric_dependency_index(self) -> None:
+        """Builds adjacency (metric -> its dependencies) and reverse adjacency (metric -> its
+        dependents) maps, keyed by metric ids, from edges of this "ValidationGraph" object.
+
+        Index is rebuilt (in one pass over edges) immediately before resolution, because default
+        kwargs can be set on "MetricConfiguration" objects (changing their ids) after corresponding
+        edges have been added.
+        """
+        metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        metric_dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+        metric_dependent_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+
+        edge: MetricEdge
+        left_id: _MetricKey
+        right_id: _MetricKey
         for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501 # FIXME CoP
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+            left_id = edge.left.id
+            if left_id not in metric_configurations:
+                metric_configurations[left_id] = edge.left
+                metric_dependency_ids[left_id] = set()
+
+            if edge.right is not None:
+                right_id = edge.right.id
+                metric_dependency_ids[left_id].add(right_id)
+                metric_dependent_ids.setdefault(right_id, set()).add(left_id)
+
+        self._metric_configurations = metric_configurations
+        self._metric_dependency_ids = metric_dependency_ids
+        self._metric_dependent_ids = metric_dependent_ids
+
+    def _update_ready_metrics(
+        self,
+        resolved_metric_ids: List[_MetricKey],
+        ready_metrics_by_id: Dict[_MetricKey, MetricConfiguration],
+        needed_metrics_by_id: Dict[_MetricKey, MetricConfiguration],
+        num_unmet_dependencies: Dict[_MetricKey, int],
+    ) -> None:
+        """Removes newly resolved metrics from ready/needed metrics and promotes their dependents to
+        ready metrics, once all dependencies of these dependents have been resolved (cost is
+        proportional to newly resolved metrics).
+        """
+        metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in resolved_metric_ids:
+            ready_metrics_by_id.pop(metric_id, None)
+            needed_metrics_by_id.pop(metric_id, None)
+            num_unmet_dependencies.pop(metric_id, None)
+            for dependent_id in self._metric_dependent_ids.get(metric_id, set()):
+                if dependent_id not in num_unmet_dependencies:
+                    continue
+
+                num_unmet_dependencies[dependent_id] -= 1
+                if num_unmet_dependencies[dependent_id] == 0:
+                    del num_unmet_dependencies[dependent_id]
+                    ready_metrics_by_id[dependent_id] = needed_metrics_by_id.pop(dependent_id)
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
@@ -0,0 +1,380 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251 # FIXME CoP
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+PROFILE_VALIDATION_RUNTIME_CONFIGURATION_KEY = "profile_validation"
+VALIDATION_PROFILE_META_KEY = "validation_profile"
+
+_MetricKey = Tuple[str, str, str]
+
+# Number of decimal digits, to which fractional measurements are rounded in validation profile.
+_PRECISION = 6
+
+
+def is_validation_profiling_requested(runtime_configuration: Optional[dict] = None) -> bool:
+    """Whether "runtime_configuration" requests recording of validation performance profile."""
+    return bool(
+        runtime_configuration
+        and runtime_configuration.get(PROFILE_VALIDATION_RUNTIME_CONFIGURATION_KEY)
+    )
+
+
+@dataclass
+class _Counters:
+    queries: float = 0
+    rows_scanned: float = 0
+    bytes_scanned: float = 0
+
+    def add(self, other: _Counters, share: float = 1.0) -> None:
+        self.queries += share * other.queries
+        self.rows_scanned += share * other.rows_scanned
+        self.bytes_scanned += share * other.bytes_scanned
+
+    def to_json_dict(self) -> dict:
+        return {
+            "queries": round(self.queries, _PRECISION),
+            "rows_scanned": round(self.rows_scanned, _PRECISION),
+            "bytes_scanned": round(self.bytes_scanned, _PRECISION),
+        }
+
+
+@dataclass
+class _MetricProfile:
+    metric_configuration: MetricConfiguration
+    wall_time: float = 0.0
+    num_computations: int = 0
+    num_computed_with: int = 1
+    counters: _Counters = field(default_factory=_Counters)
+
+
+@dataclass
+class _ExpectationProfile:
+    configuration: ExpectationConfiguration
+    metric_ids: Set[_MetricKey]
+    evaluation_time: float = 0.0
+
+
+class ValidationProfiler:
+    """Records where time is spent while Expectations are validated.
+
+    ExecutionEngine measures computation of every metric (see "measure()") and reports work it
+    issues to its backend (see "record_queries()" and "record_scan()"); the Validator attributes
+    measured metrics to Expectations relying on them (see "attribute_expectation()") and measures
+    evaluation of Expectations on resolved metrics (see "measure_expectation()").  Costs of metrics
+    computed together (e.g., by single bundled SQL query) are split evenly among them, whereas costs
+    of metrics shared by several Expectations are attributed to each of them.
+
+    Which counters are populated depends on ExecutionEngine: SQL ExecutionEngine counts queries;
+    Spark ExecutionEngine counts jobs of bundled aggregates as queries; Pandas ExecutionEngine
+    counts rows and bytes of Batch data scanned.
+
+    Measurements may be recorded from multiple threads concurrently (e.g., by
+    "ThreadPoolMetricExecutor").
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        self._metric_profiles: Dict[_MetricKey, _MetricProfile] = {}
+        # keyed by identity of "ExpectationConfiguration" object
+        self._expectation_profiles: Dict[int, _ExpectationProfile] = {}
+        self._counters = _Counters()
+
+        self._execution_engine_class_name: Optional[str] = None
+        self._wall_time: float = 0.0
+        self._metric_cache_statistics: Optional[Dict[str, int]] = None
+        self._persisted_metric_statistics: Optional[Dict[str, int]] = None
+
+    @contextlib.contextmanager
+    def profile(self, execution_engine: ExecutionEngine) -> Iterator[ValidationProfiler]:
+        """Activates this ValidationProfiler on "execution_engine" for the duration of the context.
+
+        Wall time of the context and metric cache hits and misses occurring within it are recorded.
+        """
+        self._execution_engine_class_name = type(execution_engine).__name__
+
+        metric_cache_statistics_before = getattr(execution_engine, "metric_cache_statistics", None)
+        persisted_metric_statistics_before = self._get_persisted_metric_statistics(
+            execution_engine=execution_engine
+        )
+
+        previous_validation_profiler: Optional[ValidationProfiler] = getattr(
+            execution_engine, "validation_profiler", None
+        )
+        # Engines not derived from "ExecutionEngine" may not support profiling; they are only timed.
+        supports_profiling: bool = hasattr(execution_engine, "validation_profiler")
+        if supports_profiling:
+            execution_engine.validation_profiler = self
+
+        start: float = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self._wall_time += time.perf_counter() - start
+
+            if supports_profiling:
+                execution_engine.validation_profiler = previous_validation_profiler
+
+            metric_cache_statistics_after = getattr(
+                execution_engine, "metric_cache_statistics", None
+            )
+            if (
+                metric_cache_statistics_before is not None
+                and metric_cache_statistics_after is not None
+            ):
+                self._metric_cache_statistics = {
+                    "hits": metric_cache_statistics_after.hits
+                    - metric_cache_statistics_before.hits,
+                    "misses": metric_cache_statistics_after.misses
+                    - metric_cache_statistics_before.misses,
+                    "evictions": metric_cache_statistics_after.evictions
+                    - metric_cache_statistics_before.evictions,
+                }
+
+            persisted_metric_statistics_after = self._get_persisted_metric_statistics(
+                execution_engine=execution_engine
+            )
+            if (
+                persisted_metric_statistics_before is not None
+                and persisted_metric_statistics_after is not None
+            ):
+                self._persisted_metric_statistics = {
+                    key: persisted_metric_statistics_after[key]
+                    - persisted_metric_statistics_before[key]
+                    for key in ("hits", "misses")
+                }
+
+    @contextlib.contextmanager
+    def measure(self, metric_configurations: Sequence[MetricConfiguration]) -> Iterator[None]:
+        """Measures wall time and work reported (by current thread) computing given metrics."""
+        counters = _Counters()
+        previous_counters: Optional[_Counters] = getattr(self._local, "counters", None)
+        self._local.counters = counters
+
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_time: float = time.perf_counter() - start
+            self._local.counters = previous_counters
+            self._record_measurement(
+                metric_configurations=metric_configurations,
+                wall_time=wall_time,
+                counters=counters,
+            )
+
+    def wrap(
+        self, metric_fn: Callable, metric_configuration: MetricConfiguration
+    ) -> Callable[..., Any]:
+        """Returns "metric_fn", measuring its calls as computation of "metric_configuration"."""
+
+        @functools.wraps(metric_fn)
+        def _measured_metric_fn(*args, **kwargs):
+            with self.measure(metric_configurations=[metric_configuration]):
+                return metric_fn(*args, **kwargs)
+
+        return _measured_metric_fn
+
+    def record_queries(self, num_queries: int = 1) -> None:
+        """Records queries (or jobs) issued to ExecutionEngine backend."""
+        self._record(counters=_Counters(queries=num_queries))
+
+    def record_scan(self, num_rows: int, num_bytes: int = 0) -> None:
+        """Records rows (and bytes) of Batch data scanned by ExecutionEngine."""
+        self._record(counters=_Counters(rows_scanned=num_rows, bytes_scanned=num_bytes))
+
+    def attribute_expectation(
+        self,
+        configuration: ExpectationConfiguration,
+        metric_configurations: Iterable[MetricConfiguration],
+    ) -> None:
+        """Records that Expectation, given by "configuration", relies on "metric_configurations"."""
+        with self._lock:
+            self._expectation_profiles[id(configuration)] = _ExpectationProfile(
+                configuration=configuration,
+                metric_ids={
+                    metric_configuration.id for metric_configuration in metric_configurations
+                },
+            )
+
+    @contextlib.contextmanager
+    def measure_expectation(self, configuration: ExpectationConfiguration) -> Iterator[None]:
+        """Measures evaluation of Expectation, given by "configuration", on its resolved metrics."""
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            evaluation_time: float = time.perf_counter() - start
+            with self._lock:
+                expectation_profile: Optional[_ExpectationProfile] = self._expectation_profiles.get(
+                    id(configuration)
+                )
+                if expectation_profile is None:
+                    expectation_profile = _ExpectationProfile(
+                        configuration=configuration, metric_ids=set()
+                    )
+                    self._expectation_profiles[id(configuration)] = expectation_profile
+
+                expectation_profile.evaluation_time += evaluation_time
+
+    def to_json_dict(self) -> dict:
+        """Returns validation performance profile (metrics and Expectations costliest first)."""
+        with self._lock:
+            metric_profiles: List[_MetricProfile] = sorted(
+                self._metric_profiles.values(),
+                key=lambda metric_profile: metric_profile.wall_time,
+                reverse=True,
+            )
+            expectations: List[dict] = sorted(
+                [
+                    self._build_expectation_profile(expectation_profile=expectation_profile)
+                    for expectation_profile in self._expectation_profiles.values()
+                ],
+                key=lambda expectation_profile: expectation_profile["wall_time"],
+                reverse=True,
+            )
+            return {
+                "wall_time": round(self._wall_time, _PRECISION),
+                "execution_engine": {
+                    "class_name": self._execution_engine_class_name,
+                    **self._counters.to_json_dict(),
+                },
+                "metric_cache": self._metric_cache_statistics,
+                "persisted_metrics": self._persisted_metric_statistics,
+                "metrics": [
+                    {
+                        "metric_name": metric_profile.metric_configuration.metric_name,
+                        "metric_domain_kwargs": convert_to_json_serializable(
+                            {
+                                key: value
+                                for key, value in (
+                                    metric_profile.metric_configuration.metric_domain_kwargs.items()
+                                )
+                                if value is not None
+                            }
+                        ),
+                        "metric_value_kwargs": convert_to_json_serializable(
+                            metric_profile.metric_configuration.metric_value_kwargs
+                        ),
+                        "wall_time": round(metric_profile.wall_time, _PRECISION),
+                        "num_computations": metric_profile.num_computations,
+                        "num_computed_with": metric_profile.num_computed_with,
+                        **metric_profile.counters.to_json_dict(),
+                    }
+                    for metric_profile in metric_profiles
+                ],
+                "expectations": expectations,
+            }
+
+    def _record(self, counters: _Counters) -> None:
+        measured_counters: Optional[_Counters] = getattr(self._local, "counters", None)
+        if measured_counters is not None:
+            # Counters of current measurement are only accessed by thread, which owns measurement.
+            measured_counters.add(counters)
+
+        with self._lock:
+            self._counters.add(counters)
+
+    def _record_measurement(
+        self,
+        metric_configurations: Sequence[MetricConfiguration],
+        wall_time: float,
+        counters: _Counters,
+    ) -> None:
+        if not metric_configurations:
+            return
+
+        share: float = 1.0 / len(metric_configurations)
+
+        metric_configuration: MetricConfiguration
+        metric_profile: Optional[_MetricProfile]
+        with self._lock:
+            for metric_configuration in metric_configurations:
+                metric_profile = self._metric_profiles.get(metric_configuration.id)
+                if metric_profile is None:
+                    metric_profile = _MetricProfile(metric_configuration=metric_configuration)
+                    self._metric_profiles[metric_configuration.id] = metric_profile
+
+                metric_profile.wall_time += share * wall_time
+                metric_profile.num_computations += 1
+                metric_profile.num_computed_with = len(metric_configurations)
+                metric_profile.counters.add(counters, share=share)
+
+    def _build_expectation_profile(self, expectation_profile: _ExpectationProfile) -> dict:
+        metrics_wall_time: float = 0.0
+        counters = _Counters()
+        num_computed_metrics: int = 0
+
+        metric_id: _MetricKey
+        metric_profile: Optional[_MetricProfile]
+        for metric_id in expectation_profile.metric_ids:
+            metric_profile = self._metric_profiles.get(metric_id)
+            if metric_profile is None:
+                # metric was obtained from cache (or was not computed due to failure)
+                continue
+
+            num_computed_metrics += 1
+            metrics_wall_time += metric_profile.wall_time
+            counters.add(metric_profile.counters)
+
+        configuration: ExpectationConfiguration = expectation_profile.configuration
+        return {
+            "expectation_type": configuration.type,
+            "expectation_id": configuration.id,
+            "domain_kwargs": convert_to_json_serializable(
+                {
+                    key: value
+                    for key, value in configuration.get_domain_kwargs().items()
+                    if key != "batch_id" and value is not None
+                }
+            ),
+            "wall_time": round(metrics_wall_time + expectation_profile.evaluation_time, _PRECISION),
+            "metrics_wall_time": round(metrics_wall_time, _PRECISION),
+            "evaluation_time": round(expectation_profile.evaluation_time, _PRECISION),
+            "num_metrics": len(expectation_profile.metric_ids),
+            "num_computed_metrics": num_computed_metrics,
+            **counters.to_json_dict(),
+        }
+
+    @staticmethod
+    def _get_persisted_metric_statistics(
+        execution_engine: ExecutionEngine,
+    ) -> Optional[Dict[str, int]]:
+        persistent_metric_cache = getattr(execution_engine, "persistent_metric_cache", None)
+        if persistent_metric_cache is None:
+            return None
+
+        return {
+            "hits": persistent_metric_cache.hits,
+            "misses": persistent_metric_cache.misses,
+        }
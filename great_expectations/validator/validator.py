@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import copy
 import datetime
 import inspect
@@ -65,6 +66,12 @@ from great_expectations.validator.validation_graph import (
     MetricEdge,
     ValidationGraph,
 )
+from great_expectations.validator.validation_profiler import (
+    PROFILE_VALIDATION_RUNTIME_CONFIGURATION_KEY,
+    VALIDATION_PROFILE_META_KEY,
+    ValidationProfiler,
+    is_validation_profiling_requested,
+)
 from great_expectations.validator.validation_statistics import (
     calc_validation_statistics,
 )
@@ -185,6 +192,8 @@ class Validator:
         # saving expectation config objects
         self._active_validation: bool = False
 
+        self._validation_profile: Optional[dict] = None
+
     @property
     def _include_rendered_content(self) -> bool:
         return project_manager.is_using_cloud()
@@ -199,6 +208,12 @@ class Validator:
         """Returns the "MetricsCalculator" object being used by the Validator to handle metrics computations."""  # noqa: E501 # FIXME CoP
         return self._metrics_calculator
 
+    @property
+    def validation_profile(self) -> Optional[dict]:
+        """Performance profile of most recent "graph_validate()" call (None, unless it was requested
+        using "profile_validation" runtime configuration key)."""
+        return self._validation_profile
+
     @property
     def data_context(self) -> Optional[AbstractDataContext]:
         """Reference to DataContext object handle."""
@@ -562,7 +577,7 @@ class Validator:
         keys = dir(self)
         return [expectation for expectation in keys if expectation.startswith("expect_")]
 
-    def graph_validate(
+    def graph_validate(  # noqa: C901 # FIXME CoP
         self,
         configurations: List[ExpectationConfiguration],
         runtime_configuration: Optional[dict] = None,
@@ -610,22 +625,36 @@ class Validator:
             expectation_validation_graphs=expectation_validation_graphs
         )
 
+        self._validation_profile = None
+        validation_profiler: Optional[ValidationProfiler] = self._build_validation_profiler(
+            expectation_validation_graphs=expectation_validation_graphs,
+            runtime_configuration=runtime_configuration,
+        )
+
         resolved_metrics: _MetricsDict
 
         try:
-            (
-                resolved_metrics,
-                evrs,
-                processed_configurations,
-            ) = self._resolve_suite_level_graph_and_process_metric_evaluation_errors(
-                graph=graph,
-                runtime_configuration=runtime_configuration,
-                expectation_validation_graphs=expectation_validation_graphs,
-                evrs=evrs,
-                processed_configurations=processed_configurations,
-                show_progress_bars=self._determine_progress_bars(),
-            )
+            with (
+                contextlib.nullcontext()
+                if validation_profiler is None
+                else validation_profiler.profile(execution_engine=self._execution_engine)
+            ):
+                (
+                    resolved_metrics,
+                    evrs,
+                    processed_configurations,
+                ) = self._resolve_suite_level_graph_and_process_metric_evaluation_errors(
+                    graph=graph,
+                    runtime_configuration=runtime_configuration,
+                    expectation_validation_graphs=expectation_validation_graphs,
+                    evrs=evrs,
+                    processed_configurations=processed_configurations,
+                    show_progress_bars=self._determine_progress_bars(),
+                )
         except Exception as err:
+            if validation_profiler is not None:
+                self._validation_profile = validation_profiler.to_json_dict()
+
             # If a general Exception occurs during the execution of "ValidationGraph.resolve()", then  # noqa: E501 # FIXME CoP
             # all expectations in the suite are impacted, because it is impossible to attribute the failure to a metric.  # noqa: E501 # FIXME CoP
             if catch_exceptions:
@@ -647,11 +676,16 @@ class Validator:
                 runtime_configuration_default = copy.deepcopy(runtime_configuration)
 
                 expectation = configuration.to_domain_obj()
-                result = expectation.metrics_validate(
-                    metrics=resolved_metrics,
-                    execution_engine=self._execution_engine,
-                    runtime_configuration=runtime_configuration_default,
-                )
+                with (
+                    contextlib.nullcontext()
+                    if validation_profiler is None
+                    else validation_profiler.measure_expectation(configuration=configuration)
+                ):
+                    result = expectation.metrics_validate(
+                        metrics=resolved_metrics,
+                        execution_engine=self._execution_engine,
+                        runtime_configuration=runtime_configuration_default,
+                    )
                 evrs.append(result)
             except Exception as err:
                 if catch_exceptions:
@@ -665,8 +699,36 @@ class Validator:
                 else:
                     raise err  # noqa: TRY201 # FIXME CoP
 
+        if validation_profiler is not None:
+            self._validation_profile = validation_profiler.to_json_dict()
+
         return evrs
 
+    @staticmethod
+    def _build_validation_profiler(
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        runtime_configuration: dict,
+    ) -> Optional[ValidationProfiler]:
+        # Profiling is opt-in; every Expectation is attributed metrics of its sub-graph.
+        if not is_validation_profiling_requested(runtime_configuration=runtime_configuration):
+            return None
+
+        validation_profiler = ValidationProfiler()
+
+        expectation_validation_graph: ExpectationValidationGraph
+        for expectation_validation_graph in expectation_validation_graphs:
+            validation_profiler.attribute_expectation(
+                configuration=expectation_validation_graph.configuration,
+                metric_configurations=[
+                    metric_configuration
+                    for edge in expectation_validation_graph.graph.edges
+                    for metric_configuration in (edge.left, edge.right)
+                    if metric_configuration is not None
+                ],
+            )
+
+        return validation_profiler
+
     def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
         self,
         expectation_configurations: List[ExpectationConfiguration],
@@ -1088,7 +1150,7 @@ class Validator:
         message="Only the str version of this argument is deprecated. run_id should be a RunIdentifier or dict. Support will be removed in 0.16.0.",  # noqa: E501 # FIXME CoP
         version="0.13.0",
     )
-    def validate(  # noqa: C901, PLR0912, PLR0913 # FIXME CoP
+    def validate(  # noqa: C901, PLR0912, PLR0913, PLR0915 # FIXME CoP
         self,
         expectation_suite: str | ExpectationSuite | None = None,
         run_id: str | RunIdentifier | Dict[str, str] | None = None,
@@ -1100,6 +1162,7 @@ class Validator:
         run_name: Optional[str] = None,
         run_time: Optional[str] = None,
         checkpoint_name: Optional[str] = None,
+        profile_validation: bool = False,
     ) -> Union[ExpectationValidationResult, ExpectationSuiteValidationResult]:
         # noinspection SpellCheckingInspection
         """Run all expectations and return the outcome of the run.
@@ -1115,6 +1178,7 @@ class Validator:
             result_format: If None, uses the default value ('BASIC' or as specified). If string, the returned expectation output follows the specified format ('BOOLEAN_ONLY','BASIC', etc.).
             only_return_failures: If True, expectation results are only returned when `success = False`.
             checkpoint_name: Name of the Checkpoint which invoked this Validator.validate() call against an Expectation Suite. It will be added to `meta` field of the returned ExpectationSuiteValidationResult.
+            profile_validation: If True, performance profile of validation (wall time, queries issued, and rows scanned per metric and per Expectation, as well as metric cache hits) is added to `meta` field of the returned ExpectationSuiteValidationResult under "validation_profile" key.
 
         Returns:
             Object containg the results.
@@ -1203,6 +1267,8 @@ class Validator:
             runtime_configuration = self._get_runtime_configuration(
                 catch_exceptions=catch_exceptions, result_format=result_format
             )
+            if profile_validation:
+                runtime_configuration[PROFILE_VALIDATION_RUNTIME_CONFIGURATION_KEY] = True
 
             results = self.graph_validate(
                 configurations=expectations_to_evaluate,
@@ -1247,6 +1313,8 @@ class Validator:
                 },
                 batch_id=self.active_batch_id,
             )
+            if profile_validation:
+                result.meta[VALIDATION_PROFILE_META_KEY] = self.validation_profile
 
             self._data_context = validation_data_context
         finally:
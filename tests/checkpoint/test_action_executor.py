@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Literal
+
+import pytest
+
+from great_expectations.checkpoint.action_executor import ActionExecutor
+from great_expectations.checkpoint.actions import (
+    ActionContext,
+    UpdateDataDocsAction,
+    ValidationAction,
+)
+from great_expectations.checkpoint.checkpoint import CheckpointResult
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+# Behavior of test Actions, keyed by Action name.
+_BEHAVIORS: Dict[str, Callable[[ActionContext], dict]] = {}
+
+
+class _NotificationAction(ValidationAction):
+    type: Literal["test_action_executor_notification"] = "test_action_executor_notification"
+
+    def run(
+        self, checkpoint_result: CheckpointResult, action_context: ActionContext | None = None
+    ) -> dict:
+        assert action_context is not None
+        return _BEHAVIORS[self.name](action_context)
+
+
+class _DataDocsAction(UpdateDataDocsAction):
+    type: Literal["test_action_executor_data_docs"] = "test_action_executor_data_docs"  # type: ignore[assignment] # FIXME CoP
+
+    def run(
+        self, checkpoint_result: CheckpointResult, action_context: ActionContext | None = None
+    ) -> dict:
+        return {"my_validation_result": {"local_site": "file:///my_page.html"}}
+
+
+@pytest.fixture
+def checkpoint_result(mocker: MockerFixture) -> CheckpointResult:
+    return mocker.Mock(spec=CheckpointResult)
+
+
+@pytest.fixture
+def behaviors():
+    yield _BEHAVIORS
+    _BEHAVIORS.clear()
+
+
+@pytest.mark.unit
+def test_action_executor_runs_notifications_concurrently_after_data_docs(
+    checkpoint_result: CheckpointResult, behaviors: dict
+):
+    # Both notifications must be running at the same time to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _notify(action_context: ActionContext) -> dict:
+        barrier.wait()
+        return {"data_docs_pages": action_context.filter_results(class_=UpdateDataDocsAction)}
+
+    behaviors["first"] = _notify
+    behaviors["second"] = _notify
+    data_docs_action = _DataDocsAction(name="data_docs")
+    actions = [
+        data_docs_action,
+        _NotificationAction(name="first"),
+        _NotificationAction(name="second"),
+    ]
+
+    action_context = ActionExecutor(max_workers=2).run(
+        actions=actions, checkpoint_result=checkpoint_result
+    )
+
+    # results are recorded in the order of Actions
+    assert [action.name for action, _ in action_context.data] == ["data_docs", "first", "second"]
+    data_docs_result = data_docs_action.run(checkpoint_result=checkpoint_result)
+    for _, action_result in action_context.data[1:]:
+        assert action_result == {"data_docs_pages": [data_docs_result]}
+
+
+@pytest.mark.unit
+def test_action_executor_isolates_failing_and_timed_out_notifications(
+    checkpoint_result: CheckpointResult, behaviors: dict
+):
+    release = threading.Event()
+
+    def _fail(action_context: ActionContext) -> dict:
+        raise RuntimeError("SMTP server unavailable")
+
+    def _hang(action_context: ActionContext) -> dict:
+        release.wait(timeout=5)
+        return {"hung": True}
+
+    behaviors["failing"] = _fail
+    behaviors["hanging"] = _hang
+    behaviors["succeeding"] = lambda action_context: {"succeeded": True}
+    actions = [
+        _NotificationAction(name="failing"),
+        _NotificationAction(name="hanging"),
+        _NotificationAction(name="succeeding"),
+    ]
+
+    try:
+        action_context = ActionExecutor(max_workers=3, timeout=0.2).run(
+            actions=actions, checkpoint_result=checkpoint_result
+        )
+    finally:
+        release.set()
+
+    assert [(action.name, result) for action, result in action_context.data] == [
+        ("succeeding", {"succeeded": True})
+    ]
+
+
+@pytest.mark.unit
+def test_action_executor_retries_failing_actions(
+    checkpoint_result: CheckpointResult, behaviors: dict
+):
+    attempts = []
+
+    def _flaky(action_context: ActionContext) -> dict:
+        attempts.append(len(attempts))
+        if len(attempts) < 3:
+            raise ConnectionError("Webhook unavailable")
+        return {"attempts": len(attempts)}
+
+    behaviors["flaky"] = _flaky
+
+    action_context = ActionExecutor(retries=2, retry_delay=0).run(
+        actions=[_NotificationAction(name="flaky")], checkpoint_result=checkpoint_result
+    )
+
+    assert [result for _, result in action_context.data] == [{"attempts": 3}]
+
+
+@pytest.mark.unit
+def test_action_executor_raises_failing_data_docs_actions(
+    checkpoint_result: CheckpointResult, mocker: MockerFixture
+):
+    mocker.patch.object(_DataDocsAction, "run", side_effect=ValueError("Unable to build site"))
+
+    with pytest.raises(ValueError):
+        ActionExecutor().run(
+            actions=[_DataDocsAction(name="data_docs")], checkpoint_result=checkpoint_result
+        )
+
+
+@pytest.mark.unit
+def test_action_executor_runs_actions_in_background(
+    checkpoint_result: CheckpointResult, behaviors: dict
+):
+    release = threading.Event()
+    notified = []
+
+    def _notify(action_context: ActionContext) -> dict:
+        release.wait(timeout=5)
+        notified.append(True)
+        return {}
+
+    behaviors["background"] = _notify
+    action_executor = ActionExecutor(background=True)
+
+    assert (
+        action_executor.submit(
+            actions=[_NotificationAction(name="background")], checkpoint_result=checkpoint_result
+        )
+        is None
+    )
+    # submitting does not wait for Actions to complete
+    assert action_executor.wait(timeout=0.05) is False
+    assert notified == []
+
+    release.set()
+
+    assert action_executor.wait(timeout=5) is True
+    assert notified == [True]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"max_workers": 0}, id="max_workers"),
+        pytest.param({"timeout": 0}, id="timeout"),
+        pytest.param({"retries": -1}, id="retries"),
+    ],
+)
+def test_action_executor_invalid_parameters_raise_error(kwargs: dict):
+    with pytest.raises(ValueError):
+        ActionExecutor(**kwargs)
@@ -18,6 +18,7 @@ from great_expectations.checkpoint import (
     SlackNotificationAction,
     UpdateDataDocsAction,
 )
+from great_expectations.checkpoint.action_executor import ActionExecutor
 from great_expectations.checkpoint.actions import ValidationAction
 from great_expectations.checkpoint.checkpoint import (
     Checkpoint,
@@ -713,6 +714,30 @@ class TestCheckpointResult:
             checkpoint_result=result, action_context=mock.ANY
         )
 
+    @pytest.mark.unit
+    def test_checkpoint_run_actions_with_action_executor(
+        self,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+    ):
+        # Arrange
+        action = mocker.Mock(spec=UpdateDataDocsAction, type="update_data_docs")
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=[validation_definition],
+            actions=[action],
+        )
+        action_executor = mocker.Mock(spec=ActionExecutor)
+
+        # Act
+        result = checkpoint.run(action_executor=action_executor)
+
+        # Assert
+        action_executor.submit.assert_called_once_with(
+            actions=checkpoint.actions, checkpoint_result=result
+        )
+        action._copy_and_set_values().run.assert_not_called()
+
     @pytest.mark.unit
     def test_checkpoint_sorts_actions(self, validation_definition: ValidationDefinition):
         """
@@ -767,6 +792,7 @@ class TestCheckpointResult:
             expectation_parameters=expectation_parameters,
             result_format=ResultFormat.SUMMARY,
             run_id=mock.ANY,
+            profile_validation=False,
         )
 
     @pytest.mark.unit
@@ -800,6 +826,72 @@ class TestCheckpointResult:
             )
         )
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_checkpoint_run_invalid_max_workers_raises_error(
+        self, validation_definition: ValidationDefinition, max_workers: int
+    ):
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name, validation_definitions=[validation_definition]
+        )
+
+        with pytest.raises(ValueError):
+            checkpoint.run(max_workers=max_workers)
+
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently_isolates_failures(
+        self,
+        validation_definition: ValidationDefinition,
+        mock_suite: ExpectationSuite,
+        mock_batch_def: BatchDefinition,
+    ):
+        failing_validation_definition = ValidationDefinition(
+            name="my_failing_validation_def",
+            id=str(uuid.uuid4()),
+            data=mock_batch_def,
+            suite=mock_suite,
+        )
+        succeeding_result = validation_definition.run()
+
+        def _run(self: ValidationDefinition, **kwargs) -> ExpectationSuiteValidationResult:
+            if self.name == failing_validation_definition.name:
+                raise RuntimeError("Unable to load Batch")
+            return succeeding_result
+
+        checkpoint_id = str(uuid.uuid4())
+        checkpoint = Checkpoint(
+            id=checkpoint_id,
+            name=self.checkpoint_name,
+            validation_definitions=[failing_validation_definition, validation_definition],
+        )
+
+        with (
+            mock.patch.object(
+                Checkpoint, "is_fresh", return_value=CheckpointFreshnessDiagnostics(errors=[])
+            ),
+            mock.patch.object(ValidationDefinition, "run", new=_run),
+        ):
+            result = checkpoint.run(max_workers=2)
+
+        assert result.success is False
+        # results are keyed in the order of Validation Definitions
+        keys = list(result.run_results.keys())
+        assert [key.batch_identifier for key in keys] == [
+            failing_validation_definition.name,
+            succeeding_result.batch_id,
+        ]
+        failed_result, succeeded_result = result.run_results.values()
+        assert succeeded_result is succeeding_result
+        assert failed_result.success is False
+        assert failed_result.results == []
+        assert failed_result.meta["validation_id"] == failing_validation_definition.id
+        assert failed_result.meta["checkpoint_id"] == checkpoint_id
+        assert failed_result.meta["run_id"] == result.run_id
+        exception_info = failed_result.meta["exception_info"]
+        assert exception_info["raised_exception"] is True
+        assert exception_info["exception_message"] == "Unable to load Batch"
+        assert "RuntimeError" in exception_info["exception_traceback"]
+
     @pytest.mark.unit
     def test_result_init_no_run_results_raises_error(self, mocker: MockerFixture):
         with pytest.raises(ValueError) as e:
@@ -1060,6 +1152,50 @@ class TestCheckpointResult:
         assert meta["checkpoint_id"] == checkpoint.id
         assert meta["validation_id"] == checkpoint.validation_definitions[0].id
 
+    @pytest.mark.filesystem
+    def test_checkpoint_run_concurrently_matches_serial_run(self, tmp_path: pathlib.Path):
+        checkpoint = self._build_file_backed_checkpoint(tmp_path)
+        batch_definition = checkpoint.validation_definitions[0].batch_definition
+        context = batch_definition.data_asset.datasource.data_context
+        for idx, max_value in enumerate((2.0, 10.0)):
+            suite = context.suites.add(
+                ExpectationSuite(
+                    name=f"{self.suite_name}_{idx}",
+                    expectations=[
+                        gxe.ExpectColumnMeanToBeBetween(
+                            column=self.column_name, min_value=0, max_value=max_value
+                        ),
+                    ],
+                )
+            )
+            checkpoint.validation_definitions.append(
+                context.validation_definitions.add(
+                    ValidationDefinition(
+                        name=f"{self.validation_definition_name}_{idx}",
+                        data=batch_definition,
+                        suite=suite,
+                    )
+                )
+            )
+        checkpoint = context.checkpoints.add(checkpoint)
+
+        def _describe(result: CheckpointResult) -> list:
+            return [
+                (key.expectation_suite_identifier.name, validation_result.describe_dict())
+                for key, validation_result in result.run_results.items()
+            ]
+
+        serial_result = checkpoint.run()
+        concurrent_result = checkpoint.run(max_workers=3)
+
+        assert _describe(concurrent_result) == _describe(serial_result)
+        assert [name for name, _ in _describe(concurrent_result)] == [
+            self.suite_name,
+            f"{self.suite_name}_0",
+            f"{self.suite_name}_1",
+        ]
+        assert concurrent_result.success is False
+
     @pytest.mark.filesystem
     def test_checkpoint_run_with_data_docs_and_slack_actions_emit_page_links(
         self,
@@ -1618,3 +1754,61 @@ def test_checkpoint_expectation_parameters(
         batch_parameters={"dataframe": pd.DataFrame({col: [1, 2]})},
     )
     assert results.success
+
+
+@pytest.mark.sqlite
+def test_checkpoint_rerun_reuses_persisted_metrics_of_unchanged_data(
+    empty_data_context: AbstractDataContext, tmp_path: pathlib.Path
+) -> None:
+    connection_string = f"sqlite:///{tmp_path / 'data.db'}"
+    pd.DataFrame({"a": [1, 2, 3, None]}).to_sql("my_table", con=connection_string, index=False)
+    datasource = empty_data_context.data_sources.add_sqlite(
+        name="my_datasource",
+        connection_string=connection_string,
+        persistent_metric_store={
+            "store_backend": {
+                "class_name": "DatabaseStoreBackend",
+                "connection_string": f"sqlite:///{tmp_path / 'metrics.db'}",
+            }
+        },
+    )
+    batch_definition = datasource.add_table_asset(
+        name="my_table",
+        table_name="my_table",
+        batch_fingerprint_query="SELECT COUNT(*), MAX(a) FROM my_table",
+    ).add_batch_definition_whole_table(name="my_batch_definition")
+    suite = empty_data_context.suites.add(
+        ExpectationSuite(
+            name="my_suite",
+            expectations=[
+                gxe.ExpectColumnMaxToBeBetween(column="a", min_value=3, max_value=3),
+                gxe.ExpectColumnValuesToNotBeNull(column="a", mostly=0.7),
+            ],
+        )
+    )
+    checkpoint = empty_data_context.checkpoints.add(
+        Checkpoint(
+            name="my_checkpoint",
+            validation_definitions=[
+                empty_data_context.validation_definitions.add(
+                    ValidationDefinition(name="my_validation", data=batch_definition, suite=suite)
+                )
+            ],
+        )
+    )
+    persistent_metric_cache = datasource.get_execution_engine()._persistent_metric_cache
+    assert persistent_metric_cache is not None
+
+    first_result = checkpoint.run()
+    first_run_hits = persistent_metric_cache.hits
+    second_result = checkpoint.run()
+
+    assert first_result.success and second_result.success
+    assert first_run_hits == 0
+    # Batch (and its in-memory metrics) is unloaded after validation; metrics come from the store
+    assert persistent_metric_cache.hits > 0
+    (first_validation_result,) = first_result.run_results.values()
+    (second_validation_result,) = second_result.run_results.values()
+    assert [result.result for result in second_validation_result.results] == [
+        result.result for result in first_validation_result.results
+    ]
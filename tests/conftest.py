@@ -424,6 +424,11 @@ def pytest_collection_modifyitems(config, items):
             reason="need --docs-tests option to run",
         ),
         Category(mark="cloud", flag="--cloud", reason="need --cloud option to run"),
+        Category(
+            mark="performance",
+            flag="--performance-tests",
+            reason="need --performance-tests option to run",
+        ),
     )
 
     for category in categories:
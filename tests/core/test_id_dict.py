@@ -0,0 +1,97 @@
+import copy
+import pickle
+
+import pytest
+
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.core.id_dict import IDDict
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_is_memoized(mocker):
+    compute_id_spy = mocker.spy(IDDict, "_compute_id")
+    id_dict = IDDict({"column": "a", "batch_id": "my_batch_id"})
+
+    first_id = id_dict.to_id()
+    assert id_dict.to_id() == first_id
+    assert hash(id_dict) == hash(first_id)
+    assert compute_id_spy.call_count == 1
+
+    # Explicit "id_keys" bypass memoized id.
+    assert id_dict.to_id(id_keys=["column"]) == "column=a"
+    assert compute_id_spy.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("column", "b"), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("batch_id"), id="delitem"),
+        pytest.param(lambda d: d.update({"row_condition": "x > 0"}), id="update"),
+        pytest.param(lambda d: d.__ior__({"row_condition": "x > 0"}), id="ior"),
+        pytest.param(lambda d: d.setdefault("row_condition", "x > 0"), id="setdefault"),
+        pytest.param(lambda d: d.pop("batch_id"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_id_dict_to_id_is_invalidated_on_mutation(mutate):
+    id_dict = IDDict({"column": "a", "batch_id": "my_batch_id"})
+    original_id = id_dict.to_id()
+
+    mutate(id_dict)
+
+    assert id_dict.to_id() != original_id
+    assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_survives_copy_and_pickle():
+    id_dict = IDDict({"column": "a", "batch_id": "my_batch_id"})
+    original_id = id_dict.to_id()
+
+    assert copy.copy(id_dict).to_id() == original_id
+    assert copy.deepcopy(id_dict).to_id() == original_id
+    assert pickle.loads(pickle.dumps(id_dict)).to_id() == original_id
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d["quantiles"].append(0.75), id="list"),
+        pytest.param(lambda d: d["result_format"].update(partial_unexpected_count=5), id="dict"),
+    ],
+)
+def test_id_dict_to_id_of_nested_containers_reflects_nested_mutation(mutate):
+    id_dict = IDDict({"quantiles": [0.25, 0.5], "result_format": {"result_format": "BASIC"}})
+    original_id = id_dict.to_id()
+
+    mutate(id_dict)
+
+    assert id_dict.to_id() != original_id
+    assert id_dict.to_id() == IDDict(copy.deepcopy(dict(id_dict))).to_id()
+
+
+@pytest.mark.unit
+def test_id_dict_memoized_id_is_not_carried_over_to_copies():
+    id_dict = IDDict({"column": "a", "quantiles": (0.25, 0.5)})
+    original_id = id_dict.to_id()
+    assert "_cached_id" in vars(id_dict)
+
+    for id_dict_copy in (
+        copy.copy(id_dict),
+        copy.deepcopy(id_dict),
+        pickle.loads(pickle.dumps(id_dict)),
+    ):
+        assert "_cached_id" not in vars(id_dict_copy)
+        assert id_dict_copy.to_id() == original_id
+
+
+@pytest.mark.unit
+def test_id_dict_memoized_id_is_not_stored_as_key_of_dot_dict_subclass():
+    batch_spec = RuntimeDataBatchSpec(batch_data="my_batch_data")
+
+    assert batch_spec.to_id() == "batch_data=my_batch_data"
+    assert list(batch_spec.keys()) == ["batch_data"]
@@ -979,3 +979,34 @@ def test_is_fresh_raises_error_when_child_deps_not_found(in_memory_runtime_conte
     assert len(diagnostics.errors) == 2
     assert isinstance(diagnostics.errors[0], BatchDefinitionNotFoundError)
     assert isinstance(diagnostics.errors[1], ExpectationSuiteNotFoundError)
+
+
+@pytest.mark.unit
+def test_run_unloads_batch_from_bounded_metric_cache(ephemeral_context: EphemeralDataContext):
+    context = ephemeral_context
+    data_source = context.data_sources.add_pandas(
+        DATA_SOURCE_NAME, metric_cache_max_size_in_bytes=1_000_000
+    )
+    batch_definition = data_source.add_dataframe_asset(
+        "dataframe_asset"
+    ).add_batch_definition_whole_dataframe("dataframe_batch_def")
+    suite = context.suites.add(
+        ExpectationSuite(
+            name="my_suite", expectations=[gxe.ExpectColumnValuesToNotBeNull(column="a")]
+        )
+    )
+    validation_definition = context.validation_definitions.add(
+        ValidationDefinition(name="my_validation", data=batch_definition, suite=suite)
+    )
+
+    result = validation_definition.run(
+        batch_parameters={"dataframe": pd.DataFrame({"a": [1, 2, 3]})}
+    )
+
+    assert result.success
+    execution_engine = data_source.get_execution_engine()
+    assert execution_engine._metric_cache.max_size_in_bytes == 1_000_000
+    # once the validation result is built, neither the Batch nor its metrics are retained
+    assert execution_engine.batch_manager.batch_data_cache == {}
+    assert len(execution_engine._metric_cache) == 0
+    assert execution_engine.metric_cache_statistics.evictions > 0
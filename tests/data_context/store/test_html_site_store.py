@@ -163,3 +163,21 @@ def test_HtmlSiteStore_S3_backend(aws_credentials):
         .decode("utf-8")
     )
     assert index_content == "index_html_string_content"
+
+
+@pytest.mark.filesystem
+def test_HtmlSiteStore_manifest_round_trip(tmp_path):
+    my_store = HtmlSiteStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        },
+    )
+    assert my_store.get_manifest() is None
+
+    my_store.write_manifest({"version": 1, "rendered": {}})
+
+    assert my_store.get_manifest() == {"version": 1, "rendered": {}}
+    assert (tmp_path / "data_docs_manifest.json").exists()
+    # the manifest is not mistaken for a rendered resource
+    assert my_store.list_keys() == []
@@ -3,7 +3,13 @@ import uuid
 
 import pytest
 
-from great_expectations.data_context.store.metric_store import MetricStore
+from great_expectations.data_context.store.metric_store import (
+    BatchMetricStore,
+    MetricStore,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    BatchMetricIdentifier,
+)
 from great_expectations.data_context.util import instantiate_class_from_config
 
 
@@ -104,3 +110,54 @@ def test_metric_store_deserialize() -> None:
 
     value = '{"value": {"foo": "bar"}}'
     assert store.deserialize(value=value) == {"foo": "bar"}
+
+
+@pytest.mark.unit
+def test_batch_metric_identifier_tuple_round_trip() -> None:
+    key = BatchMetricIdentifier(
+        batch_fingerprint="my_fingerprint",
+        metric_name="column.max",
+        metric_kwargs_id="my_kwargs_id",
+    )
+
+    assert key.to_tuple() == ("my_fingerprint", "column.max", "my_kwargs_id")
+    assert BatchMetricIdentifier.from_tuple(key.to_tuple()) == key
+    assert BatchMetricIdentifier.from_tuple(("my_fingerprint", "table.row_count", "__")) == (
+        BatchMetricIdentifier(
+            batch_fingerprint="my_fingerprint",
+            metric_name="table.row_count",
+            metric_kwargs_id=None,
+        )
+    )
+
+
+@pytest.mark.filesystem
+def test_batch_metric_store_persists_values_in_filesystem(tmp_path) -> None:
+    store_config = {
+        "class_name": "BatchMetricStore",
+        "store_backend": {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        },
+    }
+    key = BatchMetricIdentifier(
+        batch_fingerprint="my_fingerprint",
+        metric_name="column.max",
+        metric_kwargs_id="my_kwargs_id",
+    )
+
+    store: BatchMetricStore = instantiate_class_from_config(
+        config=store_config,
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+        runtime_environment={},
+    )
+    store.set(key=key, value=[1, 2.5, "three"])
+
+    # a new store (e.g., in a subsequent run) reads the persisted value
+    store = instantiate_class_from_config(
+        config=store_config,
+        config_defaults={"module_name": "great_expectations.data_context.store"},
+        runtime_environment={},
+    )
+    assert store.get(key=key) == [1, 2.5, "three"]
+    assert (tmp_path / "my_fingerprint" / "column.max" / "my_kwargs_id").is_file()
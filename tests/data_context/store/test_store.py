@@ -130,6 +130,17 @@ def test_store_add_success__no_id(mock_store_backend_add):
     assert original_value.id is None
 
 
+@pytest.mark.unit
+def test_store_get_many():
+    store = Store()
+    store.add(key=StringKey("foo"), value="bar")
+    store.add(key=StringKey("baz"), value="qux")
+
+    assert store.get_many([StringKey("baz"), StringKey("foo")]) == ["qux", "bar"]
+    with pytest.raises(gx_exceptions.InvalidKeyError):
+        store.get_many([StringKey("foo"), StringKey("non_existent_key")])
+
+
 @pytest.mark.unit
 def test_store_add_failure():
     store = Store()
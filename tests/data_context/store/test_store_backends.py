@@ -2,6 +2,7 @@ import datetime
 import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from unittest import mock
 
@@ -26,6 +27,7 @@ from great_expectations.data_context.store import (
     TupleGCSStoreBackend,
     TupleS3StoreBackend,
 )
+from great_expectations.data_context.store._filesystem_key_index import FilesystemKeyIndex
 from great_expectations.data_context.store.inline_store_backend import (
     InlineStoreBackend,
 )
@@ -418,6 +420,108 @@ def test_TupleFilesystemStoreBackend_get_all(tmp_path_factory):
     assert sorted(all_values) == [value_a, value_b]
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_with_key_index(tmp_path_factory, mocker: MockerFixture):
+    base_directory = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_with_key_index"))
+
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=base_directory, filepath_suffix=".json", use_key_index=True
+    )
+    my_store.set(("suite_a", "run_1", "batch"), "aaa")
+    my_store.set(("suite_a", "run_2", "batch"), "bbb")
+    my_store.set(("suite_b", "run_1", "batch"), "ccc")
+
+    walk = mocker.spy(os, "walk")
+    assert set(my_store.list_keys()) == {
+        ("suite_a", "run_1", "batch"),
+        ("suite_a", "run_2", "batch"),
+        ("suite_b", "run_1", "batch"),
+    }
+    assert set(my_store.list_keys(prefix=("suite_a",))) == {
+        ("suite_a", "run_1", "batch"),
+        ("suite_a", "run_2", "batch"),
+    }
+
+    my_store.remove_key(("suite_a", "run_1", "batch"))
+    my_store.move(("suite_b", "run_1", "batch"), ("suite_c", "run_1", "batch"))
+    assert set(my_store.list_keys(prefix=("suite_a",))) == {("suite_a", "run_2", "batch")}
+    assert set(my_store.list_keys(prefix=("suite_c",))) == {("suite_c", "run_1", "batch")}
+    assert my_store.list_keys(prefix=("suite_b",)) == []
+    walk.assert_not_called()
+
+    # keys set through other instances of the store backend are listed
+    other_store = TupleFilesystemStoreBackend(
+        base_directory=base_directory, filepath_suffix=".json", use_key_index=True
+    )
+    other_store.set(("suite_a", "run_3", "batch"), "ddd")
+    assert set(my_store.list_keys(prefix=("suite_a",))) == {
+        ("suite_a", "run_2", "batch"),
+        ("suite_a", "run_3", "batch"),
+    }
+
+    # keys listed from index are those listed by walking the directory tree
+    unindexed_store = TupleFilesystemStoreBackend(
+        base_directory=base_directory, filepath_suffix=".json"
+    )
+    assert sorted(my_store.list_keys()) == sorted(unindexed_store.list_keys())
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_rebuild_key_index(tmp_path_factory):
+    base_directory = tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_rebuild_key_index")
+
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=str(base_directory), filepath_suffix=".json", use_key_index=True
+    )
+    my_store.set(("suite_a", "run_1", "batch"), "aaa")
+
+    # files added other than through the store backend are listed once the index is rebuilt
+    (base_directory / "suite_a" / "run_2").mkdir()
+    (base_directory / "suite_a" / "run_2" / "batch.json").write_text("bbb")
+    assert set(my_store.list_keys(prefix=("suite_a",))) == {("suite_a", "run_1", "batch")}
+
+    my_store.rebuild_key_index()
+    assert set(my_store.list_keys(prefix=("suite_a",))) == {
+        ("suite_a", "run_1", "batch"),
+        ("suite_a", "run_2", "batch"),
+    }
+
+    with pytest.raises(StoreBackendError):
+        TupleFilesystemStoreBackend(base_directory=str(base_directory)).rebuild_key_index()
+
+
+@pytest.mark.filesystem
+def test_FilesystemKeyIndex_keeps_entries_appended_concurrently_with_compaction(tmp_path):
+    index_filepath = str(tmp_path / FilesystemKeyIndex.__name__)
+    num_writers = 4
+    num_files = 100
+
+    def _write(writer: int) -> None:
+        # indexes of other writers (e.g., processes) share nothing but the log
+        key_index = FilesystemKeyIndex(index_filepath=index_filepath, list_filepaths=list)
+        key_index.COMPACTION_THRESHOLD = 10
+        for idx in range(num_files):
+            if idx % 10 == 0:
+                key_index.add(f"writer_{writer}/kept_{idx}")
+            key_index.add(f"writer_{writer}/removed_{idx}")
+            key_index.remove(f"writer_{writer}/removed_{idx}")
+
+    with ThreadPoolExecutor(max_workers=num_writers) as executor:
+        list(executor.map(_write, range(num_writers)))
+
+    key_index = FilesystemKeyIndex(index_filepath=index_filepath, list_filepaths=list)
+    assert sorted(key_index.list_filepaths()) == sorted(
+        f"writer_{writer}/kept_{idx}"
+        for writer in range(num_writers)
+        for idx in range(0, num_files, 10)
+    )
+    # the log has been compacted, and no lock file is left behind
+    assert len((tmp_path / FilesystemKeyIndex.__name__).read_text().splitlines()) < (
+        2 * num_writers * num_files
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == [FilesystemKeyIndex.__name__]
+
+
 @pytest.mark.filesystem
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
@@ -593,6 +697,31 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_get_many(aws_credentials, mocker: MockerFixture):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(filepath_template="my_file_{0}", bucket=bucket)
+    create_client = mocker.spy(my_store, "_create_client")
+
+    keys = [(f"key_{index}",) for index in range(50)]
+    for key in keys:
+        my_store.set(key, f"value of {key[0]}", content_type="text/html; charset=utf-8")
+
+    assert my_store.get_many(keys) == [f"value of {key[0]}" for key in keys]
+    assert my_store.get(keys[0]) == "value of key_0"
+    # reads share a client of the store backend
+    assert create_client.call_count <= 1
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([keys[0], ("non_existent_key",)])
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915 # FIXME CoP
@@ -962,6 +1091,14 @@ def test_TupleGCSStoreBackend():  # noqa: PLR0915 # FIXME CoP
         mock_blob = mock_bucket.get_blob.return_value
         mock_str = mock_blob.download_as_bytes.return_value
 
+        # reads share a client, created by the first one
+        my_store = TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            suppress_store_backend_id=True,
+        )
         my_store.get(("BBB",))
 
         mock_gcs_client.assert_called_once_with("dummy-project")
@@ -990,6 +1127,13 @@ def test_TupleGCSStoreBackend():  # noqa: PLR0915 # FIXME CoP
 
     with mock.patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
         mock_gcs_client.side_effect = InvalidKeyError("Hi I am an InvalidKeyError")
+        my_store = TupleGCSStoreBackend(
+            filepath_template="my_file_{0}",
+            bucket=bucket,
+            prefix=prefix,
+            project=project,
+            suppress_store_backend_id=True,
+        )
         with pytest.raises(InvalidKeyError):
             my_store.get(("non_existent_key",))
 
@@ -1072,6 +1216,47 @@ def test_TupleGCSStoreBackend_get_all(mocker: MockerFixture):
         assert sorted(result) == [val_a, val_b]
 
 
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="google.cloud"),
+    reason="google is not installed",
+)
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="google"),
+    reason="google is not installed",
+)
+@pytest.mark.big
+def test_TupleGCSStoreBackend_get_many(mocker: MockerFixture):
+    prefix = "this_is_a_test_prefix"
+    keys = [(f"key_{index}",) for index in range(50)]
+
+    def mock_get_blob(gcs_object_key):
+        """Test double for bucket::get_blob."""
+        if gcs_object_key == f"{prefix}/non_existent_key":
+            return None
+        return mocker.Mock(
+            download_as_bytes=mocker.Mock(return_value=f"value of {gcs_object_key}".encode())
+        )
+
+    with mock.patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_gcs_client.return_value.bucket.return_value.get_blob.side_effect = mock_get_blob
+
+        my_store = TupleGCSStoreBackend(
+            filepath_template=None,
+            bucket="leakybucket",
+            prefix=prefix,
+            project="dummy-project",
+            suppress_store_backend_id=True,
+        )
+
+        assert my_store.get_many(keys) == [f"value of {prefix}/{key[0]}" for key in keys]
+        assert my_store.get(keys[0]) == f"value of {prefix}/key_0"
+        # reads share a client of the store backend
+        mock_gcs_client.assert_called_once_with("dummy-project")
+
+        with pytest.raises(InvalidKeyError):
+            my_store.get_many([keys[0], ("non_existent_key",)])
+
+
 @pytest.mark.unit
 def test_TupleAzureBlobStoreBackend_credential():
     pytest.importorskip("azure.storage.blob")
@@ -1238,6 +1423,31 @@ def test_TupleAzureBlobStoreBackend_get_all(mocker: MockerFixture):
         assert sorted(result) == [val_a, val_b]
 
 
+@pytest.mark.unit
+def test_TupleAzureBlobStoreBackend_get_many(mocker: MockerFixture):
+    pytest.importorskip("azure.storage.blob")
+    pytest.importorskip("azure.identity")
+
+    prefix = "this_is_a_test_prefix"
+    keys = [(f"key_{index}",) for index in range(50)]
+
+    my_store = TupleAzureBlobStoreBackend(
+        credential="this_is_a_test_credential_string",
+        account_url="this_is_a_test_account_url",
+        prefix=prefix,
+        container="dummy-container",
+    )
+
+    with mock.patch("great_expectations.compatibility.azure.BlobServiceClient", autospec=True):
+        mock_container_client = my_store._container_client
+        mock_container_client.download_blob.side_effect = lambda object_key: mocker.Mock(
+            readall=mocker.Mock(return_value=f"value of {object_key}".encode())
+        )
+
+        assert my_store.get_many(keys) == [f"value of {prefix}/{key[0]}" for key in keys]
+        assert mock_container_client.download_blob.call_count == len(keys)
+
+
 @mock_s3
 @pytest.mark.slow  # 14.36s
 @pytest.mark.aws_deps
@@ -1433,6 +1643,18 @@ def test_InlineStoreBackend_get_all_invalid_resource_type(empty_data_context) ->
         inline_store_backend.get_all()
 
 
+@pytest.mark.unit
+def test_InMemoryStoreBackend_get_many() -> None:
+    store_backend = InMemoryStoreBackend()
+    store_backend.set(("a",), "value_a")
+    store_backend.set(("b",), "value_b")
+
+    assert store_backend.get_many([("b",), ("a",)]) == ["value_b", "value_a"]
+    assert store_backend.get_many([]) == []
+    with pytest.raises(InvalidKeyError):
+        store_backend.get_many([("a",), ("non_existent_key",)])
+
+
 @pytest.mark.unit
 def test_InMemoryStoreBackend_move_overwrites_key() -> None:
     store_backend = InMemoryStoreBackend()
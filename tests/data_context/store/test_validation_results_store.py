@@ -1,5 +1,6 @@
 import datetime
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 import pytest
@@ -7,11 +8,17 @@ from freezegun import freeze_time
 from moto import mock_s3
 
 from great_expectations.core import ExpectationSuiteValidationResult
-from great_expectations.data_context.store import ValidationResultsStore
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context.store import DatabaseStoreBackend, ValidationResultsStore
+from great_expectations.data_context.store.validation_results_store import (
+    deferring_writes,
+    writing_deferred,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     ValidationResultIdentifier,
 )
+from great_expectations.exceptions import StoreConfigurationError, StoreError
 from great_expectations.util import gen_directory_tree_str
 from tests import test_utils
 
@@ -263,6 +270,95 @@ def test_ValidationResultsStore_with_TupleFileSystemStoreBackend(tmp_path_factor
     assert my_store.store_backend_id == my_store_duplicate.store_backend_id
 
 
+@pytest.mark.filesystem
+@pytest.mark.parametrize("use_key_index", [False, True])
+def test_ValidationResultsStore_list_keys_for_suite(tmp_path_factory, use_key_index: bool):
+    path = str(tmp_path_factory.mktemp("test_ValidationResultsStore_list_keys_for_suite__dir"))
+    my_store = ValidationResultsStore(
+        store_backend={
+            "module_name": "great_expectations.data_context.store",
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": "my_store/",
+            "use_key_index": use_key_index,
+        },
+        runtime_environment={"root_directory": path},
+    )
+
+    run_time_1 = datetime.datetime(2019, 9, 26, 13, 42, 41, tzinfo=datetime.timezone.utc)
+    run_time_2 = datetime.datetime(2019, 9, 27, 13, 42, 41, tzinfo=datetime.timezone.utc)
+    keys = [
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(suite_name),
+            run_id=RunIdentifier(run_name="prod", run_time=run_time),
+            batch_identifier="batch_id",
+        )
+        for suite_name in ["asset", "asset.quarantine"]
+        for run_time in [run_time_1, run_time_2]
+    ]
+    for key in keys:
+        my_store.set(
+            key,
+            ExpectationSuiteValidationResult(
+                success=True, results=[], suite_name=key.expectation_suite_identifier.name
+            ),
+        )
+
+    assert set(my_store.list_keys_for_suite(suite_name="asset")) == set(keys[:2])
+    assert set(my_store.list_keys_for_suite(suite_name="asset.quarantine")) == set(keys[2:])
+    assert my_store.list_keys_for_suite(suite_name="asset", run_time=run_time_2) == [keys[1]]
+    assert my_store.list_keys_for_suite(suite_name="other") == []
+
+
+@pytest.mark.filesystem
+@pytest.mark.parametrize("codec", ["gzip", "bz2"])
+def test_ValidationResultsStore_with_codec(tmp_path_factory, codec: str):
+    path = str(tmp_path_factory.mktemp("test_ValidationResultsStore_with_codec__dir"))
+    store_backend = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "TupleFilesystemStoreBackend",
+        "base_directory": "my_store/",
+    }
+    compressed_store = ValidationResultsStore(
+        store_backend=store_backend, runtime_environment={"root_directory": path}, codec=codec
+    )
+    uncompressed_store = ValidationResultsStore(
+        store_backend=store_backend, runtime_environment={"root_directory": path}
+    )
+
+    validation_result = ExpectationSuiteValidationResult(
+        success=False,
+        results=[],
+        suite_name="asset",
+        meta={"partial_unexpected_list": list(range(10000))},
+    )
+    compressed_key, uncompressed_key = (
+        ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier("asset"),
+            run_id=RunIdentifier(run_name=run_name),
+            batch_identifier="batch_id",
+        )
+        for run_name in ["compressed", "uncompressed"]
+    )
+    compressed_store.set(compressed_key, validation_result)
+    uncompressed_store.set(uncompressed_key, validation_result)
+
+    compressed_value = compressed_store.store_backend.get(compressed_key.to_tuple())
+    uncompressed_value = uncompressed_store.store_backend.get(uncompressed_key.to_tuple())
+    assert compressed_value.startswith(f"gx-store-codec:{codec}:")
+    assert len(compressed_value) < len(uncompressed_value) / 2
+
+    # values are read back regardless of the codec of the store reading them
+    for store in [compressed_store, uncompressed_store]:
+        assert store.get(compressed_key) == validation_result
+        assert store.get(uncompressed_key) == validation_result
+
+
+@pytest.mark.unit
+def test_ValidationResultsStore_with_unknown_codec():
+    with pytest.raises(StoreConfigurationError):
+        ValidationResultsStore(codec="unknown")
+
+
 @pytest.mark.filterwarnings(
     "ignore:String run_ids are deprecated*:DeprecationWarning:great_expectations.data_context.types.resource_identifiers"  # noqa: E501 # FIXME CoP
 )
@@ -329,6 +425,173 @@ def test_ValidationResultsStore_with_DatabaseStoreBackend(sa):
     assert test_utils.validate_uuid4(my_store.store_backend_id)
 
 
+def _validation_result_key(run_name: str) -> ValidationResultIdentifier:
+    return ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name="asset"),
+        run_id=RunIdentifier(
+            run_name=run_name,
+            run_time=datetime.datetime(2019, 10, 7, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier="batch_id",
+    )
+
+
+@pytest.mark.big
+@pytest.mark.parametrize("use_native_upsert", [True, False])
+def test_ValidationResultsStore_with_DatabaseStoreBackend_bulk_operations(
+    sa, mocker, use_native_upsert: bool
+):
+    my_store = ValidationResultsStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "credentials": {"drivername": "sqlite"},
+        }
+    )
+    if not use_native_upsert:
+        mocker.patch.object(my_store.store_backend, "_build_upsert", return_value=None)
+
+    keys = [_validation_result_key(run_name=f"run_{idx}") for idx in range(5)]
+    my_store.set(
+        keys[0], ExpectationSuiteValidationResult(success=False, results=[], suite_name="asset")
+    )
+
+    # existing keys are updated, and new ones inserted
+    my_store.set_many(
+        [
+            (key, ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset"))
+            for key in keys
+        ]
+    )
+    assert set(my_store.list_keys()) == set(keys)
+    assert my_store.get_many(keys[::-1]) == [
+        ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset")
+    ] * len(keys)
+
+    with pytest.raises(StoreError):
+        my_store.get_many([keys[0], _validation_result_key(run_name="missing")])
+
+
+@pytest.mark.big
+def test_ValidationResultsStore_deferred_writes(sa, mocker):
+    my_store = ValidationResultsStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "credentials": {"drivername": "sqlite"},
+        }
+    )
+    set_many = mocker.spy(my_store.store_backend, "_set_many")
+    validation_result = ExpectationSuiteValidationResult(
+        success=True, results=[], suite_name="asset"
+    )
+    keys = [_validation_result_key(run_name=f"run_{idx}") for idx in range(3)]
+
+    with writing_deferred(my_store.defer_writes()):
+        for key in keys:
+            my_store.set(key, validation_result)
+
+        assert my_store.list_keys() == []
+        # deferred values are read back before they are written
+        assert my_store.get(keys[0]) == validation_result
+
+    set_many.assert_called_once()
+    assert set(my_store.list_keys()) == set(keys)
+
+
+@pytest.mark.filesystem
+def test_ValidationResultsStore_does_not_defer_writes_without_bulk_writes(tmp_path):
+    my_store = ValidationResultsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        }
+    )
+    key = _validation_result_key(run_name="run")
+
+    assert my_store.defer_writes() is None
+    with writing_deferred(my_store.defer_writes()):
+        my_store.set(
+            key, ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset")
+        )
+
+        # written right away, rather than held in memory until the context exits
+        assert my_store.list_keys() == [key]
+
+
+@pytest.mark.big
+def test_ValidationResultsStore_deferred_writes_are_scoped_to_thread(sa, tmp_path):
+    # in-memory SQLite databases are not shared between threads
+    my_store = ValidationResultsStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "credentials": {"drivername": "sqlite", "database": str(tmp_path / "store.db")},
+        }
+    )
+    validation_result = ExpectationSuiteValidationResult(
+        success=True, results=[], suite_name="asset"
+    )
+    deferred_key, other_key, worker_key = (
+        _validation_result_key(run_name=run_name) for run_name in ("deferred", "other", "worker")
+    )
+
+    def _set(key: ValidationResultIdentifier, deferred_writes=None) -> None:
+        with deferring_writes(deferred_writes):
+            my_store.set(key, validation_result)
+
+    deferred_writes = my_store.defer_writes()
+    with writing_deferred(deferred_writes):
+        my_store.set(deferred_key, validation_result)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # e.g., another Checkpoint run
+            executor.submit(_set, other_key).result()
+            # e.g., a Validation Definition of this Checkpoint run
+            executor.submit(_set, worker_key, deferred_writes).result()
+
+        assert my_store.list_keys() == [other_key]
+
+    assert set(my_store.list_keys()) == {deferred_key, other_key, worker_key}
+
+
+@pytest.mark.big
+def test_ValidationResultsStore_deferred_writes_failure_does_not_hide_exception(sa, mocker):
+    my_store = ValidationResultsStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "credentials": {"drivername": "sqlite"},
+        }
+    )
+    mocker.patch.object(my_store.store_backend, "_set_many", side_effect=StoreError("write"))
+
+    with pytest.raises(ValueError, match="validation"):
+        with writing_deferred(my_store.defer_writes()):
+            my_store.set(
+                _validation_result_key(run_name="run"),
+                ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset"),
+            )
+            raise ValueError("validation")
+
+    # without an exception being raised, failures of deferred writes are raised
+    with pytest.raises(StoreError, match="write"):
+        with writing_deferred(my_store.defer_writes()):
+            my_store.set(
+                _validation_result_key(run_name="run"),
+                ExpectationSuiteValidationResult(success=True, results=[], suite_name="asset"),
+            )
+
+
+@pytest.mark.big
+def test_DatabaseStoreBackend_passes_connection_pool_settings_to_engine(sa, tmp_path):
+    store_backend = DatabaseStoreBackend(
+        url=f"sqlite:///{tmp_path / 'store.db'}",
+        table_name="ge_validation_results_store",
+        key_columns=["k1"],
+        pool_size=3,
+        pool_pre_ping=True,
+    )
+
+    assert store_backend.engine.pool.size() == 3
+    assert store_backend.config["pool_size"] == 3
+
+
 @pytest.mark.cloud
 def test_gx_cloud_response_json_to_object_dict() -> None:
     validation_id = "c1e8f964-ba44-4a13-a9b6-7331a358f12d"
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from great_expectations.datasource.fluent.data_connector.data_reference_index import (
+    DataReferenceIndex,
+    DataReferenceSnapshot,
+)
+
+
+@pytest.mark.unit
+def test_data_reference_index_round_trip(tmp_path):
+    index = DataReferenceIndex.in_directory(directory=tmp_path / "index", source="s3://bucket/")
+    assert index.load() is None
+
+    snapshot = DataReferenceSnapshot(
+        data_references=["a.csv", "b.csv"], listed_at=1.5, state={"start_after": "b.csv"}
+    )
+    index.save(snapshot)
+
+    assert index.load() == snapshot
+    assert list(index.index_filepath.parent.iterdir()) == [index.index_filepath]
+
+    index.clear()
+    assert index.load() is None
+
+
+@pytest.mark.unit
+def test_data_reference_index_of_other_source_is_not_loaded(tmp_path):
+    index_filepath = tmp_path / "index.json"
+    DataReferenceIndex(index_filepath=index_filepath, source="s3://bucket/").save(
+        DataReferenceSnapshot(data_references=["a.csv"], listed_at=1.5)
+    )
+
+    assert DataReferenceIndex(index_filepath=index_filepath, source="s3://other/").load() is None
+
+
+@pytest.mark.unit
+def test_unreadable_data_reference_index_is_not_loaded(tmp_path):
+    index_filepath = tmp_path / "index.json"
+    index_filepath.write_text("{not json")
+
+    assert DataReferenceIndex(index_filepath=index_filepath, source="s3://bucket/").load() is None
+
+
+@pytest.mark.unit
+def test_data_reference_index_is_saved_by_concurrent_threads(tmp_path):
+    index = DataReferenceIndex.in_directory(directory=tmp_path, source="s3://bucket/")
+    snapshots = [
+        DataReferenceSnapshot(data_references=[f"{i}.csv"], listed_at=float(i)) for i in range(20)
+    ]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(index.save, snapshots))
+
+    assert index.load() in snapshots
+    assert list(tmp_path.iterdir()) == [index.index_filepath]
@@ -1,6 +1,8 @@
+import os
 import pathlib
 import re
 from typing import TYPE_CHECKING, List, Union
+from unittest import mock
 
 import pytest
 
@@ -670,3 +672,36 @@ def test_filesystem_data_connector_uses_batching_regex_from_batch_request(
 
     # assert
     assert len(batch_definitions) == batch_definition_count
+
+
+@pytest.mark.filesystem
+def test_data_reference_index_is_reused_until_directories_change(tmp_path):
+    base_directory = tmp_path / "data"
+    create_files_in_directory(
+        directory=str(base_directory),
+        file_name_list=["2020/alpha-1.csv", "2021/alpha-2.csv"],
+    )
+    # directories modified just before listing are listed anew, regardless of the index
+    for directory in (base_directory, base_directory / "2020", base_directory / "2021"):
+        os.utime(directory, ns=(10**18, 10**18))
+
+    def build_data_connector() -> FilesystemDataConnector:
+        return FilesystemDataConnector(
+            datasource_name="my_file_path_datasource",
+            data_asset_name="my_filesystem_data_asset",
+            base_directory=base_directory,
+            glob_directive="*/*.csv",
+            data_reference_index_directory=tmp_path / "index",
+        )
+
+    expected = ["2020/alpha-1.csv", "2021/alpha-2.csv"]
+    assert build_data_connector().get_matched_data_references() == expected
+
+    with mock.patch.object(
+        FilesystemDataConnector, "get_data_references", autospec=True
+    ) as get_data_references:
+        assert build_data_connector().get_matched_data_references() == expected
+    get_data_references.assert_not_called()
+
+    create_files_in_directory(directory=str(base_directory), file_name_list=["2021/alpha-3.csv"])
+    assert build_data_connector().get_matched_data_references() == [*expected, "2021/alpha-3.csv"]
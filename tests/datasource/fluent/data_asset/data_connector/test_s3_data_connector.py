@@ -2,6 +2,7 @@ import logging
 import os
 import re
 from typing import TYPE_CHECKING, List
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -685,3 +686,57 @@ def test_sanitize_prefix_behaves_the_same_as_local_files():
     check_sameness("a.x/b/c", "a.x/b/c/")
     check_sameness("path/to/folder.something/", "path/to/folder.something/")
     check_sameness("path/to/folder.something", "path/to/folder.something")
+
+
+@pytest.mark.big
+@mock_s3
+def test_data_reference_index_lists_keys_after_last_listed_key(tmp_path):
+    region_name: str = "us-east-1"
+    bucket: str = "test_bucket"
+    conn = boto3.resource("s3", region_name=region_name)
+    conn.create_bucket(Bucket=bucket)
+    client: BaseClient = boto3.client("s3", region_name=region_name)
+
+    for key in ["alpha-1.csv", "alpha-2.csv"]:
+        client.put_object(Bucket=bucket, Body=b"a,b\n1,2\n", Key=key)
+
+    def build_data_connector() -> S3DataConnector:
+        return S3DataConnector(
+            datasource_name="my_file_path_datasource",
+            data_asset_name="my_s3_data_asset",
+            s3_client=client,
+            bucket=bucket,
+            prefix="",
+            file_path_template_map_fn=S3Url.OBJECT_URL_TEMPLATE.format,
+            data_reference_index_directory=tmp_path,
+        )
+
+    assert build_data_connector().get_matched_data_references() == [
+        "alpha-1.csv",
+        "alpha-2.csv",
+    ]
+
+    client.put_object(Bucket=bucket, Body=b"a,b\n1,2\n", Key="alpha-3.csv")
+    my_data_connector = build_data_connector()
+    with mock.patch.object(client, "list_objects_v2", wraps=client.list_objects_v2) as spy:
+        assert my_data_connector.get_matched_data_references() == [
+            "alpha-1.csv",
+            "alpha-2.csv",
+            "alpha-3.csv",
+        ]
+    assert spy.call_args.kwargs["StartAfter"] == "alpha-2.csv"
+
+    # keys sorting before the last listed key are only listed after refreshing
+    client.put_object(Bucket=bucket, Body=b"a,b\n1,2\n", Key="alpha-0.csv")
+    my_data_connector = build_data_connector()
+    assert len(my_data_connector.get_matched_data_references()) == 3
+
+    my_data_connector.refresh_data_references()
+    with mock.patch.object(client, "list_objects_v2", wraps=client.list_objects_v2) as spy:
+        assert my_data_connector.get_matched_data_references() == [
+            "alpha-0.csv",
+            "alpha-1.csv",
+            "alpha-2.csv",
+            "alpha-3.csv",
+        ]
+    assert "StartAfter" not in spy.call_args.kwargs
@@ -5,6 +5,7 @@ import inspect
 import logging
 import os
 import pathlib
+import threading
 import uuid
 from pprint import pformat as pf
 from typing import TYPE_CHECKING, Any, Callable, Type
@@ -17,7 +18,7 @@ import great_expectations.execution_engine.pandas_execution_engine
 from great_expectations.compatibility import pydantic
 from great_expectations.datasource.fluent import PandasDatasource
 from great_expectations.datasource.fluent.dynamic_pandas import PANDAS_VERSION
-from great_expectations.datasource.fluent.interfaces import Batch
+from great_expectations.datasource.fluent.interfaces import Batch, isolated_execution_engines
 from great_expectations.datasource.fluent.pandas_datasource import (
     _DYNAMIC_ASSET_TYPES,
     CSVAsset,
@@ -547,3 +548,36 @@ def test_build_batch_request_raises_if_missing_dataframe(
         dataframe_asset.build_batch_request()
 
     assert str(e.value).startswith("Bad input to build_batch_request:")
+
+
+@pytest.mark.unit
+def test_isolated_execution_engines(pandas_datasource: PandasDatasource):
+    shared_execution_engine = pandas_datasource.get_execution_engine()
+    assert pandas_datasource.get_execution_engine() is shared_execution_engine
+
+    isolated: dict = {}
+
+    def _get_isolated_execution_engines(name: str) -> None:
+        with isolated_execution_engines():
+            isolated[name] = (
+                pandas_datasource.get_execution_engine(),
+                pandas_datasource.get_execution_engine(),
+            )
+
+    threads = [
+        threading.Thread(target=_get_isolated_execution_engines, args=(name,))
+        for name in ("first", "second")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    first, second = isolated["first"], isolated["second"]
+    # ExecutionEngine is reused within context, but not shared with other contexts
+    assert first[0] is first[1]
+    assert second[0] is second[1]
+    assert first[0] is not second[0]
+    assert shared_execution_engine not in (first[0], second[0])
+    # ExecutionEngine cached outside of context is not affected
+    assert pandas_datasource.get_execution_engine() is shared_execution_engine
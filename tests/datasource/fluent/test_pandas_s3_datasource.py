@@ -290,3 +290,26 @@ def test_add_csv_asset_with_recursive_file_discovery_to_datasource(
     )
     # Only 1 additional file was added to the subfolder
     assert found_files_without_recursion + 1 == found_files_with_recursion
+
+
+@pytest.mark.aws_deps
+def test_refresh_data_references_lists_removed_keys_anew(
+    pandas_s3_datasource: PandasS3Datasource, s3_mock, s3_bucket: str, aws_credentials, tmp_path
+):
+    asset = pandas_s3_datasource.add_csv_asset(
+        name="csv_asset",
+        s3_data_reference_index_directory=str(tmp_path),
+    )
+    batch_request = asset.build_batch_request()
+    listed_paths = {
+        identifiers["path"] for identifiers in asset.get_batch_identifiers_list(batch_request)
+    }
+    assert "yellow_tripdata_sample_2024-01.csv" in listed_paths
+
+    s3_mock.delete_object(Bucket=s3_bucket, Key="yellow_tripdata_sample_2024-01.csv")
+    asset.refresh_data_references()
+
+    listed_paths = {
+        identifiers["path"] for identifiers in asset.get_batch_identifiers_list(batch_request)
+    }
+    assert "yellow_tripdata_sample_2024-01.csv" not in listed_paths
@@ -11,6 +11,7 @@ from pytest import param
 
 from great_expectations.compatibility import sqlalchemy
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.partitioners import ColumnPartitionerMonthly
 from great_expectations.datasource.fluent import GxDatasourceWarning, SQLDatasource
 from great_expectations.datasource.fluent.sql_datasource import (
     DEFAULT_QUOTE_CHARACTERS,
@@ -105,6 +106,27 @@ def create_engine_fake(monkeypatch: pytest.MonkeyPatch) -> None:
             ),
             id="create_temp_table=False",
         ),
+        param(
+            dict(
+                connection_string="sqlite:///",
+                max_concurrent_queries=4,
+            ),
+            id="max_concurrent_queries=4",
+        ),
+        param(
+            dict(
+                connection_string="sqlite:///",
+                metric_cache_max_size_in_bytes=1_000_000,
+            ),
+            id="metric_cache_max_size_in_bytes=1_000_000",
+        ),
+        param(
+            dict(
+                connection_string="sqlite:///",
+                persistent_metric_store={"store_backend": {"class_name": "InMemoryStoreBackend"}},
+            ),
+            id="persistent_metric_store",
+        ),
     ],
 )
 class TestConfigPasstrough:
@@ -405,5 +427,79 @@ class TestTableAsset:
         assert table_asset.schema_name == schema_name
 
 
+@pytest.fixture
+def sqlite_monthly_table_asset(
+    ephemeral_context_with_defaults: EphemeralDataContext, tmp_path
+) -> TableAsset:
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'events.db'}")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE events (id INTEGER, event_date DATE)"))
+        connection.execute(
+            sa.text(
+                "INSERT INTO events VALUES"
+                " (1, '2024-01-05'), (2, '2024-01-20'), (3, '2024-02-01'), (4, '2023-12-31')"
+            )
+        )
+    datasource = ephemeral_context_with_defaults.data_sources.add_sqlite(
+        name="my_sqlite", connection_string=f"sqlite:///{tmp_path / 'events.db'}"
+    )
+    return datasource.add_table_asset(name="events", table_name="events")
+
+
+@pytest.mark.sqlite
+def test_partition_discovery_queries_only_requested_partitions(
+    sqlite_monthly_table_asset: TableAsset, mocker: MockerFixture
+):
+    asset = sqlite_monthly_table_asset
+    execute_spy = mocker.spy(SqlAlchemyExecutionEngine, "execute_partitioned_query")
+    partitioner = ColumnPartitionerMonthly(column_name="event_date")
+
+    batch = asset.get_batch(
+        asset.build_batch_request(options={"year": 2024, "month": 1}, partitioner=partitioner)
+    )
+
+    assert batch.metadata == {"year": 2024, "month": 1}
+    (partitioned_query,) = execute_spy.call_args.args[1:]
+    assert "WHERE" in str(partitioned_query)
+    assert [
+        batch_identifiers["month"]
+        for batch_identifiers in asset.get_batch_identifiers_list(
+            asset.build_batch_request(options={"year": 2024}, partitioner=partitioner)
+        )
+    ] == [1, 2]
+
+
+@pytest.mark.sqlite
+def test_partition_discovery_is_cached_until_ttl_expires_or_refresh(
+    sqlite_monthly_table_asset: TableAsset, mocker: MockerFixture
+):
+    asset = sqlite_monthly_table_asset
+    execute_spy = mocker.spy(SqlAlchemyExecutionEngine, "execute_partitioned_query")
+    batch_request = asset.build_batch_request(
+        partitioner=ColumnPartitionerMonthly(column_name="event_date")
+    )
+
+    asset.get_batch_identifiers_list(batch_request)
+    asset.get_batch_identifiers_list(batch_request)
+    assert execute_spy.call_count == 2  # not cached by default
+
+    asset.set_partition_cache_ttl(60)
+    assert len(asset.get_batch_identifiers_list(batch_request)) == 3  # 3 months
+    assert asset.get_batch(batch_request).metadata == {"year": 2024, "month": 2}
+    assert execute_spy.call_count == 3  # discovered once
+
+    with asset.datasource.get_engine().begin() as connection:
+        connection.execute(sa.text("INSERT INTO events VALUES (5, '2024-03-15')"))
+    assert len(asset.get_batch_identifiers_list(batch_request)) == 3  # cached
+
+    asset.refresh_partitions()
+    assert len(asset.get_batch_identifiers_list(batch_request)) == 4  # rediscovered
+
+    asset.set_partition_cache_ttl(0)
+    asset.get_batch_identifiers_list(batch_request)
+    asset.get_batch_identifiers_list(batch_request)
+    assert execute_spy.call_count == 6  # expired immediately
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
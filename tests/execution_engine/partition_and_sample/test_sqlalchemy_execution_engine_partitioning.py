@@ -177,6 +177,48 @@ def test_partition_on_date_parts_multiple_date_parts(batch_identifiers_for_colum
     assert result.clauses[1].right.effective_value == 10
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "date_parts, expected_range",
+    [
+        ({"year": 2024}, ("2024-01-01", "2025-01-01")),
+        ({"year": 2024, "month": 12}, ("2024-12-01", "2025-01-01")),
+        ({"year": 2024, "month": 2, "day": 29}, ("2024-02-29", "2024-03-01")),
+    ],
+)
+def test_get_partition_clause_for_date_range(date_parts, expected_range):
+    data_partitioner = SqlAlchemyDataPartitioner(dialect="postgresql")
+
+    result = data_partitioner.get_partition_clause_for_date_range(
+        column_name="column_name", batch_identifiers={"column_name": date_parts}
+    )
+
+    lower_bound, upper_bound = result.clauses
+    assert lower_bound.left.name == upper_bound.left.name == "column_name"
+    assert (str(lower_bound.right.value), str(upper_bound.right.value)) == expected_range
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect, date_parts",
+    [
+        ("sqlite", {"year": 2024}),
+        ("postgresql", {"month": 2}),
+        ("postgresql", {"year": 2024, "day": 1}),
+        ("postgresql", {"year": 2024, "month": 13}),
+    ],
+)
+def test_get_partition_clause_for_date_range_is_not_supported(dialect, date_parts):
+    data_partitioner = SqlAlchemyDataPartitioner(dialect=dialect)
+
+    assert (
+        data_partitioner.get_partition_clause_for_date_range(
+            column_name="column_name", batch_identifiers={"column_name": date_parts}
+        )
+        is None
+    )
+
+
 @mock.patch(
     "great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_partitioner.SqlAlchemyDataPartitioner.get_data_for_batch_identifiers_for_partition_on_date_parts"
 )
@@ -6,11 +6,13 @@ import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.core.batch import BatchData, BatchMarkers
+from great_expectations.core.batch import Batch, BatchData, BatchMarkers
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.data_context.store import BatchMetricStore
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -20,6 +22,7 @@ from great_expectations.expectations.row_conditions import (
 # Testing ordinary process of adding column row condition
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -315,3 +318,158 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(gx_exceptions.GreatExpectationsError):
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+@pytest.mark.unit
+def test_resolve_metrics_with_thread_pool_metric_executor():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+
+    metrics.update(results)
+
+    desired_metrics = []
+    for column in ("a", "b"):
+        for metric_name in ("column.mean", "column.max", "column.standard_deviation"):
+            metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": column},
+                metric_value_kwargs=None,
+            )
+            metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(metric)
+
+    serial_results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+    thread_results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics,
+        metrics=metrics,
+        runtime_configuration={"metric_executor": "thread", "metric_executor_max_workers": 4},
+    )
+
+    assert len(thread_results) == len(desired_metrics)
+    assert thread_results == serial_results
+
+
+@pytest.mark.unit
+def test_metric_cache_is_evicted_when_batch_is_unloaded_or_replaced():
+    engine = PandasExecutionEngine(
+        batch_data_dict={
+            "batch_a": pd.DataFrame({"a": [1, 2, 3]}),
+            "batch_b": pd.DataFrame({"b": [4, 5, 6]}),
+        }
+    )
+
+    def _build_table_columns_metric(batch_id: str) -> MetricConfiguration:
+        table_column_types_metric = MetricConfiguration(
+            metric_name="table.column_types",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs={"include_nested": True},
+        )
+        table_columns_metric = MetricConfiguration(
+            metric_name="table.columns",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+        table_columns_metric.metric_dependencies = {
+            "table.column_types": table_column_types_metric,
+        }
+        return table_columns_metric
+
+    for batch_id in ("batch_a", "batch_b"):
+        table_columns_metric = _build_table_columns_metric(batch_id=batch_id)
+        engine.resolve_metrics(
+            metrics_to_resolve=(table_columns_metric.metric_dependencies["table.column_types"],)
+        )
+        # the dependency is obtained from metric cache
+        results = engine.resolve_metrics(metrics_to_resolve=(table_columns_metric,))
+        assert results[table_columns_metric.id] == [batch_id[-1]]
+
+    statistics = engine.metric_cache_statistics
+    assert statistics is not None
+    assert statistics.entries == 4
+    assert statistics.hits == 2
+    assert statistics.evictions == 0
+
+    engine.unload_batch_data(batch_id="batch_a")
+
+    assert engine.batch_manager.loaded_batch_ids == ["batch_b"]
+    assert engine.metric_cache_statistics.entries == 2
+    assert engine.metric_cache_statistics.evictions == 2
+    with pytest.raises(gx_exceptions.MetricError):
+        engine.resolve_metrics(metrics_to_resolve=(_build_table_columns_metric("batch_a"),))
+
+    # reloading the same data keeps cached metrics, while replacing it evicts them
+    engine.load_batch_data(
+        batch_id="batch_b", batch_data=engine.batch_manager.batch_data_cache["batch_b"]
+    )
+    assert engine.metric_cache_statistics.entries == 2
+
+    engine.load_batch_data(batch_id="batch_b", batch_data=pd.DataFrame({"c": [7, 8, 9]}))
+    assert engine.metric_cache_statistics.entries == 0
+
+
+@pytest.mark.unit
+def test_metric_cache_statistics_is_none_without_caching():
+    engine = PandasExecutionEngine(caching=False)
+
+    assert engine.metric_cache_statistics is None
+
+
+@pytest.mark.unit
+def test_persistent_metric_store_reuses_metrics_of_unchanged_batch_data():
+    batch_metric_store = BatchMetricStore()
+
+    def _compute_metrics(df: pd.DataFrame) -> Tuple[Dict[Tuple[str, str, str], MetricValue], int]:
+        # every run uses its own ExecutionEngine; only the store is shared between runs
+        engine = PandasExecutionEngine(persistent_metric_store=batch_metric_store)
+        batch_spec = RuntimeDataBatchSpec(batch_data=df)
+        batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec=batch_spec)
+        batch = Batch(data=batch_data, batch_spec=batch_spec, batch_markers=batch_markers)
+        validator = Validator(execution_engine=engine, batches=[batch])
+
+        metrics, _ = validator.compute_metrics(
+            metric_configurations=[
+                MetricConfiguration(
+                    metric_name="column.max",
+                    metric_domain_kwargs={"column": "a", "batch_id": batch.id},
+                    metric_value_kwargs=None,
+                ),
+                MetricConfiguration(
+                    metric_name="column_values.null.unexpected_count",
+                    metric_domain_kwargs={"column": "a", "batch_id": batch.id},
+                    metric_value_kwargs=None,
+                ),
+            ]
+        )
+        return metrics, engine._persistent_metric_cache.hits
+
+    df = pd.DataFrame({"a": [1, 2, None]})
+    first_run_metrics, first_run_hits = _compute_metrics(df=df)
+    second_run_metrics, second_run_hits = _compute_metrics(df=df.copy())
+    changed_data_metrics, changed_data_hits = _compute_metrics(df=pd.DataFrame({"a": [5, 6, 7]}))
+
+    assert first_run_hits == 0
+    assert second_run_hits > 0
+    assert changed_data_hits == 0
+
+    metric_names = ("column.max", "column_values.null.unexpected_count")
+    assert {
+        metric_id: value
+        for metric_id, value in second_run_metrics.items()
+        if metric_id[0] in metric_names
+    } == {
+        metric_id: value
+        for metric_id, value in first_run_metrics.items()
+        if metric_id[0] in metric_names
+    }
+    assert sorted(
+        value for metric_id, value in changed_data_metrics.items() if metric_id[0] in metric_names
+    ) == [3, 7]
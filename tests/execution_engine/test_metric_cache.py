@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.data_context.store.metric_store import BatchMetricStore
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    MetricCacheStatistics,
+    PersistentMetricCache,
+    build_batch_fingerprint,
+    estimate_size_in_bytes,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+def _metric_id(idx: int):
+    return (f"metric_{idx}", "batch_id=my_batch", tuple())
+
+
+@pytest.mark.unit
+def test_estimate_size_in_bytes():
+    df = pd.DataFrame({"a": list(range(1000)), "b": ["x" * 10] * 1000})
+
+    assert estimate_size_in_bytes(df) == df.memory_usage(index=True, deep=True).sum()
+    assert estimate_size_in_bytes(df["a"]) == df["a"].memory_usage(deep=True)
+    assert estimate_size_in_bytes(np.zeros(100)) == 800
+    # containers account for their elements
+    assert estimate_size_in_bytes({"values": list(range(100))}) > estimate_size_in_bytes(
+        list(range(100))
+    )
+    assert estimate_size_in_bytes(list(range(100))) > estimate_size_in_bytes([])
+
+
+@pytest.mark.unit
+def test_metric_cache_counts_hits_and_misses():
+    metric_cache = MetricCache()
+    metric_cache.put(metric_id=_metric_id(0), value=1, batch_id="my_batch")
+
+    assert metric_cache.get(_metric_id(0)) == 1
+    assert metric_cache.get(_metric_id(1)) is None
+    assert metric_cache.get(_metric_id(1), "default") == "default"
+
+    statistics = metric_cache.statistics
+    assert statistics == MetricCacheStatistics(
+        hits=1,
+        misses=2,
+        evictions=0,
+        entries=1,
+        size_in_bytes=estimate_size_in_bytes(1),
+    )
+
+
+@pytest.mark.unit
+def test_metric_cache_evicts_least_recently_used_entries_beyond_capacity():
+    value_size = estimate_size_in_bytes(np.zeros(100))
+    metric_cache = MetricCache(max_size_in_bytes=3 * value_size)
+
+    for idx in range(3):
+        metric_cache.put(metric_id=_metric_id(idx), value=np.zeros(100), batch_id="my_batch")
+
+    # accessing the oldest entry makes it the most recently used one
+    assert metric_cache.get(_metric_id(0)) is not None
+
+    metric_cache.put(metric_id=_metric_id(3), value=np.zeros(100), batch_id="my_batch")
+
+    assert _metric_id(0) in metric_cache
+    assert _metric_id(1) not in metric_cache
+    assert _metric_id(2) in metric_cache
+    assert _metric_id(3) in metric_cache
+    assert metric_cache.size_in_bytes == 3 * value_size
+    assert metric_cache.statistics.evictions == 1
+
+
+@pytest.mark.unit
+def test_metric_cache_does_not_cache_values_larger_than_capacity():
+    metric_cache = MetricCache(max_size_in_bytes=100)
+    metric_cache.put(metric_id=_metric_id(0), value=1, batch_id="my_batch")
+    metric_cache.put(metric_id=_metric_id(1), value=np.zeros(100), batch_id="my_batch")
+
+    assert _metric_id(0) in metric_cache
+    assert _metric_id(1) not in metric_cache
+
+
+@pytest.mark.unit
+def test_metric_cache_replacing_entry_updates_size():
+    metric_cache = MetricCache()
+    metric_cache.put(metric_id=_metric_id(0), value=np.zeros(100), batch_id="my_batch")
+    metric_cache.put(metric_id=_metric_id(0), value=np.zeros(10), batch_id="my_batch")
+
+    assert len(metric_cache) == 1
+    assert metric_cache.size_in_bytes == 80
+
+
+@pytest.mark.unit
+def test_metric_cache_evict_batch():
+    metric_cache = MetricCache()
+    metric_cache.update(
+        metrics={_metric_id(0): 0, _metric_id(1): 1, _metric_id(2): 2},
+        batch_ids={_metric_id(0): "batch_a", _metric_id(1): "batch_b", _metric_id(2): "batch_a"},
+    )
+
+    assert metric_cache.evict_batch(batch_id="batch_a") == 2
+    assert metric_cache.evict_batch(batch_id="batch_a") == 0
+
+    assert _metric_id(1) in metric_cache
+    assert len(metric_cache) == 1
+    assert metric_cache.size_in_bytes == estimate_size_in_bytes(1)
+    assert metric_cache.statistics.evictions == 2
+
+
+@pytest.mark.unit
+def test_metric_cache_max_size_in_bytes_must_not_be_negative():
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        MetricCache(max_size_in_bytes=-1)
+
+
+def _metric_configuration(batch_id: str, column: str = "a") -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"batch_id": batch_id, "column": column},
+        metric_value_kwargs=None,
+    )
+
+
+@pytest.mark.unit
+def test_build_batch_fingerprint():
+    fingerprint = build_batch_fingerprint({"path": "data.csv"}, 1024, 1700000000)
+
+    assert fingerprint == build_batch_fingerprint({"path": "data.csv"}, 1024, 1700000000)
+    assert fingerprint != build_batch_fingerprint({"path": "data.csv"}, 1024, 1700000001)
+    assert fingerprint != build_batch_fingerprint({"path": "other.csv"}, 1024, 1700000000)
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_round_trip_ignores_batch_id():
+    persistent_metric_cache = PersistentMetricCache(store=BatchMetricStore())
+
+    assert persistent_metric_cache.put(
+        batch_fingerprint="fingerprint",
+        metric_configuration=_metric_configuration(batch_id="run_1"),
+        value=np.float64(3.5),
+    )
+
+    value = persistent_metric_cache.get(
+        batch_fingerprint="fingerprint",
+        metric_configuration=_metric_configuration(batch_id="run_2"),
+    )
+    assert value == 3.5
+    assert type(value) is float
+    assert (
+        persistent_metric_cache.get(
+            batch_fingerprint="other_fingerprint",
+            metric_configuration=_metric_configuration(batch_id="run_2"),
+            default="missing",
+        )
+        == "missing"
+    )
+    assert (
+        persistent_metric_cache.get(
+            batch_fingerprint="fingerprint",
+            metric_configuration=_metric_configuration(batch_id="run_2", column="b"),
+        )
+        is None
+    )
+    assert persistent_metric_cache.hits == 1
+    assert persistent_metric_cache.misses == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(None, id="None"),
+        pytest.param((1, 2), id="tuple"),
+        pytest.param(pd.DataFrame({"a": [1]}), id="DataFrame"),
+        pytest.param({"a": (1, 2)}, id="dict with tuple"),
+        pytest.param({1: "a"}, id="dict with non-string key"),
+    ],
+)
+def test_persistent_metric_cache_skips_non_persistable_values(value):
+    persistent_metric_cache = PersistentMetricCache(store=BatchMetricStore())
+
+    assert not persistent_metric_cache.put(
+        batch_fingerprint="fingerprint",
+        metric_configuration=_metric_configuration(batch_id="run_1"),
+        value=value,
+    )
+    assert (
+        persistent_metric_cache.get(
+            batch_fingerprint="fingerprint",
+            metric_configuration=_metric_configuration(batch_id="run_1"),
+        )
+        is None
+    )
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_put_many_writes_persistable_values_together(mocker):
+    store = BatchMetricStore()
+    set_many = mocker.spy(store, "set_many")
+    persistent_metric_cache = PersistentMetricCache(store=store)
+
+    assert (
+        persistent_metric_cache.put_many(
+            entries=[
+                ("fingerprint", _metric_configuration(batch_id="run_1", column="a"), 1),
+                ("fingerprint", _metric_configuration(batch_id="run_1", column="b"), (1, 2)),
+                ("fingerprint", _metric_configuration(batch_id="run_1", column="c"), [3]),
+            ]
+        )
+        == 2
+    )
+
+    set_many.assert_called_once()
+    assert [
+        persistent_metric_cache.get(
+            batch_fingerprint="fingerprint",
+            metric_configuration=_metric_configuration(batch_id="run_2", column=column),
+        )
+        for column in ["a", "b", "c"]
+    ] == [1, None, [3]]
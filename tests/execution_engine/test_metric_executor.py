@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
+from great_expectations.execution_engine.metric_executor import (
+    SerialMetricExecutor,
+    ThreadPoolMetricExecutor,
+    build_metric_executor,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+def _build_metric_computation_configuration(
+    metric_name: str, metric_fn
+) -> MetricComputationConfiguration:
+    return MetricComputationConfiguration(
+        metric_configuration=MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={},
+            metric_value_kwargs=None,
+        ),
+        metric_fn=metric_fn,
+        metric_provider_kwargs={"metric_name": metric_name},
+    )
+
+
+def _return_metric_name(metric_name: str) -> str:
+    return metric_name
+
+
+def _fail(metric_name: str) -> str:
+    raise ValueError(f"{metric_name} failed")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "runtime_configuration,expected_type",
+    [
+        pytest.param(None, SerialMetricExecutor, id="no runtime_configuration"),
+        pytest.param({"result_format": "BASIC"}, SerialMetricExecutor, id="not requested"),
+        pytest.param({"metric_executor": "serial"}, SerialMetricExecutor, id="serial"),
+        pytest.param({"metric_executor": "thread"}, ThreadPoolMetricExecutor, id="thread"),
+    ],
+)
+def test_build_metric_executor(runtime_configuration, expected_type):
+    assert isinstance(
+        build_metric_executor(runtime_configuration=runtime_configuration), expected_type
+    )
+
+
+@pytest.mark.unit
+def test_build_metric_executor_passes_instances_and_max_workers_through():
+    metric_executor = ThreadPoolMetricExecutor(max_workers=2)
+    assert (
+        build_metric_executor(runtime_configuration={"metric_executor": metric_executor})
+        is metric_executor
+    )
+
+    metric_executor = build_metric_executor(
+        runtime_configuration={"metric_executor": "thread", "metric_executor_max_workers": 3}
+    )
+    assert isinstance(metric_executor, ThreadPoolMetricExecutor)
+    assert metric_executor.max_workers == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "runtime_configuration",
+    [
+        pytest.param({"metric_executor": "process"}, id="unknown executor"),
+        pytest.param(
+            {"metric_executor": "thread", "metric_executor_max_workers": 0},
+            id="non-positive max_workers",
+        ),
+    ],
+)
+def test_build_metric_executor_invalid_configuration_raises(runtime_configuration):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        build_metric_executor(runtime_configuration=runtime_configuration)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_executor",
+    [SerialMetricExecutor(), ThreadPoolMetricExecutor(max_workers=4)],
+    ids=["serial", "thread"],
+)
+def test_metric_executor_resolves_all_metrics(metric_executor):
+    metric_computation_configurations: List[MetricComputationConfiguration] = [
+        _build_metric_computation_configuration(f"metric_{idx}", _return_metric_name)
+        for idx in range(10)
+    ]
+
+    resolved_metrics = metric_executor.execute(
+        metric_computation_configurations=metric_computation_configurations
+    )
+
+    assert resolved_metrics == {
+        configuration.metric_configuration.id: configuration.metric_configuration.metric_name
+        for configuration in metric_computation_configurations
+    }
+
+
+@pytest.mark.unit
+def test_thread_pool_metric_executor_runs_metrics_concurrently():
+    num_metrics = 3
+    # Every metric function waits for all others to start, which succeeds only if run concurrently.
+    barrier = threading.Barrier(num_metrics, timeout=5)
+
+    def _wait_for_siblings(metric_name: str) -> str:
+        barrier.wait()
+        return metric_name
+
+    metric_computation_configurations: List[MetricComputationConfiguration] = [
+        _build_metric_computation_configuration(f"metric_{idx}", _wait_for_siblings)
+        for idx in range(num_metrics)
+    ]
+
+    resolved_metrics = ThreadPoolMetricExecutor(max_workers=num_metrics).execute(
+        metric_computation_configurations=metric_computation_configurations
+    )
+
+    assert len(resolved_metrics) == num_metrics
+
+
+@pytest.mark.unit
+def test_serial_metric_executor_stops_at_first_failure():
+    calls: List[str] = []
+
+    def _record(metric_name: str) -> str:
+        calls.append(metric_name)
+        return metric_name
+
+    metric_computation_configurations: List[MetricComputationConfiguration] = [
+        _build_metric_computation_configuration("metric_0", _record),
+        _build_metric_computation_configuration("metric_1", _fail),
+        _build_metric_computation_configuration("metric_2", _record),
+    ]
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        SerialMetricExecutor().execute(
+            metric_computation_configurations=metric_computation_configurations
+        )
+
+    assert calls == ["metric_0"]
+    assert [metric.metric_name for metric in e.value.failed_metrics] == ["metric_1"]
+
+
+@pytest.mark.unit
+def test_thread_pool_metric_executor_reports_all_failed_metrics():
+    metric_computation_configurations: List[MetricComputationConfiguration] = [
+        _build_metric_computation_configuration("metric_0", _fail),
+        _build_metric_computation_configuration("metric_1", _return_metric_name),
+        _build_metric_computation_configuration("metric_2", _fail),
+    ]
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        ThreadPoolMetricExecutor(max_workers=2).execute(
+            metric_computation_configurations=metric_computation_configurations
+        )
+
+    assert [metric.metric_name for metric in e.value.failed_metrics] == [
+        "metric_0",
+        "metric_2",
+    ]
+    assert e.value.message == "metric_0 failed\nmetric_2 failed"
@@ -0,0 +1,324 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations as gx
+import great_expectations.exceptions as gx_exceptions
+import great_expectations.expectations as gxe
+from great_expectations.core import IDDict
+from great_expectations.core.batch import Batch, LegacyBatchDefinition
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 50, size=1000),
+            "b": rng.normal(size=1000),
+            "c": [f"value_{index % 7}" for index in range(1000)],
+        }
+    )
+    df.loc[[3, 500], "b"] = np.nan
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def _compute_metrics(
+    execution_engine: PandasExecutionEngine, path, metrics: List[MetricConfiguration]
+) -> dict:
+    batch_data = execution_engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=path, reader_method="read_csv")
+    )
+    execution_engine.load_batch_data(batch_id="my_batch_id", batch_data=batch_data)
+    resolved_metrics, aborted_metrics = MetricsCalculator(
+        execution_engine=execution_engine, show_progress_bars=False
+    ).compute_metrics(metric_configurations=metrics)
+    assert not aborted_metrics
+    return {metric.id: resolved_metrics[metric.id] for metric in metrics}
+
+
+@pytest.mark.unit
+def test_chunked_metrics_match_metrics_of_whole_file(csv_path):
+    def column_metric(metric_name: str, column: str, **metric_value_kwargs):
+        return MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column, "batch_id": "my_batch_id"},
+            metric_value_kwargs=metric_value_kwargs or None,
+        )
+
+    metrics = [
+        MetricConfiguration(
+            metric_name="table.row_count", metric_domain_kwargs={"batch_id": "my_batch_id"}
+        ),
+        column_metric("column.min", "a"),
+        column_metric("column.max", "b"),
+        column_metric("column.sum", "a"),
+        column_metric("column.distinct_values.count", "a"),
+        column_metric("column.value_counts", "c", sort="value", collate=None),
+        column_metric("column_values.in_set.unexpected_count", "a", value_set=list(range(40))),
+        column_metric(
+            "column_values.in_set.unexpected_index_list",
+            "a",
+            value_set=list(range(40)),
+            result_format={"result_format": "COMPLETE"},
+        ),
+    ]
+
+    expected = _compute_metrics(PandasExecutionEngine(), csv_path, metrics)
+    actual = _compute_metrics(PandasExecutionEngine(chunksize=64), csv_path, metrics)
+
+    for metric in metrics:
+        if isinstance(expected[metric.id], pd.Series):
+            pd.testing.assert_series_equal(actual[metric.id], expected[metric.id])
+        else:
+            assert actual[metric.id] == expected[metric.id], metric.metric_name
+
+
+@pytest.mark.unit
+def test_chunked_moments_and_quantiles(csv_path):
+    metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "b", "batch_id": "my_batch_id"},
+            metric_value_kwargs=None,
+        )
+        for metric_name in ("column.mean", "column.standard_deviation", "column.median")
+    ]
+
+    expected = _compute_metrics(PandasExecutionEngine(), csv_path, metrics)
+    actual = _compute_metrics(PandasExecutionEngine(chunksize=64), csv_path, metrics)
+
+    mean, standard_deviation, median = (metric.id for metric in metrics)
+    assert actual[mean] == pytest.approx(expected[mean])
+    assert actual[standard_deviation] == pytest.approx(expected[standard_deviation])
+    assert actual[median] == pytest.approx(expected[median], abs=0.1)
+
+
+@pytest.mark.unit
+def test_chunked_metric_without_merge_rule_fails(csv_path):
+    execution_engine = PandasExecutionEngine(chunksize=64)
+    execution_engine.load_batch_data(
+        batch_id="my_batch_id",
+        batch_data=execution_engine.get_batch_data(
+            batch_spec=PathBatchSpec(path=csv_path, reader_method="read_csv")
+        ),
+    )
+    table_head = MetricConfiguration(
+        metric_name="table.head",
+        metric_domain_kwargs={"batch_id": "my_batch_id"},
+        metric_value_kwargs={"n_rows": 5, "fetch_all": False},
+    )
+
+    with pytest.raises(gx_exceptions.MetricResolutionError, match="read in chunks"):
+        execution_engine.resolve_metrics(metrics_to_resolve=(table_head,))
+
+
+@pytest.mark.unit
+def test_get_batch_data_reads_chunks_with_partitioning_and_sampling(csv_path):
+    batch_data = PandasExecutionEngine(chunksize=64).get_batch_data(
+        batch_spec=PathBatchSpec(
+            path=csv_path,
+            reader_method="read_csv",
+            partitioner_method="partition_on_column_value",
+            partitioner_kwargs={"column_name": "c", "batch_identifiers": {"c": "value_1"}},
+            sampling_method="sample_using_limit",
+            sampling_kwargs={"n": 50},
+        )
+    )
+
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    chunks = list(batch_data.iter_chunks())
+    assert len(chunks) > 1
+    df = pd.concat(chunks)
+    assert df.index.tolist() == list(range(1, 350, 7))
+    assert set(df["c"]) == {"value_1"}
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        _ = batch_data.dataframe
+
+
+@pytest.mark.unit
+def test_get_batch_data_with_random_sampling_of_chunks_fails(csv_path):
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(chunksize=64).get_batch_data(
+            batch_spec=PathBatchSpec(
+                path=csv_path,
+                reader_method="read_csv",
+                sampling_method="sample_using_random",
+                sampling_kwargs={"p": 0.5},
+            )
+        )
+
+
+def _build_validator(execution_engine: PandasExecutionEngine, path, context) -> Validator:
+    batch_spec = PathBatchSpec(path=path, reader_method="read_csv")
+    batch = Batch(
+        data=execution_engine.get_batch_data(batch_spec=batch_spec),
+        batch_spec=batch_spec,
+        batch_definition=LegacyBatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_asset",
+            batch_identifiers=IDDict({}),
+        ),
+    )
+    return Validator(execution_engine=execution_engine, batches=[batch], data_context=context)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectation_type,expectation_kwargs",
+    [
+        pytest.param("expect_column_values_to_not_be_null", {"column": "b"}, id="not_be_null"),
+        pytest.param(
+            "expect_column_values_to_be_between",
+            {
+                "column": "a",
+                "min_value": 0,
+                "max_value": 40,
+                "row_condition": 'c=="value_3"',
+                "condition_parser": "pandas",
+            },
+            id="be_between_with_row_condition",
+        ),
+        pytest.param(
+            "expect_column_values_to_be_in_set",
+            {"column": "a", "value_set": list(range(40))},
+            id="be_in_set",
+        ),
+    ],
+)
+@pytest.mark.parametrize("result_format", ["SUMMARY", "COMPLETE"])
+def test_chunked_map_expectations_match_expectations_of_whole_file(
+    csv_path, in_memory_runtime_context, expectation_type, expectation_kwargs, result_format
+):
+    results = [
+        getattr(
+            _build_validator(execution_engine, csv_path, in_memory_runtime_context),
+            expectation_type,
+        )(**expectation_kwargs, result_format=result_format, catch_exceptions=True)
+        for execution_engine in (PandasExecutionEngine(), PandasExecutionEngine(chunksize=64))
+    ]
+
+    expected, actual = results
+    assert not expected.exception_info["raised_exception"]
+    assert not actual.exception_info["raised_exception"]
+    assert actual.success == expected.success
+    assert actual.result["unexpected_count"] == expected.result["unexpected_count"] > 0
+    pd.testing.assert_series_equal(
+        pd.Series(actual.result["partial_unexpected_list"]),
+        pd.Series(expected.result["partial_unexpected_list"]),
+    )
+    if result_format == "COMPLETE":
+        assert actual.result["unexpected_index_list"] == expected.result["unexpected_index_list"]
+        assert actual.result["unexpected_index_query"] == expected.result["unexpected_index_query"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectation_type,expectation_kwargs",
+    [
+        pytest.param("expect_column_values_to_be_unique", {"column": "a"}, id="column"),
+        pytest.param(
+            "expect_compound_columns_to_be_unique", {"column_list": ["a", "b"]}, id="compound"
+        ),
+    ],
+)
+def test_chunked_uniqueness_of_values_in_different_chunks_fails(
+    tmp_path, in_memory_runtime_context, expectation_type, expectation_kwargs
+):
+    # every value is duplicated, but no chunk has duplicates
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": list(range(100)) * 2, "b": [0] * 200}).to_csv(path, index=False)
+
+    expected = getattr(
+        _build_validator(PandasExecutionEngine(), path, in_memory_runtime_context),
+        expectation_type,
+    )(**expectation_kwargs, catch_exceptions=True)
+    actual = getattr(
+        _build_validator(PandasExecutionEngine(chunksize=50), path, in_memory_runtime_context),
+        expectation_type,
+    )(**expectation_kwargs, catch_exceptions=True)
+
+    assert expected.result["unexpected_count"] == 200
+    assert not actual.success
+    # exceptions of aborted metrics are reported by metric
+    (exception_info,) = actual.exception_info.values()
+    assert exception_info["raised_exception"]
+    assert "not supported when reading Batch data in chunks" in exception_info["exception_message"]
+
+
+@pytest.mark.unit
+def test_only_line_delimited_json_is_read_in_chunks(tmp_path):
+    df = pd.DataFrame({"a": range(10)})
+    json_path = tmp_path / "data.json"
+    df.to_json(json_path, orient="records")
+    json_lines_path = tmp_path / "data.jsonl"
+    df.to_json(json_lines_path, orient="records", lines=True)
+    execution_engine = PandasExecutionEngine(chunksize=4)
+
+    batch_data = execution_engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=json_path, reader_method="read_json")
+    )
+    pd.testing.assert_frame_equal(batch_data.dataframe, df)
+
+    batch_data = execution_engine.get_batch_data(
+        batch_spec=PathBatchSpec(
+            path=json_lines_path, reader_method="read_json", reader_options={"lines": True}
+        )
+    )
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    pd.testing.assert_frame_equal(pd.concat(batch_data.iter_chunks()), df)
+
+
+def _add_chunked_csv_asset(context, datasource_type: str, csv_path):
+    if datasource_type == "pandas":
+        return (
+            context.data_sources.add_pandas(name="my_datasource", chunksize=64)
+            .add_csv_asset(name="my_asset", filepath_or_buffer=csv_path)
+            .add_batch_definition_whole_dataframe(name="my_batch_definition")
+        )
+
+    return (
+        context.data_sources.add_pandas_filesystem(
+            name="my_datasource", base_directory=csv_path.parent, chunksize=64
+        )
+        .add_csv_asset(name="my_asset")
+        .add_batch_definition_path(name="my_batch_definition", path=csv_path.name)
+    )
+
+
+@pytest.mark.filesystem
+@pytest.mark.parametrize("datasource_type", ["pandas", "pandas_filesystem"])
+def test_chunked_validation_of_fluent_csv_asset(csv_path, datasource_type):
+    context = gx.get_context(mode="ephemeral")
+    batch_definition = _add_chunked_csv_asset(context, datasource_type, csv_path)
+    suite = context.suites.add(
+        gx.ExpectationSuite(
+            name="my_suite",
+            expectations=[
+                gxe.ExpectTableRowCountToEqual(value=1000),
+                gxe.ExpectColumnValuesToBeBetween(column="a", min_value=0, max_value=49),
+                gxe.ExpectColumnValuesToBeInSet(column="a", value_set=list(range(40)), mostly=0.7),
+                gxe.ExpectColumnMeanToBeBetween(column="b", min_value=-0.2, max_value=0.2),
+            ],
+        )
+    )
+
+    assert isinstance(batch_definition.get_batch().data, ChunkedPandasBatchData)
+
+    result = context.validation_definitions.add(
+        gx.ValidationDefinition(name="my_validation", data=batch_definition, suite=suite)
+    ).run()
+
+    assert result.success
+    assert [expectation_result.success for expectation_result in result.results] == [True] * 4
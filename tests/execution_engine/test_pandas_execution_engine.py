@@ -1,4 +1,5 @@
 import os
+from functools import partial
 from typing import Dict, Tuple
 from unittest import mock
 
@@ -7,12 +8,18 @@ import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import pandas_execution_engine
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    columns_to_load,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
@@ -155,6 +162,86 @@ def test_get_domain_records_with_column_pair_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+@pytest.mark.unit
+def test_get_domain_records_memoizes_domain_masks_per_batch(mocker):
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5, 6],
+            "b": [2, 3, 4, 5, None, 6],
+            "c": [1, 2, 3, 4, 5, None],
+        }
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    column_domain_kwargs = {"column": "a", "row_condition": "b>2", "condition_parser": "pandas"}
+    column_pair_domain_kwargs = {
+        "column_A": "b",
+        "column_B": "c",
+        "row_condition": "b>2",
+        "condition_parser": "pandas",
+        "ignore_row_if": "either_value_is_missing",
+    }
+
+    expected_column_df = df.query("b>2")
+    expected_column_pair_df = expected_column_df.dropna(axis=0, how="any", subset=["b", "c"])
+
+    eval_spy = mocker.spy(pd.DataFrame, "eval")
+    for _ in range(3):
+        assert engine.get_domain_records(domain_kwargs=column_domain_kwargs).equals(
+            expected_column_df
+        )
+        assert engine.get_domain_records(domain_kwargs=column_pair_domain_kwargs).equals(
+            expected_column_pair_df
+        )
+
+    # every distinct row condition and "ignore_row_if" directive is evaluated once
+    assert eval_spy.call_count == 2
+
+    # replacing Batch data evicts its Domain masks
+    other_df = pd.DataFrame({"a": [7, 8], "b": [1, 9], "c": [None, 1]})
+    engine.load_batch_data(batch_data=other_df, batch_id="1234")
+    assert engine.get_domain_records(domain_kwargs=column_domain_kwargs).equals(other_df.iloc[1:])
+    assert eval_spy.call_count == 3
+
+    engine.unload_batch_data(batch_id="1234")
+    assert engine._domain_masks == {}
+
+
+@pytest.mark.unit
+def test_get_domain_records_does_not_reuse_domain_masks_of_data_changed_in_place():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [1, 2, 3, 4]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {"column": "a", "row_condition": "b>2", "condition_parser": "pandas"}
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs).equals(df.iloc[2:])
+
+    # values changed in place are seen once the (same) DataFrame is loaded again
+    df.loc[0, "b"] = 5
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs).equals(df.query("b>2"))
+
+    # rows added in place are seen without loading the DataFrame again
+    df.loc[4] = [5, 5]
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs).equals(df.query("b>2"))
+
+
+@pytest.mark.unit
+def test_get_domain_records_does_not_memoize_domain_masks_without_caching(mocker):
+    engine = PandasExecutionEngine(caching=False)
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    eval_spy = mocker.spy(pd.DataFrame, "eval")
+    for _ in range(2):
+        assert engine.get_domain_records(
+            domain_kwargs={"column": "a", "row_condition": "b<5", "condition_parser": "pandas"}
+        ).equals(df.iloc[:3])
+
+    assert eval_spy.call_count == 2
+    assert engine._domain_masks == {}
+
+
 @pytest.mark.unit
 def test_get_domain_records_with_multicolumn_domain():
     engine = PandasExecutionEngine()
@@ -403,6 +490,70 @@ def test_resolve_metric_bundle():
     )
 
 
+@pytest.mark.unit
+def test_resolve_metrics_shares_compute_domain_of_column_conditions(mocker):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, None, 5, 6],
+            "b": ["x", "y", "z", "x", None, "y"],
+            "c": [True, True, False, True, True, True],
+        }
+    )
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    table_columns_metric, metrics = get_table_columns_metric(execution_engine=engine)
+
+    def _build_condition_metrics(row_condition: str):
+        metric_configurations = []
+        for metric_name, column, metric_value_kwargs in (
+            ("column_values.between", "a", {"min_value": 2, "max_value": 5}),
+            ("column_values.in_set", "b", {"value_set": ["x", "y"]}),
+            ("column_values.in_set", "a", {"value_set": [1, 5]}),
+        ):
+            metric_configuration = MetricConfiguration(
+                metric_name=f"{metric_name}.condition",
+                metric_domain_kwargs={
+                    "column": column,
+                    "row_condition": row_condition,
+                    "condition_parser": "pandas",
+                },
+                metric_value_kwargs=metric_value_kwargs,
+            )
+            metric_configuration.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            metric_configurations.append(metric_configuration)
+
+        return metric_configurations
+
+    condition_metrics = _build_condition_metrics(row_condition="c==True")
+    # a different row condition constitutes different compute Domain
+    other_condition_metrics = _build_condition_metrics(row_condition="c==False")
+
+    get_domain_records_spy = mocker.spy(engine, "get_domain_records")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=condition_metrics + other_condition_metrics, metrics=metrics
+    )
+
+    assert get_domain_records_spy.call_count == 2
+
+    # conditions sharing compute Domain are evaluated as if computed individually
+    for metric_configuration in condition_metrics + other_condition_metrics:
+        individual_results = engine.resolve_metrics(
+            metrics_to_resolve=(metric_configuration,), metrics=metrics
+        )
+        pd.testing.assert_series_equal(
+            results[metric_configuration.id][0], individual_results[metric_configuration.id][0]
+        )
+        assert (
+            results[metric_configuration.id][1:]
+            == (individual_results[metric_configuration.id][1:])
+        )
+
+    assert list(results[condition_metrics[0].id][0]) == [True, False, False, True]
+    assert list(results[condition_metrics[1].id][0]) == [False, False, False, False]
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error  # noqa: E501 # FIXME CoP
 @pytest.mark.unit
 def test_resolve_metric_bundle_with_nonexistent_metric():
@@ -470,6 +621,68 @@ def test_get_batch_s3_compressed_files(test_s3_files_compressed, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+def test_get_batch_s3_reads_object_in_ranges(s3, s3_bucket, test_df_small, mocker):
+    key = "path/A-100.csv"
+    s3.put_object(Bucket=s3_bucket, Body=test_df_small.to_csv(index=False), Key=key)
+    execution_engine = PandasExecutionEngine()
+    execution_engine._s3 = s3
+    get_object = mocker.spy(s3, "get_object")
+    mocker.patch.object(
+        pandas_execution_engine,
+        "open_ranged_object_stream",
+        partial(pandas_execution_engine.open_ranged_object_stream, buffer_size=4),
+    )
+
+    batch_spec = S3BatchSpec(path=f"s3a://{s3_bucket}/{key}", reader_method="read_csv")
+    df = execution_engine.get_batch_data(batch_spec=batch_spec)
+
+    pd.testing.assert_frame_equal(df.dataframe, test_df_small)
+    # the object is never read whole; every read is of a range of (at most) the buffer size
+    assert get_object.call_count > 1
+    etag = s3.head_object(Bucket=s3_bucket, Key=key)["ETag"]
+    for call in get_object.call_args_list:
+        start, end = map(int, call.kwargs["Range"][len("bytes=") :].split("-"))
+        assert end - start < 4
+        assert call.kwargs["IfMatch"] == etag
+
+
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+def test_get_batch_s3_fails_if_object_changes_during_read(s3, s3_bucket, test_df_small, mocker):
+    key = "path/A-100.csv"
+    s3.put_object(Bucket=s3_bucket, Body=test_df_small.to_csv(index=False), Key=key)
+    execution_engine = PandasExecutionEngine()
+    execution_engine._s3 = s3
+    get_object = s3.get_object
+
+    def get_object_after_overwrite(**kwargs):
+        # the object is overwritten once its first range has been read
+        if get_object_after_overwrite.calls == 1:
+            s3.put_object(Bucket=s3_bucket, Body="changed\n" * 100, Key=key)
+        get_object_after_overwrite.calls += 1
+        return get_object(**kwargs)
+
+    get_object_after_overwrite.calls = 0
+    mocker.patch.object(s3, "get_object", side_effect=get_object_after_overwrite)
+    mocker.patch.object(
+        pandas_execution_engine,
+        "open_ranged_object_stream",
+        partial(pandas_execution_engine.open_ranged_object_stream, buffer_size=4),
+    )
+
+    batch_spec = S3BatchSpec(path=f"s3a://{s3_bucket}/{key}", reader_method="read_csv")
+    with pytest.raises(gx_exceptions.ExecutionEngineError, match="changed during the read"):
+        execution_engine.get_batch_data(batch_spec=batch_spec)
+
+
 @pytest.mark.skipif(
     not aws.boto3
     or (
@@ -489,6 +702,136 @@ def test_get_batch_s3_parquet(test_s3_files_parquet, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+@pytest.mark.parametrize(
+    "key,reader_method,sequential",
+    [
+        pytest.param("path/A-100.csv", "read_csv", True, id="csv"),
+        pytest.param(
+            "path/A-100.parquet",
+            "read_parquet",
+            False,
+            id="parquet",
+            marks=pytest.mark.skipif(
+                not is_library_loadable(library_name="pyarrow")
+                and not is_library_loadable(library_name="fastparquet"),
+                reason="pyarrow and fastparquet are not installed",
+            ),
+        ),
+    ],
+)
+def test_get_batch_s3_reads_ahead_only_for_sequential_readers(
+    s3, s3_bucket, test_df_small, mocker, key, reader_method, sequential
+):
+    if reader_method == "read_parquet":
+        body = test_df_small.to_parquet()
+    else:
+        body = test_df_small.to_csv(index=False)
+    s3.put_object(Bucket=s3_bucket, Body=body, Key=key)
+    execution_engine = PandasExecutionEngine()
+    execution_engine._s3 = s3
+    open_stream = mocker.spy(pandas_execution_engine, "open_ranged_object_stream")
+
+    batch_spec = S3BatchSpec(path=f"s3a://{s3_bucket}/{key}", reader_method=reader_method)
+    df = execution_engine.get_batch_data(batch_spec=batch_spec)
+
+    pd.testing.assert_frame_equal(df.dataframe, test_df_small)
+    open_stream.assert_called_once()
+    # seeking readers (e.g., of Parquet) would discard most of the read-ahead on every seek
+    assert open_stream.call_args.kwargs["sequential"] is sequential
+
+
+@pytest.mark.unit
+def test_get_batch_data_pushes_columns_and_predicates_down_into_parquet_reader(mocker, tmp_path):
+    path = tmp_path / "data.parquet"
+    path.touch()
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "x"], "c": [3, 4]})
+    reader_fn = mocker.Mock(return_value=df)
+    mocker.patch.object(PandasExecutionEngine, "_get_reader_fn", return_value=reader_fn)
+    batch_spec = PathBatchSpec(
+        path=path,
+        reader_method="read_parquet",
+        partitioner_method="partition_on_column_value",
+        partitioner_kwargs={"column_name": "b", "batch_identifiers": {"b": "x"}},
+    )
+
+    with columns_to_load(["a"]):
+        batch_data, batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+            batch_spec=batch_spec
+        )
+
+    reader_fn.assert_called_once_with(str(path), columns=["a", "b"], filters=[("b", "==", "x")])
+    assert batch_spec["reader_options"] == {"columns": ["a", "b"], "filters": [("b", "==", "x")]}
+    assert batch_data.dataframe.equals(df)
+
+    # pushed down reader options are part of the batch fingerprint
+    _, batch_markers_of_all_columns = PandasExecutionEngine().get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=path,
+            reader_method="read_parquet",
+            partitioner_method="partition_on_column_value",
+            partitioner_kwargs={"column_name": "b", "batch_identifiers": {"b": "x"}},
+        )
+    )
+    assert batch_markers["batch_fingerprint"] != batch_markers_of_all_columns["batch_fingerprint"]
+
+
+@pytest.mark.unit
+def test_get_batch_data_reads_all_columns_when_pushed_down_read_fails(mocker, tmp_path):
+    path = tmp_path / "data.parquet"
+    path.touch()
+    df = pd.DataFrame({"a": [1, 2]})
+    reader_fn = mocker.Mock(side_effect=[ValueError("No match for FieldRef.Name(b)"), df])
+    mocker.patch.object(PandasExecutionEngine, "_get_reader_fn", return_value=reader_fn)
+    batch_spec = PathBatchSpec(path=path, reader_method="read_parquet")
+
+    with columns_to_load(["a", "b"]):
+        batch_data = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+
+    assert reader_fn.call_args_list == [
+        mock.call(str(path), columns=["a", "b"]),
+        mock.call(str(path)),
+    ]
+    assert "reader_options" not in batch_spec
+    assert batch_data.dataframe.equals(df)
+
+
+@pytest.mark.unit
+def test_get_batch_data_does_not_push_columns_down_into_csv_reader(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2], "b": [3, 4]}).to_csv(path, index=False)
+
+    with columns_to_load(["a"]):
+        batch_data = PandasExecutionEngine().get_batch_data(
+            batch_spec=PathBatchSpec(path=path, reader_method="read_csv")
+        )
+
+    assert list(batch_data.dataframe.columns) == ["a", "b"]
+
+
+@pytest.mark.unit
+def test_get_batch_data_loads_columns_of_parquet_file(tmp_path):
+    pytest.importorskip("pyarrow", exc_type=ImportError)
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"], "c": [4, 5, 6]}).to_parquet(path)
+
+    with columns_to_load(["a"]):
+        batch_data = PandasExecutionEngine().get_batch_data(
+            batch_spec=PathBatchSpec(
+                path=path,
+                reader_method="read_parquet",
+                sampling_method="sample_using_a_list",
+                sampling_kwargs={"column_name": "b", "value_list": ["x"]},
+            )
+        )
+
+    assert batch_data.dataframe.to_dict(orient="list") == {"a": [1, 3], "b": ["x", "x"]}
+
+
 @pytest.mark.skipif(
     not aws.boto3,
     reason="Unable to load AWS connection object. Please install boto3 and botocore.",
@@ -566,17 +909,18 @@ def test_get_batch_data_with_azure_batch_spec(
     mock_azure_conn,
     azure_batch_spec,
 ):
+    content = b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
     mock_blob_client = mock_azure_conn().get_blob_client()
+    mock_blob_client.get_blob_properties().size = len(content)
     mock_azure_obj = mock_blob_client.download_blob()
-    mock_azure_obj.readall.return_value = (
-        b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
-    )
+    mock_azure_obj.readall.return_value = content
 
     df = PandasExecutionEngine().get_batch_data(batch_spec=azure_batch_spec)
 
     mock_azure_conn().get_blob_client.assert_called_with(
         container="test_container", blob="path/A-100.csv"
     )
+    mock_blob_client.download_blob.assert_called_with(offset=0, length=len(content))
     mock_azure_obj.readall.assert_called_once()
 
     assert df.dataframe.shape == (3, 3)
@@ -631,10 +975,10 @@ def test_get_batch_data_with_gcs_batch_spec(
     gcs_batch_spec,
 ):
     mock_gcs_bucket = mock_gcs_conn().get_bucket()
+    content = b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
     mock_gcs_blob = mock_gcs_bucket.blob()
-    mock_gcs_blob.download_as_bytes.return_value = (
-        b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
-    )
+    mock_gcs_blob.size = len(content)
+    mock_gcs_blob.download_as_bytes.return_value = content
 
     # Necessary to pass kwargs to bypass "os.getenv | gcs_options == {}" check
     kwargs = {"gcs_options": {"my_option": "my_value"}}
@@ -642,7 +986,7 @@ def test_get_batch_data_with_gcs_batch_spec(
 
     mock_gcs_conn().get_bucket.assert_called_with("test_bucket")
     mock_gcs_bucket.blob.assert_called_with("path/A-100.csv")
-    mock_gcs_blob.download_as_bytes.assert_called_once()
+    mock_gcs_blob.download_as_bytes.assert_called_once_with(start=0, end=len(content) - 1)
 
     assert df.dataframe.shape == (3, 3)
 
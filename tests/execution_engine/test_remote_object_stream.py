@@ -0,0 +1,93 @@
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import _remote_object_stream
+from great_expectations.execution_engine._remote_object_stream import (
+    open_ranged_object_stream,
+)
+
+
+class _RemoteObject:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.ranges = []
+
+    def read_range(self, start: int, end: int) -> bytes:
+        self.ranges.append((start, end))
+        return self.content[start:end]
+
+
+@pytest.mark.unit
+def test_ranged_object_stream_reads_sequentially_in_ranges():
+    remote_object = _RemoteObject(content=bytes(range(100)))
+
+    with open_ranged_object_stream(
+        size=len(remote_object.content), read_range=remote_object.read_range, buffer_size=32
+    ) as stream:
+        assert stream.read() == remote_object.content
+
+    assert remote_object.ranges == [(0, 32), (32, 64), (64, 96), (96, 100)]
+
+
+@pytest.mark.unit
+def test_ranged_object_stream_seeks_without_reading_skipped_ranges():
+    remote_object = _RemoteObject(content=bytes(range(100)))
+
+    with open_ranged_object_stream(
+        size=len(remote_object.content), read_range=remote_object.read_range, buffer_size=8
+    ) as stream:
+        assert stream.seek(-4, io.SEEK_END) == 96
+        assert stream.read() == bytes(range(96, 100))
+        assert stream.read() == b""
+        stream.seek(10)
+        assert stream.read(2) == bytes([10, 11])
+
+    assert remote_object.ranges == [(96, 100), (10, 18)]
+
+
+@pytest.mark.unit
+def test_ranged_object_stream_of_compressed_csv():
+    df = pd.DataFrame({"a": range(1000), "b": [f"value_{index}" for index in range(1000)]})
+    remote_object = _RemoteObject(content=gzip.compress(df.to_csv(index=False).encode("utf-8")))
+
+    with open_ranged_object_stream(
+        size=len(remote_object.content), read_range=remote_object.read_range, buffer_size=256
+    ) as stream:
+        pd.testing.assert_frame_equal(pd.read_csv(stream, compression="gzip"), df)
+
+    assert len(remote_object.ranges) > 1
+    assert all(end - start <= 256 for start, end in remote_object.ranges)
+
+
+@pytest.mark.unit
+def test_ranged_object_stream_of_empty_object():
+    remote_object = _RemoteObject(content=b"")
+
+    with open_ranged_object_stream(size=0, read_range=remote_object.read_range) as stream:
+        assert stream.read() == b""
+
+    assert remote_object.ranges == []
+
+
+@pytest.mark.unit
+def test_ranged_object_stream_of_seeking_reader_does_not_read_ahead(monkeypatch):
+    remote_object = _RemoteObject(content=bytes(range(200)))
+    monkeypatch.setattr(_remote_object_stream, "SEEKING_READ_BUFFER_SIZE", 8)
+
+    with open_ranged_object_stream(
+        size=len(remote_object.content),
+        read_range=remote_object.read_range,
+        buffer_size=64,
+        sequential=False,
+    ) as stream:
+        # e.g., footer of a Parquet file, and then one of its column chunks
+        stream.seek(-4, io.SEEK_END)
+        assert stream.read(4) == bytes(range(196, 200))
+        stream.seek(100)
+        assert stream.read(48) == bytes(range(100, 148))
+
+    # small reads fetch (at most) the small buffer; large reads fetch only the bytes read
+    assert remote_object.ranges == [(196, 200), (100, 148)]
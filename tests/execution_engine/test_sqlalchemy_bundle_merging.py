@@ -0,0 +1,75 @@
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_bundle_merging import (
+    filter_aggregates_by_condition,
+)
+
+
+def _render(expression) -> str:
+    return str(expression.compile(compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "expression,use_filter_clause,expected",
+    [
+        pytest.param(
+            sa.func.max(sa.column("a")),
+            False,
+            "max(CASE WHEN (b > 2) THEN a END)",
+            id="case",
+        ),
+        pytest.param(
+            sa.func.max(sa.column("a")),
+            True,
+            "max(a) FILTER (WHERE b > 2)",
+            id="filter",
+        ),
+        pytest.param(
+            sa.func.count(),
+            False,
+            "count(CASE WHEN (b > 2) THEN 1 END)",
+            id="count rows",
+        ),
+        pytest.param(
+            sa.func.count(sa.distinct(sa.column("a"))),
+            False,
+            "count(DISTINCT CASE WHEN (b > 2) THEN a END)",
+            id="count distinct",
+        ),
+        pytest.param(
+            sa.func.coalesce(sa.func.sum(sa.func.length(sa.column("a"))), 0),
+            False,
+            "coalesce(sum(CASE WHEN (b > 2) THEN length(a) END), 0)",
+            id="nested scalar functions",
+        ),
+    ],
+)
+def test_filter_aggregates_by_condition(expression, use_filter_clause, expected):
+    rewritten_expression = filter_aggregates_by_condition(
+        expression=expression,
+        condition=sa.column("b") > 2,
+        use_filter_clause=use_filter_clause,
+    )
+
+    assert _render(rewritten_expression) == expected
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "expression",
+    [
+        pytest.param(
+            sa.func.percentile_cont(0.5).within_group(sa.column("a")), id="ordered-set aggregate"
+        ),
+        pytest.param(sa.func.row_number().over(), id="window function"),
+        pytest.param(sa.func.median(sa.column("a")), id="unknown function"),
+        pytest.param(sa.func.sum(sa.literal_column("a + 1")), id="textual SQL"),
+        pytest.param(sa.column("a"), id="no aggregate"),
+    ],
+)
+def test_filter_aggregates_by_condition_declines_unsafe_expressions(expression):
+    assert (
+        filter_aggregates_by_condition(expression=expression, condition=sa.column("b") > 2) is None
+    )
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+from typing import Dict, List, Tuple, cast
 
 import pandas as pd
 import pytest
@@ -21,6 +21,13 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
+from great_expectations.execution_engine.metric_executor import (
+    SerialMetricExecutor,
+    ThreadPoolMetricExecutor,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -1011,6 +1018,296 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+def _build_row_conditioned_max_bundle(
+    batch_id: str, row_conditions: Tuple[str, ...]
+) -> Tuple[MetricComputationConfiguration, ...]:
+    """Builds one "column.max" bundle entry per row condition (i.e., per compute Domain)."""
+    bundle = []
+    for row_condition in row_conditions:
+        domain_kwargs: dict = {
+            "batch_id": batch_id,
+            "row_condition": row_condition,
+            "condition_parser": "great_expectations",
+        }
+        bundle.append(
+            MetricComputationConfiguration(
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.max",
+                    metric_domain_kwargs={"column": "a", **domain_kwargs},
+                ),
+                metric_fn=sqlalchemy.func.max(sqlalchemy.column("a")),
+                metric_provider_kwargs={},
+                compute_domain_kwargs=domain_kwargs,
+                accessor_domain_kwargs={"column": "a"},
+            )
+        )
+
+    return tuple(bundle)
+
+
+@pytest.fixture
+def file_based_sqlite_execution_engine(sa, tmp_path) -> SqlAlchemyExecutionEngine:
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'concurrent.db'}")
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 2, 3, 3]}),
+        name="test",
+        con=sqlalchemy_engine,
+        index=False,
+    )
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, create_temp_table=False, max_concurrent_queries=3
+    )
+    execution_engine.load_batch_data(
+        batch_id="my_batch_id",
+        batch_data=SqlAlchemyBatchData(execution_engine=execution_engine, table_name="test"),
+    )
+    return execution_engine
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_concurrently_across_domains(
+    file_based_sqlite_execution_engine: SqlAlchemyExecutionEngine, mocker
+):
+    execution_engine = file_based_sqlite_execution_engine
+    # File-based SQLite database allows multiple pooled connections, so SQLite is not excluded.
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    concurrent_spy = mocker.spy(execution_engine, "_execute_bundle_queries_concurrently")
+
+    bundle = _build_row_conditioned_max_bundle(
+        batch_id="my_batch_id",
+        row_conditions=('col("b")==1', 'col("b")==2', 'col("b")==3'),
+    )
+    results = execution_engine.resolve_metric_bundle(metric_fn_bundle=bundle)
+
+    assert concurrent_spy.call_count == 1
+    assert results == {
+        bundle[0].metric_configuration.id: 2,
+        bundle[1].metric_configuration.id: 4,
+        bundle[2].metric_configuration.id: 6,
+    }
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_concurrently_reports_only_metrics_of_failed_domains(
+    file_based_sqlite_execution_engine: SqlAlchemyExecutionEngine, mocker
+):
+    execution_engine = file_based_sqlite_execution_engine
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    original_execute_bundle_query = execution_engine._execute_bundle_query
+
+    def execute_bundle_query(query: dict):
+        if query["domain_kwargs"]["row_condition"] == 'col("b")==2':
+            raise gx_exceptions.ExecutionEngineError(message="query failed")
+        return original_execute_bundle_query(query=query)
+
+    mocker.patch.object(execution_engine, "_execute_bundle_query", side_effect=execute_bundle_query)
+
+    bundle = _build_row_conditioned_max_bundle(
+        batch_id="my_batch_id",
+        row_conditions=('col("b")==1', 'col("b")==2', 'col("b")==3'),
+    )
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        execution_engine.resolve_metric_bundle(metric_fn_bundle=bundle)
+
+    assert e.value.message == "query failed"
+    assert list(e.value.failed_metrics) == [bundle[1].metric_configuration]
+    # results of the domains, whose queries succeeded, are not discarded
+    assert e.value.resolved_metrics == {
+        bundle[0].metric_configuration.id: 2,
+        bundle[2].metric_configuration.id: 6,
+    }
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_serially_when_batch_spec_enables_temp_tables(
+    file_based_sqlite_execution_engine: SqlAlchemyExecutionEngine, mocker
+):
+    execution_engine = file_based_sqlite_execution_engine
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    # "create_temp_table" of BatchSpec overrides that of ExecutionEngine (False in this fixture)
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="test", create_temp_table=True)
+    )
+    execution_engine.load_batch_data(batch_id="temp_table_batch_id", batch_data=batch_data)
+    concurrent_spy = mocker.spy(execution_engine, "_execute_bundle_queries_concurrently")
+
+    bundle = _build_row_conditioned_max_bundle(
+        batch_id="temp_table_batch_id", row_conditions=('col("b")==1', 'col("b")==3')
+    )
+    results = execution_engine.resolve_metric_bundle(metric_fn_bundle=bundle)
+
+    assert concurrent_spy.call_count == 0
+    assert results == {
+        bundle[0].metric_configuration.id: 2,
+        bundle[1].metric_configuration.id: 6,
+    }
+
+
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_serially_for_single_connection_dialects(sa, mocker):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, 5, 6], "b": [1, 1, 2, 2, 3, 3]}), sa, batch_id="1234"
+    )
+    execution_engine._max_concurrent_queries = 3
+    execution_engine._create_temp_table = False
+    concurrent_spy = mocker.spy(execution_engine, "_execute_bundle_queries_concurrently")
+
+    bundle = _build_row_conditioned_max_bundle(
+        batch_id="1234", row_conditions=('col("b")==1', 'col("b")==3')
+    )
+    results = execution_engine.resolve_metric_bundle(metric_fn_bundle=bundle)
+
+    assert concurrent_spy.call_count == 0
+    assert results == {
+        bundle[0].metric_configuration.id: 2,
+        bundle[1].metric_configuration.id: 6,
+    }
+
+
+@pytest.mark.sqlite
+def test_max_concurrent_queries_must_be_positive(sa):
+    with pytest.raises(gx_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(connection_string="sqlite://", max_concurrent_queries=0)
+
+
+@pytest.mark.sqlite
+def test_metric_executor_falls_back_to_serial_for_single_connection_dialects(
+    sa, file_based_sqlite_execution_engine: SqlAlchemyExecutionEngine, mocker
+):
+    runtime_configuration = {"metric_executor": "thread"}
+
+    assert isinstance(
+        file_based_sqlite_execution_engine._get_metric_executor(
+            runtime_configuration=runtime_configuration
+        ),
+        SerialMetricExecutor,
+    )
+
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    assert isinstance(
+        file_based_sqlite_execution_engine._get_metric_executor(
+            runtime_configuration=runtime_configuration
+        ),
+        ThreadPoolMetricExecutor,
+    )
+
+
+@pytest.mark.sqlite
+def test_metric_executor_falls_back_to_serial_when_batch_spec_enables_temp_tables(
+    sa, file_based_sqlite_execution_engine: SqlAlchemyExecutionEngine, mocker
+):
+    execution_engine = file_based_sqlite_execution_engine
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    runtime_configuration = {"metric_executor": "thread"}
+    # "create_temp_table" of BatchSpec overrides that of ExecutionEngine (False in this fixture)
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="test", create_temp_table=True)
+    )
+    execution_engine.load_batch_data(batch_id="temp_table_batch_id", batch_data=batch_data)
+
+    assert batch_data.uses_temp_table
+    assert isinstance(
+        execution_engine._get_metric_executor(runtime_configuration=runtime_configuration),
+        SerialMetricExecutor,
+    )
+
+    execution_engine.unload_batch_data(batch_id="temp_table_batch_id")
+    assert isinstance(
+        execution_engine._get_metric_executor(runtime_configuration=runtime_configuration),
+        ThreadPoolMetricExecutor,
+    )
+
+
+@pytest.mark.sqlite
+def test_metric_executor_falls_back_to_serial_when_temp_tables_are_enabled(sa, tmp_path, mocker):
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._PERSISTED_CONNECTION_DIALECTS",
+        (),
+    )
+    # "create_temp_table" is enabled by default
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=f"sqlite:///{tmp_path / 'temp_tables.db'}"
+    )
+
+    assert isinstance(
+        execution_engine._get_metric_executor(runtime_configuration={"metric_executor": "thread"}),
+        SerialMetricExecutor,
+    )
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "use_filter_clause", [True, False], ids=["filter clause", "case expressions"]
+)
+def test_merge_row_condition_bundles(sa, mocker, use_filter_clause):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, None, 5, 6], "b": [1, 2, 3, 4, 5, 6]}), sa
+    )
+    batch_id = execution_engine.batch_manager.active_batch_data_id
+
+    metric_configurations: List[MetricConfiguration] = []
+    for row_condition in (None, 'col("b")>2', 'col("b")<=4'):
+        metric_domain_kwargs = {"column": "a", "batch_id": batch_id}
+        if row_condition is not None:
+            metric_domain_kwargs["row_condition"] = row_condition
+            metric_domain_kwargs["condition_parser"] = "great_expectations"
+
+        for metric_name, metric_value_kwargs in (
+            ("column.max", None),
+            ("column.mean", None),
+            ("column.distinct_values.count", None),
+            ("column_values.between.unexpected_count", {"min_value": 2, "max_value": 5}),
+        ):
+            metric_configurations.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                )
+            )
+
+    def _compute_metrics(merge_row_condition_bundles: bool):
+        engine = SqlAlchemyExecutionEngine(
+            engine=execution_engine.engine,
+            batch_data_dict=execution_engine.batch_manager.batch_data_cache,
+            merge_row_condition_bundles=merge_row_condition_bundles,
+        )
+        mocker.patch.object(
+            engine, "_supports_aggregate_filter_clause", return_value=use_filter_clause
+        )
+        execute_bundle_query_spy = mocker.spy(engine, "_execute_bundle_query")
+        metrics, _ = Validator(execution_engine=engine).compute_metrics(
+            metric_configurations=metric_configurations,
+            runtime_configuration={"catch_exceptions": False},
+        )
+        return {
+            metric_configuration.id: metrics[metric_configuration.id]
+            for metric_configuration in metric_configurations
+        }, execute_bundle_query_spy.call_count
+
+    metrics, num_queries = _compute_metrics(merge_row_condition_bundles=False)
+    merged_metrics, num_merged_queries = _compute_metrics(merge_row_condition_bundles=True)
+
+    assert merged_metrics == metrics
+    # one query (scan) per resolution round, rather than one per row condition
+    assert num_merged_queries * 3 == num_queries
+
+
 @pytest.mark.sqlite
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
@@ -1031,6 +1328,29 @@ def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     assert batch_markers.get("ge_load_time") is not None
 
 
+@pytest.mark.sqlite
+def test_get_batch_data_and_markers_with_batch_fingerprint_query(sa):
+    execution_engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 3]}), sa)
+
+    def _get_batch_fingerprint():
+        _batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+            batch_spec=SqlAlchemyDatasourceBatchSpec(
+                table_name="test",
+                schema_name="main",
+                batch_fingerprint_query="SELECT COUNT(*), MAX(a) FROM main.test",
+            )
+        )
+        return batch_markers["batch_fingerprint"]
+
+    batch_fingerprint = _get_batch_fingerprint()
+    assert _get_batch_fingerprint() == batch_fingerprint
+
+    with execution_engine.get_connection() as connection:
+        connection.execute(sa.text("INSERT INTO main.test (a) VALUES (4)"))
+
+    assert _get_batch_fingerprint() != batch_fingerprint
+
+
 @pytest.mark.sqlite
 def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     def validate_tmp_tables(execution_engine):
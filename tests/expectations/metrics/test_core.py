@@ -27,6 +27,7 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics import column_quantile_values
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_column_names,
 )
@@ -4197,6 +4198,112 @@ def test_column_median_metric_sa(sa, dataframe: pd.DataFrame, median: int):
     assert results == {desired_metric.id: median}
 
 
+@pytest.mark.unit
+def test_column_approximate_median_and_quantile_values_metrics_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": [5, None, 1, 4, 2, 3]}))
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    median_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate": True},
+    )
+    quantile_values_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 0.25, 1.0],
+            "allow_relative_error": False,
+            "approximate": True,
+        },
+    )
+    for desired_metric in (median_metric, quantile_values_metric):
+        desired_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(median_metric, quantile_values_metric), metrics=metrics
+    )
+    assert results == {
+        median_metric.id: {"value": 3.0, "rank_error": 0.0},
+        quantile_values_metric.id: {"values": [1.0, 2.0, 5.0], "rank_error": 0.0},
+    }
+
+
+@pytest.mark.sqlite
+def test_column_approximate_median_and_quantile_values_metrics_sa(sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [5, None, 1, 4, 2, 3]}), sa)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    median_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"approximate": True},
+    )
+    quantile_values_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.0, 0.25, 1.0], "approximate": True},
+    )
+    for desired_metric in (median_metric, quantile_values_metric):
+        desired_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(median_metric, quantile_values_metric), metrics=metrics
+    )
+    assert results == {
+        median_metric.id: {"value": 3.0, "rank_error": 0.0},
+        quantile_values_metric.id: {"values": [1.0, 2.0, 5.0], "rank_error": 0.0},
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_name,expected_function,fetched_row,expected_values",
+    [
+        pytest.param("postgresql", "percentile_disc", (2.0, 3.0), [2.0, 3.0], id="postgresql"),
+        pytest.param("mssql", "percentile_disc", (2.0, 3.0), [2.0, 3.0], id="mssql"),
+        pytest.param("mysql", "percent_rank", (2.0, 3.0), [2.0, 3.0], id="mysql"),
+        pytest.param(
+            "bigquery", "approx_quantiles", (list(range(1001)),), [250, 500], id="bigquery"
+        ),
+        pytest.param(
+            "clickhouse", "quantiles(0.25, 0.5)", ([2.0, 3.0],), [2.0, 3.0], id="clickhouse"
+        ),
+    ],
+)
+def test_approximate_column_quantiles_are_computed_server_side(
+    sa, mocker, dialect_name, expected_function, fetched_row, expected_values
+):
+    execution_engine = mocker.Mock(spec=SqlAlchemyExecutionEngine, dialect_name=dialect_name)
+    execution_engine.execute_query.return_value.fetchone.return_value = fetched_row
+    build_sketch = mocker.patch.object(column_quantile_values, "_build_column_quantile_sketch")
+
+    values, _ = column_quantile_values.get_approximate_column_quantiles(
+        column=sa.column("a"),
+        quantiles=[0.25, 0.5],
+        selectable=sa.table("my_table"),
+        execution_engine=execution_engine,
+    )
+
+    assert values == expected_values
+    build_sketch.assert_not_called()
+    (query,) = execution_engine.execute_query.call_args.args
+    compiled_query = str(query.compile(compile_kwargs={"literal_binds": True})).lower()
+    assert expected_function in compiled_query
+    # quantiles are those of non-null values
+    assert "a is not null" in compiled_query
+
+
 @pytest.mark.spark
 def test_column_median_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -4248,6 +4355,17 @@ def test_value_counts_metric_pd():
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    unsorted_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "none", "collate": None},
+    )
+    unsorted_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(unsorted_metric,), metrics=metrics)
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.value_counts",
         metric_domain_kwargs={"column": "a"},
@@ -4255,12 +4373,29 @@ def test_value_counts_metric_pd():
     )
     desired_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
+        "column.value_counts": unsorted_metric,
     }
 
     results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
     metrics.update(results)
     assert pd.Series(index=[1, 2, 3], data=[2, 2, 2]).equals(metrics[desired_metric.id])
 
+    count_sorted_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "count", "collate": None},
+    )
+    count_sorted_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "column.value_counts": unsorted_metric,
+    }
+
+    results = engine.resolve_metrics(metrics_to_resolve=(count_sorted_metric,), metrics=metrics)
+    metrics.update(results)
+    assert metrics[count_sorted_metric.id].sort_index().equals(metrics[desired_metric.id])
+    # sorting does not modify the shared unsorted value counts
+    assert metrics[unsorted_metric.id].sum() == 6
+
 
 @pytest.mark.big
 def test_value_counts_metric_sa(sa):
@@ -4268,18 +4403,38 @@ def test_value_counts_metric_sa(sa):
         pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
     )
 
+    unsorted_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "none", "collate": None},
+    )
+    unsorted_metric_b = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"sort": "none", "collate": None},
+    )
+    metrics = engine.resolve_metrics(metrics_to_resolve=(unsorted_metric, unsorted_metric_b))
+
     desired_metric = MetricConfiguration(
         metric_name="column.value_counts",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs={"sort": "value", "collate": None},
     )
+    desired_metric.metric_dependencies = {
+        "column.value_counts": unsorted_metric,
+    }
     desired_metric_b = MetricConfiguration(
         metric_name="column.value_counts",
         metric_domain_kwargs={"column": "b"},
         metric_value_kwargs={"sort": "value", "collate": None},
     )
+    desired_metric_b.metric_dependencies = {
+        "column.value_counts": unsorted_metric_b,
+    }
 
-    metrics = engine.resolve_metrics(metrics_to_resolve=(desired_metric, desired_metric_b))
+    metrics = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric, desired_metric_b), metrics=metrics
+    )
     assert pd.Series(
         index=pd.Index(data=[1, 2, 3], name="value"),
         data=[2, 2, 2],
@@ -4356,6 +4511,21 @@ def test_distinct_metric_spark(
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    column_value_counts_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "none", "collate": None},
+    )
+    column_value_counts_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(column_value_counts_metric,),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     column_distinct_values_metric = MetricConfiguration(
         metric_name="column.distinct_values",
         metric_domain_kwargs={"column": "a"},
@@ -4363,6 +4533,7 @@ def test_distinct_metric_spark(
     )
     column_distinct_values_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
+        "column.value_counts": column_value_counts_metric,
     }
 
     results = engine.resolve_metrics(
@@ -4444,6 +4615,21 @@ def test_distinct_metric_sa(
     table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
     metrics.update(results)
 
+    column_value_counts_metric = MetricConfiguration(
+        metric_name="column.value_counts",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"sort": "none", "collate": None},
+    )
+    column_value_counts_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(column_value_counts_metric,),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     column_distinct_values_metric = MetricConfiguration(
         metric_name="column.distinct_values",
         metric_domain_kwargs={"column": "a"},
@@ -4451,6 +4637,7 @@ def test_distinct_metric_sa(
     )
     column_distinct_values_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
+        "column.value_counts": column_value_counts_metric,
     }
 
     results = engine.resolve_metrics(
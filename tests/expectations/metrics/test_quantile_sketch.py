@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from great_expectations.expectations.metrics.quantile_sketch import QuantileSketch
+
+
+@pytest.mark.unit
+def test_quantile_sketch_is_exact_below_capacity():
+    sketch = QuantileSketch(k=100)
+    sketch.update([5, 3, 1, 4, 2])
+
+    assert sketch.count == 5
+    assert sketch.rank_error == 0.0
+    assert sketch.quantiles([0.0, 0.5, 1.0]) == [1, 3, 5]
+
+
+@pytest.mark.unit
+def test_quantile_sketch_of_empty_stream():
+    sketch = QuantileSketch()
+    sketch.update([])
+
+    assert sketch.count == 0
+    assert sketch.rank_error == 0.0
+    assert sketch.quantiles([0.25, 0.5]) == [None, None]
+
+
+@pytest.mark.unit
+def test_quantile_sketch_rank_error_is_within_bound():
+    values = np.random.default_rng(seed=0).normal(size=200_000)
+    sketch = QuantileSketch(k=200, seed=0)
+    for chunk in np.array_split(values, 100):
+        sketch.update(chunk)
+
+    quantiles = [0.01, 0.25, 0.5, 0.75, 0.99]
+    sorted_values = np.sort(values)
+    ranks = np.searchsorted(sorted_values, sketch.quantiles(quantiles)) / values.size
+
+    assert sketch.count == values.size
+    assert 0.0 < sketch.rank_error < 0.05
+    assert np.all(np.abs(ranks - quantiles) <= sketch.rank_error)
+
+
+@pytest.mark.unit
+def test_quantile_sketch_merge():
+    first_sketch = QuantileSketch(k=100, seed=0)
+    first_sketch.update(range(0, 5000))
+    second_sketch = QuantileSketch(k=100, seed=1)
+    second_sketch.update(range(5000, 10000))
+
+    first_sketch.merge(second_sketch)
+
+    assert first_sketch.count == 10000
+    (median,) = first_sketch.quantiles([0.5])
+    assert abs(median / 10000 - 0.5) <= first_sketch.rank_error
+
+
+@pytest.mark.unit
+def test_quantile_sketch_of_strings():
+    sketch = QuantileSketch(k=10)
+    sketch.update([f"value_{index:03d}" for index in range(100)])
+
+    (median,) = sketch.quantiles([0.5])
+    assert isinstance(median, str)
+
+
+@pytest.mark.unit
+def test_quantile_sketch_requires_capacity_of_at_least_two():
+    with pytest.raises(ValueError):
+        QuantileSketch(k=1)
@@ -0,0 +1,117 @@
+"""Benchmarks rendering Data Docs pages of many Validation Results, serially and in parallel.
+
+Run with:
+
+    pytest tests/performance/test_data_docs_rendering_benchmarks.py --performance-tests
+"""
+
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from great_expectations import expectations as gxe
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.data_context import get_context
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.render.renderer.site_builder import SiteBuilder
+
+NUM_VALIDATION_RESULTS: int = 2000
+NUM_COLUMNS: int = 10
+SUITE_NAME: str = "my_suite"
+
+
+def _build_validation_result(run_index: int) -> ExpectationSuiteValidationResult:
+    results = [
+        ExpectationValidationResult(
+            success=column_index % 3 != 0,
+            expectation_config=ExpectationConfiguration(
+                type="expect_column_values_to_be_between",
+                kwargs={"column": f"column_{column_index}", "min_value": 0, "max_value": 100},
+            ),
+            result={
+                "element_count": 1000,
+                "missing_count": 0,
+                "missing_percent": 0.0,
+                "unexpected_count": column_index,
+                "unexpected_percent": column_index / 10,
+                "partial_unexpected_list": list(range(101, 101 + column_index)),
+            },
+        )
+        for column_index in range(NUM_COLUMNS)
+    ]
+    return ExpectationSuiteValidationResult(
+        success=False,
+        results=results,
+        suite_name=SUITE_NAME,
+        statistics={
+            "evaluated_expectations": NUM_COLUMNS,
+            "successful_expectations": NUM_COLUMNS - len(results[::3]),
+            "unsuccessful_expectations": len(results[::3]),
+            "success_percent": 100 * (NUM_COLUMNS - len(results[::3])) / NUM_COLUMNS,
+        },
+        meta={"active_batch_definition": {"data_asset_name": f"asset_{run_index % 20}"}},
+    )
+
+
+@pytest.fixture(scope="module")
+def context_with_validation_results(tmp_path_factory):
+    context = get_context(mode="file", project_root_dir=tmp_path_factory.mktemp("project"))
+    context.suites.add(
+        ExpectationSuite(
+            name=SUITE_NAME,
+            expectations=[
+                gxe.ExpectColumnValuesToBeBetween(
+                    column=f"column_{column_index}", min_value=0, max_value=100
+                )
+                for column_index in range(NUM_COLUMNS)
+            ],
+        )
+    )
+    for run_index in range(NUM_VALIDATION_RESULTS):
+        key = ValidationResultIdentifier(
+            expectation_suite_identifier=ExpectationSuiteIdentifier(name=SUITE_NAME),
+            run_id=RunIdentifier(run_name=f"run_{run_index}"),
+            batch_identifier="my_batch",
+        )
+        validation_result = _build_validation_result(run_index=run_index)
+        validation_result.meta["run_id"] = key.run_id
+        context.validation_results_store.set(key, validation_result)
+
+    return context
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("rendering_workers", [1, 4])
+def test_data_docs_rendering(
+    benchmark, context_with_validation_results, tmp_path: pathlib.Path, rendering_workers: int
+):
+    site_builder = SiteBuilder(
+        data_context=context_with_validation_results,
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path / "data_docs"),
+        },
+        site_name="local_site",
+        site_section_builders={"expectations": "None", "profiling": "None"},
+        rendering_workers=rendering_workers,
+    )
+
+    benchmark.pedantic(site_builder.build, rounds=1, iterations=1)
+
+    assert (
+        len(list((tmp_path / "data_docs" / "validations").glob("**/*.html")))
+        == NUM_VALIDATION_RESULTS
+    )
@@ -0,0 +1,128 @@
+"""Benchmarks for "ValidationGraph" resolution overhead (excluding actual metric computation).
+
+Run with:
+
+    pytest tests/performance/test_validation_graph_benchmarks.py --performance-tests
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple, cast
+
+import pytest
+
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+NUM_COLUMNS: int = 1000
+NUM_METRICS_PER_COLUMN: int = 25
+
+NUM_SUITE_COLUMNS: int = 200
+SUITE_METRICS: List[Tuple[str, dict]] = [
+    (
+        "column_values.between.unexpected_count",
+        {"min_value": 0, "max_value": 10, "strict_min": False, "strict_max": False},
+    ),
+    ("column_values.in_set.unexpected_count", {"value_set": [1, 2, 3]}),
+    ("column_values.nonnull.unexpected_count", {}),
+    ("column.max", {}),
+]
+
+
+class _NoOpExecutionEngine:
+    """Resolves every requested metric instantly, so that only graph traversal cost is measured."""
+
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def resolve_metrics(
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        return {metric_configuration.id: 0 for metric_configuration in metrics_to_resolve}
+
+
+def _build_synthetic_edges() -> List[MetricEdge]:
+    """Builds layered graph of ~100k edges.
+
+    Per column, every metric depends on all metrics in preceding layer.
+    """
+    edges: List[MetricEdge] = []
+    layer_width: int = 5
+    column_index: int
+    metric_index: int
+    for column_index in range(NUM_COLUMNS):
+        column_metrics: List[MetricConfiguration] = [
+            MetricConfiguration(
+                metric_name=f"synthetic.metric_{metric_index}",
+                metric_domain_kwargs={"column": f"column_{column_index}"},
+            )
+            for metric_index in range(NUM_METRICS_PER_COLUMN)
+        ]
+        for metric_index, metric_configuration in enumerate(column_metrics):
+            layer_start: int = (metric_index // layer_width - 1) * layer_width
+            if layer_start < 0:
+                edges.append(MetricEdge(left=metric_configuration))
+                continue
+
+            edges.extend(
+                MetricEdge(left=metric_configuration, right=dependency)
+                for dependency in column_metrics[layer_start : layer_start + layer_width]
+            )
+
+    return edges
+
+
+@pytest.mark.performance
+def test_validation_graph_resolution_overhead(benchmark):
+    edges: List[MetricEdge] = _build_synthetic_edges()
+    assert len(edges) >= 100_000
+
+    def resolve() -> Dict[Tuple[str, str, str], MetricValue]:
+        graph = ValidationGraph(
+            execution_engine=cast(ExecutionEngine, _NoOpExecutionEngine()),
+            edges=list(edges),
+        )
+        resolved_metrics, _ = graph.resolve(show_progress_bars=False)
+        return resolved_metrics
+
+    resolved_metrics = benchmark.pedantic(resolve, rounds=3, iterations=1)
+
+    assert len(resolved_metrics) == NUM_COLUMNS * NUM_METRICS_PER_COLUMN
+
+
+@pytest.mark.performance
+def test_validation_graph_build_and_resolve_for_large_suite(benchmark):
+    """Exercises metric id computation (multi-key kwargs) in graph of wide Expectation Suite."""
+    runtime_configuration: dict = {"result_format": {"result_format": "SUMMARY"}}
+
+    def build_and_resolve() -> Dict[Tuple[str, str, str], MetricValue]:
+        graph = ValidationGraph(execution_engine=PandasExecutionEngine())
+        column_index: int
+        metric_name: str
+        metric_value_kwargs: dict
+        for column_index in range(NUM_SUITE_COLUMNS):
+            for metric_name, metric_value_kwargs in SUITE_METRICS:
+                graph.build_metric_dependency_graph(
+                    metric_configuration=MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={
+                            "column": f"column_{column_index}",
+                            "batch_id": "my_batch_id",
+                        },
+                        metric_value_kwargs=metric_value_kwargs,
+                    ),
+                    runtime_configuration=runtime_configuration,
+                )
+
+        resolved_metrics, _ = ValidationGraph(
+            execution_engine=cast(ExecutionEngine, _NoOpExecutionEngine()),
+            edges=graph.edges,
+        ).resolve(runtime_configuration=runtime_configuration, show_progress_bars=False)
+        return resolved_metrics
+
+    resolved_metrics = benchmark.pedantic(build_and_resolve, rounds=5, iterations=1)
+
+    assert len(resolved_metrics) >= NUM_SUITE_COLUMNS * len(SUITE_METRICS)
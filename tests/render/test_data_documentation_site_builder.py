@@ -1,18 +1,31 @@
 import os
+import pathlib
+import re
 import shutil
-from typing import Dict
+from typing import Dict, Tuple
 
 import pytest
 
+from great_expectations import expectations as gxe
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer.site_builder import SiteBuilder
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +138,121 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def _add_validation_result(context, suite_name: str, run_name: str) -> ValidationResultIdentifier:
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier(name=suite_name),
+        run_id=RunIdentifier(run_name=run_name),
+        batch_identifier="my_batch",
+    )
+    validation_result = ExpectationSuiteValidationResult(
+        success=True,
+        results=[],
+        suite_name=suite_name,
+        statistics={"evaluated_expectations": 0},
+        meta={"active_batch_definition": {"data_asset_name": "my_asset"}},
+    )
+    validation_result.meta["run_id"] = key.run_id
+    context.validation_results_store.set(key, validation_result)
+    return key
+
+
+def test_site_builder_incremental_build(tmp_path, mocker):
+    context = get_context(mode="file", project_root_dir=tmp_path)
+    suite = context.suites.add(
+        ExpectationSuite(
+            name="my_suite",
+            expectations=[gxe.ExpectColumnValuesToNotBeNull(column="a")],
+        )
+    )
+    for run_name in ("run_1", "run_2"):
+        _add_validation_result(context, suite_name=suite.name, run_name=run_name)
+
+    def _build_site() -> Tuple[SiteBuilder, dict]:
+        site_builder = SiteBuilder(
+            data_context=context,
+            store_backend={
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": str(tmp_path / "data_docs"),
+            },
+            site_name="local_site",
+            incremental=True,
+        )
+        for site_section_builder in site_builder.site_section_builders.values():
+            mocker.spy(site_section_builder.renderer_class, "render")
+        _, index_links_dict = site_builder.build()
+        return site_builder, index_links_dict
+
+    def _num_rendered(site_builder: SiteBuilder, section_name: str) -> int:
+        return site_builder.site_section_builders[section_name].renderer_class.render.call_count
+
+    # reads of Validation Results (by validations section and index page)
+    read_validation_result = mocker.spy(context.validation_results_store.store_backend, "_get")
+
+    site_builder, index_links_dict = _build_site()
+    assert _num_rendered(site_builder, "expectations") == 1
+    assert _num_rendered(site_builder, "validations") == 2
+    assert read_validation_result.call_count == 4
+    assert len(index_links_dict["validations_links"]) == 2
+
+    # nothing has changed
+    read_validation_result.reset_mock()
+    site_builder, incremental_index_links_dict = _build_site()
+    assert _num_rendered(site_builder, "expectations") == 0
+    assert _num_rendered(site_builder, "validations") == 0
+    assert read_validation_result.call_count == 0
+    assert incremental_index_links_dict == index_links_dict
+
+    # only new Validation Result and changed Expectation Suite are rendered
+    _add_validation_result(context, suite_name=suite.name, run_name="run_3")
+    suite.add_expectation(gxe.ExpectColumnValuesToBeUnique(column="b"))
+    suite.save()
+    read_validation_result.reset_mock()
+    site_builder, index_links_dict = _build_site()
+    assert _num_rendered(site_builder, "expectations") == 1
+    assert _num_rendered(site_builder, "validations") == 1
+    assert read_validation_result.call_count == 2
+    assert len(index_links_dict["validations_links"]) == 3
+    assert all(link["asset_name"] == "my_asset" for link in index_links_dict["validations_links"])
+
+
+@pytest.mark.filesystem
+def test_site_builder_rendering_workers(tmp_path):
+    context = get_context(mode="file", project_root_dir=tmp_path)
+    suite = context.suites.add(
+        ExpectationSuite(
+            name="my_suite",
+            expectations=[gxe.ExpectColumnValuesToNotBeNull(column="a")],
+        )
+    )
+    for run_name in ("run_1", "run_2", "run_3"):
+        _add_validation_result(context, suite_name=suite.name, run_name=run_name)
+
+    def _build_site(site_directory: pathlib.Path, rendering_workers: int) -> Dict[str, str]:
+        site_builder = SiteBuilder(
+            data_context=context,
+            store_backend={
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": str(site_directory),
+            },
+            site_name="local_site",
+            rendering_workers=rendering_workers,
+        )
+        site_builder.build()
+        # pages embed render time and random element ids
+        return {
+            str(path.relative_to(site_directory)): re.sub(
+                r"\d{8}T\d{6}\.\d{6}Z|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+                "",
+                path.read_text(),
+            )
+            for path in site_directory.glob("**/*.html")
+        }
+
+    serial_pages = _build_site(tmp_path / "serial", rendering_workers=1)
+    parallel_pages = _build_site(tmp_path / "parallel", rendering_workers=2)
+
+    # index page, one Expectation Suite page, and three Validation Result pages
+    assert len(serial_pages) == 5
+    assert parallel_pages == serial_pages
@@ -16,7 +16,8 @@ from great_expectations.data_context.data_context.abstract_data_context import (
 )
 from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
 from great_expectations.expectations.expectation import Expectation
-from great_expectations.validator.v1_validator import Validator
+from great_expectations.validator import v1_validator
+from great_expectations.validator.v1_validator import Validator, _get_columns_to_load
 
 
 @pytest.fixture
@@ -207,6 +208,123 @@ def test_validate_expectation_suite(validator: Validator, expectation_suite: Exp
     }
 
 
+@pytest.mark.unit
+def test_validate_expectation_suite_loads_columns_expectations_refer_to(
+    mocker, validator: Validator, expectation_suite: ExpectationSuite
+):
+    columns_to_load = mocker.spy(v1_validator, "columns_to_load")
+
+    validator.validate_expectation_suite(expectation_suite)
+
+    columns_to_load.assert_called_once_with({"event_type", "id"})
+
+
+@pytest.mark.unit
+def test_validate_expectation_reloads_batch_with_more_columns(
+    mocker,
+    validator: Validator,
+    failing_expectation: Expectation,
+    passing_expectation: Expectation,
+):
+    columns_to_load = mocker.spy(v1_validator, "columns_to_load")
+
+    assert validator.validate_expectation(passing_expectation).success
+    assert validator.validate_expectation(passing_expectation).success
+    assert not validator.validate_expectation(failing_expectation).success
+
+    assert columns_to_load.call_args_list == [mock.call({"id"}), mock.call({"event_type"})]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ["expectations", "result_format", "expected"],
+    [
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectColumnPairValuesToBeEqual(column_A="b", column_B="c"),
+                gxe.ExpectCompoundColumnsToBeUnique(column_list=["c", "d"]),
+                gxe.ExpectTableRowCountToBeBetween(min_value=1),
+            ],
+            ResultFormat.SUMMARY,
+            {"a", "b", "c", "d"},
+            id="column expectations",
+        ),
+        pytest.param(
+            [gxe.ExpectColumnValuesToNotBeNull(column="a")],
+            {"result_format": "COMPLETE", "unexpected_index_column_names": ["pk"]},
+            {"a", "pk"},
+            id="unexpected index columns",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectTableColumnsToMatchSet(column_set=["a"]),
+            ],
+            ResultFormat.SUMMARY,
+            None,
+            id="table expectation",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectColumnToExist(column="b", column_index=1),
+            ],
+            ResultFormat.SUMMARY,
+            None,
+            id="column index",
+        ),
+        pytest.param(
+            [gxe.ExpectTableColumnsToMatchOrderedList(column_list=["a", "b"])],
+            ResultFormat.SUMMARY,
+            None,
+            id="ordered column list",
+        ),
+        pytest.param(
+            [gxe.ExpectColumnValuesToNotBeNull(column="a")],
+            {"result_format": "COMPLETE", "include_unexpected_rows": True},
+            None,
+            id="unexpected rows",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(
+                    column="a",
+                    result_format={"result_format": "SUMMARY", "include_unexpected_rows": True},
+                )
+            ],
+            ResultFormat.SUMMARY,
+            None,
+            id="unexpected rows of expectation",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(
+                    column="a", row_condition='b == "x"', condition_parser="pandas"
+                )
+            ],
+            ResultFormat.SUMMARY,
+            None,
+            id="row condition",
+        ),
+        pytest.param(
+            [gxe.ExpectTableRowCountToBeBetween(min_value=1)],
+            ResultFormat.SUMMARY,
+            None,
+            id="no columns",
+        ),
+    ],
+)
+def test_get_columns_to_load(expectations: list[Expectation], result_format, expected):
+    assert (
+        _get_columns_to_load(
+            expectation_configs=[expectation.configuration for expectation in expectations],
+            result_format=result_format,
+        )
+        == expected
+    )
+
+
 @pytest.mark.parametrize(
     ["parameter", "expected"],
     [
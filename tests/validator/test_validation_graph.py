@@ -1,6 +1,6 @@
 import sys
 import uuid
-from typing import Dict, Iterable, Optional, Set, Tuple, Union, cast
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 from unittest import mock
 
 import pytest
@@ -406,6 +406,139 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true(
     )
 
 
+@pytest.mark.unit
+def test_resolve_validation_graph_parses_edges_once_and_resolves_in_dependency_order():
+    resolution_rounds: List[List[str]] = []
+
+    class ExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            metric_configuration: MetricConfiguration
+            for metric_configuration in metrics_to_resolve:
+                assert all(
+                    dependency.id in metrics
+                    for dependency in metric_configuration.metric_dependencies.values()
+                )
+
+            resolution_rounds.append(
+                sorted(
+                    metric_configuration.metric_domain_kwargs["column"]
+                    for metric_configuration in metrics_to_resolve
+                )
+            )
+            return {
+                metric_configuration.id: "my_value" for metric_configuration in metrics_to_resolve
+            }
+
+    graph = ValidationGraph(execution_engine=cast(ExecutionEngine, ExecutionEngineFake()))
+
+    # "a" and "b" have no dependencies, "c" depends on "a" and "b", and "d" depends on "c" and "a".
+    metric_configurations: Dict[str, MetricConfiguration] = {
+        name: MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": name})
+        for name in ["a", "b", "c", "d"]
+    }
+    metric_configurations["c"].metric_dependencies = {
+        "a": metric_configurations["a"],
+        "b": metric_configurations["b"],
+    }
+    metric_configurations["d"].metric_dependencies = {
+        "c": metric_configurations["c"],
+        "a": metric_configurations["a"],
+    }
+    graph.add(MetricEdge(left=metric_configurations["a"]))
+    graph.add(MetricEdge(left=metric_configurations["b"]))
+    graph.add(MetricEdge(left=metric_configurations["c"], right=metric_configurations["a"]))
+    graph.add(MetricEdge(left=metric_configurations["c"], right=metric_configurations["b"]))
+    graph.add(MetricEdge(left=metric_configurations["d"], right=metric_configurations["c"]))
+    graph.add(MetricEdge(left=metric_configurations["d"], right=metric_configurations["a"]))
+
+    with mock.patch.object(
+        ValidationGraph, "_parse", autospec=True, side_effect=ValidationGraph._parse
+    ) as mock_parse:
+        resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert mock_parse.call_count == 1
+    assert resolution_rounds == [["a", "b"], ["c"], ["d"], []]
+    assert set(resolved_metrics.keys()) == {
+        metric_configuration.id for metric_configuration in metric_configurations.values()
+    }
+    assert aborted_metrics_info == {}
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_keeps_metrics_resolved_alongside_failed_metrics():
+    resolution_rounds: List[List[str]] = []
+
+    class ExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            """Fails metric of column "b" only (as concurrent queries do), resolving all others."""
+            resolution_rounds.append(
+                sorted(
+                    metric_configuration.metric_domain_kwargs["column"]
+                    for metric_configuration in metrics_to_resolve
+                )
+            )
+            resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+                metric_configuration.id: "my_value"
+                for metric_configuration in metrics_to_resolve
+                if metric_configuration.metric_domain_kwargs["column"] != "b"
+            }
+            failed_metrics: List[MetricConfiguration] = [
+                metric_configuration
+                for metric_configuration in metrics_to_resolve
+                if metric_configuration.metric_domain_kwargs["column"] == "b"
+            ]
+            if failed_metrics:
+                raise gx_exceptions.MetricResolutionError(
+                    message="query failed",
+                    failed_metrics=failed_metrics,
+                    resolved_metrics=resolved_metrics,
+                )
+
+            return resolved_metrics
+
+    graph = ValidationGraph(execution_engine=cast(ExecutionEngine, ExecutionEngineFake()))
+
+    # "a" and "b" have no dependencies, and "c" depends on "a".
+    metric_configurations: Dict[str, MetricConfiguration] = {
+        name: MetricConfiguration(metric_name="column.max", metric_domain_kwargs={"column": name})
+        for name in ["a", "b", "c"]
+    }
+    metric_configurations["c"].metric_dependencies = {"a": metric_configurations["a"]}
+    graph.add(MetricEdge(left=metric_configurations["a"]))
+    graph.add(MetricEdge(left=metric_configurations["b"]))
+    graph.add(MetricEdge(left=metric_configurations["c"], right=metric_configurations["a"]))
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(
+        runtime_configuration={"catch_exceptions": True}, show_progress_bars=False
+    )
+
+    # "a" is resolved once, rather than being retried (and aborted) along with failed "b"
+    assert [resolution_round.count("a") for resolution_round in resolution_rounds] == [1] + [0] * (
+        len(resolution_rounds) - 1
+    )
+    assert set(resolved_metrics.keys()) == {
+        metric_configurations["a"].id,
+        metric_configurations["c"].id,
+    }
+    assert set(aborted_metrics_info.keys()) == {metric_configurations["b"].id}
+    assert (
+        aborted_metrics_info[metric_configurations["b"].id]["num_failures"]
+        == MAX_METRIC_COMPUTATION_RETRIES
+    )
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "show_progress_bars, are_progress_bars_disabled, ",
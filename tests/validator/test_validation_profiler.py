@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.self_check.util import build_sa_execution_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_profiler import (
+    VALIDATION_PROFILE_META_KEY,
+    ValidationProfiler,
+    is_validation_profiling_requested,
+)
+from great_expectations.validator.validator import Validator
+
+
+def _metric_configuration(metric_name: str, column: str = "a") -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs={"column": column},
+        metric_value_kwargs=None,
+    )
+
+
+def _expectation_suite() -> ExpectationSuite:
+    return ExpectationSuite(
+        name="my_suite",
+        expectations=[
+            ExpectationConfiguration(
+                type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a"},
+            ),
+            ExpectationConfiguration(
+                type="expect_column_max_to_be_between",
+                kwargs={"column": "b", "min_value": 0, "max_value": 10},
+            ),
+        ],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "runtime_configuration,expected",
+    [
+        pytest.param(None, False, id="no runtime_configuration"),
+        pytest.param({"result_format": "BASIC"}, False, id="not requested"),
+        pytest.param({"profile_validation": True}, True, id="requested"),
+    ],
+)
+def test_is_validation_profiling_requested(runtime_configuration, expected):
+    assert (
+        is_validation_profiling_requested(runtime_configuration=runtime_configuration) is expected
+    )
+
+
+@pytest.mark.unit
+def test_validation_profiler_splits_costs_of_metrics_computed_together():
+    validation_profiler = ValidationProfiler()
+    column_max = _metric_configuration("column.max")
+    column_min = _metric_configuration("column.min")
+
+    # work reported outside of measurements only counts towards totals
+    validation_profiler.record_queries()
+    with validation_profiler.measure(metric_configurations=[column_max, column_min]):
+        validation_profiler.record_queries()
+        validation_profiler.record_scan(num_rows=10, num_bytes=80)
+
+    profile = validation_profiler.to_json_dict()
+
+    assert profile["execution_engine"]["queries"] == 2
+    assert profile["execution_engine"]["rows_scanned"] == 10
+    assert [metric["metric_name"] for metric in profile["metrics"]] == [
+        "column.max",
+        "column.min",
+    ]
+    for metric in profile["metrics"]:
+        assert metric["num_computations"] == 1
+        assert metric["num_computed_with"] == 2
+        assert metric["queries"] == 0.5
+        assert metric["rows_scanned"] == 5
+        assert metric["bytes_scanned"] == 40
+
+
+@pytest.mark.unit
+def test_validation_profiler_attributes_metrics_to_expectations():
+    validation_profiler = ValidationProfiler()
+    column_max = _metric_configuration("column.max")
+    column_min = _metric_configuration("column.min")
+    expect_max = ExpectationConfiguration(
+        type="expect_column_max_to_be_between", kwargs={"column": "a", "batch_id": "my_batch"}
+    )
+    expect_min = ExpectationConfiguration(
+        type="expect_column_min_to_be_between", kwargs={"column": "a", "batch_id": "my_batch"}
+    )
+
+    validation_profiler.attribute_expectation(
+        configuration=expect_max, metric_configurations=[column_max]
+    )
+    validation_profiler.attribute_expectation(
+        configuration=expect_min, metric_configurations=[column_max, column_min]
+    )
+    with validation_profiler.measure(metric_configurations=[column_max]):
+        validation_profiler.record_queries(num_queries=3)
+    with validation_profiler.measure_expectation(configuration=expect_min):
+        pass
+
+    expectations = {
+        expectation["expectation_type"]: expectation
+        for expectation in validation_profiler.to_json_dict()["expectations"]
+    }
+
+    # shared metrics are attributed to every Expectation relying on them
+    assert expectations["expect_column_max_to_be_between"]["queries"] == 3
+    assert expectations["expect_column_min_to_be_between"]["queries"] == 3
+    # "column.min" was not computed (e.g., it was obtained from cache)
+    assert expectations["expect_column_min_to_be_between"]["num_metrics"] == 2
+    assert expectations["expect_column_min_to_be_between"]["num_computed_metrics"] == 1
+    assert expectations["expect_column_min_to_be_between"]["domain_kwargs"] == {"column": "a"}
+    assert expectations["expect_column_min_to_be_between"]["evaluation_time"] >= 0
+
+
+@pytest.mark.big
+def test_validator_validate_adds_validation_profile_to_meta(in_memory_runtime_context):
+    engine = PandasExecutionEngine()
+    batch_spec = RuntimeDataBatchSpec(
+        batch_data=pd.DataFrame({"a": [1, 2, None, 4], "b": [1, 2, 3, 4]})
+    )
+    batch_data, batch_markers = engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    validator = Validator(
+        execution_engine=engine,
+        batches=[Batch(data=batch_data, batch_spec=batch_spec, batch_markers=batch_markers)],
+    )
+
+    result = validator.validate(expectation_suite=_expectation_suite())
+    assert VALIDATION_PROFILE_META_KEY not in result.meta
+    assert validator.validation_profile is None
+
+    result = validator.validate(expectation_suite=_expectation_suite(), profile_validation=True)
+    profile = result.meta[VALIDATION_PROFILE_META_KEY]
+
+    assert profile == validator.validation_profile
+    assert profile["execution_engine"]["class_name"] == "PandasExecutionEngine"
+    assert profile["execution_engine"]["rows_scanned"] > 0
+    assert profile["execution_engine"]["bytes_scanned"] > 0
+    assert set(profile["metric_cache"]) == {"hits", "misses", "evictions"}
+    assert profile["persisted_metrics"] is None
+    assert {"column.max", "column_values.nonnull.unexpected_count"} <= {
+        metric["metric_name"] for metric in profile["metrics"]
+    }
+    assert sorted(expectation["expectation_type"] for expectation in profile["expectations"]) == [
+        "expect_column_max_to_be_between",
+        "expect_column_values_to_not_be_null",
+    ]
+    assert all(
+        0 < expectation["num_computed_metrics"] <= expectation["num_metrics"]
+        for expectation in profile["expectations"]
+    )
+    # ExecutionEngine is no longer profiled once validation is done
+    assert engine.validation_profiler is None
+
+
+@pytest.mark.sqlite
+def test_validator_validate_profile_counts_sql_queries(in_memory_runtime_context, sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, None, 4], "b": [1, 2, 3, 4]}), sa)
+    validator = Validator(execution_engine=engine)
+
+    profile = validator.validate(
+        expectation_suite=_expectation_suite(), profile_validation=True
+    ).meta[VALIDATION_PROFILE_META_KEY]
+
+    assert profile["execution_engine"]["class_name"] == "SqlAlchemyExecutionEngine"
+    assert profile["execution_engine"]["queries"] > 0
+    column_max = next(
+        metric for metric in profile["metrics"] if metric["metric_name"] == "column.max"
+    )
+    # "column.max" is computed by bundled query
+    assert column_max["queries"] > 0
+    assert column_max["wall_time"] > 0